@@ -44,37 +44,53 @@ def clean_text(text: str) -> list:
     return [word for word in tokens if word.isalpha() and word not in ALL_STOPWORDS and len(word) > 2]
 
 
-def generate_wordcloud_from_papers(papers: list, output_path: Path) -> bool:
+class WordFrequencyCounter:
     """
-    Generates and saves a word cloud image from the titles and abstracts of papers.
-    Returns True if successful, False otherwise.
+    Incrementally accumulates word frequencies from paper titles and abstracts.
+    Only the Counter is kept, so memory is bounded by the vocabulary rather than the number of papers.
     """
-    if not papers:
-        return False
 
-    # Combine all titles and abstracts into a single string
-    full_text = " ".join([p.get('title', '') + " " + p.get('abstract', '') for p in papers])
+    def __init__(self):
+        self.word_freq = Counter()
+        self.papers_seen = 0
 
-    if not full_text.strip():
-        print("Warning: No text available to generate word cloud.")
-        return False
+    def add(self, paper: dict):
+        self.papers_seen += 1
+        text = str(paper.get('title', '') or '') + " " + str(paper.get('abstract', '') or '')
+        if text.strip():
+            self.word_freq.update(clean_text(text))
 
-    word_tokens = clean_text(full_text)
+    def save_wordcloud(self, output_path: Path) -> bool:
+        """Generates and saves the word cloud image. Returns True if successful, False otherwise."""
+        if not self.papers_seen:
+            return False
 
-    if not word_tokens:
-        print("Warning: No valid words left after cleaning to generate word cloud.")
-        return False
+        if not self.word_freq:
+            print("Warning: No valid words left after cleaning to generate word cloud.")
+            return False
+
+        try:
+            wc = WordCloud(width=1200, height=600, background_color="white",
+                           collocations=False).generate_from_frequencies(self.word_freq)
+            wc.to_file(str(output_path))
+            print(f"Word cloud generated and saved to {output_path}")
+            return True
+        except Exception as e:
+            print(f"Error generating word cloud: {e}")
+            return False
 
-    word_freq = Counter(word_tokens)
 
-    try:
-        wc = WordCloud(width=1200, height=600, background_color="white", collocations=False).generate_from_frequencies(
-            word_freq)
-        wc.to_file(str(output_path))
-        print(f"Word cloud generated and saved to {output_path}")
-        return True
-    except Exception as e:
-        print(f"Error generating word cloud: {e}")
+def generate_wordcloud_from_papers(papers: list, output_path: Path) -> bool:
+    """
+    Generates and saves a word cloud image from the titles and abstracts of papers.
+    Returns True if successful, False otherwise.
+    """
+    if not papers:
         return False
 
+    counter = WordFrequencyCounter()
+    for paper in papers:
+        counter.add(paper)
+    return counter.save_wordcloud(output_path)
+
 # END OF FILE: src/analysis/analyzer.py
\ No newline at end of file
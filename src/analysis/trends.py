@@ -2,11 +2,14 @@
 
 import yaml
 import re
+import math
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from collections import Counter, defaultdict
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 import matplotlib.ticker as mtick
 
 from src.crawlers.config import ROOT_DIR, get_logger
@@ -25,21 +28,105 @@ def _load_trend_config():
         return yaml.safe_load(f)
 
 
-def _classify_paper_subfields(paper: dict, trend_config: dict) -> list:
-    text = str(paper.get('title', '')) + ' ' + str(paper.get('abstract', ''))
-    if not text.strip(): return []
-    text = text.lower()
-    matched = set()
+def _compile_subfield_patterns(trend_config: dict) -> List[Tuple[str, re.Pattern]]:
+    patterns = []
     for field, data in trend_config.items():
         if 'sub_fields' not in data: continue
         for sub_field, keywords in data.get('sub_fields', {}).items():
             if not isinstance(keywords, list): continue
             keyword_pattern = r'\b(' + '|'.join(re.escape(k) for k in keywords) + r')\b'
-            if re.search(keyword_pattern, text, re.IGNORECASE):
-                matched.add(sub_field)
+            patterns.append((sub_field, re.compile(keyword_pattern, re.IGNORECASE)))
+    return patterns
+
+
+def _classify_paper_subfields(paper: dict, trend_config: dict, patterns=None) -> list:
+    text = str(paper.get('title', '')) + ' ' + str(paper.get('abstract', ''))
+    if not text.strip(): return []
+    text = text.lower()
+    matched = set()
+    # 预编译的模式列表可能为空 (没有配置任何子方向)，不能用 `or` 判断是否传入
+    if patterns is None:
+        patterns = _compile_subfield_patterns(trend_config or {})
+    for sub_field, pattern in patterns:
+        if pattern.search(text):
+            matched.add(sub_field)
     return list(matched)
 
 
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+class TopicStats:
+    """
+    单个任务 (会议-年份) 的主题统计累加器，供流式流水线逐篇调用 add()。
+
+    只保留每个子方向的论文数、评分和、决策计数，内存占用与论文数量无关。
+    to_dataframe() 的结果与 _create_analysis_df 对完整 DataFrame 的计算结果一致；
+    paper_counts 同时也是跨年趋势分析所需的全部数据。
+    """
+
+    def __init__(self, trend_config: Optional[dict] = None):
+        self._patterns = _compile_subfield_patterns(trend_config or {})
+        self.total_papers = 0
+        self.paper_counts: Counter = Counter()
+        self._rating_sum: Dict[str, float] = defaultdict(float)
+        self._rating_count: Counter = Counter()
+        self._decisions: Dict[str, Counter] = defaultdict(Counter)
+        self._has_rating_column = False
+        self._has_decision_column = False
+
+    def add(self, paper: dict):
+        self.total_papers += 1
+        sub_fields = _classify_paper_subfields(paper, None, self._patterns)
+        if 'avg_rating' in paper:
+            self._has_rating_column = True
+        if 'decision' in paper:
+            self._has_decision_column = True
+        if not sub_fields:
+            return
+        rating = _to_float(paper.get('avg_rating'))
+        decision = paper.get('decision')
+        for sub_field in sub_fields:
+            self.paper_counts[sub_field] += 1
+            if rating is not None:
+                self._rating_sum[sub_field] += rating
+                self._rating_count[sub_field] += 1
+            if decision is not None and not (isinstance(decision, float) and math.isnan(decision)):
+                self._decisions[sub_field][decision] += 1
+
+    def to_dataframe(self) -> pd.DataFrame:
+        if not self.paper_counts:
+            return pd.DataFrame()
+        topics = sorted(self.paper_counts)
+        analysis_df = pd.DataFrame({'sub_fields': topics, 'paper_count': [self.paper_counts[t] for t in topics]})
+
+        if self._has_rating_column and self._rating_count:
+            analysis_df['avg_rating'] = [self._rating_sum[t] / self._rating_count[t] if self._rating_count[t]
+                                         else np.nan for t in topics]
+
+        if self._has_decision_column:
+            decision_types = sorted({d for counts in self._decisions.values() for d in counts})
+            for dtype in decision_types:
+                analysis_df[dtype] = [self._decisions[t][dtype] for t in topics]
+            analysis_df = analysis_df.fillna(0)
+
+            for dtype in ['Oral', 'Spotlight', 'Poster', 'Reject', 'N/A']:
+                if dtype not in analysis_df.columns:
+                    analysis_df[dtype] = 0
+
+            accepted = analysis_df.get('Oral', 0) + analysis_df.get('Spotlight', 0) + analysis_df.get('Poster', 0)
+            total_decision = accepted + analysis_df.get('Reject', 0)
+            analysis_df['acceptance_rate'] = (accepted / total_decision.where(total_decision != 0, np.nan)).fillna(0)
+
+        analysis_df.rename(columns={'sub_fields': 'Topic_Name'}, inplace=True)
+        return analysis_df
+
+
 def _create_analysis_df(df: pd.DataFrame, trend_config: dict) -> pd.DataFrame:
     df['sub_fields'] = df.apply(lambda row: _classify_paper_subfields(row, trend_config), axis=1)
     df_exploded = df.explode('sub_fields').dropna(subset=['sub_fields'])
@@ -142,12 +229,13 @@ def _save_summary_table(df, title, path_base, top_n=65):
         f.write(styler.to_html())
 
 
-def _plot_cross_year_trends(df, title, path):
-    df_exploded = df.explode('sub_fields').dropna(subset=['sub_fields'])
-    if df_exploded.empty or df_exploded['year'].nunique() < 2:
+def _plot_cross_year_trends(counts_by_year: Dict[Any, Counter], title, path):
+    counts_by_year = {int(year): counts for year, counts in counts_by_year.items()
+                      if counts and str(year).strip().isdigit()}
+    if len(counts_by_year) < 2:
         logger.warning(f"Skipping cross-year trend plot for '{title}': requires data from at least 2 years.")
         return
-    pivot = df_exploded.groupby(['year', 'sub_fields']).size().unstack(fill_value=0)
+    pivot = pd.DataFrame.from_dict(counts_by_year, orient='index').fillna(0)
     top_sub_fields = pivot.sum().nlargest(12).index
     pivot = pivot[top_sub_fields]
     pivot_percent = pivot.div(pivot.sum(axis=1), axis=0) * 100
@@ -164,12 +252,18 @@ def _plot_cross_year_trends(df, title, path):
     plt.close()
 
 
-def run_single_task_analysis(papers: list, task_name: str, output_dir: Path):
-    trend_config = _load_trend_config()
-    if not trend_config or not papers: return
+def run_single_task_analysis(papers: Union[Iterable[dict], TopicStats], task_name: str, output_dir: Path):
+    """单任务分析。papers 可以是论文列表，也可以是流水线中已累加好的 TopicStats。"""
+    if isinstance(papers, TopicStats):
+        stats = papers
+    else:
+        trend_config = _load_trend_config()
+        if not trend_config or not papers: return
+        stats = TopicStats(trend_config)
+        for paper in papers:
+            stats.add(paper)
 
-    df = pd.DataFrame(papers)
-    analysis_df = _create_analysis_df(df, trend_config)
+    analysis_df = stats.to_dataframe()
     if analysis_df.empty:
         logger.warning(f"No topics matched for {task_name}, skipping analysis plots.")
         return
@@ -190,20 +284,16 @@ def run_single_task_analysis(papers: list, task_name: str, output_dir: Path):
     logger.info(f"Single-task analysis for {task_name} completed.")
 
 
-def run_cross_year_analysis(papers: list, conference_name: str, output_dir: Path):
-    trend_config = _load_trend_config()
-    if not trend_config or not papers: return
-
-    df = pd.DataFrame(papers)
-    if 'year' not in df.columns or df['year'].isnull().all():
-        logger.warning(f"Skipping cross-year analysis for {conference_name}: 'year' column not found or is empty.")
-        return
-
-    df['sub_fields'] = df.apply(lambda row: _classify_paper_subfields(row, trend_config), axis=1)
+def run_cross_year_analysis(counts_by_year: Dict[Any, Counter], conference_name: str, output_dir: Path):
+    """
+    跨年趋势分析。只需要每年各子方向的论文数 ({year: Counter})，
+    即各任务 TopicStats.paper_counts 的汇总，无需保留论文本身。
+    """
+    if not counts_by_year: return
 
     _plot_cross_year_trends(
-        df,
+        counts_by_year,
         f"Sub-Field Trends at {conference_name} Over Time",
         output_dir / f"trends_{conference_name}.png"
     )
-    logger.info(f"Cross-year analysis for {conference_name} completed.")
\ No newline at end of file
+    logger.info(f"Cross-year analysis for {conference_name} completed.")
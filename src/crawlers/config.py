@@ -1,6 +1,7 @@
 # FILE: src/config.py (Structured Logging)
 
 import logging
+import re
 from pathlib import Path
 
 # 导入 Tqdm 日志处理器和彩色格式化器
@@ -13,11 +14,19 @@ ROOT_DIR = Path(__file__).parent.parent.parent
 
 OUTPUT_DIR = ROOT_DIR / "output"
 LOG_DIR = ROOT_DIR / "logs" # <-- 现在这个 logs 路径也正确了
+TASK_LOG_DIR = LOG_DIR / "tasks"
 CONFIG_FILE = ROOT_DIR / "configs" / "tasks.yaml" # <-- 现在这个 configs 路径也正确了
 
 METADATA_OUTPUT_DIR = OUTPUT_DIR / "metadata"
+METADATA_STORE_DIR = OUTPUT_DIR / "dataset"  # 按 conference=/year= 分区的 Parquet 元数据数据集
 PDF_DOWNLOAD_DIR = OUTPUT_DIR / "pdfs"
 TRENDS_OUTPUT_DIR = OUTPUT_DIR / "trends"
+HTTP_CACHE_DIR = OUTPUT_DIR / "http_cache"
+CHECKPOINT_DIR = OUTPUT_DIR / "checkpoints"
+STATE_DIR = OUTPUT_DIR / "state"  # 跨运行保存的抓取状态 (如 arXiv OAI-PMH 水位线)
+DOWNLOAD_QUEUE_DIR = STATE_DIR / "downloads"  # 每个任务的持久化 PDF 下载队列
+PDF_STORE_DIR = OUTPUT_DIR / "pdf_store"  # 内容寻址 PDF 仓库 (output/pdfs/ 下是指向它的视图)
+PDF_TEXT_DIR = PDF_STORE_DIR / "text"  # PDF 全文的 gzip 旁路存储 (按内容哈希命名)
 
 # --- Create Directories ---
 # 这部分代码现在可以正常工作了
@@ -26,10 +35,10 @@ LOG_DIR.mkdir(exist_ok=True)
 
 
 # --- Logging Configuration (核心修改点) ---
-def get_logger(name: str, log_file: Path = LOG_DIR / "pubcrawler.log") -> logging.Logger:
+def get_logger(name: str, log_file: Path = LOG_DIR / "pubcrawler.log", console_level: int = logging.INFO) -> logging.Logger:
     """
     配置并返回一个日志记录器。
-    - 控制台输出: 简洁、彩色、结构化的信息。
+    - 控制台输出: 简洁、彩色、结构化的信息 (级别由 console_level 控制)。
     - 文件输出: 包含完整 Traceback 的详细信息，用于调试。
     """
     logger = logging.getLogger(name)
@@ -38,7 +47,7 @@ def get_logger(name: str, log_file: Path = LOG_DIR / "pubcrawler.log") -> loggin
 
         # 1. 控制台处理器 (使用 Tqdm 安全处理器和新的结构化彩色格式)
         tqdm_handler = TqdmLoggingHandler()
-        tqdm_handler.setLevel(logging.INFO)
+        tqdm_handler.setLevel(console_level)
         # --- 新的结构化格式 ---
         # %(levelname)s 会被 ColoredFormatter 转换成带颜色的标识
         console_format = f"{COLORS['STEP']}[%(levelname)s]{COLORS['RESET']} %(message)s"
@@ -57,4 +66,16 @@ def get_logger(name: str, log_file: Path = LOG_DIR / "pubcrawler.log") -> loggin
 
         logger.propagate = False # 防止日志向上传播到 root logger
 
-    return logger
\ No newline at end of file
+    return logger
+
+
+def get_task_logger(task_name: str) -> logging.Logger:
+    """
+    为并发调度中的单个任务创建独立的日志记录器。
+    - 完整日志写入 logs/tasks/<task_name>.log，互不交织。
+    - 控制台只显示 WARNING 及以上级别，避免干扰合并后的进度显示。
+    """
+    TASK_LOG_DIR.mkdir(parents=True, exist_ok=True)
+    safe_name = re.sub(r'[\\/*?:"<>|\s]', "_", task_name)
+    return get_logger(f"pubcrawler.task.{safe_name}", log_file=TASK_LOG_DIR / f"{safe_name}.log",
+                      console_level=logging.WARNING)
@@ -2,14 +2,24 @@
 
 import logging
 import os
-import requests
+import queue
+import threading
+import time
 import zipfile
 import re
-from typing import Iterator, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Dict, Any, Optional
 from tqdm import tqdm
 
+from src.utils.download_manager import iter_download
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+DEFAULT_WORKERS = 4               # Concurrent PDF downloads feeding the zip writer
+DEFAULT_QUEUE_CHUNKS = 32         # Chunks buffered per download while the writer is busy
+CHUNK_SIZE = 64 * 1024
+SUMMARY_BUFFER_SIZE = 1024 * 1024
+
 
 class Processor:
     """
@@ -18,9 +28,12 @@ class Processor:
     - A compressed .zip file containing all downloaded PDFs.
     """
 
-    def __init__(self, output_dir: str = 'output', download_pdfs: bool = False):
+    def __init__(self, output_dir: str = 'output', download_pdfs: bool = False, max_workers: int = DEFAULT_WORKERS,
+                 queue_chunks: int = DEFAULT_QUEUE_CHUNKS):
         self.output_dir = output_dir
         self.download_pdfs = download_pdfs
+        self.max_workers = max_workers
+        self.queue_chunks = queue_chunks
         self.summary_path = os.path.join(self.output_dir, 'summary.txt')
         self.zip_path = os.path.join(self.output_dir, 'papers.zip')
 
@@ -38,11 +51,13 @@ class Processor:
         """Formats a single paper's data into the specified text format."""
         # Safely get all required fields
         title = paper_data.get('title', 'N/A')
-        authors = ", ".join(paper_data.get('authors', []))
+        authors = paper_data.get('authors', [])
+        if not isinstance(authors, str):
+            authors = ", ".join(authors)
         conference = paper_data.get('conference', 'N/A')
         year = paper_data.get('year', 'N/A')
         source_url = paper_data.get('source_url', 'N/A')
-        pdf_link = paper_data.get('pdf_link', 'N/A')
+        pdf_link = paper_data.get('pdf_link') or paper_data.get('pdf_url') or 'N/A'
         abstract = paper_data.get('abstract', 'No abstract available.')
         reviews = paper_data.get('reviews', [])
 
@@ -76,38 +91,18 @@ class Processor:
         entry.append("=" * 80 + "\n\n")
         return "\n".join(entry)
 
-    def _download_pdf(self, pdf_url: str, filename: str, zip_file: zipfile.ZipFile):
-        """Downloads a PDF in streaming fashion and adds it to the zip archive."""
+    def _submit_pdf(self, pdf_url: str, filename: str, archive: 'StreamingZipArchiver'):
+        """Queues a PDF for concurrent download straight into the zip archive."""
         if not pdf_url:
             logging.warning(f"Skipping download for '{filename}' due to missing URL.")
             return
-
-        temp_pdf_path = os.path.join(self.output_dir, filename)
-        try:
-            logging.info(f"Downloading: {pdf_url}")
-            with requests.get(pdf_url, stream=True, timeout=30, headers=HEADERS) as r:
-                r.raise_for_status()
-                with open(temp_pdf_path, 'wb') as f:
-                    # Download in chunks to keep memory usage low
-                    for chunk in r.iter_content(chunk_size=8192):
-                        f.write(chunk)
-
-            # Add the downloaded file to the zip archive
-            zip_file.write(temp_pdf_path, arcname=filename)
-            logging.info(f"Added to zip: {filename}")
-
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to download {pdf_url}: {e}")
-        except Exception as e:
-            logging.error(f"An error occurred while handling {filename}: {e}")
-        finally:
-            # Clean up the temporary PDF file
-            if os.path.exists(temp_pdf_path):
-                os.remove(temp_pdf_path)
+        archive.submit(pdf_url, filename)
 
     def process_papers(self, papers_iterator: Iterator[Dict[str, Any]], total: int):
         """
         The main processing pipeline. Iterates through papers and writes to files.
+        The summary file stays open (buffered) for the whole run; PDFs are downloaded
+        concurrently and streamed into the zip archive by a single writer thread.
         """
         logging.info("Starting paper processing pipeline...")
         logging.info(f"Summary will be saved to: {self.summary_path}")
@@ -116,28 +111,163 @@ class Processor:
         else:
             logging.info("PDF download is disabled.")
 
-        # Clear summary file at the start of a run
-        with open(self.summary_path, 'w', encoding='utf-8') as f:
-            f.write("--- PubCrawler Summary ---\n\n")
-
         try:
-            with zipfile.ZipFile(self.zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            with open(self.summary_path, 'w', encoding='utf-8', buffering=SUMMARY_BUFFER_SIZE) as summary, \
+                    StreamingZipArchiver(self.zip_path, max_workers=self.max_workers,
+                                         queue_chunks=self.queue_chunks) as archive:
+                summary.write("--- PubCrawler Summary ---\n\n")
                 # Use tqdm for a nice progress bar
                 pbar = tqdm(papers_iterator, total=total, desc="Processing papers")
                 for paper_data in pbar:
                     # 1. Format and append to summary.txt
-                    summary_entry = self._format_summary_entry(paper_data)
-                    with open(self.summary_path, 'a', encoding='utf-8') as f:
-                        f.write(summary_entry)
+                    summary.write(self._format_summary_entry(paper_data))
 
                     # 2. Download PDF if enabled
                     if self.download_pdfs:
                         filename = self._sanitize_filename(paper_data.get('title', 'untitled'))
-                        self._download_pdf(paper_data.get('pdf_link'), filename, zipf)
+                        self._submit_pdf(paper_data.get('pdf_link') or paper_data.get('pdf_url'), filename, archive)
 
         except Exception as e:
             logging.error(f"A critical error occurred during processing: {e}")
 
         logging.info("Processing pipeline complete.")
 
+
+class _ZipEntry:
+    """One archive member: a bounded queue of chunks filled by a download thread."""
+
+    def __init__(self, arcname: str, max_chunks: int):
+        self.arcname = arcname
+        self.chunks: "queue.Queue[Any]" = queue.Queue(maxsize=max_chunks)
+        self.error: Optional[BaseException] = None
+
+    def put(self, chunk: bytes):
+        # Blocks while the writer is busy with another entry (back-pressure on the download)
+        self.chunks.put(chunk)
+
+    def finish(self, error: Optional[BaseException] = None):
+        self.error = error
+        self.chunks.put(_END_OF_ENTRY)
+
+
+_END_OF_ENTRY = object()
+
+
+class StreamingZipArchiver:
+    """
+    Streams PDFs from HTTP straight into a zip archive, without temporary files.
+
+    - Downloads run concurrently in a thread pool; each one feeds its chunks into a
+      bounded queue, so memory use is capped at max_workers * queue_chunks chunks.
+    - A single writer thread owns the ZipFile and copies one entry at a time into
+      ZipFile.open(name, 'w'), in the order the downloads start returning data.
+    - Dropped connections are resumed with HTTP Range requests (iter_download).
+      A download that fails before its first chunk leaves no entry. One that still
+      fails mid-stream cannot be taken back out of the archive: it is counted as
+      failed and listed in a TRUNCATED.txt entry written when the archive closes.
+    """
+
+    TRUNCATED_LIST = "TRUNCATED.txt"
+
+    def __init__(self, zip_path: str, max_workers: int = DEFAULT_WORKERS, queue_chunks: int = DEFAULT_QUEUE_CHUNKS,
+                 compression: int = zipfile.ZIP_DEFLATED):
+        self.zip_path = zip_path
+        self.queue_chunks = max(1, int(queue_chunks))
+        self.compression = compression
+        self.added = 0
+        self.failed = 0
+        self.truncated = []
+        # failed is updated from the download threads, added/truncated from the writer thread
+        self._stats_lock = threading.Lock()
+        self._names = set()
+        self._entries: "queue.Queue[Optional[_ZipEntry]]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix='zip-download')
+        # Bounds the number of queued + running downloads so a fast paper iterator cannot run ahead unboundedly
+        self._slots = threading.BoundedSemaphore(max(1, int(max_workers)) * 2)
+        self._zip = zipfile.ZipFile(zip_path, 'w', compression)
+        self._writer = threading.Thread(target=self._write_entries, name='zip-writer', daemon=True)
+        self._writer.start()
+
+    def submit(self, pdf_url: str, filename: str):
+        arcname = self._unique_name(filename)
+        self._slots.acquire()
+        self._executor.submit(self._download, pdf_url, arcname)
+
+    def _unique_name(self, filename: str) -> str:
+        stem, ext = os.path.splitext(filename)
+        arcname, n = filename, 1
+        while arcname in self._names:
+            n += 1
+            arcname = f"{stem} ({n}){ext}"
+        self._names.add(arcname)
+        return arcname
+
+    def _download(self, pdf_url: str, arcname: str):
+        entry = None
+        try:
+            logging.info(f"Downloading: {pdf_url}")
+            for chunk in iter_download(pdf_url, chunk_size=CHUNK_SIZE):
+                if entry is None:
+                    # Register the entry only once data arrives: failed requests leave nothing in the archive
+                    entry = _ZipEntry(arcname, self.queue_chunks)
+                    self._entries.put(entry)
+                entry.put(chunk)
+            if entry is None:
+                entry = _ZipEntry(arcname, self.queue_chunks)
+                self._entries.put(entry)
+            entry.finish()
+        except Exception as e:
+            with self._stats_lock:
+                self.failed += 1
+            logging.error(f"Failed to download {pdf_url}: {e}")
+            if entry is not None:
+                entry.finish(e)
+        finally:
+            self._slots.release()
+
+    def _write_entries(self):
+        while True:
+            entry = self._entries.get()
+            if entry is None:
+                return
+            try:
+                info = zipfile.ZipInfo(entry.arcname, date_time=time.localtime()[:6])
+                info.compress_type = self.compression
+                with self._zip.open(info, 'w', force_zip64=True) as dest:
+                    for chunk in iter(entry.chunks.get, _END_OF_ENTRY):
+                        dest.write(chunk)
+                if entry.error is None:
+                    with self._stats_lock:
+                        self.added += 1
+                    logging.info(f"Added to zip: {entry.arcname}")
+                else:
+                    # Already counted as failed by the download thread
+                    with self._stats_lock:
+                        self.truncated.append(entry.arcname)
+                    logging.error(f"Zip entry '{entry.arcname}' is truncated: {entry.error}")
+            except Exception as e:
+                logging.error(f"An error occurred while handling {entry.arcname}: {e}")
+                # Keep draining so the download thread is never blocked on a full queue
+                for _ in iter(entry.chunks.get, _END_OF_ENTRY):
+                    pass
+
+    def close(self):
+        """Waits for all downloads, then for the writer to flush the last entry, and closes the archive."""
+        self._executor.shutdown(wait=True)
+        self._entries.put(None)
+        self._writer.join()
+        if self.truncated:
+            self._zip.writestr(self._unique_name(self.TRUNCATED_LIST),
+                               "Incomplete PDFs (download failed mid-stream):\n" + "\n".join(sorted(self.truncated)) + "\n")
+        self._zip.close()
+        logging.info(f"Zip archive complete: {self.added} PDFs added, {self.failed} failed"
+                     f"{f' ({len(self.truncated)} truncated)' if self.truncated else ''}.")
+
+    def __enter__(self) -> 'StreamingZipArchiver':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
 # END OF FILE: src/processor.py
\ No newline at end of file
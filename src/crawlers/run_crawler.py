@@ -1,16 +1,22 @@
 # FILE: src/main.py (Optimized for Memory)
 
-import time
-import yaml
+import logging
 import re
+import sys
+import threading
+from typing import Iterable, Iterator, Optional
+import yaml
 import pandas as pd
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import partial
 from pathlib import Path
-from tqdm import tqdm
+from urllib.parse import urlparse
 
 # --- 导入所有独立的 Scraper ---
 from src.scrapers.iclr_scraper import IclrScraper
 from src.scrapers.neurips_scraper import NeuripsScraper
+from src.scrapers.openreview_scraper import OpenReviewScraper
+from src.scrapers.parsers import configure_parsers, shutdown_parse_pool
 from src.scrapers.icml_scraper import IcmlScraper
 from src.scrapers.acl_scraper import AclScraper
 from src.scrapers.arxiv_scraper import ArxivScraper
@@ -18,15 +24,27 @@ from src.scrapers.cvf_scraper import CvfScraper
 from src.scrapers.aaai_scraper import AaaiScraper
 from src.scrapers.kdd_scraper import KddScraper
 
-from src.crawlers.config import get_logger, CONFIG_FILE, METADATA_OUTPUT_DIR, PDF_DOWNLOAD_DIR, TRENDS_OUTPUT_DIR, \
-    LOG_DIR
+from src.crawlers.config import get_logger, get_task_logger, CONFIG_FILE, METADATA_OUTPUT_DIR, PDF_DOWNLOAD_DIR, \
+    TRENDS_OUTPUT_DIR, LOG_DIR, TASK_LOG_DIR, HTTP_CACHE_DIR, CHECKPOINT_DIR, \
+    STATE_DIR, DOWNLOAD_QUEUE_DIR, PDF_STORE_DIR, PDF_TEXT_DIR, METADATA_STORE_DIR
+from src.crawlers.scheduler import ScheduledTask, TaskScheduler
 from src.scrapers.tpami_scraper import TpamiScraper
 # --- 【修改点】: 导入 save_as_markdown 和 generate_wordcloud_from_papers ---
-from src.utils.formatter import save_as_csv, save_as_markdown
-from src.analysis.analyzer import generate_wordcloud_from_papers
+from src.utils.formatter import StreamingCsvWriter, StreamingMarkdownWriter
+from src.analysis.analyzer import WordFrequencyCounter
 # ----------------------------------------------------------------------
-from src.utils.downloader import download_single_pdf
-from src.analysis.trends import run_single_task_analysis, run_cross_year_analysis
+from src.utils.download_manager import DownloadManager, DEFAULT_DOWNLOAD_WORKERS, DEFAULT_PER_HOST
+from src.utils.pdf_store import configure_pdf_store, get_pdf_store
+from src.utils.pdf_text import configure_text_extraction, run_text_extraction
+from src.utils.metadata_store import configure_metadata_store, csv_files_without_partition, get_metadata_store
+from src.utils.network_utils import configure_http_client
+from src.utils.rate_limiter import configure_rate_limits
+from src.utils.http_cache import configure_response_cache
+from src.utils.checkpoint import CheckpointJournal
+from src.utils.browser_pool import configure_browser_pool, shutdown_browser_pool
+from src.utils.paper_filter import PaperFilter
+from src.utils.incremental import load_latest_dataset, index_by_id, merge_papers, prune_superseded
+from src.analysis.trends import TopicStats, run_single_task_analysis, run_cross_year_analysis, _load_trend_config
 from src.utils.console_logger import print_banner, COLORS
 
 OPERATION_MODE = "collect_and_analyze"
@@ -36,13 +54,15 @@ logger = get_logger(__name__)
 # --- Scraper 和 Conference 定义 (保持不变) ---
 SCRAPER_MAPPING = {"iclr": IclrScraper, "neurips": NeuripsScraper, "icml": IcmlScraper, "acl": AclScraper,
                    "cvf": CvfScraper, "aaai": AaaiScraper, "kdd": KddScraper, "arxiv": ArxivScraper,
-                   "tpami": TpamiScraper}
+                   "tpami": TpamiScraper, "openreview": OpenReviewScraper}
 CONF_TO_DEF_SOURCE = {'ICLR': 'openreview', 'NeurIPS': 'openreview', 'ICML': 'html_pmlr', 'ACL': 'html_acl',
                       'EMNLP': 'html_acl', 'NAACL': 'html_acl', 'CVPR': 'html_cvf', 'ICCV': 'html_cvf',
                       'AAAI': 'selenium', 'KDD': 'selenium'}
 
-# 定义哪些爬虫类型支持并发优化，以便在主程序中给出提示
-CONCURRENT_SCRAPER_TYPES = ['acl', 'cvf']
+# 定义哪些爬虫类型使用异步详情页抓取引擎，以便在主程序中给出提示
+CONCURRENT_SCRAPER_TYPES = ['acl', 'cvf', 'aaai', 'kdd']
+
+_PLOT_LOCK = threading.Lock()
 
 
 def load_config():
@@ -57,11 +77,20 @@ def build_task_info(task: dict, source_definitions: dict) -> dict:
     # 此函数逻辑保持不变
     task_info = task.copy()
     conf, year, source_type = task.get('conference'), task.get('year'), task.get('source_type')
+    if source_type == 'arxiv' and task.get('harvest_mode') == 'oai':
+        # OAI-PMH 水位线按任务名保存，每日任务只抓取上次成功运行以来有变更的记录
+        safe_name = re.sub(r'[\\/*?:"<>|\s]', "_", task.get('name', 'arxiv'))
+        task_info.setdefault('watermark_file', str(STATE_DIR / f"{safe_name}.oai_watermark.json"))
     if source_type in ['arxiv', 'tpami']: return task_info
+    # 通用 OpenReview 任务可直接给出 venue_id (如 TMLR、workshop)，无需在 source_definitions 中登记
+    if source_type == 'openreview' and task.get('venue_id'):
+        task_info['venue_id'] = str(task['venue_id']).replace('YYYY', str(year))
+        task_info.setdefault('api_version', 'v2')
+        return task_info
     if not conf or not year:
         logger.error(f"[✖ ERROR] Task '{task.get('name')}' is missing 'conference' or 'year'.");
         return None
-    def_source_key = CONF_TO_DEF_SOURCE.get(conf)
+    def_source_key = 'openreview' if source_type == 'openreview' else CONF_TO_DEF_SOURCE.get(conf)
     if not def_source_key:
         logger.error(f"[✖ ERROR] No definition source found for conference '{conf}'.");
         return None
@@ -89,134 +118,400 @@ def build_task_info(task: dict, source_definitions: dict) -> dict:
     return task_info
 
 
-def filter_papers(papers: list, filters: list) -> list:
-    # 此函数逻辑保持不变
-    if not filters: return papers
-    original_count = len(papers)
-    filter_regex = re.compile('|'.join(filters), re.IGNORECASE)
-    filtered_papers = [p for p in papers if filter_regex.search(p.get('title', '') + ' ' + p.get('abstract', ''))]
-    logger.info(
-        f"    {COLORS['STEP']}-> Filtered papers: {original_count} -> {len(filtered_papers)} using filters: {filters}")
-    return filtered_papers
+def filter_papers(papers: Iterable[dict], filters: list, task_logger: logging.Logger = logger) -> Iterator[dict]:
+    """流式过滤: 逐篇产出匹配 filters 的论文，遍历结束后记录过滤前后的数量。"""
+    if not filters:
+        yield from papers
+        return
+    original_count, kept_count = 0, 0
+    paper_filter = PaperFilter(filters)
+    for paper in papers:
+        original_count += 1
+        if paper_filter.matches(paper):
+            kept_count += 1
+            yield paper
+    task_logger.info(
+        f"    {COLORS['STEP']}-> Filtered papers: {original_count} -> {kept_count} using filters: {filters}")
+
+
+def get_task_name(task: dict) -> str:
+    return task.get('name', f"{task.get('conference')}_{task.get('year')}")
+
+
+def get_task_hosts(task_info: dict) -> set:
+    """推断任务会访问的主机，供调度器做按主机的并发限制。"""
+    source_type = task_info.get('source_type')
+    if source_type in ('iclr', 'neurips', 'openreview'):
+        return {'api.openreview.net' if task_info.get('api_version') == 'v1' else 'api2.openreview.net'}
+    if source_type == 'arxiv':
+        return {'export.arxiv.org'}
+    if source_type == 'tpami':
+        return {'ieeexplore.ieee.org'}
+    host = urlparse(task_info.get('url', '')).hostname
+    return {host} if host else set()
+
+
+def _log_file_path(task_logger: logging.Logger) -> Path:
+    """返回记录器实际写入的日志文件 (并发调度时为 logs/tasks/<task_name>.log)。"""
+    for handler in task_logger.handlers:
+        if isinstance(handler, logging.FileHandler):
+            return Path(handler.baseFilename)
+    return LOG_DIR / 'pubcrawler.log'
+
+
+def run_single_task(task: dict, source_definitions: dict, perform_single_analysis: bool,
+                    task_logger: logging.Logger = logger, task_info: Optional[dict] = None) -> Optional[TopicStats]:
+    """
+    执行单个任务: 以流水线方式抓取、过滤、保存、下载与单任务分析，内存占用不随论文数量增长。
+    task_info 为调用方已由 build_task_info 构建好的任务信息 (并发调度时使用)，为 None 时在此构建。
+    返回该任务的主题统计 (供跨年分析汇总)，失败或无结果时返回 None。
+    """
+    task_name = get_task_name(task)
+    task_logger.info(f"{COLORS['TASK_START']}[▶] STARTING TASK: {task_name}{COLORS['RESET']}")
+
+    # --- 新增的提示信息 ---
+    source_type = task.get('source_type')
+    # ACL 默认使用卷级导出文件，CVF 的 index_only 模式只读索引页，ICML 仅在补全摘要时才需要逐一访问详情页，
+    # AAAI / KDD 在 fetch_details: false 或只使用浏览器时不经过异步引擎
+    needs_detail_pages = source_type in CONCURRENT_SCRAPER_TYPES and not (
+        (source_type == 'acl' and task.get('bulk_metadata', True))
+        or (source_type == 'cvf' and task.get('fetch_mode') == 'index_only')
+        or (source_type in ('aaai', 'kdd') and (not task.get('fetch_details', True)
+                                                 or task.get('fetch_mode') == 'browser')))
+    needs_detail_pages |= source_type == 'icml' and bool(task.get('enrich_abstracts'))
+    if needs_detail_pages:
+        max_workers = task.get('max_workers', 8)
+        max_concurrency = task.get('max_concurrency', 100)
+        task_logger.info(f"    {COLORS['STEP']}[!] 注意: 此任务类型 ({source_type}) 需要逐一访问论文详情页。")
+        task_logger.info(
+            f"    {COLORS['STEP']}    已启用异步抓取引擎 (每主机 {max_workers} 个连接, 最多 {max_concurrency} 个在途请求)。")
+
+    scraper_class = SCRAPER_MAPPING.get(source_type)
+    if not scraper_class:
+        task_logger.error(
+            f"{COLORS['ERROR']}[✖ FAILURE] No scraper for source: '{task['source_type']}'{COLORS['RESET']}\n");
+        return None
+
+    if task_info is None:
+        task_info = build_task_info(task, source_definitions)
+    if not task_info:
+        task_logger.error(
+            f"{COLORS['ERROR']}[✖ FAILURE] Could not build task info for '{task_name}'.{COLORS['RESET']}\n");
+        return None
 
+    # 断点续爬日志: 已完成的详情页/note 会被记录，任务中断后重新运行时从断点继续
+    checkpoint = None
+    if task.get('resume', True):
+        checkpoint = CheckpointJournal.for_task(CHECKPOINT_DIR, task_name)
+        if len(checkpoint):
+            task_logger.info(f"    {COLORS['STEP']}-> 发现未完成的检查点 ({len(checkpoint)} 条记录)，将从断点继续。")
+
+    conf, year = task.get('conference', 'Misc'), task.get('year', 'Latest')
+    metadata_dir = METADATA_OUTPUT_DIR / conf / str(year)
+
+    # 增量模式: 与已保存的数据集比对，只抓取新增或有更新的论文，再按 id 合并
+    incremental = task.get('incremental', False)
+    metadata_store = get_metadata_store()
+    existing_papers = []
+    if incremental:
+        if metadata_store is not None:
+            existing_papers = metadata_store.load_task(task_name, conf, year)
+        # 启用 Parquet 数据集之前保存的任务: 回退到最新的 CSV
+        if not existing_papers:
+            existing_papers = load_latest_dataset(task_name, metadata_dir)
+    if incremental:
+        task_logger.info(f"    {COLORS['STEP']}-> [增量模式] 已有数据集包含 {len(existing_papers)} 篇论文。")
+
+    csv_writer = md_writer = dataset_writer = None
+    # 过滤下推: 抓取器在详情页/审稿请求之前按已有字段提前排除不匹配的论文，最终仍由 filter_papers 精确过滤
+    paper_filter = PaperFilter.from_task(task)
+    try:
+        scraper = scraper_class(task_info, task_logger, checkpoint=checkpoint,
+                                known_papers=index_by_id(existing_papers), paper_filter=paper_filter)
+        # 流水线: 抓取 -> 过滤 -> (增量合并) -> 写 CSV/Markdown、下载 PDF、累加统计，逐篇处理
+        papers = filter_papers(scraper.iter_papers(), task.get('filters', []), task_logger)
+        new_papers = None
+
+        if incremental and existing_papers:
+            # 新增/更新的论文通常只占一小部分，收集后按 id 合并进已有数据集
+            new_papers = list(papers)
+            if not new_papers:
+                task_logger.info(
+                    f"{COLORS['SUCCESS']}[✔ SUCCESS] Task '{task_name}' has no new or updated papers.{COLORS['RESET']}\n")
+                if checkpoint is not None:
+                    checkpoint.clear()
+                scraper.commit_state()
+                return _collect_stats(existing_papers)
+            task_logger.info(f"    {COLORS['STEP']}-> [增量模式] {len(new_papers)} 篇新增或有更新，合并到已有数据集。")
+            papers = merge_papers(existing_papers, new_papers)
+
+        metadata_dir.mkdir(exist_ok=True, parents=True)
+        # Parquet 数据集是主数据存储；未启用 (或未安装 pyarrow) 时 CSV 仍是唯一的数据文件
+        if metadata_store is None or metadata_store.csv_export:
+            csv_writer = StreamingCsvWriter(task_name, metadata_dir)
+        if metadata_store is not None:
+            dataset_writer = metadata_store.writer(task_name, conf, year)
+        md_writer = StreamingMarkdownWriter(task_name, metadata_dir)
+        word_counter = WordFrequencyCounter()
+        stats = TopicStats(_load_trend_config())
+
+        download_pdfs = task.get('download_pdfs', False)
+        pdf_dir = PDF_DOWNLOAD_DIR / conf / str(year)
+        downloads = None
+        if download_pdfs:
+            # 并发下载 (不阻塞写 CSV/Markdown)，下载队列持久化，中断后重新运行会继续未完成的文件
+            downloads = DownloadManager(
+                pdf_dir, queue=CheckpointJournal.for_task(DOWNLOAD_QUEUE_DIR, task_name),
+                max_workers=task.get('download_workers', DEFAULT_DOWNLOAD_WORKERS),
+                per_host=task.get('download_per_host', DEFAULT_PER_HOST), store=get_pdf_store(),
+                task_logger=task_logger, desc=f"    -> Downloading PDFs for {task_name}")
 
-def run_tasks_sequentially(tasks_to_run: list, source_definitions: dict, perform_single_analysis: bool) -> list:
+        try:
+            for paper in papers:
+                paper['year'] = task.get('year')
+                paper['conference'] = task.get('conference')
+                if dataset_writer is not None:
+                    dataset_writer.write(paper)
+                if csv_writer is not None:
+                    csv_writer.write(paper)
+                md_writer.write(paper)
+                word_counter.add(paper)
+                stats.add(paper)
+                # 增量模式下只下载新增/更新的论文 (见下方)
+                if downloads is not None and new_papers is None:
+                    downloads.submit(paper)
+            if downloads is not None and new_papers is not None:
+                for paper in new_papers:
+                    downloads.submit(paper)
+        finally:
+            if downloads is not None:
+                # 任务异常或被中断时不再等待排队中的下载，它们留在下载队列中
+                downloads.close(cancel=sys.exc_info()[0] is not None)
+
+        if paper_filter.fetches_avoided:
+            task_logger.info(
+                f"    {COLORS['STEP']}-> [过滤下推] 提前过滤省去了 {paper_filter.fetches_avoided} 次详情页/审稿请求。")
+
+        if md_writer.count:
+            task_logger.info(
+                f"    {COLORS['STEP']}-> Successfully processed {md_writer.count} papers for '{task_name}'.")
+
+            task_logger.info(f"{COLORS['PHASE']}--- Processing & Saving Results for '{task_name}' ---{COLORS['RESET']}")
+
+            # --- 【新增功能】: 生成词云图和Markdown报告 ---
+            task_logger.info(f"    -> Generating word cloud...")
+            wordcloud_path = metadata_dir / f"{task_name}_wordcloud.png"
+            wordcloud_success = word_counter.save_wordcloud(wordcloud_path)
+            final_wordcloud_path = str(wordcloud_path) if wordcloud_success else None
+
+            task_logger.info(f"    -> Saving results to Markdown report...")
+            md_writer.close(wordcloud_path=final_wordcloud_path)
+            # ----------------------------------------------------
+
+            if dataset_writer is not None:
+                task_logger.info(f"    -> Saving metadata to Parquet dataset: {dataset_writer.close()}")
+            csv_path = None
+            if csv_writer is not None:
+                task_logger.info(f"    -> Saving metadata to {metadata_dir}")
+                csv_path = csv_writer.close()
+            # 结果已落盘，检查点不再需要
+            if checkpoint is not None:
+                checkpoint.clear()
+            scraper.commit_state()
+            if incremental and csv_path:
+                # 合并后的 CSV 已包含全部数据，旧文件会让 analyze 模式重复统计
+                removed = prune_superseded(task_name, metadata_dir, keep=csv_path)
+                if removed:
+                    task_logger.info(f"    -> [增量模式] 已删除 {removed} 个被合并结果取代的旧 CSV。")
+
+            if perform_single_analysis:
+                analysis_output_dir = metadata_dir / "analysis"
+                analysis_output_dir.mkdir(exist_ok=True)
+                task_logger.info(f"    -> Running single-task analysis...")
+                # matplotlib 的 pyplot 接口不是线程安全的，并发调度时绘图需串行
+                with _PLOT_LOCK:
+                    run_single_task_analysis(stats, task_name, analysis_output_dir)
+
+            task_logger.info(
+                f"{COLORS['SUCCESS']}[✔ SUCCESS] Task '{task_name}' completed and saved.{COLORS['RESET']}\n")
+            return stats
+
+        md_writer.close()
+        for writer in (csv_writer, dataset_writer):
+            if writer is not None:
+                writer.close()
+        # 抓取正常结束但没有结果 (如 OAI-PMH 自上次运行以来没有变更)，状态同样可以前移
+        scraper.commit_state()
+        task_logger.warning(f"[⚠ WARNING] No papers found for task: {task_name} (or none matched filters)")
+        task_logger.info(f"{COLORS['WARNING']}[!] Task '{task_name}' finished with no results.{COLORS['RESET']}\n")
+
+    except Exception as e:
+        task_logger.critical(f"任务 '{task_name}' 遭遇严重错误，已终止。错误: {e}", exc_info=True)
+        task_logger.info(f"详细的错误堆栈信息已记录到日志文件: {_log_file_path(task_logger)}")
+        if checkpoint is not None and len(checkpoint):
+            task_logger.info(f"已完成的 {len(checkpoint)} 条结果保存在检查点中，重新运行该任务即可继续。")
+        for writer in (csv_writer, md_writer, dataset_writer):
+            if writer is not None:
+                writer.abort()
+
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+    return None
+
+
+def _collect_stats(papers: Iterable[dict]) -> TopicStats:
+    stats = TopicStats(_load_trend_config())
+    for paper in papers:
+        stats.add(paper)
+    return stats
+
+
+def _add_trend_counts(trend_counts: dict, task: dict, stats: Optional[TopicStats]):
+    """把单个任务的主题计数并入跨年分析所需的紧凑聚合 {conference: {year: Counter}}。"""
+    if stats is None or not stats.total_papers or not task.get('conference'):
+        return
+    trend_counts[task['conference']][task.get('year')].update(stats.paper_counts)
+
+
+def run_tasks_sequentially(tasks_to_run: list, source_definitions: dict, perform_single_analysis: bool) -> dict:
     """
-    顺序执行每个任务，并在每个任务完成后立即处理和保存结果，以节省内存。
-    返回所有任务收集到的论文总列表，用于后续的跨年分析。
+    顺序执行每个任务，每个任务以流水线方式处理和保存结果，以节省内存。
+    返回跨年分析所需的紧凑聚合 {conference: {year: Counter(子方向 -> 论文数)}}。
     """
-    all_collected_papers = []
+    trend_counts = defaultdict(lambda: defaultdict(Counter))
 
     for task in tasks_to_run:
-        task_name = task.get('name', f"{task.get('conference')}_{task.get('year')}")
         if not task.get('enabled', False):
             continue
+        stats = run_single_task(task, source_definitions, perform_single_analysis)
+        _add_trend_counts(trend_counts, task, stats)
 
-        logger.info(f"{COLORS['TASK_START']}[▶] STARTING TASK: {task_name}{COLORS['RESET']}")
+    return trend_counts
 
-        # --- 新增的提示信息 ---
-        source_type = task.get('source_type')
-        if source_type in CONCURRENT_SCRAPER_TYPES:
-            max_workers = task.get('max_workers', 1)  # 默认为1保证安全
-            logger.info(f"    {COLORS['STEP']}[!] 注意: 此任务类型 ({source_type}) 需要逐一访问论文详情页。")
-            logger.info(
-                f"    {COLORS['STEP']}    已启用 {max_workers} 个并发线程进行加速。尽管如此，如果论文数量庞大，仍可能需要较长时间。")
 
-        scraper_class = SCRAPER_MAPPING.get(source_type)
-        if not scraper_class:
-            logger.error(
-                f"{COLORS['ERROR']}[✖ FAILURE] No scraper for source: '{task['source_type']}'{COLORS['RESET']}\n");
+def run_tasks_concurrently(tasks_to_run: list, source_definitions: dict, perform_single_analysis: bool,
+                           max_concurrent_tasks: int = 4, per_host_tasks: int = 1) -> dict:
+    """
+    并发执行相互独立的任务 (例如 OpenReview 任务与 CVF 任务访问的是不同主机)。
+    - 每个任务使用独立的日志文件 (logs/tasks/<task_name>.log)，控制台显示合并后的任务进度。
+    - 访问同一主机的任务最多同时运行 per_host_tasks 个。
+    - 写入同一个 METADATA_OUTPUT_DIR/conf/year 目录的任务严格串行。
+    返回跨年分析所需的紧凑聚合 {conference: {year: Counter(子方向 -> 论文数)}}。
+    """
+    scheduled, task_by_name = [], {}
+    for task in tasks_to_run:
+        if not task.get('enabled', False):
             continue
-
+        task_name = get_task_name(task)
+        task_logger = get_task_logger(task_name)
+        # 只构建一次: 调度需要其中的主机列表，run_single_task 直接复用，配置错误不会被记录两次
         task_info = build_task_info(task, source_definitions)
         if not task_info:
-            logger.error(
-                f"{COLORS['ERROR']}[✖ FAILURE] Could not build task info for '{task_name}'.{COLORS['RESET']}\n");
+            task_logger.error(
+                f"{COLORS['ERROR']}[✖ FAILURE] Could not build task info for '{task_name}'.{COLORS['RESET']}\n")
             continue
-
-        try:
-            scraper = scraper_class(task_info, logger)
-            papers = scraper.scrape()
-            papers = filter_papers(papers, task.get('filters', []))
-
-            if papers:
-                for paper in papers:
-                    paper['year'] = task.get('year')
-                    paper['conference'] = task.get('conference')
-
-                logger.info(f"    {COLORS['STEP']}-> Successfully processed {len(papers)} papers for '{task_name}'.")
-
-                logger.info(f"{COLORS['PHASE']}--- Processing & Saving Results for '{task_name}' ---{COLORS['RESET']}")
-                conf, year = task.get('conference', 'Misc'), task.get('year', 'Latest')
-
-                metadata_dir = METADATA_OUTPUT_DIR / conf / str(year)
-                metadata_dir.mkdir(exist_ok=True, parents=True)
-
-                # --- 【新增功能】: 生成词云图和Markdown报告 ---
-                logger.info(f"    -> Generating word cloud...")
-                wordcloud_path = metadata_dir / f"{task_name}_wordcloud.png"
-                wordcloud_success = generate_wordcloud_from_papers(papers, wordcloud_path)
-                final_wordcloud_path = str(wordcloud_path) if wordcloud_success else None
-
-                logger.info(f"    -> Saving results to Markdown report...")
-                save_as_markdown(papers, task_name, metadata_dir, wordcloud_path=final_wordcloud_path)
-                # ----------------------------------------------------
-
-                logger.info(f"    -> Saving metadata to {metadata_dir}")
-                save_as_csv(papers, task_name, metadata_dir)
-
-                if task.get('download_pdfs', False):
-                    logger.info(f"    -> Starting PDF download...")
-                    pdf_dir = PDF_DOWNLOAD_DIR / conf / str(year)
-                    pdf_dir.mkdir(exist_ok=True, parents=True)
-                    pbar_desc = f"    -> Downloading PDFs for {task_name}"
-                    for paper in tqdm(papers, desc=pbar_desc, leave=True):
-                        download_single_pdf(paper, pdf_dir)
-
-                if perform_single_analysis:
-                    analysis_output_dir = metadata_dir / "analysis"
-                    analysis_output_dir.mkdir(exist_ok=True)
-                    logger.info(f"    -> Running single-task analysis...")
-                    run_single_task_analysis(papers, task_name, analysis_output_dir)
-
-                all_collected_papers.extend(papers)
-                logger.info(
-                    f"{COLORS['SUCCESS']}[✔ SUCCESS] Task '{task_name}' completed and saved.{COLORS['RESET']}\n")
-
-            else:
-                logger.warning(f"[⚠ WARNING] No papers found for task: {task_name} (or none matched filters)")
-                logger.info(f"{COLORS['WARNING']}[!] Task '{task_name}' finished with no results.{COLORS['RESET']}\n")
-
-        except Exception as e:
-            logger.critical(f"任务 '{task_name}' 遭遇严重错误，已终止。错误: {e}")
-            logger.info(f"详细的错误堆栈信息已记录到日志文件: {LOG_DIR / 'pubcrawler.log'}")
-
-        time.sleep(0.5)
-
-    return all_collected_papers
-
-
-def load_all_data_for_cross_analysis(metadata_dir: Path) -> list:
-    """在 'analyze' 模式下，从磁盘加载所有之前保存的 CSV 文件。"""
+        output_key = f"{task.get('conference', 'Misc')}/{task.get('year', 'Latest')}"
+        task_by_name[task_name] = task
+        scheduled.append(ScheduledTask(
+            name=task_name,
+            run=partial(run_single_task, task, source_definitions, perform_single_analysis, task_logger, task_info),
+            hosts=get_task_hosts(task_info),
+            output_key=output_key,
+        ))
+
+    logger.info(f"    -> 并发调度 {len(scheduled)} 个任务 (最多同时 {max_concurrent_tasks} 个, "
+                f"每主机 {per_host_tasks} 个)。各任务日志位于: {TASK_LOG_DIR}")
+    scheduler = TaskScheduler(max_workers=max_concurrent_tasks, per_host_limit=per_host_tasks, logger=logger)
+    results = scheduler.run(scheduled)
+
+    trend_counts = defaultdict(lambda: defaultdict(Counter))
+    for task in scheduled:
+        stats = results.get(task.name)
+        status = f"{stats.total_papers} papers" if stats is not None and stats.total_papers else "no results"
+        logger.info(f"    -> [{task.name}] {status}")
+        _add_trend_counts(trend_counts, task_by_name[task.name], stats)
+    return trend_counts
+
+
+# 跨年分析只需要这些列 (主题分类用标题与摘要，评分与决策用于单任务统计)
+TREND_COLUMNS = ['conference', 'year', 'title', 'abstract', 'avg_rating', 'decision']
+
+
+def _trend_year(year):
+    # 分区目录中的年份是字符串，与 CSV / 任务配置中的整数年份保持一致
+    return int(year) if isinstance(year, str) and year.isdigit() else year
+
+
+def load_trend_counts_from_dataset(store, chunksize: int = 5000) -> dict:
+    """从 Parquet 数据集计算跨年分析所需的聚合: 只读取 TREND_COLUMNS，按块处理。"""
+    trend_counts = defaultdict(lambda: defaultdict(Counter))
+    partitions = store.partitions()
+    if not partitions:
+        return trend_counts
+
+    logger.info(f"    -> Loading {len(partitions)} conference/year partition(s) from the Parquet dataset...")
+    trend_config = _load_trend_config()
+    stats_by_key = {}
+    for chunk in store.iter_batches(columns=TREND_COLUMNS, batch_rows=chunksize):
+        for paper in chunk.to_dict('records'):
+            # 与读取 CSV 时一致: 空值列视为不存在
+            paper = {k: v for k, v in paper.items() if not pd.isna(v)}
+            key = (paper.get('conference'), _trend_year(paper.get('year')))
+            if key not in stats_by_key:
+                stats_by_key[key] = TopicStats(trend_config)
+            stats_by_key[key].add(paper)
+
+    for (conference, year), stats in stats_by_key.items():
+        trend_counts[conference][year].update(stats.paper_counts)
+    return trend_counts
+
+
+def load_trend_counts_from_disk(metadata_dir: Path, chunksize: int = 5000) -> dict:
+    """
+    在 'analyze' 模式下，从磁盘上之前保存的数据计算跨年分析所需的紧凑聚合。
+    已有 Parquet 分区的 (会议, 年份) 从数据集读取 (只读需要的列，每个任务只有一份数据)；
+    其余 (会议, 年份) 回退到 CSV 文件 (启用数据集之前采集的历史数据)。
+    CSV 按块读取，任何时刻只有一个块在内存中。
+    """
+    store = get_metadata_store()
+    partitions = store.partitions() if store is not None else []
+    if partitions:
+        trend_counts = load_trend_counts_from_dataset(store, chunksize)
+    else:
+        trend_counts = defaultdict(lambda: defaultdict(Counter))
     if not metadata_dir.exists():
-        logger.error(f"[✖ ERROR] Data directory not found: {metadata_dir}.");
-        return []
+        if not partitions:
+            logger.error(f"[✖ ERROR] Data directory not found: {metadata_dir}.");
+        return trend_counts
 
-    all_papers = []
-    csv_files = list(metadata_dir.rglob("*_data_*.csv"))
+    csv_files = csv_files_without_partition(metadata_dir, partitions)
     if not csv_files:
-        logger.warning("[⚠ WARNING] No CSV data files found for cross-year analysis.");
-        return []
+        if not partitions:
+            logger.warning("[⚠ WARNING] No CSV data files found for cross-year analysis.");
+        return trend_counts
 
     logger.info(f"    -> Loading {len(csv_files)} previously collected CSV file(s) from disk...")
+    trend_config = _load_trend_config()
+    stats_by_key = {}
     for csv_path in csv_files:
         try:
-            df = pd.read_csv(csv_path)
-            df.fillna('', inplace=True)
-            all_papers.extend(df.to_dict('records'))
+            for chunk in pd.read_csv(csv_path, chunksize=chunksize, encoding='utf-8-sig'):
+                chunk.fillna('', inplace=True)
+                for paper in chunk.to_dict('records'):
+                    key = (paper.get('conference'), paper.get('year'))
+                    if not key[0]:
+                        continue
+                    if key not in stats_by_key:
+                        stats_by_key[key] = TopicStats(trend_config)
+                    stats_by_key[key].add(paper)
         except Exception as e:
             logger.error(f"[✖ ERROR] Failed to load data from {csv_path}: {e}")
-    return all_papers
+
+    for (conference, year), stats in stats_by_key.items():
+        trend_counts[conference][year].update(stats.paper_counts)
+    return trend_counts
 
 
 def main():
@@ -228,44 +523,74 @@ def main():
     config = load_config()
     if not config: return
 
-    all_papers_for_analysis = []
+    # 所有 scraper 与下载器共享同一个带连接池的 HTTP 客户端
+    configure_http_client(**(config.get('http') or {}))
+    # 按主机的令牌桶限速器，取代各处零散的 time.sleep
+    configure_rate_limits(config.get('source_definitions', {}))
+    # 磁盘响应缓存: 重复运行时索引页/详情页只需条件重验证，无需重新下载
+    configure_response_cache(HTTP_CACHE_DIR, config.get('source_definitions', {}), **(config.get('cache') or {}))
+    # HTML 解析后端 (lxml 快速路径 / BeautifulSoup) 与大索引页的解析进程池
+    configure_parsers(**(config.get('parsing') or {}))
+    # AAAI / KDD 共享的无头浏览器池 (按需启动，采集阶段结束后关闭)
+    configure_browser_pool(**(config.get('browser') or {}))
+    # 内容寻址 PDF 仓库: 多个任务下载的同一 PDF 只保存、只下载一次
+    configure_pdf_store(PDF_STORE_DIR, **(config.get('pdf_store') or {}))
+    # PDF 全文提取 (进程池，按内容哈希缓存)，供全文检索使用
+    configure_text_extraction(**(config.get('text_extraction') or {}))
+    # 按会议/年份分区的 Parquet 元数据数据集 (主数据存储，CSV 作为导出格式)
+    configure_metadata_store(METADATA_STORE_DIR, **(config.get('metadata_store') or {}))
+
+    trend_counts = {}
 
     if OPERATION_MODE in ["collect", "collect_and_analyze"]:
         logger.info(f"{COLORS['PHASE']}+----------------------------------------------------------+")
         logger.info(f"|    PHASE 1: PAPER COLLECTION & SINGLE-TASK ANALYSIS      |")
         logger.info(f"+----------------------------------------------------------+{COLORS['RESET']}\n")
 
-        all_papers_for_analysis = run_tasks_sequentially(
-            config.get('tasks', []),
-            config.get('source_definitions', {}),
-            perform_single_analysis=True
-        )
+        scheduler_config = config.get('scheduler') or {}
+        max_concurrent_tasks = scheduler_config.get('max_concurrent_tasks', 1)
+        if max_concurrent_tasks > 1:
+            trend_counts = run_tasks_concurrently(
+                config.get('tasks', []),
+                config.get('source_definitions', {}),
+                perform_single_analysis=True,
+                max_concurrent_tasks=max_concurrent_tasks,
+                per_host_tasks=scheduler_config.get('per_host_tasks', 1),
+            )
+        else:
+            trend_counts = run_tasks_sequentially(
+                config.get('tasks', []),
+                config.get('source_definitions', {}),
+                perform_single_analysis=True
+            )
+        shutdown_parse_pool()
+        shutdown_browser_pool()
+
+        text_stats = run_text_extraction(get_pdf_store(), PDF_TEXT_DIR)
+        if text_stats:
+            logger.info(f"    {COLORS['STEP']}-> [全文提取] 新提取 {text_stats['extracted']} 篇，"
+                        f"已缓存 {text_stats['skipped']} 篇，失败 {text_stats['failed']} 篇。")
 
     if OPERATION_MODE in ["analyze", "collect_and_analyze"]:
         logger.info(f"\n{COLORS['PHASE']}+----------------------------------------------------------+")
         logger.info(f"|          PHASE 2: CROSS-YEAR TREND ANALYSIS              |")
         logger.info(f"+----------------------------------------------------------+{COLORS['RESET']}\n")
 
-        if OPERATION_MODE == "collect_and_analyze" and not all_papers_for_analysis:
+        if OPERATION_MODE == "collect_and_analyze" and not trend_counts:
             logger.warning("[⚠ WARNING] No data was collected in Phase 1 to perform cross-year analysis.")
 
         elif OPERATION_MODE == "analyze":
-            all_papers_for_analysis = load_all_data_for_cross_analysis(METADATA_OUTPUT_DIR)
-
-        if all_papers_for_analysis:
-            all_data_by_conf = defaultdict(list)
-            for paper in all_papers_for_analysis:
-                if paper.get('conference'):
-                    all_data_by_conf[paper['conference']].append(paper)
-
-            for conference, papers in all_data_by_conf.items():
-                if not papers: continue
-                conf_trend_dir = TRENDS_OUTPUT_DIR / conference
-                conf_trend_dir.mkdir(exist_ok=True, parents=True)
-                logger.info(f"{COLORS['TASK_START']}[▶] Analyzing trends for: {conference}{COLORS['RESET']}")
-                run_cross_year_analysis(papers, conference, conf_trend_dir)
-                logger.info(
-                    f"{COLORS['SUCCESS']}[✔ SUCCESS] Cross-year analysis for '{conference}' completed.{COLORS['RESET']}\n")
+            trend_counts = load_trend_counts_from_disk(METADATA_OUTPUT_DIR)
+
+        # 跨年分析只需要每个会议每年各子方向的论文数，无需保留论文本身
+        for conference, counts_by_year in trend_counts.items():
+            if not counts_by_year: continue
+            conf_trend_dir = TRENDS_OUTPUT_DIR / conference
+            conf_trend_dir.mkdir(exist_ok=True, parents=True)
+            logger.info(f"{COLORS['TASK_START']}[▶] Analyzing trends for: {conference}{COLORS['RESET']}")
+            run_cross_year_analysis(counts_by_year, conference, conf_trend_dir)
+            logger.info(
+                f"{COLORS['SUCCESS']}[✔ SUCCESS] Cross-year analysis for '{conference}' completed.{COLORS['RESET']}\n")
 
     logger.info("=====================================================================================")
     logger.info("PubCrawler run finished successfully.")
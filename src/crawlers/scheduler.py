@@ -0,0 +1,97 @@
+# FILE: src/crawlers/scheduler.py
+
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from tqdm import tqdm
+
+
+@dataclass
+class ScheduledTask:
+    """
+    调度器中的一个任务单元。
+
+    Attributes:
+        name: 任务名 (用于进度显示与日志)。
+        run: 实际执行任务的无参函数，返回值会原样收集。
+        hosts: 任务会访问的主机集合，用于按主机限制并发。
+        output_key: 任务的输出目录标识 (如 "ICLR/2024")，相同 output_key 的任务严格串行。
+    """
+    name: str
+    run: Callable[[], Any]
+    hosts: Set[str] = field(default_factory=set)
+    output_key: Optional[str] = None
+
+
+class TaskScheduler:
+    """
+    并发任务调度器。
+
+    - 全局最多同时运行 max_workers 个任务。
+    - 访问同一主机的任务最多同时运行 per_host_limit 个 (任务内部的请求仍由主机限速器控制)。
+    - 写入同一输出目录 (conference/year) 的任务互斥，保证输出文件不会被并发覆盖。
+    - 调度在主线程完成: 只有资源全部可用的任务才会被提交，因此等待中的任务不会占用工作线程，
+      某个慢主机上的任务也不会阻塞其他主机的任务。
+    """
+
+    def __init__(self, max_workers: int = 4, per_host_limit: int = 1, logger: Optional[logging.Logger] = None):
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.logger = logger or logging.getLogger(__name__)
+        self._host_usage: Counter = Counter()
+        self._busy_outputs: Set[str] = set()
+
+    def _can_start(self, task: ScheduledTask) -> bool:
+        if task.output_key and task.output_key in self._busy_outputs:
+            return False
+        return all(self._host_usage[host] < self.per_host_limit for host in task.hosts)
+
+    def _claim(self, task: ScheduledTask):
+        for host in task.hosts:
+            self._host_usage[host] += 1
+        if task.output_key:
+            self._busy_outputs.add(task.output_key)
+
+    def _release(self, task: ScheduledTask):
+        for host in task.hosts:
+            self._host_usage[host] -= 1
+        if task.output_key:
+            self._busy_outputs.discard(task.output_key)
+
+    def run(self, tasks: List[ScheduledTask]) -> Dict[str, Any]:
+        """
+        执行所有任务，返回 {任务名: 返回值} 字典。任务抛出的异常会被记录，其返回值为 None。
+        """
+        pending = list(tasks)
+        running: Dict[Any, ScheduledTask] = {}
+        results: Dict[str, Any] = {}
+
+        pbar = tqdm(total=len(tasks), desc="[Scheduler] Tasks", unit="task", leave=True)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="task") as executor:
+            while pending or running:
+                # 1. 按配置顺序提交所有资源可用的任务
+                for task in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    if self._can_start(task):
+                        self._claim(task)
+                        running[executor.submit(task.run)] = task
+                        pending.remove(task)
+                pbar.set_postfix_str(", ".join(t.name for t in running.values()), refresh=True)
+
+                # 2. 等待任意一个任务完成，释放其资源后继续调度
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    self._release(task)
+                    try:
+                        results[task.name] = future.result()
+                    except Exception as e:
+                        self.logger.critical(f"任务 '{task.name}' 遭遇严重错误，已终止。错误: {e}", exc_info=True)
+                        results[task.name] = None
+                    pbar.update(1)
+        pbar.close()
+        return results
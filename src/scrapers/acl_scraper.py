@@ -1,79 +1,147 @@
-# FILE: src/scrapers/acl_scraper.py (Concurrent Version)
+# FILE: src/scrapers/acl_scraper.py (Async Version)
 
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-from tqdm import tqdm
-from typing import List, Dict, Optional, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import io
+import xml.etree.ElementTree as ET
+from urllib.parse import urlparse
+from typing import List, Dict, Iterator, Optional, Any, IO
 
 from .base_scraper import BaseScraper
+from .parsers import parse_acl_detail, parse_acl_index, parse_in_pool
+from src.utils.bibtex import bibtex_authors, iter_bibtex_entries
 from src.utils.network_utils import robust_get
 
+ANTHOLOGY_BASE_URL = "https://aclanthology.org/"
+# 卷级导出文件: MODS XML 与 BibTeX 都包含整卷论文的标题、作者、摘要与链接
+EXPORT_EXTENSIONS = {'mods': 'xml', 'bibtex': 'bib'}
+REQUIRED_FIELDS = ('title', 'authors', 'abstract')
 
-class AclScraper(BaseScraper):
-    """
-    专门用于 ACL Anthology 网站的爬虫。
-    此版本经过优化，使用多线程并发获取论文详情，以大幅提高速度。
-    """
 
-    def _scrape_details_page(self, url: str) -> Optional[Dict[str, Any]]:
-        """
-        抓取并解析单个 ACL 论文详情页。这是将被并发执行的核心工作函数。
-        """
-        response = robust_get(url, timeout=20)
-        if not response:
-            self.logger.debug(f"    -> 请求详情页失败 (已重试): {url}")
-            return None
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
 
-        try:
-            soup = BeautifulSoup(response.content, 'lxml')
 
-            title_tag = soup.select_one("h2#title")
-            title = title_tag.get_text(strip=True) if title_tag else "N/A"
+def _child(elem: ET.Element, name: str) -> Optional[ET.Element]:
+    return next((c for c in elem if _local_name(c.tag) == name), None)
+
+
+def _text(elem: Optional[ET.Element]) -> str:
+    return ' '.join(''.join(elem.itertext()).split()) if elem is not None else ''
+
+
+def _path_text(elem: ET.Element, *names: str) -> str:
+    """沿直接子元素路径取文本，如 _path_text(mods, 'titleInfo', 'title')。"""
+    for name in names:
+        elem = _child(elem, name)
+        if elem is None:
+            return ''
+    return _text(elem)
+
+
+def _name_part(name: ET.Element, part_type: str) -> str:
+    return ' '.join(_text(p) for p in name if _local_name(p.tag) == 'namePart' and p.get('type') == part_type)
+
+
+def _anthology_id(url: str) -> str:
+    return url.strip('/').split('/')[-1]
+
+
+def _paper_record(anthology_id: str, title: str, authors: str, abstract: str) -> Dict[str, Any]:
+    """与详情页解析结果保持相同的字段和 URL 形式，增量模式按 source_url 比对时两种模式可以互换。"""
+    source_url = f"{ANTHOLOGY_BASE_URL}{anthology_id}/"
+    return {'id': anthology_id, 'title': title or 'N/A', 'authors': authors or 'N/A', 'abstract': abstract or 'N/A',
+            'pdf_url': f"{ANTHOLOGY_BASE_URL}{anthology_id}.pdf", 'source_url': source_url}
+
 
-            author_tags = soup.select("p.lead a")
-            authors = ", ".join([a.get_text(strip=True) for a in author_tags]) if author_tags else "N/A"
+def iter_mods_records(stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    """
+    以 iterparse 流式解析 ACL Anthology 卷级 MODS XML，逐篇产出论文字典。
+    每处理完一个 <mods> 元素就将其清空，内存占用与卷的大小无关。
+    """
+    root = None
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        if root is None:
+            root = elem
+        if event != 'end' or _local_name(elem.tag) != 'mods':
+            continue
+
+        url = _path_text(elem, 'location', 'url')
+        if url:
+            authors = []
+            # 只取 <mods> 的直接子元素 <name>，relatedItem 中的编者不算作者
+            for name in (c for c in elem if _local_name(c.tag) == 'name'):
+                role = next((_text(r) for r in name.iter() if _local_name(r.tag) == 'roleTerm'), 'author')
+                if role != 'author':
+                    continue
+                authors.append(' '.join(part for part in (_name_part(name, 'given'), _name_part(name, 'family')) if part))
+            yield _paper_record(_anthology_id(url), _path_text(elem, 'titleInfo', 'title'), ', '.join(authors),
+                                _path_text(elem, 'abstract'))
+
+        elem.clear()
+        root.clear()
+
+
+def iter_bibtex_records(stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    """流式解析 ACL Anthology 卷级 BibTeX，逐篇产出论文字典 (跳过 @proceedings 卷条目)。"""
+    lines = io.TextIOWrapper(stream, encoding='utf-8', errors='replace')
+    for entry_type, _, fields in iter_bibtex_entries(lines):
+        if entry_type == 'proceedings' or not fields.get('url'):
+            continue
+        yield _paper_record(_anthology_id(fields['url']), fields.get('title', ''),
+                            bibtex_authors(fields.get('author', '')), fields.get('abstract', ''))
 
-            abstract_tag = soup.select_one("div.acl-abstract > span")
-            abstract = abstract_tag.get_text(strip=True) if abstract_tag else "N/A"
 
-            pdf_url_tag = soup.select_one('meta[name="citation_pdf_url"]')
-            pdf_url = pdf_url_tag['content'] if pdf_url_tag else None
-            if pdf_url and not pdf_url.startswith('http'):
-                pdf_url = urljoin(url, pdf_url)
+class AclScraper(BaseScraper):
+    """
+    专门用于 ACL Anthology 网站的爬虫。
 
-            paper_id = url.strip('/').split('/')[-1]
+    默认 (bulk_metadata: true) 先下载整卷的 MODS XML / BibTeX 导出文件并流式解析，一个请求即可得到整卷论文的元数据；
+    只有导出记录缺少字段 (标题、作者或摘要) 时，才通过 BaseScraper.iter_details 的异步引擎并发访问这些论文的详情页。
+    导出文件不可用时，自动回退为逐一抓取详情页。
+    """
 
-            return {'id': paper_id, 'title': title, 'authors': authors, 'abstract': abstract, 'pdf_url': pdf_url,
-                    'source_url': url}
+    def _parse_details_page(self, url: str, content: bytes) -> Optional[Dict[str, Any]]:
+        """
+        解析单个 ACL 论文详情页。由异步引擎在解析线程池中调用。
+        """
+        try:
+            return parse_acl_detail(content, url)
         except Exception as e:
             self.logger.debug(f"    -> 解析 ACL 详情页失败 {url}: {e}")
             return None
 
     def scrape(self) -> List[Dict[str, Any]]:
+        return list(self.iter_papers())
+
+    def iter_papers(self) -> Iterator[Dict[str, Any]]:
         index_url = self.task_info["url"]
 
-        # 从配置中读取并发参数，并提供安全的默认值
-        max_workers = self.task_info.get("max_workers", 1)
+        # 从配置中读取数量限制，并发参数由 fetch_details 统一读取
         max_papers_limit = self.task_info.get("max_papers_limit", 0)
 
+        if self.task_info.get("bulk_metadata", True):
+            records = self._load_volume_export(index_url)
+            if records is not None:
+                yield from self._iter_export_papers(records, max_papers_limit)
+                return
+            self.logger.warning(f"    -> [⚠ WARNING] 卷级导出文件不可用，回退为逐一抓取详情页。")
+
         # 1. 首先，获取包含所有论文链接的索引页
         self.logger.info(f"    -> 正在抓取 ACL 索引页: {index_url}")
         response = robust_get(index_url)
         if not response:
-            return []
+            return
 
         if response.status_code == 404:
             self.logger.warning(f"    -> 页面未找到 (404): {index_url}")
-            return []
+            return
 
         try:
-            soup = BeautifulSoup(response.content, 'lxml')
-            link_tags = soup.select('p.d-sm-flex strong a.align-middle')
-
-            detail_urls = [urljoin(index_url, tag['href']) for tag in link_tags if
-                           f'{self.task_info["year"]}.acl-long.0' not in tag['href']]
-            self.logger.info(f"    -> 索引页解析完成，共找到 {len(detail_urls)} 篇有效论文。")
+            index_links = parse_in_pool(parse_acl_index, response.content, index_url)
+            index_links = [(url, title) for url, title in index_links
+                           if f'{self.task_info["year"]}.acl-long.0' not in url]
+            self.logger.info(f"    -> 索引页解析完成，共找到 {len(index_links)} 篇有效论文。")
+            # 过滤下推: 索引页上的链接文本就是标题，不匹配的论文无需访问详情页
+            detail_urls = [url for url, title in index_links if self.keep_title(title)]
 
             # 2. 应用数量限制
             urls_to_crawl = detail_urls
@@ -84,23 +152,68 @@ class AclScraper(BaseScraper):
                 self.logger.info(f"    -> 已应用数量限制，将爬取前 {len(urls_to_crawl)} 篇论文。")
 
             if not urls_to_crawl:
-                return []
+                return
 
-            # 3. 使用 ThreadPoolExecutor 进行并发爬取
-            papers = []
+            # 3. 交给异步引擎并发抓取与解析
             pbar_desc = f"    -> 并发解析 {self.task_info.get('conference')} 详情页"
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_url = {executor.submit(self._scrape_details_page, url): url for url in urls_to_crawl}
-
-                # 使用 tqdm 显示进度
-                for future in tqdm(as_completed(future_to_url), total=len(urls_to_crawl), desc=pbar_desc, leave=True):
-                    result = future.result()
-                    if result:
-                        papers.append(result)
-
-            return papers
+            detail_requests = ((url, self._parse_details_page) for url in urls_to_crawl)
+            yield from self.iter_details(detail_requests, total=len(urls_to_crawl), desc=pbar_desc)
 
         except Exception as e:
-            self.logger.error(f"    [✖ ERROR] 解析 ACL 页面时发生未知错误: {e}", exc_info=True)
-            return []
\ No newline at end of file
+            # 向上抛出: 由 run_single_task 丢弃不完整的输出并保留检查点
+            self.logger.error(f"    [✖ ERROR] 解析 ACL 页面时发生未知错误: {e}")
+            raise
+
+    def _export_url(self, index_url: str) -> str:
+        if self.task_info.get("export_url"):
+            return self.task_info["export_url"]
+        export_format = self.task_info.get("export_format", "mods")
+        volume_id = urlparse(index_url).path.strip('/').split('/')[-1]
+        return f"{ANTHOLOGY_BASE_URL}volumes/{volume_id}.{EXPORT_EXTENSIONS.get(export_format, 'xml')}"
+
+    def _load_volume_export(self, index_url: str) -> Optional[List[Dict[str, Any]]]:
+        """下载并解析卷级导出文件。失败时返回 None，由调用方回退到详情页模式。"""
+        export_url = self._export_url(index_url)
+        self.logger.info(f"    -> 正在获取 ACL 卷级元数据: {export_url}")
+        response = robust_get(export_url, timeout=60)
+        if not response or response.status_code != 200:
+            return None
+        parse = iter_bibtex_records if export_url.endswith('.bib') else iter_mods_records
+        try:
+            # 卷的前言 (如 2024.acl-long.0) 不是论文
+            records = [r for r in parse(io.BytesIO(response.content)) if not r['id'].endswith('.0')]
+        except (ET.ParseError, ValueError) as e:
+            self.logger.error(f"    [✖ ERROR] 解析卷级导出文件失败 {export_url}: {e}")
+            return None
+        if not records:
+            return None
+        self.logger.info(f"    -> 卷级导出文件解析完成，共找到 {len(records)} 篇有效论文。")
+        return records
+
+    def _iter_export_papers(self, records: List[Dict[str, Any]], max_papers_limit: int) -> Iterator[Dict[str, Any]]:
+        if max_papers_limit > 0:
+            records = records[:max_papers_limit]
+            self.logger.info(f"    -> 已应用数量限制，将处理前 {len(records)} 篇论文。")
+
+        incomplete = {}
+        for record in records:
+            if record['source_url'] in self._known_urls:
+                continue
+            if any(record[field] == 'N/A' for field in REQUIRED_FIELDS):
+                # 缺少摘要的记录在补全前先按标题过滤，不匹配的论文无需访问详情页
+                if self.keep_title(record['title']):
+                    incomplete[record['source_url']] = record
+            else:
+                yield record
+
+        requested = len(incomplete)
+        if incomplete:
+            self.logger.info(f"    -> {requested} 篇论文的导出记录缺少字段，将访问其详情页补全。")
+            pbar_desc = f"    -> 并发解析 {self.task_info.get('conference')} 详情页"
+            detail_requests = [(url, self._parse_details_page) for url in incomplete]
+            for paper in self.iter_details(detail_requests, total=requested, desc=pbar_desc):
+                incomplete.pop(paper['source_url'], None)
+                yield paper
+            # 详情页抓取失败的论文仍保留导出文件中的信息
+            yield from incomplete.values()
+        self.logger.info(f"    -> [批量元数据] 共 {len(records)} 篇论文，仅 {requested} 篇需要请求详情页。")
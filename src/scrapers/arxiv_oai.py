@@ -0,0 +1,119 @@
+# FILE: src/scrapers/arxiv_oai.py
+
+import io
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+OAI_BASE_URL = 'http://export.arxiv.org/oai2'
+OAI_NS = 'http://www.openarchives.org/OAI/2.0/'
+ARXIV_META_NS = 'http://arxiv.org/OAI/arXiv/'
+METADATA_PREFIX = 'arXiv'
+# arXiv 的 OAI 集合: 这些 archive 各自是顶层集合，其余 (hep-th、astro-ph 等) 都属于 physics
+TOP_LEVEL_SETS = ('cs', 'econ', 'eess', 'math', 'q-bio', 'q-fin', 'stat')
+# 没有匹配记录 (例如自上次抓取以来没有更新) 不是错误
+NO_RECORDS_MATCH = 'noRecordsMatch'
+
+
+class OaiError(Exception):
+    """OAI-PMH 接口返回的 <error code="..."> 响应。"""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+
+
+@dataclass
+class OaiPage:
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    resumption_token: Optional[str] = None
+    complete_list_size: Optional[int] = None
+    response_date: Optional[str] = None
+    deleted: int = 0
+
+
+def list_records_url(base_url: str = OAI_BASE_URL, set_spec: Optional[str] = None, from_date: Optional[str] = None,
+                     until: Optional[str] = None, resumption_token: Optional[str] = None,
+                     metadata_prefix: str = METADATA_PREFIX) -> str:
+    """
+    构建 ListRecords 请求。按 OAI-PMH 规范，带 resumptionToken 的后续请求不能再携带其他参数。
+    """
+    if resumption_token:
+        params = {'verb': 'ListRecords', 'resumptionToken': resumption_token}
+    else:
+        params = {'verb': 'ListRecords', 'metadataPrefix': metadata_prefix}
+        if set_spec:
+            params['set'] = set_spec
+        if from_date:
+            params['from'] = from_date
+        if until:
+            params['until'] = until
+    return f"{base_url}?{urlencode(params)}"
+
+
+def default_set_spec(categories) -> Optional[str]:
+    """由分类 (如 cs.LG) 推断 OAI 集合 (cs)；分类分属多个集合时返回 None (即不限集合)。"""
+    sets = {c.split('.')[0] if c.split('.')[0] in TOP_LEVEL_SETS else 'physics' for c in categories}
+    return sets.pop() if len(sets) == 1 else None
+
+
+def _tag(ns: str, name: str) -> str:
+    return f'{{{ns}}}{name}'
+
+
+def _clean(text: Optional[str]) -> Optional[str]:
+    return ' '.join(text.split()) if text else None
+
+
+def _author_name(author: ET.Element) -> str:
+    parts = [author.findtext(_tag(ARXIV_META_NS, name)) for name in ('forenames', 'keyname', 'suffix')]
+    return ' '.join(p.strip() for p in parts if p and p.strip())
+
+
+def _parse_record(record: ET.Element) -> Optional[Dict[str, Any]]:
+    """解析 arXiv 元数据格式的 <record>；已删除的记录返回 None。"""
+    header = record.find(_tag(OAI_NS, 'header'))
+    if header is None or header.get('status') == 'deleted':
+        return None
+    meta = record.find(f"{_tag(OAI_NS, 'metadata')}/{_tag(ARXIV_META_NS, 'arXiv')}")
+    if meta is None:
+        return None
+    arxiv_id = meta.findtext(_tag(ARXIV_META_NS, 'id'))
+    authors = [_author_name(a) for a in meta.iter(_tag(ARXIV_META_NS, 'author'))]
+    return {'id': arxiv_id,
+            'title': _clean(meta.findtext(_tag(ARXIV_META_NS, 'title'))),
+            'authors': ", ".join(a for a in authors if a),
+            'abstract': _clean(meta.findtext(_tag(ARXIV_META_NS, 'abstract'))),
+            'pdf_url': f"http://arxiv.org/pdf/{arxiv_id}",
+            'source_url': f"http://arxiv.org/abs/{arxiv_id}",
+            'categories': meta.findtext(_tag(ARXIV_META_NS, 'categories'), '').strip(),
+            # OAI datestamp: 记录最后一次变更的日期，供增量模式判断是否有更新
+            'mdate': header.findtext(_tag(OAI_NS, 'datestamp'))}
+
+
+def parse_list_records(content: bytes) -> OaiPage:
+    """
+    用 iterparse 逐条解析 ListRecords 响应，每条 <record> 解析后立即清空，内存占用与页大小无关。
+    noRecordsMatch 返回空页，其他 OAI 错误抛出 OaiError。
+    """
+    page = OaiPage()
+    for _, elem in ET.iterparse(io.BytesIO(content), events=('end',)):
+        if elem.tag == _tag(OAI_NS, 'record'):
+            paper = _parse_record(elem)
+            if paper is None:
+                page.deleted += 1
+            else:
+                page.records.append(paper)
+            elem.clear()
+        elif elem.tag == _tag(OAI_NS, 'resumptionToken'):
+            page.resumption_token = (elem.text or '').strip() or None
+            size = elem.get('completeListSize')
+            page.complete_list_size = int(size) if size and size.isdigit() else None
+        elif elem.tag == _tag(OAI_NS, 'responseDate'):
+            page.response_date = (elem.text or '').strip()
+        elif elem.tag == _tag(OAI_NS, 'error'):
+            code = elem.get('code', '')
+            if code != NO_RECORDS_MATCH:
+                raise OaiError(code, (elem.text or '').strip())
+    return page
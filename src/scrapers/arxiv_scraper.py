@@ -1,29 +1,86 @@
 # FILE: src/scrapers/arxiv_scraper.py
 
-import urllib.request
+import io
+import json
+import os
+import re
 import urllib.parse
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Any
+from datetime import date, datetime, timezone
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import logging
 
+from tqdm import tqdm
+
+from .arxiv_oai import OAI_BASE_URL, OaiError, default_set_spec, list_records_url, parse_list_records
 from .base_scraper import BaseScraper
+from src.utils.http_cache import get_response_cache
+from src.utils.network_utils import get_http_client
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+OPENSEARCH_NS = 'http://a9.com/-/spec/opensearch/1.1/'
+NAMESPACES = {'atom': ATOM_NS, 'arxiv': 'http://arxiv.org/schemas/atom', 'opensearch': OPENSEARCH_NS}
+
+# arXiv API limits: at most 2000 results per call, and no more than 30000 results per query
+MAX_PAGE_SIZE = 2000
+DEFAULT_PAGE_SIZE = 1000
+API_RESULT_CAP = 30000
+# Earliest submission date in arXiv; lower bound when a query has to be sliced without date_from
+ARXIV_EPOCH = date(1991, 8, 1)
+CURSOR_STATE = 'arxiv_cursor'
+OAI_CURSOR_STATE = 'arxiv_oai_cursor'
+
+# (first day, last day) as ISO strings, both inclusive; None means the query has no date clause
+Window = Optional[Tuple[str, str]]
+
+
+def _to_date(value: Any) -> date:
+    # YAML already turns unquoted 2024-01-01 into a date object
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
 
 
 class ArxivScraper(BaseScraper):
-    """Scraper for the arXiv API."""
+    """
+    Scraper for the arXiv API.
+
+    Results are harvested page by page with `start` offsets (page_size per call). Request spacing
+    comes from the shared rate limiter for export.arxiv.org (rate 0.33 in tasks.yaml, i.e. the
+    3 seconds between calls that arXiv asks for). Queries matching more than API_RESULT_CAP papers
+    are sliced into submittedDate windows, bisected until every window fits under the cap.
+    Each Atom page is parsed incrementally with iterparse. With resume enabled, the harvest cursor
+    (remaining windows + offset) is stored in the task checkpoint next to the harvested papers.
+
+    harvest_mode: oai switches to bulk OAI-PMH harvesting (ListRecords + resumptionToken, see
+    arxiv_oai.py) for daily category tracking. The harvest starts at the watermark saved by the
+    previous successful run (or date_from on the first run), so only records changed since then are fetched.
+    """
     BASE_URL = 'http://export.arxiv.org/api/query?'
 
-    def __init__(self, task_info: Dict[str, Any], logger: logging.Logger):
-        super().__init__(task_info, logger)
+    def __init__(self, task_info: Dict[str, Any], logger: logging.Logger, **kwargs):
+        super().__init__(task_info, logger, **kwargs)
         self.search_query = self.task_info.get('search_query', 'cat:cs.AI')
         self.limit = self.task_info.get('limit')
+        # max_results: null harvests everything the query matches
         self.max_results = self.limit if self.limit is not None else self.task_info.get('max_results', 10)
         self.sort_by = self.task_info.get('sort_by', 'submittedDate')
         self.sort_order = self.task_info.get('sort_order', 'descending')
+        self.page_size = min(int(self.task_info.get('page_size', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        if self.max_results:
+            # small requests stay a single call
+            self.page_size = min(self.page_size, int(self.max_results))
+        self.date_from = self.task_info.get('date_from')
+        self.date_to = self.task_info.get('date_to')
+        self.max_retries = self.task_info.get('max_retries', 3)
+        self.watermark_file = self.task_info.get('watermark_file')
+        self._pending_watermark: Optional[Dict[str, Any]] = None
 
-    def _build_url(self) -> str:
-        encoded_query = urllib.parse.quote(self.search_query)
-        query_params = (f'search_query={encoded_query}&start=0&max_results={self.max_results}&'
+    def _build_url(self, window: Window = None, start: int = 0) -> str:
+        query = self.search_query
+        if window is not None:
+            first, last = (_to_date(d).strftime('%Y%m%d') for d in window)
+            query = f'({query}) AND submittedDate:[{first}0000 TO {last}2359]'
+        encoded_query = urllib.parse.quote(query)
+        query_params = (f'search_query={encoded_query}&start={start}&max_results={self.page_size}&'
                         f'sortBy={self.sort_by}&sortOrder={self.sort_order}')
         return self.BASE_URL + query_params
 
@@ -48,22 +105,271 @@ class ArxivScraper(BaseScraper):
         return {"id": arxiv_id, "title": _get_text('title'), "authors": ", ".join(authors_list),
                 "abstract": _get_text('summary'), "pdf_url": pdf_url, "source_url": arxiv_id_url}
 
+    def _parse_feed(self, content: bytes) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+        """Parse one Atom page entry by entry; returns (opensearch:totalResults, papers)."""
+        total, papers = None, []
+        for _, elem in ET.iterparse(io.BytesIO(content), events=('end',)):
+            if elem.tag == f'{{{OPENSEARCH_NS}}}totalResults':
+                total = int(elem.text or 0)
+            elif elem.tag == f'{{{ATOM_NS}}}entry':
+                paper = self._parse_xml_entry(elem, NAMESPACES)
+                # Malformed queries come back as a single entry pointing at /api/errors
+                if '/api/errors' in (paper['source_url'] or ''):
+                    raise ValueError(f"arXiv API error: {paper['abstract']}")
+                papers.append(paper)
+                elem.clear()
+        return total, papers
+
+    def _fetch_page(self, window: Window, start: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Fetch and parse one page. Raises IOError when the request fails or arXiv keeps returning an empty page
+        inside the result set, so the window is never skipped silently.
+        """
+        url = self._build_url(window, start)
+        total = None
+        for attempt in range(1, self.max_retries + 1):
+            response = get_http_client().get(url, timeout=60)
+            if response.status_code != 200:
+                raise IOError(f"HTTP request to arXiv failed with status code {response.status_code}: {url}")
+            total, papers = self._parse_feed(response.content)
+            if total is None:
+                raise IOError(f"arXiv response has no opensearch:totalResults: {url}")
+            if papers or start >= total:
+                return total, papers
+            # arXiv occasionally returns an empty page in the middle of a result set; the cached copy must not be reused
+            cache = get_response_cache()
+            if cache is not None:
+                cache.delete(cache.make_key('GET', response.request.url))
+            self.logger.warning(f"    [⚠ WARNING] arXiv returned an empty page at start={start} (total {total}), "
+                                f"retrying ({attempt}/{self.max_retries})...")
+        raise IOError(f"arXiv kept returning an empty page for {self._describe(window)} at start={start} "
+                      f"(total {total}) after {self.max_retries} attempts")
+
+    def _initial_windows(self) -> List[Window]:
+        if self.date_from is None and self.date_to is None:
+            return [None]
+        first = _to_date(self.date_from) if self.date_from is not None else ARXIV_EPOCH
+        last = _to_date(self.date_to) if self.date_to is not None else datetime.now(timezone.utc).date()
+        return [(first.isoformat(), last.isoformat())]
+
+    def _split(self, window: Window) -> Optional[List[Window]]:
+        """Bisect a date window; returns None when it is a single day and cannot be split further."""
+        if window is None:
+            first, last = ARXIV_EPOCH, datetime.now(timezone.utc).date()
+        else:
+            first, last = _to_date(window[0]), _to_date(window[1])
+        if first >= last:
+            return None
+        middle = first + (last - first) // 2
+        halves = [(first.isoformat(), middle.isoformat()),
+                  (date.fromordinal(middle.toordinal() + 1).isoformat(), last.isoformat())]
+        return halves[::-1] if self.sort_order == 'descending' else halves
+
+    @staticmethod
+    def _describe(window: Window) -> str:
+        return f"submittedDate {window[0]}..{window[1]}" if window else "full query"
+
+    def _cursor_signature(self) -> str:
+        return '|'.join(str(v) for v in (self.search_query, self.sort_by, self.sort_order, self.date_from, self.date_to))
+
+    def _save_cursor(self, signature: str, pending: List[Window], start: int):
+        if self.checkpoint is not None:
+            self.checkpoint.set_state(CURSOR_STATE, {'signature': signature, 'pending': pending, 'start': start})
+
+    def _reached_limit(self, emitted: int) -> bool:
+        return bool(self.max_results) and emitted >= self.max_results
+
     def scrape(self) -> List[Dict[str, Any]]:
-        full_url = self._build_url()
+        return list(self.iter_papers())
+
+    def iter_papers(self) -> Iterator[Dict[str, Any]]:
+        if self.task_info.get('harvest_mode', 'api') == 'oai':
+            return self._iter_oai_papers()
+        return self._iter_api_papers()
+
+    def _iter_api_papers(self) -> Iterator[Dict[str, Any]]:
         self.logger.info(f"    -> Requesting data from arXiv: {self.search_query}")
-        papers: List[Dict[str, Any]] = []
+        signature = self._cursor_signature()
+        cursor = self.checkpoint.get_state(CURSOR_STATE) if self.checkpoint is not None else None
+        seen = set()
+
+        with tqdm(total=self.max_results or None, desc="    -> Harvesting arXiv", unit="paper", leave=True) as pbar:
+            if cursor and cursor.get('signature') == signature:
+                pending = [tuple(w) if w else None for w in cursor['pending']]
+                start = cursor['start']
+                self.logger.info(f"    -> [Resume] {len(self.checkpoint)} papers already harvested, continuing at "
+                                 f"{self._describe(pending[0]) if pending else 'end'} (start={start}).")
+                for paper in self.checkpoint.records():
+                    seen.add(paper['id'])
+                    pbar.update(1)
+                    yield paper
+            else:
+                pending, start = self._initial_windows(), 0
+
+            try:
+                while pending and not self._reached_limit(len(seen)):
+                    window = pending[0]
+                    total, papers = self._fetch_page(window, start)
+
+                    # Slicing is only needed when this window must be read past the offset cap
+                    wanted = self.max_results - len(seen) if self.max_results else total
+                    if start == 0 and min(total, wanted) > API_RESULT_CAP:
+                        halves = self._split(window)
+                        if halves:
+                            self.logger.info(f"    -> {self._describe(window)} matches {total} papers (API cap "
+                                             f"{API_RESULT_CAP}), slicing into date windows.")
+                            pending[0:1] = halves
+                            self._save_cursor(signature, pending, 0)
+                            continue
+                        self.logger.warning(f"    [⚠ WARNING] {self._describe(window)} matches {total} papers; "
+                                            f"only the first {API_RESULT_CAP} can be retrieved.")
+                    if start == 0:
+                        self.logger.info(f"    -> {self._describe(window)}: {total} papers.")
+
+                    for paper in papers:
+                        if paper['id'] in seen:
+                            continue
+                        seen.add(paper['id'])
+                        if self.checkpoint is not None:
+                            self.checkpoint.append(paper['id'], paper)
+                        pbar.update(1)
+                        yield paper
+                        if self._reached_limit(len(seen)):
+                            break
+
+                    start += len(papers)
+                    if not papers or start >= min(total, API_RESULT_CAP):
+                        pending.pop(0)
+                        start = 0
+                    self._save_cursor(signature, pending, start)
+
+            except Exception as e:
+                # Fail the task so run_single_task keeps the checkpoint (and the cursor in it) instead of clearing it
+                self.logger.error(f"    [✖ ERROR] arXiv harvesting failed: {e}")
+                if self.checkpoint is not None:
+                    self.logger.info("    -> Harvest cursor saved in checkpoint; rerun the task to continue.")
+                raise
+
+        self.logger.info(f"    -> Harvested {len(seen)} papers from arXiv.")
+
+    # --- OAI-PMH mode ---
+
+    def _oai_categories(self) -> List[str]:
+        categories = self.task_info.get('categories')
+        if categories:
+            return [categories] if isinstance(categories, str) else list(categories)
+        return re.findall(r'cat:([\w.-]+)', self.search_query)
+
+    def _load_watermark(self, set_spec: Optional[str]) -> Optional[str]:
+        if not self.watermark_file or not os.path.exists(self.watermark_file):
+            return None
         try:
-            with urllib.request.urlopen(full_url) as response:
-                if response.status != 200:
-                    self.logger.error(f"    [✖ ERROR] HTTP request to arXiv failed with status code: {response.status}")
-                    return papers
-                xml_data = response.read().decode('utf-8')
-                ns = {'atom': 'http://www.w3.org/2005/Atom', 'arxiv': 'http://arxiv.org/schemas/atom'}
-                root = ET.fromstring(xml_data)
-                entries = root.findall('atom:entry', ns)
-                for entry in entries:
-                    papers.append(self._parse_xml_entry(entry, ns))
-                return papers
-        except Exception as e:
-            self.logger.error(f"    [✖ ERROR] An unexpected error occurred during arXiv scraping: {e}", exc_info=True)
-            return papers
\ No newline at end of file
+            with open(self.watermark_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"    [⚠ WARNING] Ignoring unreadable OAI watermark {self.watermark_file}: {e}")
+            return None
+        # A watermark recorded for another set does not say anything about this one
+        return state.get('from') if state.get('set') == set_spec else None
+
+    def commit_state(self):
+        """Persist the OAI watermark once the harvested papers have been saved."""
+        if self._pending_watermark is None or not self.watermark_file:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.watermark_file)), exist_ok=True)
+        tmp_path = f"{self.watermark_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._pending_watermark, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.watermark_file)
+        self.logger.info(f"    -> OAI watermark advanced to {self._pending_watermark['from']}.")
+        self._pending_watermark = None
+
+    def _iter_oai_papers(self) -> Iterator[Dict[str, Any]]:
+        base_url = self.task_info.get('oai_url', OAI_BASE_URL)
+        categories = set(self._oai_categories())
+        set_spec = self.task_info.get('oai_set') or default_set_spec(categories)
+        # date_from is the lower bound for the first run; afterwards the watermark moves the window forward
+        watermark = self._load_watermark(set_spec)
+        from_date = str(self.date_from) if self.date_from is not None else None
+        if watermark and (from_date is None or watermark > from_date):
+            from_date = watermark
+        until = str(self.date_to) if self.date_to is not None else None
+        signature = '|'.join(str(v) for v in ('oai', base_url, set_spec, from_date, until))
+        cursor = self.checkpoint.get_state(OAI_CURSOR_STATE) if self.checkpoint is not None else None
+
+        seen = set()
+        token, response_date = None, None
+        unchanged = other_categories = deleted = 0
+        self.logger.info(f"    -> OAI-PMH harvest from {base_url}: set={set_spec or 'all'}, "
+                         f"from={from_date or 'beginning'}, until={until or 'now'}, "
+                         f"categories={', '.join(sorted(categories)) or 'all'}")
+
+        with tqdm(desc="    -> Harvesting arXiv (OAI-PMH)", unit="paper", leave=True) as pbar:
+            if cursor and cursor.get('signature') == signature:
+                token, response_date = cursor.get('token'), cursor.get('response_date')
+                self.logger.info(f"    -> [Resume] {len(self.checkpoint)} papers already harvested, "
+                                 f"continuing from the saved resumptionToken.")
+                for paper in self.checkpoint.records():
+                    seen.add(paper['id'])
+                    pbar.update(1)
+                    yield paper
+
+            while True:
+                url = list_records_url(base_url, set_spec, from_date, until, resumption_token=token)
+                try:
+                    response = get_http_client().get(url, timeout=120)
+                    if response.status_code != 200:
+                        raise IOError(f"OAI-PMH request failed with status code {response.status_code}: {url}")
+                    page = parse_list_records(response.content)
+                except OaiError as e:
+                    if e.code == 'badResumptionToken' and token:
+                        # Tokens expire after a while; restart the window, already harvested ids are skipped
+                        self.logger.warning(f"    [⚠ WARNING] resumptionToken expired, restarting the harvest window.")
+                        token = None
+                        continue
+                    self.logger.error(f"    [✖ ERROR] OAI-PMH error: {e}")
+                    raise
+                except Exception as e:
+                    # Fail the task so the checkpoint keeps the resumptionToken and the watermark stays put
+                    self.logger.error(f"    [✖ ERROR] OAI-PMH harvesting failed: {e}")
+                    if self.checkpoint is not None:
+                        self.logger.info("    -> Harvest cursor saved in checkpoint; rerun the task to continue.")
+                    raise
+
+                response_date = response_date or page.response_date
+                deleted += page.deleted
+                if page.complete_list_size and pbar.total is None:
+                    pbar.total = page.complete_list_size
+                for paper in page.records:
+                    pbar.update(1)
+                    if categories and not categories.intersection(paper['categories'].split()):
+                        other_categories += 1
+                        continue
+                    if paper['id'] in seen:
+                        continue
+                    seen.add(paper['id'])
+                    # Incremental mode: records whose datestamp did not change are already saved
+                    if self.is_known(paper['id'], paper['mdate']):
+                        unchanged += 1
+                        continue
+                    if self.checkpoint is not None:
+                        self.checkpoint.append(paper['id'], paper)
+                    yield paper
+                    if self.limit and len(seen) - unchanged >= self.limit:
+                        # A partial harvest must not move the watermark
+                        self.logger.info(f"    -> Reached limit of {self.limit} papers.")
+                        return
+
+                token = page.resumption_token
+                if self.checkpoint is not None:
+                    self.checkpoint.set_state(OAI_CURSOR_STATE, {'signature': signature, 'token': token,
+                                                                 'response_date': response_date})
+                if not token:
+                    break
+
+        self.logger.info(f"    -> OAI-PMH harvest complete: {len(seen) - unchanged} new or updated, "
+                         f"{unchanged} unchanged, {other_categories} in other categories, {deleted} deleted.")
+        # Next run starts at the day this harvest began ("from" is inclusive, so nothing is missed)
+        watermark = until or (response_date or datetime.now(timezone.utc).isoformat())[:10]
+        self._pending_watermark = {'set': set_spec, 'from': watermark,
+                                   'harvested_at': datetime.now(timezone.utc).isoformat(timespec='seconds')}
@@ -1,25 +1,76 @@
 # FILE: src/scrapers/base_scraper.py
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 import logging
 
+from src.utils.async_engine import AsyncCrawlEngine, FetchRequest, ParseCallback
+from src.utils.checkpoint import CheckpointJournal
+from src.utils.paper_filter import PaperFilter
+
+
 class BaseScraper(ABC):
     """
     所有抓取器类的抽象基类。
     定义了所有具体抓取器必须遵循的接口。
     """
 
-    def __init__(self, task_info: Dict[str, Any], logger: logging.Logger):
+    def __init__(self, task_info: Dict[str, Any], logger: logging.Logger,
+                 checkpoint: Optional[CheckpointJournal] = None,
+                 known_papers: Optional[Dict[str, Dict[str, Any]]] = None,
+                 paper_filter: Optional[PaperFilter] = None):
         """
         初始化抓取器。
 
         Args:
             task_info (Dict[str, Any]): 从 tasks.yaml 中读取并构建的特定任务配置。
             logger (logging.Logger): 从主程序传递过来的共享日志记录器。
+            checkpoint (CheckpointJournal, optional): 断点续爬日志；为 None 时不记录进度。
+            known_papers (Dict[str, Dict], optional): 增量模式下已保存的论文 ({id: 论文字典})。
+                抓取器应跳过这些论文的详情抓取，只返回新增或有更新的论文。
+            paper_filter (PaperFilter, optional): 任务 filters 的预编译谓词，默认由 task_info['filters'] 构建。
+                抓取器应在详情页、审稿等昂贵请求之前用它提前排除不匹配的论文 (见 keep_title / keep_paper)。
         """
         self.task_info = task_info
         self.logger = logger
+        self.checkpoint = checkpoint
+        self.known_papers = known_papers or {}
+        self._known_urls = {p.get('source_url') for p in self.known_papers.values() if p.get('source_url')}
+        self.paper_filter = paper_filter if paper_filter is not None else PaperFilter.from_task(task_info)
+
+    def keep_title(self, title: Any) -> bool:
+        """过滤下推 (标题阶段): 在访问详情页之前仅凭标题判断；排除时计入省去的请求数。"""
+        if self.paper_filter.matches_title(title):
+            return True
+        self.paper_filter.record_avoided()
+        return False
+
+    def keep_paper(self, paper: Dict[str, Any], avoids_fetch: bool = True) -> bool:
+        """
+        过滤下推 (标题 + 摘要阶段): 结果与主程序的最终过滤一致。
+        avoids_fetch 表示排除这篇论文是否省去了一次请求 (如审稿信息)，仅用于统计。
+        """
+        if self.paper_filter.matches(paper):
+            return True
+        if avoids_fetch:
+            self.paper_filter.record_avoided()
+        return False
+
+    def is_known(self, paper_id: Any, mdate: Any = None) -> bool:
+        """
+        增量模式: 判断某篇论文是否已保存且无需更新。
+        提供 mdate (数据源的最后修改时间) 时，只有与已保存的 mdate 一致才视为无需更新。
+        """
+        known = self.known_papers.get(str(paper_id))
+        if known is None:
+            return False
+        return mdate is None or str(known.get('mdate', '')) == str(mdate)
+
+    def commit_state(self):
+        """
+        任务结果成功保存后由主程序调用。需要跨运行保存状态的抓取器 (如 arXiv OAI-PMH 的抓取水位线)
+        应在这里写入，保证结果未落盘时状态不会前移。默认什么也不做。
+        """
 
     @abstractmethod
     def scrape(self) -> List[Dict[str, Any]]:
@@ -32,4 +83,79 @@ class BaseScraper(ABC):
         Returns:
             List[Dict[str, Any]]: 抓取到的论文信息列表。
         """
-        raise NotImplementedError("每个 scraper 子类必须实现 scrape 方法。")
\ No newline at end of file
+        raise NotImplementedError("每个 scraper 子类必须实现 scrape 方法。")
+
+    def iter_papers(self) -> Iterator[Dict[str, Any]]:
+        """
+        流式抓取接口: 逐条产出论文字典。
+
+        主程序以流水线方式消费它 (过滤 -> 写 CSV/Markdown -> 下载 PDF -> 统计)，
+        单个任务的内存占用不随论文数量增长。默认实现直接遍历 scrape() 的结果；
+        需要逐页/逐条抓取的子类应重写此方法，并让 scrape() 返回 list(self.iter_papers())。
+        """
+        yield from self.scrape()
+
+    def fetch_details(self, requests: Iterable[FetchRequest], total: Optional[int] = None,
+                      desc: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        并发抓取详情页的通用钩子，返回列表。流式版本见 iter_details。
+
+        Returns:
+            List[Dict[str, Any]]: 解析成功的论文列表 (已恢复的结果在前，其余按完成顺序)。
+        """
+        return list(self.iter_details(requests, total=total, desc=desc))
+
+    def iter_details(self, requests: Iterable[FetchRequest], total: Optional[int] = None,
+                     desc: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        并发抓取详情页，解析结果一产生就逐条产出。
+
+        子类只需产出 (url, parse_callback) 二元组，无需自行管理线程；
+        parse_callback(url, content) 接收响应体字节并返回论文字典 (失败时返回 None)。
+        并发参数读取自任务配置:
+            - max_workers: 每个主机的最大并发连接数 (默认 8)
+            - max_concurrency: 全局最大在途请求数 (默认 100)
+
+        启用断点续爬时，日志中已完成的 URL 直接复用上次的解析结果，新解析成功的结果会立即追加到日志。
+        增量模式下，source_url 已在 known_papers 中的详情页会被跳过，不出现在结果中。
+        """
+        restored_urls: List[str] = []
+        if self._known_urls or (self.checkpoint is not None and len(self.checkpoint)):
+            pending, skipped = [], 0
+            for url, callback in requests:
+                if url in self._known_urls:
+                    skipped += 1
+                elif self.checkpoint is not None and url in self.checkpoint:
+                    restored_urls.append(url)
+                else:
+                    pending.append((url, self._journaled(callback) if self.checkpoint is not None else callback))
+            if skipped:
+                self.logger.info(f"    -> [增量模式] 跳过 {skipped} 篇已保存的论文。")
+            if restored_urls:
+                self.logger.info(
+                    f"    -> [断点续爬] 从检查点恢复 {len(restored_urls)} 篇，剩余 {len(pending)} 篇待抓取。")
+            requests, total = pending, len(pending)
+        elif self.checkpoint is not None:
+            requests = ((url, self._journaled(callback)) for url, callback in requests)
+
+        for url in restored_urls:
+            yield self.checkpoint.get(url)
+        if total == 0:
+            return
+
+        engine = AsyncCrawlEngine(
+            max_concurrency=self.task_info.get("max_concurrency", 100),
+            per_host_limit=self.task_info.get("max_workers", 8),
+            logger=self.logger,
+        )
+        yield from engine.iter_results(requests, total=total, desc=desc)
+
+    def _journaled(self, callback: ParseCallback) -> ParseCallback:
+        """包装解析回调: 解析成功后把结果写入断点日志。"""
+        def parse_and_record(url: str, content: bytes) -> Optional[Dict[str, Any]]:
+            result = callback(url, content)
+            if result:
+                self.checkpoint.append(url, result)
+            return result
+
+        return parse_and_record
@@ -1,75 +1,67 @@
-# FILE: src/scrapers/cvf_scraper.py (Concurrent Version)
+# FILE: src/scrapers/cvf_scraper.py (Async Version)
 
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-from tqdm import tqdm
-from typing import List, Dict, Optional, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Iterator, Optional, Any
 
 from .base_scraper import BaseScraper
+from .parsers import parse_cvf_detail, parse_cvf_index, parse_in_pool
 from src.utils.network_utils import robust_get
 
+# fetch_mode:
+#   detail     逐一访问详情页 (默认，包含摘要)
+#   index_only 只解析 ?day=all 索引页 (标题、作者、PDF/补充材料链接)，不请求任何详情页，摘要为 N/A
+#   two_phase  先由索引页构建记录，再访问详情页补全摘要 (prefilter_titles: true 时只为标题通过 filters 的论文补全)
+FETCH_MODES = ('detail', 'index_only', 'two_phase')
+
 
 class CvfScraper(BaseScraper):
     """
     专门用于 CVF (CVPR, ICCV) 网站的爬虫。
-    此版本经过优化，使用多线程并发获取论文详情，以大幅提高速度。
+    此版本经过优化，通过 BaseScraper.fetch_details 的异步引擎并发获取论文详情，以大幅提高速度。
+    索引页本身已包含标题、作者与 PDF 链接，因此 index_only 模式无需请求详情页，
+    two_phase 模式配合 prefilter_titles 可以跳过大部分详情页请求。
     """
 
-    def _scrape_details_page(self, url: str) -> Optional[Dict[str, Any]]:
+    def _parse_details_page(self, url: str, content: bytes) -> Optional[Dict[str, Any]]:
         """
-        抓取并解析单个 CVF 论文详情页。这是将被并发执行的核心工作函数。
+        解析单个 CVF 论文详情页。由异步引擎在解析线程池中调用。
         """
-        response = robust_get(url, timeout=20)
-        if not response:
-            self.logger.debug(f"    -> 请求详情页失败 (已重试): {url}")
-            return None
-
         try:
-            soup = BeautifulSoup(response.content, 'lxml')
-
-            title_tag = soup.select_one("#papertitle")
-            title = title_tag.get_text(strip=True) if title_tag else "N/A"
-
-            author_tags = soup.select("#authors > b > i")
-            authors = ", ".join([a.get_text(strip=True) for a in author_tags]) if author_tags else "N/A"
-
-            abstract_tag = soup.select_one("#abstract")
-            abstract = abstract_tag.get_text(strip=True) if abstract_tag else "N/A"
-
-            pdf_url_tag = soup.select_one('meta[name="citation_pdf_url"]')
-            pdf_url = pdf_url_tag['content'] if pdf_url_tag else None
-            if pdf_url and not pdf_url.startswith('http'):
-                pdf_url = urljoin(url, pdf_url)
-
-            paper_id = url.strip('/').split('/')[-1].replace('.html', '')
-
-            return {'id': paper_id, 'title': title, 'authors': authors, 'abstract': abstract, 'pdf_url': pdf_url,
-                    'source_url': url}
+            return parse_cvf_detail(content, url)
         except Exception as e:
             self.logger.debug(f"    -> 解析 CVF 详情页失败 {url}: {e}")
             return None
 
     def scrape(self) -> List[Dict[str, Any]]:
+        return list(self.iter_papers())
+
+    def iter_papers(self) -> Iterator[Dict[str, Any]]:
         index_url = self.task_info["url"]
-        max_workers = self.task_info.get("max_workers", 1)
         max_papers_limit = self.task_info.get("max_papers_limit", 0)
 
         self.logger.info(f"    -> 正在抓取 CVF 索引页: {index_url}")
         response = robust_get(index_url)
         if not response:
-            return []
+            return
 
         if response.status_code == 404:
             self.logger.warning(f"    -> 页面未找到 (404): {index_url}")
-            return []
+            return
+
+        fetch_mode = self.task_info.get("fetch_mode", "detail")
+        if fetch_mode not in FETCH_MODES:
+            self.logger.warning(f"    -> [⚠ WARNING] 未知的 fetch_mode '{fetch_mode}'，改用 detail 模式。")
+            fetch_mode = "detail"
 
         try:
-            soup = BeautifulSoup(response.content, 'lxml')
-            link_tags = soup.select('dt.ptitle > a[href$=".html"]')
+            # ?day=all 索引页包含整届会议的论文，交给解析进程池处理
+            records = parse_in_pool(parse_cvf_index, response.content, index_url)
+            if fetch_mode != "detail":
+                yield from self._iter_index_papers(records, max_papers_limit, fetch_mode)
+                return
 
-            detail_urls = [urljoin(index_url, tag['href']) for tag in link_tags]
-            self.logger.info(f"    -> 索引页解析完成，共找到 {len(detail_urls)} 篇论文。")
+            self.logger.info(f"    -> 索引页解析完成，共找到 {len(records)} 篇论文。")
+            # 过滤下推: 索引页上的链接文本就是标题，不匹配的论文无需访问详情页
+            detail_urls = [r['source_url'] for r in records if self.keep_title(r['title'])]
 
             urls_to_crawl = detail_urls
             if max_papers_limit > 0:
@@ -78,21 +70,58 @@ class CvfScraper(BaseScraper):
                 self.logger.info(f"    -> 已应用数量限制，将爬取前 {len(urls_to_crawl)} 篇论文。")
 
             if not urls_to_crawl:
-                return []
+                return
 
-            papers = []
             pbar_desc = f"    -> 并发解析 {self.task_info.get('conference')} 详情页"
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_url = {executor.submit(self._scrape_details_page, url): url for url in urls_to_crawl}
-
-                for future in tqdm(as_completed(future_to_url), total=len(urls_to_crawl), desc=pbar_desc, leave=True):
-                    result = future.result()
-                    if result:
-                        papers.append(result)
-
-            return papers
+            detail_requests = ((url, self._parse_details_page) for url in urls_to_crawl)
+            yield from self.iter_details(detail_requests, total=len(urls_to_crawl), desc=pbar_desc)
 
         except Exception as e:
-            self.logger.error(f"    [✖ ERROR] 解析 CVF 页面时发生未知错误: {e}", exc_info=True)
-            return []
\ No newline at end of file
+            # 向上抛出: 由 run_single_task 丢弃不完整的输出并保留检查点
+            self.logger.error(f"    [✖ ERROR] 解析 CVF 页面时发生未知错误: {e}")
+            raise
+
+    def _iter_index_papers(self, records: List[Dict[str, Any]], max_papers_limit: int,
+                           fetch_mode: str) -> Iterator[Dict[str, Any]]:
+        """第一阶段: 仅由索引页构建记录；two_phase 模式下第二阶段为通过标题阶段过滤的论文补全摘要。"""
+        self.logger.info(f"    -> 索引页解析完成，共找到 {len(records)} 篇论文。")
+        # 与 detail 模式相同的顺序: 先按标题过滤，再应用数量限制，最后跳过已保存的论文
+        if fetch_mode == "index_only":
+            # 不请求详情页，标题阶段不省去任何请求，不计入统计
+            kept = [r for r in records if self.paper_filter.matches_title(r['title'])]
+        else:
+            kept = [r for r in records if self.keep_title(r['title'])]
+            if len(kept) < len(records):
+                self.logger.info(f"    -> [两阶段模式] {len(kept)}/{len(records)} 篇论文的标题通过过滤，"
+                                 f"跳过 {len(records) - len(kept)} 次详情页请求。")
+        if max_papers_limit > 0:
+            kept = kept[:max_papers_limit]
+            self.logger.info(f"    -> 已应用数量限制，将处理前 {len(kept)} 篇论文。")
+
+        records = [r for r in kept if r['source_url'] not in self._known_urls]
+        if fetch_mode == "index_only":
+            yield from records
+            return
+
+        pending = {r['source_url']: r for r in records}
+        if not pending:
+            return
+
+        pbar_desc = f"    -> 并发补全 {self.task_info.get('conference')} 摘要"
+        detail_requests = [(url, self._backfill_callback(record)) for url, record in pending.items()]
+        for paper in self.iter_details(detail_requests, total=len(detail_requests), desc=pbar_desc):
+            pending.pop(paper['source_url'], None)
+            yield paper
+        # 详情页抓取失败的论文仍保留索引页中的信息
+        yield from pending.values()
+
+    def _backfill_callback(self, record: Dict[str, Any]):
+        def parse(url: str, content: bytes) -> Optional[Dict[str, Any]]:
+            details = self._parse_details_page(url, content)
+            if not details:
+                return None
+            merged = dict(record)
+            merged.update({k: v for k, v in details.items() if v and v != 'N/A'})
+            return merged
+
+        return parse
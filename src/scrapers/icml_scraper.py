@@ -1,74 +1,108 @@
 # FILE: src/scrapers/icml_scraper.py
 
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-from tqdm import tqdm
-from typing import List, Dict, Optional, Any
-from bs4.element import Tag
+from typing import List, Dict, Optional, Any, Iterator
 
 from .base_scraper import BaseScraper
+from .parsers import ICML_ABSTRACT_PLACEHOLDER, parse_icml_index, parse_in_pool, parse_pmlr_abstract
 from src.utils.network_utils import robust_get  # <-- 导入新的工具函数
 
 
+def has_abstract(paper: Dict[str, Any]) -> bool:
+    abstract = str(paper.get('abstract', '') or '').strip()
+    return bool(abstract) and abstract != 'N/A' and abstract != ICML_ABSTRACT_PLACEHOLDER
+
+
 class IcmlScraper(BaseScraper):
-    """专门用于 ICML (PMLR) 网站的爬虫。"""
+    """
+    专门用于 ICML (PMLR) 网站的爬虫。
+
+    索引页只包含标题、作者与链接。启用 enrich_abstracts 后，会通过 BaseScraper.iter_details 的异步引擎
+    (共享连接池、限速器与磁盘缓存) 并发访问每篇论文的摘要页，补全摘要与 BibTeX 中的出版信息。
+    补全过程支持断点续爬；增量模式下已保存摘要的论文不会重复请求。
+    """
 
     def scrape(self) -> List[Dict[str, Any]]:
+        return list(self.iter_papers())
+
+    def iter_papers(self) -> Iterator[Dict[str, Any]]:
         index_url = self.task_info["url"]
         limit = self.task_info.get("limit")
-        papers = []
 
         self.logger.info(f"    -> 正在抓取 ICML 索引页: {index_url}")
 
         response = robust_get(index_url, timeout=45)  # <-- 使用 robust_get 并增加超时
         if not response:
-            return []
+            return
 
         try:
-            soup = BeautifulSoup(response.content, 'lxml')
-            paper_containers = soup.select('div.paper')
-            self.logger.info(f"    -> 找到了 {len(paper_containers)} 篇论文。")
+            # PMLR 卷索引页通常有数 MB，交给解析进程池处理
+            papers = parse_in_pool(parse_icml_index, response.content, index_url)
+            self.logger.info(f"    -> 找到了 {len(papers)} 篇论文。")
 
             if limit:
-                paper_containers = paper_containers[:limit]
+                papers = papers[:limit]
                 self.logger.info(f"    -> 应用限制：处理前 {limit} 篇论文。")
 
-            pbar_desc = f"    -> 正在解析 {self.task_info.get('conference')} 页面"
-            for paper_div in tqdm(paper_containers, desc=pbar_desc, leave=True):
-                paper_data = self._parse_paper_div(paper_div, index_url)
-                if paper_data:
-                    papers.append(paper_data)
-
-            return papers
-
         except Exception as e:
-            self.logger.error(f"    [✖ ERROR] 解析 ICML 页面时发生未知错误: {e}", exc_info=True)
-            return []
-
-    def _parse_paper_div(self, paper_div: Tag, base_url: str) -> Optional[Dict[str, Any]]:
-        """从单个 <div class="paper"> 中解析出所有信息。"""
+            self.logger.error(f"    [✖ ERROR] 解析 ICML 页面时发生未知错误: {e}")
+            raise
+
+        if not self.task_info.get("enrich_abstracts", False):
+            for paper in papers:
+                if not self.is_known(paper['id']):
+                    yield paper
+            return
+
+        yield from self._enrich_abstracts(papers)
+
+    def _enrich_abstracts(self, papers: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """并发访问摘要页补全论文信息；没有摘要页链接或摘要页抓取失败的论文仍以索引页中的信息产出。"""
+        # 增量模式: 已保存且有摘要的论文直接跳过；已保存但缺少摘要的 (如早先未启用补全) 重新请求
+        for paper in self.known_papers.values():
+            if not has_abstract(paper):
+                self._known_urls.discard(paper.get('source_url'))
+
+        pending = {}
+        for paper in papers:
+            if paper['source_url'] == 'N/A':
+                if not self.is_known(paper['id']):
+                    yield paper
+                continue
+            # 过滤下推: 标题不匹配的论文无需访问摘要页
+            if paper['source_url'] not in self._known_urls and self.keep_title(paper['title']):
+                pending[paper['source_url']] = paper
+        if not pending:
+            return
+
+        self.logger.info(f"    -> [摘要补全] 将并发访问 {len(pending)} 个 PMLR 摘要页。")
+        pbar_desc = f"    -> 并发补全 {self.task_info.get('conference')} 摘要"
+        requests = [(url, self._abstract_callback(paper)) for url, paper in pending.items()]
+        for paper in self.iter_details(requests, total=len(requests), desc=pbar_desc):
+            pending.pop(paper['source_url'], None)
+            yield paper
+        # 剩下的是摘要页抓取失败的论文，保留索引页中的信息 (摘要为占位符)，不能整篇丢失
+        if pending:
+            self.logger.warning(f"    [⚠ WARNING] {len(pending)} 个摘要页未能获取，这些论文只包含索引页信息。")
+        yield from pending.values()
+
+    def _abstract_callback(self, paper: Dict[str, Any]):
+        def parse(url: str, content: bytes) -> Optional[Dict[str, Any]]:
+            return self._parse_abstract_page(paper, url, content)
+
+        return parse
+
+    def _parse_abstract_page(self, paper: Dict[str, Any], url: str, content: bytes) -> Optional[Dict[str, Any]]:
+        """
+        解析 PMLR 摘要页，返回补全后的论文字典。由异步引擎在解析线程池中调用。
+        页面解析失败时仍返回索引页中的信息，避免因个别页面异常丢失论文。
+        """
+        enriched = dict(paper)
         try:
-            title_tag = paper_div.select_one('p.title')
-            title = title_tag.get_text(strip=True) if title_tag else "N/A"
-
-            authors_tag = paper_div.select_one('p.details span.authors')
-            authors = authors_tag.get_text(strip=True).replace(';', ', ') if authors_tag else "N/A"
-
-            links_p = paper_div.select_one('p.links')
-            if not links_p:
-                return None
-
-            source_url_tag = links_p.select_one('a:-soup-contains("abs")')
-            source_url = urljoin(base_url, source_url_tag['href']) if source_url_tag else 'N/A'
-
-            pdf_url_tag = links_p.select_one('a:-soup-contains("Download PDF")')
-            pdf_url = urljoin(base_url, pdf_url_tag['href']) if pdf_url_tag else 'N/A'
-
-            paper_id = source_url.split('/')[-1].replace('.html', '') if source_url != 'N/A' else title
-            abstract = "N/A (摘要需访问详情页)"
-
-            return {'id': paper_id, 'title': title, 'authors': authors, 'abstract': abstract, 'pdf_url': pdf_url,
-                    'source_url': source_url}
+            fields = parse_pmlr_abstract(content, url)
+            # 索引页已有 PDF 链接时以索引页为准
+            if enriched.get('pdf_url') not in (None, 'N/A'):
+                fields.pop('pdf_url', None)
+            enriched.update(fields)
         except Exception as e:
-            self.logger.debug(f"    -> 从 ICML 容器解析失败: {e}")
-            return None
\ No newline at end of file
+            self.logger.debug(f"    -> 解析 PMLR 摘要页失败 {url}: {e}")
+        return enriched
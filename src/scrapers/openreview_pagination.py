@@ -0,0 +1,70 @@
+# FILE: src/scrapers/openreview_pagination.py
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 1000     # OpenReview API 单次请求的最大返回数量
+DEFAULT_PAGE_WORKERS = 4     # 同时在途的分页请求数，实际速率仍由 OpenReview 主机的限速器控制
+
+
+def _get_page_with_retry(client: Any, query: Dict[str, Any], offset: int, limit: int, max_retries: int,
+                         log: logging.Logger) -> List[Any]:
+    for attempt in range(max_retries):
+        try:
+            return client.get_notes(**query, limit=limit, offset=offset)
+        except Exception as e:
+            log.warning(f"    -> [OpenReview] offset={offset} 第 {attempt + 1}/{max_retries} 次请求失败: {e}")
+            if attempt < max_retries - 1:
+                time.sleep(5 * (attempt + 1))  # 等待时间逐渐增加
+            else:
+                raise
+
+
+def iter_note_pages(client: Any, query: Dict[str, Any], page_size: int = DEFAULT_PAGE_SIZE,
+                    workers: int = DEFAULT_PAGE_WORKERS, limit: Optional[int] = None, max_retries: int = 3,
+                    log: Optional[logging.Logger] = None) -> Iterator[List[Any]]:
+    """
+    按 offset 窗口并发获取 OpenReview note，按 offset 顺序逐页产出。
+
+    总数事先未知，因此维持一个宽度为 workers 的滑动窗口: 始终有 workers 个后续页面在途，
+    一旦某页返回的数量不足 page_size (或达到 limit)，就不再提交更远的窗口。
+    client 可以是 API v1 (openreview.Client) 或 API v2 (openreview.api.OpenReviewClient)，
+    两者的 get_notes 都支持 limit/offset 分页。query 为传给 get_notes 的其他参数 (如 content、details)。
+    """
+    log = log or logger
+    if limit:
+        page_size = min(page_size, limit)
+    workers = max(1, workers)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="openreview-page") as executor:
+        pending = {}
+        next_offset = 0
+
+        def submit_until_full():
+            nonlocal next_offset
+            while len(pending) < workers and (not limit or next_offset < limit):
+                page_limit = min(page_size, limit - next_offset) if limit else page_size
+                pending[next_offset] = executor.submit(_get_page_with_retry, client, query, next_offset, page_limit,
+                                                       max_retries, log)
+                next_offset += page_size
+
+        submit_until_full()
+        offset = 0
+        try:
+            while offset in pending:
+                page = pending.pop(offset).result()
+                if page:
+                    yield page
+                expected = min(page_size, limit - offset) if limit else page_size
+                if len(page) < expected or (limit and offset + len(page) >= limit):
+                    break
+                offset += page_size
+                submit_until_full()
+        finally:
+            # 已到末尾或调用方提前停止: 取消尚未开始的多余窗口
+            for future in pending.values():
+                future.cancel()
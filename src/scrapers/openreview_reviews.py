@@ -0,0 +1,61 @@
+# FILE: src/scrapers/openreview_reviews.py
+
+import logging
+import re
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DECISION_PATTERN = re.compile(r'/Decision', re.IGNORECASE)
+REVIEW_PATTERN = re.compile(r'/Review|/Official_Review', re.IGNORECASE)
+# API v2 的 replies 与 API v1 的 directReplies 都挂在投稿的 details 上
+REPLY_DETAILS = {'v1': 'directReplies', 'v2': 'replies'}
+
+
+def empty_review_summary() -> Dict[str, Any]:
+    return {'decision': 'N/A', 'avg_rating': None, 'review_ratings': []}
+
+
+def _invitations(reply: Any) -> List[str]:
+    """兼容 Note 对象与 JSON 字典，兼容 API v2 的 invitations 列表与 API v1 的单个 invitation。"""
+    if isinstance(reply, dict):
+        invitations = reply.get('invitations') or [reply.get('invitation')]
+    else:
+        invitations = getattr(reply, 'invitations', None) or [getattr(reply, 'invitation', None)]
+    return [inv for inv in invitations if inv]
+
+
+def _content_value(reply: Any, field_name: str) -> Any:
+    content = reply.get('content', {}) if isinstance(reply, dict) else getattr(reply, 'content', {})
+    field_data = (content or {}).get(field_name)
+    # API v2 的字段形如 {'value': ...}，API v1 直接是值
+    if isinstance(field_data, dict):
+        return field_data.get('value')
+    return field_data
+
+
+def summarize_reviews(replies: Iterable[Any]) -> Dict[str, Any]:
+    """从一篇论文的回复 (审稿、决定、评论等) 中提取决定与评分。"""
+    ratings, decision = [], 'N/A'
+    for reply in replies:
+        invitations = _invitations(reply)
+        if any(DECISION_PATTERN.search(inv) for inv in invitations):
+            decision_value = _content_value(reply, 'decision')
+            if decision_value: decision = str(decision_value)
+        if any(REVIEW_PATTERN.search(inv) for inv in invitations):
+            rating_val = _content_value(reply, 'rating')
+            if isinstance(rating_val, str):
+                match = re.search(r'^\d+', rating_val)
+                if match: ratings.append(int(match.group(0)))
+            elif isinstance(rating_val, (int, float)):
+                ratings.append(int(rating_val))
+    return {'decision': decision, 'avg_rating': round(np.mean(ratings), 2) if ratings else None,
+            'review_ratings': ratings}
+
+
+def summarize_note_replies(note: Any, api_version: str = 'v2') -> Dict[str, Any]:
+    """汇总以 details=replies/directReplies 获取的投稿上附带的回复。"""
+    details = REPLY_DETAILS.get(api_version, 'replies')
+    return summarize_reviews((getattr(note, 'details', None) or {}).get(details) or [])
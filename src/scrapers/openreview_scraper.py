@@ -0,0 +1,139 @@
+# FILE: src/scrapers/openreview_scraper.py
+
+import openreview
+import openreview.api
+from tqdm import tqdm
+from typing import List, Dict, Any, Iterator
+
+from .base_scraper import BaseScraper
+from .openreview_pagination import DEFAULT_PAGE_SIZE, DEFAULT_PAGE_WORKERS, iter_note_pages
+from .openreview_reviews import REPLY_DETAILS, empty_review_summary, summarize_note_replies, summarize_reviews
+from src.utils.network_utils import get_http_client
+
+OPENREVIEW_BASEURLS = {'v1': 'https://api.openreview.net', 'v2': 'https://api2.openreview.net'}
+
+
+class OpenReviewScraper(BaseScraper):
+    """
+    通用的 OpenReview 爬虫，适用于任何以 venueid 组织投稿的 venue (ICLR、NeurIPS、TMLR、workshop 等)。
+
+    投稿按 offset 窗口并发分页获取 (page_size / pagination_workers)，每页到达后立即逐篇解析并产出，
+    不必等待整个 venue 下载完毕。同时支持 API v1 与 API v2。
+    """
+
+    def scrape(self) -> List[Dict[str, Any]]:
+        return list(self.iter_papers())
+
+    def _create_client(self, api_version: str) -> Any:
+        if api_version == "v1":
+            client = openreview.Client(baseurl=OPENREVIEW_BASEURLS['v1'])
+        else:
+            client = openreview.api.OpenReviewClient(baseurl=OPENREVIEW_BASEURLS['v2'])
+        self._attach_rate_limiter(client)
+        return client
+
+    def iter_papers(self) -> Iterator[Dict[str, Any]]:
+        api_version = self.task_info.get("api_version", "v2")
+        venue_id = self.task_info["venue_id"]
+        limit = self.task_info.get("limit")
+        fetch_reviews = self.task_info.get("fetch_reviews", False)
+        page_size = self.task_info.get("page_size", DEFAULT_PAGE_SIZE)
+        workers = self.task_info.get("pagination_workers", DEFAULT_PAGE_WORKERS)
+        label = self.task_info.get("conference") or venue_id
+
+        self.logger.info(f"    -> 使用 OpenReview API v{api_version} for venue: {venue_id}")
+        # bulk: 投稿分页请求时一并带回全部回复 (details)，在本地按投稿归并审稿与决定 (默认)
+        # per_forum: 逐篇调用 get_notes(forum=...)，适合只抓取少量论文时
+        review_fetch_mode = self.task_info.get("review_fetch_mode", "bulk")
+        if fetch_reviews:
+            self.logger.info(f"    -> 已启用审稿信息获取 (模式: {review_fetch_mode})。请求速率由 OpenReview 主机的限速器控制。")
+
+        try:
+            client = self._create_client(api_version)
+            query = {'content': {'venueid': venue_id}}
+            bulk_reviews = fetch_reviews and review_fetch_mode == "bulk"
+            client_v2_for_reviews = None
+            if bulk_reviews:
+                query['details'] = REPLY_DETAILS.get(api_version, 'replies')
+            elif fetch_reviews:
+                # 审稿请求走共享限速器 (api2.openreview.net)，取代固定的 sleep
+                client_v2_for_reviews = self._create_client("v2")
+
+            if self.checkpoint is not None and len(self.checkpoint):
+                self.logger.info(f"    -> [断点续爬] 检查点中已有 {len(self.checkpoint)} 篇论文，将跳过这些 note。")
+            self.logger.info(f"    -> 以 {workers} 个并发分页窗口获取投稿 (每页 {page_size} 篇)。")
+
+            unchanged, emitted = 0, 0
+            with tqdm(total=limit, desc=f"    -> 正在解析 {label} 论文", leave=True) as pbar:
+                for page in iter_note_pages(client, query, page_size=page_size, workers=workers, limit=limit,
+                                            log=self.logger):
+                    for note in page:
+                        pbar.update(1)
+                        # 增量模式: 已保存且 mdate 未变化的 note 无需重新解析和获取审稿信息
+                        if self.is_known(note.id, self._note_mdate(note)):
+                            unchanged += 1
+                            continue
+                        if self.checkpoint is not None and note.id in self.checkpoint:
+                            emitted += 1
+                            yield self.checkpoint.get(note.id)
+                            continue
+                        paper_details = self._parse_note(note)
+                        # 过滤下推: note 已包含标题与摘要，不匹配的论文无需获取审稿信息 (per_forum 模式省去一次请求)
+                        if not self.keep_paper(paper_details, avoids_fetch=client_v2_for_reviews is not None):
+                            continue
+                        emitted += 1
+                        if bulk_reviews:
+                            paper_details.update(summarize_note_replies(note, api_version))
+                        elif client_v2_for_reviews:
+                            paper_details.update(self._fetch_review_details(client_v2_for_reviews, note.id))
+                        if self.checkpoint is not None:
+                            self.checkpoint.append(note.id, paper_details)
+                        yield paper_details
+
+            self.logger.info(f"    -> 共处理 {unchanged + emitted} 份提交。")
+            if unchanged:
+                self.logger.info(f"    -> [增量模式] {unchanged} 篇论文未变化，{emitted} 篇新增或有更新。")
+
+        except Exception as e:
+            # 向上抛出: 由 run_single_task 丢弃不完整的输出并保留检查点，重新运行即可从断点继续
+            self.logger.error(f"    [✖ ERROR] {label} OpenReview 抓取失败: {e}")
+            raise
+
+    def _attach_rate_limiter(self, client: Any):
+        """为 openreview-py 客户端内部的 Session 挂载共享的重试与限速适配器。"""
+        session = getattr(client, 'session', None)
+        if session is not None:
+            get_http_client().attach(session)
+
+    @staticmethod
+    def _note_mdate(note: Any) -> Any:
+        """note 的最后修改时间 (毫秒时间戳)，用于增量模式判断是否有更新。"""
+        return getattr(note, 'tmdate', None) or getattr(note, 'mdate', None)
+
+    def _parse_note(self, note: Any) -> Dict[str, Any]:
+        """解析单个 OpenReview note 对象。"""
+        content = note.content
+
+        def get_field_robust(field_name, default_value):
+            field_data = content.get(field_name)
+            if isinstance(field_data, dict):
+                return field_data.get('value', default_value)
+            return field_data if field_data is not None else default_value
+
+        return {
+            'id': note.id,
+            'title': get_field_robust('title', 'N/A'),
+            'authors': ', '.join(get_field_robust('authors', [])),
+            'abstract': get_field_robust('abstract', 'N/A'),
+            'pdf_url': f"https://openreview.net/pdf?id={note.id}",
+            'source_url': f"https://openreview.net/forum?id={note.id}",
+            'mdate': self._note_mdate(note)
+        }
+
+    def _fetch_review_details(self, client: openreview.api.OpenReviewClient, forum_id: str) -> Dict[str, Any]:
+        """获取单个论文的审稿信息 (per_forum 模式)。"""
+        try:
+            return summarize_reviews(client.get_notes(forum=forum_id))
+        except Exception as e:
+            self.logger.debug(f"获取审稿信息失败 forum_id={forum_id}: {e}")
+        return empty_review_summary()
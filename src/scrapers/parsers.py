@@ -0,0 +1,577 @@
+# FILE: src/scrapers/parsers.py
+
+"""
+HTML 解析层: ICML (PMLR)、ACL Anthology、CVF、AAAI (OJS) 与 ACM DL 页面的解析函数。
+
+- 每个页面类型提供一个纯函数 parse_xxx(content, url)，输入响应体字节，输出论文字典或列表，
+  不依赖 scraper 实例，因此可以在解析线程池或进程池中直接调用。
+- 默认使用 lxml XPath 快速路径 (不构建 BeautifulSoup 树，不运行 CSS 选择器)；
+  lxml 不可用、配置为 bs4 或快速路径出错时，回退到与旧实现一致的 BeautifulSoup 解析。
+  两种实现的输出由 src/test/test_parsers.py 在保存的页面样本上逐字段比对。
+- PMLR、CVF ?day=all 这类大索引页通过 parse_in_pool 交给独立进程解析，不占用 I/O 线程与事件循环所在进程的 GIL。
+"""
+
+import logging
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+from bs4.dammit import UnicodeDammit
+
+from src.utils.bibtex import parse_bibtex_fields
+
+# 尝试导入 lxml，如果失败则所有解析都使用 BeautifulSoup
+try:
+    import lxml.html
+
+    IS_LXML_AVAILABLE = True
+except ImportError:
+    lxml = None
+    IS_LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ICML_ABSTRACT_PLACEHOLDER = "N/A (摘要需访问详情页)"
+# 从 PMLR 摘要页 BibTeX 中提取并写入结果的字段
+PMLR_BIBTEX_FIELDS = ('booktitle', 'volume', 'pages', 'publisher')
+
+BACKENDS = ('auto', 'lxml', 'bs4')
+_settings = {'backend': 'auto', 'process_pool_min_bytes': 512 * 1024, 'process_workers': 2}
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def configure_parsers(backend: str = 'auto', process_pool_min_kb: int = 512, process_workers: int = 2):
+    """
+    使用 tasks.yaml 中 `parsing:` 小节的参数配置解析层。
+    backend: auto (有 lxml 时使用快速路径) / lxml / bs4；
+    process_pool_min_kb: 不小于该大小的索引页交给进程池解析，0 表示不使用进程池；
+    process_workers: 解析进程数。
+    """
+    global _pool
+    if backend not in BACKENDS:
+        logger.warning(f"    -> [⚠ WARNING] 未知的解析后端 '{backend}'，改用 auto。")
+        backend = 'auto'
+    _settings.update(backend=backend, process_pool_min_bytes=int(process_pool_min_kb) * 1024,
+                     process_workers=max(1, int(process_workers)))
+    with _pool_lock:
+        old_pool, _pool = _pool, None
+    if old_pool is not None:
+        old_pool.shutdown(wait=False)
+
+
+def _use_lxml() -> bool:
+    return IS_LXML_AVAILABLE and _settings['backend'] != 'bs4'
+
+
+def _dispatch(fast: Callable, fallback: Callable, content: bytes, url: str) -> Any:
+    if _use_lxml():
+        try:
+            return fast(content, url)
+        except Exception as e:
+            logger.debug(f"    -> lxml 快速解析失败，回退到 BeautifulSoup: {url}: {e}")
+    return fallback(content, url)
+
+
+# --- 进程池 ---
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # 进程池在抓取线程中按需创建，此时进程内已有其他线程 (可能持有锁): 用 spawn 启动全新的解析进程，
+            # 不 fork 多线程进程
+            _pool = ProcessPoolExecutor(max_workers=_settings['process_workers'],
+                                        mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+
+def _apply_backend(backend: str, func: Callable, content: bytes, url: str) -> Any:
+    """在解析进程中执行: 子进程不会继承主进程运行时的配置，因此随任务一起传入后端。"""
+    _settings['backend'] = backend
+    return func(content, url)
+
+
+def parse_in_pool(func: Callable[[bytes, str], Any], content: bytes, url: str) -> Any:
+    """
+    解析大页面: 内容不小于 process_pool_min_kb 时在进程池中执行 func(content, url)，否则就地执行。
+    进程池不可用 (例如受限环境无法创建子进程) 时自动回退为就地解析。
+    """
+    min_bytes = _settings['process_pool_min_bytes']
+    if not min_bytes or len(content) < min_bytes:
+        return func(content, url)
+    try:
+        return _get_pool().submit(_apply_backend, _settings['backend'], func, content, url).result()
+    except (BrokenProcessPool, OSError, RuntimeError) as e:
+        logger.warning(f"    -> [⚠ WARNING] 解析进程池不可用，改为就地解析: {e}")
+        return func(content, url)
+
+
+def shutdown_parse_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+# --- lxml 辅助函数 ---
+
+def _lxml_root(content: bytes):
+    if isinstance(content, bytes):
+        try:
+            text = content.decode('utf-8')
+        except UnicodeDecodeError:
+            text = UnicodeDammit(content).unicode_markup
+    else:
+        text = content
+    # lxml 不接受带编码声明的 Unicode 字符串
+    text = re.sub(r'^\s*<\?xml[^>]*\?>', '', text)
+    return lxml.html.fromstring(text)
+
+
+def _soup(content: bytes) -> BeautifulSoup:
+    return BeautifulSoup(content, 'lxml' if IS_LXML_AVAILABLE else 'html.parser')
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _text(elem, separator: str = '') -> str:
+    """等价于 BeautifulSoup 的 get_text(separator, strip=True)。"""
+    return separator.join(t.strip() for t in elem.xpath('.//text()') if t.strip())
+
+
+def _first(elements: list):
+    return elements[0] if elements else None
+
+
+def _meta_pdf_url(root, url: str) -> Optional[str]:
+    pdf_url = _first(root.xpath('//meta[@name="citation_pdf_url"]/@content'))
+    if pdf_url and not pdf_url.startswith('http'):
+        pdf_url = urljoin(url, pdf_url)
+    return pdf_url
+
+
+def _bs4_meta_pdf_url(soup: BeautifulSoup, url: str) -> Optional[str]:
+    pdf_url_tag = soup.select_one('meta[name="citation_pdf_url"]')
+    pdf_url = pdf_url_tag['content'] if pdf_url_tag else None
+    if pdf_url and not pdf_url.startswith('http'):
+        pdf_url = urljoin(url, pdf_url)
+    return pdf_url
+
+
+# --- ICML / PMLR ---
+
+def _collect_entries(containers: list, parse_entry: Callable, base_url: str, label: str) -> list:
+    """逐个解析索引页中的条目；单个条目解析失败 (返回 None 或抛出异常) 时跳过该条目。"""
+    results = []
+    for container in containers:
+        try:
+            entry = parse_entry(container, base_url)
+        except Exception as e:
+            logger.debug(f"    -> 从 {label} 容器解析失败: {e}")
+            continue
+        if entry is not None:
+            results.append(entry)
+    return results
+
+
+def _icml_record(title: str, authors: str, source_url: str, pdf_url: str) -> Dict[str, Any]:
+    paper_id = source_url.split('/')[-1].replace('.html', '') if source_url != 'N/A' else title
+    return {'id': paper_id, 'title': title, 'authors': authors, 'abstract': ICML_ABSTRACT_PLACEHOLDER,
+            'pdf_url': pdf_url, 'source_url': source_url}
+
+
+def _icml_entry_lxml(paper_div, base_url: str) -> Optional[Dict[str, Any]]:
+    title_tag = _first(paper_div.xpath(f'.//p[{_has_class("title")}]'))
+    title = _text(title_tag) if title_tag is not None else "N/A"
+    authors_tag = _first(paper_div.xpath(f'.//p[{_has_class("details")}]//span[{_has_class("authors")}]'))
+    authors = _text(authors_tag).replace(';', ', ') if authors_tag is not None else "N/A"
+
+    links_p = _first(paper_div.xpath(f'.//p[{_has_class("links")}]'))
+    if links_p is None:
+        return None
+    # 与 :-soup-contains() 一致: 链接文本包含关键字即可
+    source_link = _first(links_p.xpath('.//a[contains(string(.), "abs")]'))
+    pdf_link = _first(links_p.xpath('.//a[contains(string(.), "Download PDF")]'))
+    return _icml_record(title, authors,
+                        urljoin(base_url, source_link.attrib['href']) if source_link is not None else 'N/A',
+                        urljoin(base_url, pdf_link.attrib['href']) if pdf_link is not None else 'N/A')
+
+
+def _icml_entry_bs4(paper_div, base_url: str) -> Optional[Dict[str, Any]]:
+    title_tag = paper_div.select_one('p.title')
+    title = title_tag.get_text(strip=True) if title_tag else "N/A"
+    authors_tag = paper_div.select_one('p.details span.authors')
+    authors = authors_tag.get_text(strip=True).replace(';', ', ') if authors_tag else "N/A"
+
+    links_p = paper_div.select_one('p.links')
+    if not links_p:
+        return None
+    source_url_tag = links_p.select_one('a:-soup-contains("abs")')
+    pdf_url_tag = links_p.select_one('a:-soup-contains("Download PDF")')
+    return _icml_record(title, authors,
+                        urljoin(base_url, source_url_tag['href']) if source_url_tag else 'N/A',
+                        urljoin(base_url, pdf_url_tag['href']) if pdf_url_tag else 'N/A')
+
+
+def _parse_icml_index_lxml(content: bytes, base_url: str) -> List[Dict[str, Any]]:
+    paper_divs = _lxml_root(content).xpath(f'//div[{_has_class("paper")}]')
+    return _collect_entries(paper_divs, _icml_entry_lxml, base_url, 'ICML')
+
+
+def _parse_icml_index_bs4(content: bytes, base_url: str) -> List[Dict[str, Any]]:
+    return _collect_entries(_soup(content).select('div.paper'), _icml_entry_bs4, base_url, 'ICML')
+
+
+def parse_icml_index(content: bytes, base_url: str) -> List[Dict[str, Any]]:
+    """解析 PMLR 卷索引页，返回每篇论文的基本信息 (摘要为占位符)。"""
+    return _dispatch(_parse_icml_index_lxml, _parse_icml_index_bs4, content, base_url)
+
+
+def _pmlr_abstract_fields(abstract: Optional[str], pdf_url: Optional[str], bibtex_text: Optional[str],
+                          url: str) -> Dict[str, Any]:
+    bibtex = parse_bibtex_fields(bibtex_text) if bibtex_text else {}
+    abstract = abstract or bibtex.get('abstract')
+    fields = {field: bibtex[field] for field in PMLR_BIBTEX_FIELDS if bibtex.get(field)}
+    if abstract:
+        fields['abstract'] = re.sub(r'\s+', ' ', abstract)
+    if pdf_url:
+        fields['pdf_url'] = urljoin(url, pdf_url)
+    return fields
+
+
+def _parse_pmlr_abstract_lxml(content: bytes, url: str) -> Dict[str, Any]:
+    root = _lxml_root(content)
+    bibtex_tag = _first(root.xpath('//*[@id="bibtex"]'))
+    abstract_tag = _first(root.xpath('//div[@id="abstract"]'))
+    if abstract_tag is None:
+        abstract_tag = _first(root.xpath(f'//div[{_has_class("abstract")}]'))
+    return _pmlr_abstract_fields(_text(abstract_tag, ' ') if abstract_tag is not None else None,
+                                 _first(root.xpath('//meta[@name="citation_pdf_url"]/@content')),
+                                 ''.join(bibtex_tag.xpath('.//text()')) if bibtex_tag is not None else None, url)
+
+
+def _parse_pmlr_abstract_bs4(content: bytes, url: str) -> Dict[str, Any]:
+    soup = _soup(content)
+    bibtex_tag = soup.select_one('#bibtex')
+    abstract_tag = soup.select_one('div#abstract') or soup.select_one('div.abstract')
+    pdf_tag = soup.select_one('meta[name="citation_pdf_url"]')
+    return _pmlr_abstract_fields(abstract_tag.get_text(" ", strip=True) if abstract_tag else None,
+                                 pdf_tag.get('content') if pdf_tag else None,
+                                 bibtex_tag.get_text() if bibtex_tag else None, url)
+
+
+def parse_pmlr_abstract(content: bytes, url: str) -> Dict[str, Any]:
+    """
+    解析 PMLR 摘要页，返回可补全的字段: abstract、pdf_url (citation_pdf_url) 与 BibTeX 中的出版信息。
+    缺失的字段不出现在结果中。
+    """
+    return _dispatch(_parse_pmlr_abstract_lxml, _parse_pmlr_abstract_bs4, content, url)
+
+
+# --- ACL Anthology ---
+
+def _parse_acl_index_lxml(content: bytes, base_url: str) -> List[Tuple[str, str]]:
+    root = _lxml_root(content)
+    links = root.xpath(f'//p[{_has_class("d-sm-flex")}]//strong//a[{_has_class("align-middle")}]')
+    return [(urljoin(base_url, a.get('href')), ''.join(a.xpath('.//text()'))) for a in links if a.get('href')]
+
+
+def _parse_acl_index_bs4(content: bytes, base_url: str) -> List[Tuple[str, str]]:
+    soup = _soup(content)
+    return [(urljoin(base_url, tag['href']), tag.get_text())
+            for tag in soup.select('p.d-sm-flex strong a.align-middle') if tag.get('href')]
+
+
+def parse_acl_index(content: bytes, base_url: str) -> List[Tuple[str, str]]:
+    """解析 ACL Anthology 卷页面，返回 [(详情页 URL, 标题)]。"""
+    return _dispatch(_parse_acl_index_lxml, _parse_acl_index_bs4, content, base_url)
+
+
+def _parse_acl_detail_lxml(content: bytes, url: str) -> Dict[str, Any]:
+    root = _lxml_root(content)
+    title_tag = _first(root.xpath('//h2[@id="title"]'))
+    author_tags = root.xpath(f'//p[{_has_class("lead")}]//a')
+    abstract_tag = _first(root.xpath(f'//div[{_has_class("acl-abstract")}]/span'))
+    return {'id': url.strip('/').split('/')[-1],
+            'title': _text(title_tag) if title_tag is not None else "N/A",
+            'authors': ", ".join(_text(a) for a in author_tags) if author_tags else "N/A",
+            'abstract': _text(abstract_tag) if abstract_tag is not None else "N/A",
+            'pdf_url': _meta_pdf_url(root, url), 'source_url': url}
+
+
+def _parse_acl_detail_bs4(content: bytes, url: str) -> Dict[str, Any]:
+    soup = _soup(content)
+    title_tag = soup.select_one("h2#title")
+    author_tags = soup.select("p.lead a")
+    abstract_tag = soup.select_one("div.acl-abstract > span")
+    return {'id': url.strip('/').split('/')[-1],
+            'title': title_tag.get_text(strip=True) if title_tag else "N/A",
+            'authors': ", ".join([a.get_text(strip=True) for a in author_tags]) if author_tags else "N/A",
+            'abstract': abstract_tag.get_text(strip=True) if abstract_tag else "N/A",
+            'pdf_url': _bs4_meta_pdf_url(soup, url), 'source_url': url}
+
+
+def parse_acl_detail(content: bytes, url: str) -> Dict[str, Any]:
+    """解析单个 ACL 论文详情页。"""
+    return _dispatch(_parse_acl_detail_lxml, _parse_acl_detail_bs4, content, url)
+
+
+# --- CVF ---
+
+def _cvf_paper_id(url: str) -> str:
+    return url.strip('/').split('/')[-1].replace('.html', '')
+
+
+def _cvf_index_record(url: str, title: str, authors: List[str], pdf_url: Optional[str],
+                      supp_url: Optional[str]) -> Dict[str, Any]:
+    record = {'id': _cvf_paper_id(url), 'title': title or "N/A",
+              'authors': ", ".join(a for a in authors if a) or "N/A",
+              'abstract': "N/A", 'pdf_url': pdf_url, 'source_url': url}
+    if supp_url:
+        record['supp_url'] = supp_url
+    return record
+
+
+def _cvf_entry_lxml(dt, base_url: str) -> Optional[Dict[str, Any]]:
+    link = _first([a for a in dt.xpath('.//a[@href]') if a.get('href').endswith('.html')])
+    if link is None:
+        return None
+    url = urljoin(base_url, link.get('href'))
+    author_dd, links_dd = (dt.xpath('following-sibling::dd[position() <= 2]') + [None, None])[:2]
+
+    authors = []
+    if author_dd is not None:
+        authors = [(v or '').strip() for v in author_dd.xpath('.//input[@name="query_author"]/@value')] or \
+                  [a.strip() for a in ''.join(author_dd.xpath('.//text()')).split(',')]
+
+    pdf_url, supp_url = None, None
+    if links_dd is not None:
+        for a in links_dd.xpath('.//a[@href]'):
+            label = _text(a).lower()
+            if label == 'pdf' and not pdf_url:
+                pdf_url = urljoin(base_url, a.get('href'))
+            elif label == 'supp' and not supp_url:
+                supp_url = urljoin(base_url, a.get('href'))
+    return _cvf_index_record(url, _text(link), authors, pdf_url, supp_url)
+
+
+def _cvf_entry_bs4(dt, base_url: str) -> Optional[Dict[str, Any]]:
+    link = dt.select_one('a[href$=".html"]')
+    if not link:
+        return None
+    url = urljoin(base_url, link['href'])
+    author_dd, links_dd = (dt.find_next_siblings('dd', limit=2) + [None, None])[:2]
+
+    authors = []
+    if author_dd is not None:
+        inputs = author_dd.select('input[name="query_author"]')
+        authors = [i.get('value', '').strip() for i in inputs] or \
+                  [a.strip() for a in author_dd.get_text().split(',')]
+
+    pdf_url, supp_url = None, None
+    if links_dd is not None:
+        for a in links_dd.select('a[href]'):
+            label = a.get_text(strip=True).lower()
+            if label == 'pdf' and not pdf_url:
+                pdf_url = urljoin(base_url, a['href'])
+            elif label == 'supp' and not supp_url:
+                supp_url = urljoin(base_url, a['href'])
+    return _cvf_index_record(url, link.get_text(strip=True), authors, pdf_url, supp_url)
+
+
+def _parse_cvf_index_lxml(content: bytes, base_url: str) -> List[Dict[str, Any]]:
+    return _collect_entries(_lxml_root(content).xpath(f'//dt[{_has_class("ptitle")}]'), _cvf_entry_lxml, base_url,
+                            'CVF')
+
+
+def _parse_cvf_index_bs4(content: bytes, base_url: str) -> List[Dict[str, Any]]:
+    return _collect_entries(_soup(content).select('dt.ptitle'), _cvf_entry_bs4, base_url, 'CVF')
+
+
+def parse_cvf_index(content: bytes, base_url: str) -> List[Dict[str, Any]]:
+    """
+    解析 CVF ?day=all 索引页: <dt class="ptitle"> 为标题与详情页链接，
+    其后第一个 <dd> 为作者列表，第二个 <dd> 为 pdf / supp / arXiv 等链接。摘要为 N/A。
+    """
+    return _dispatch(_parse_cvf_index_lxml, _parse_cvf_index_bs4, content, base_url)
+
+
+def _parse_cvf_detail_lxml(content: bytes, url: str) -> Dict[str, Any]:
+    root = _lxml_root(content)
+    title_tag = _first(root.xpath('//*[@id="papertitle"]'))
+    author_tags = root.xpath('//*[@id="authors"]/b/i')
+    abstract_tag = _first(root.xpath('//*[@id="abstract"]'))
+    return {'id': _cvf_paper_id(url),
+            'title': _text(title_tag) if title_tag is not None else "N/A",
+            'authors': ", ".join(_text(a) for a in author_tags) if author_tags else "N/A",
+            'abstract': _text(abstract_tag) if abstract_tag is not None else "N/A",
+            'pdf_url': _meta_pdf_url(root, url), 'source_url': url}
+
+
+def _parse_cvf_detail_bs4(content: bytes, url: str) -> Dict[str, Any]:
+    soup = _soup(content)
+    title_tag = soup.select_one("#papertitle")
+    author_tags = soup.select("#authors > b > i")
+    abstract_tag = soup.select_one("#abstract")
+    return {'id': _cvf_paper_id(url),
+            'title': title_tag.get_text(strip=True) if title_tag else "N/A",
+            'authors': ", ".join([a.get_text(strip=True) for a in author_tags]) if author_tags else "N/A",
+            'abstract': abstract_tag.get_text(strip=True) if abstract_tag else "N/A",
+            'pdf_url': _bs4_meta_pdf_url(soup, url), 'source_url': url}
+
+
+def parse_cvf_detail(content: bytes, url: str) -> Dict[str, Any]:
+    """解析单个 CVF 论文详情页。"""
+    return _dispatch(_parse_cvf_detail_lxml, _parse_cvf_detail_bs4, content, url)
+
+
+
+# --- 通用文章页 (OJS / ACM DL 等，依据 citation_* 与 Dublin Core meta 标签) ---
+
+# 页面正文中可能包含摘要的元素 class / id (meta 标签缺失时使用)
+ABSTRACT_CLASSES = ('abstractSection', 'abstractInFull', 'abstract')
+_LOWER = "translate(@name, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+
+def _article_fields(title: Optional[str], authors: List[str], abstract: Optional[str],
+                    pdf_url: Optional[str], url: str) -> Dict[str, Any]:
+    fields = {}
+    if title and title.strip():
+        fields['title'] = re.sub(r'\s+', ' ', title).strip()
+    authors = [re.sub(r'\s+', ' ', a).strip() for a in authors if a and a.strip()]
+    if authors:
+        fields['authors'] = ", ".join(authors)
+    if abstract and abstract.strip():
+        fields['abstract'] = re.sub(r'\s+', ' ', abstract).strip()
+    if pdf_url:
+        fields['pdf_url'] = urljoin(url, pdf_url)
+    return fields
+
+
+def _meta_values_lxml(root, *names: str) -> List[str]:
+    """按顺序尝试多个 meta name (不区分大小写)，返回第一个有值的 name 对应的全部 content。"""
+    for name in names:
+        values = [v for v in root.xpath(f'//meta[{_LOWER}="{name}"]/@content') if v.strip()]
+        if values:
+            return values
+    return []
+
+
+def _meta_values_bs4(soup: BeautifulSoup, *names: str) -> List[str]:
+    for name in names:
+        values = [tag.get('content', '') for tag in soup.find_all('meta', attrs={'name': True, 'content': True})
+                  if tag['name'].lower() == name and tag.get('content', '').strip()]
+        if values:
+            return values
+    return []
+
+
+def _abstract_element_lxml(root):
+    for name in ABSTRACT_CLASSES:
+        elem = _first(root.xpath(f'//*[self::div or self::section][{_has_class(name)}]'))
+        if elem is not None:
+            return elem
+    return _first(root.xpath('//*[@id="abstract"]'))
+
+
+def _abstract_element_bs4(soup: BeautifulSoup):
+    for name in ABSTRACT_CLASSES:
+        elem = soup.select_one(f'div.{name}, section.{name}')
+        if elem is not None:
+            return elem
+    return soup.select_one('#abstract')
+
+
+def _parse_article_meta_lxml(content: bytes, url: str) -> Dict[str, Any]:
+    root = _lxml_root(content)
+    abstract = _first(_meta_values_lxml(root, 'citation_abstract', 'dc.description'))
+    if not abstract:
+        elem = _abstract_element_lxml(root)
+        if elem is not None:
+            # 只取段落，跳过 "Abstract" 之类的小标题
+            paragraphs = elem.xpath('.//p')
+            abstract = ' '.join(_text(p, ' ') for p in paragraphs) if paragraphs else _text(elem, ' ')
+    return _article_fields(_first(_meta_values_lxml(root, 'citation_title', 'dc.title')),
+                           _meta_values_lxml(root, 'citation_author', 'dc.creator'), abstract,
+                           _first(_meta_values_lxml(root, 'citation_pdf_url')), url)
+
+
+def _parse_article_meta_bs4(content: bytes, url: str) -> Dict[str, Any]:
+    soup = _soup(content)
+    abstract = _first(_meta_values_bs4(soup, 'citation_abstract', 'dc.description'))
+    if not abstract:
+        elem = _abstract_element_bs4(soup)
+        if elem is not None:
+            paragraphs = elem.find_all('p')
+            abstract = ' '.join(p.get_text(' ', strip=True) for p in paragraphs) if paragraphs else \
+                elem.get_text(' ', strip=True)
+    return _article_fields(_first(_meta_values_bs4(soup, 'citation_title', 'dc.title')),
+                           _meta_values_bs4(soup, 'citation_author', 'dc.creator'), abstract,
+                           _first(_meta_values_bs4(soup, 'citation_pdf_url')), url)
+
+
+def parse_article_meta(content: bytes, url: str) -> Dict[str, Any]:
+    """
+    解析期刊/会议文章页 (AAAI 的 OJS 页面、ACM DL 等) 的 citation_* 与 Dublin Core meta 标签，
+    返回可补全的字段: title、authors、abstract、pdf_url。缺失的字段不出现在结果中。
+    meta 中没有摘要时，从 class 为 abstractSection / abstract 的正文元素中提取。
+    """
+    return _dispatch(_parse_article_meta_lxml, _parse_article_meta_bs4, content, url)
+
+
+# --- 论文列表页 (AAAI / ACM DL) ---
+
+def _listing_links_lxml(content: bytes, base_url: str, xpath: str) -> List[Tuple[str, str]]:
+    root = _lxml_root(content)
+    return [(urljoin(base_url, a.get('href')), ' '.join(''.join(a.xpath('.//text()')).split()))
+            for a in root.xpath(xpath) if a.get('href')]
+
+
+def _listing_links_bs4(content: bytes, base_url: str, css: str) -> List[Tuple[str, str]]:
+    soup = _soup(content)
+    return [(urljoin(base_url, tag['href']), ' '.join(tag.get_text().split()))
+            for tag in soup.select(css) if tag.get('href')]
+
+
+# AAAI: aaai.org 论文集页面 (h5.toc-title) 与 OJS 期目录页 (div.obj_article_summary h3.title)
+_AAAI_INDEX_XPATH = (f'//h5[{_has_class("toc-title")}]/a'
+                     f' | //div[{_has_class("obj_article_summary")}]//h3[{_has_class("title")}]/a')
+_AAAI_INDEX_CSS = 'h5.toc-title > a, div.obj_article_summary h3.title > a'
+# ACM DL: 论文集目录页 (h5.issue-item__title) 与会议页面 (a.item-title)
+_ACM_INDEX_XPATH = f'//h5[{_has_class("issue-item__title")}]/a | //a[{_has_class("item-title")}]'
+_ACM_INDEX_CSS = 'h5.issue-item__title > a, a.item-title'
+
+
+def _parse_aaai_index_lxml(content: bytes, base_url: str) -> List[Tuple[str, str]]:
+    return _listing_links_lxml(content, base_url, _AAAI_INDEX_XPATH)
+
+
+def _parse_aaai_index_bs4(content: bytes, base_url: str) -> List[Tuple[str, str]]:
+    return _listing_links_bs4(content, base_url, _AAAI_INDEX_CSS)
+
+
+def parse_aaai_index(content: bytes, base_url: str) -> List[Tuple[str, str]]:
+    """解析 AAAI 论文集页面或 OJS 期目录页，按页面顺序返回 [(文章页 URL, 标题)]。"""
+    return _dispatch(_parse_aaai_index_lxml, _parse_aaai_index_bs4, content, base_url)
+
+
+def _parse_acm_index_lxml(content: bytes, base_url: str) -> List[Tuple[str, str]]:
+    return _listing_links_lxml(content, base_url, _ACM_INDEX_XPATH)
+
+
+def _parse_acm_index_bs4(content: bytes, base_url: str) -> List[Tuple[str, str]]:
+    return _listing_links_bs4(content, base_url, _ACM_INDEX_CSS)
+
+
+def parse_acm_index(content: bytes, base_url: str) -> List[Tuple[str, str]]:
+    """解析 ACM DL 论文集目录页，按页面顺序返回 [(文章页 URL, 标题)]。"""
+    return _dispatch(_parse_acm_index_lxml, _parse_acm_index_bs4, content, base_url)
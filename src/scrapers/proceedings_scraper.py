@@ -0,0 +1,225 @@
+# FILE: src/scrapers/proceedings_scraper.py
+
+import hashlib
+import re
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from tqdm import tqdm
+
+from .base_scraper import BaseScraper
+from .parsers import parse_article_meta, parse_in_pool
+from src.utils.browser_pool import DEFAULT_TABS, DEFAULT_WAIT_TIMEOUT, fetch_in_tabs, get_browser_pool, \
+    wait_for_elements
+from src.utils.network_utils import robust_get
+
+# fetch_mode:
+#   auto    先用共享 HTTP 客户端直接解析列表页与文章页，列表页中找不到任何论文链接时才回退到浏览器 (默认)
+#   http    只使用 HTTP，不启动浏览器
+#   browser 只使用浏览器 (旧行为)
+FETCH_MODES = ('auto', 'http', 'browser')
+
+# ACM DL: /doi/10.1145/xxx 或 /doi/abs|pdf|full/10.1145/xxx
+_DOI_PATH = re.compile(r'/doi/(?:(?:abs|pdf|epdf|full|fullHtml)/)?(10\.\d{4,9}/[^?#]+)')
+# OJS (AAAI): /article/view/<文章编号>[/<文件编号>]
+_OJS_ARTICLE_PATH = re.compile(r'/article/view/(\d+)')
+
+
+def paper_key(url: str) -> str:
+    """由文章页 URL 导出稳定的论文标识: DOI 或 OJS 文章编号，都不匹配时使用 URL 的短哈希。"""
+    path = unquote(urlparse(url).path)
+    match = _DOI_PATH.search(path)
+    if match:
+        return match.group(1).rstrip('/')
+    match = _OJS_ARTICLE_PATH.search(path)
+    if match:
+        return match.group(1)
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]
+
+
+class ProceedingsScraper(BaseScraper):
+    """
+    AAAI、KDD 等论文集网站的抓取器基类: 列表页给出文章链接，文章页的 citation_* / Dublin Core meta 给出详细信息。
+
+    - HTTP 路径: 列表页与文章页都是服务端渲染的 HTML，通过共享的连接池客户端获取并由 parsers 解析；
+      文章页交给 BaseScraper.iter_details 的异步引擎并发抓取 (max_workers / max_concurrency)，
+      速率受对应主机的限速器约束，响应进入 HTTP 缓存，与 ACL/CVF 相同。
+    - 浏览器路径: HTTP 列表页中找不到论文链接时 (页面由脚本渲染或被拦截)，从共享 BrowserPool 借出浏览器，
+      显式等待链接出现，再在 browser_tabs 个并行标签中加载文章页。
+    - id 由文章页 URL 中的 DOI 或文章编号导出 (见 paper_key)，与列表页顺序、limit 及过滤条件无关，
+      两条路径产出相同的 id 与 source_url，增量模式与检查点可以互换使用。
+    - fetch_details: false 时只返回列表页信息。
+
+    子类需声明 VENUE、INDEX_PARSER (HTTP 列表页解析函数)、LINK_SELECTOR 与 DETAIL_READY_SELECTOR (浏览器路径)。
+    """
+    VENUE = ''
+    # 解析 HTTP 列表页的函数: (content, base_url) -> [(文章页 URL, 标题)]
+    INDEX_PARSER: Optional[Callable[[bytes, str], List[Tuple[str, str]]]] = None
+    # 浏览器路径: 列表页中论文链接 (<a>) 的 CSS 选择器
+    LINK_SELECTOR = ''
+    # 浏览器路径: 文章页中出现即视为内容已就绪的元素
+    DETAIL_READY_SELECTOR = 'meta[name="citation_title"], meta[name="dc.Title"]'
+
+    def scrape(self) -> List[Dict[str, Any]]:
+        return list(self.iter_papers())
+
+    @property
+    def browser_placeholder(self) -> str:
+        return f'N/A ({self.VENUE} Selenium)'
+
+    def iter_papers(self) -> Iterator[Dict[str, Any]]:
+        fetch_mode = self.task_info.get("fetch_mode", "auto")
+        if fetch_mode not in FETCH_MODES:
+            self.logger.warning(f"    -> [⚠ WARNING] 未知的 fetch_mode '{fetch_mode}'，改用 auto 模式。")
+            fetch_mode = "auto"
+
+        if fetch_mode != "browser":
+            links = self._fetch_index_links(self.task_info["url"])
+            if links:
+                yield from self._iter_http_papers(links)
+                return
+            if fetch_mode == "http":
+                self.logger.warning(f"    -> HTTP 列表页中没有找到论文链接 (fetch_mode: http，不回退到浏览器)。")
+                return
+            self.logger.info(f"    -> HTTP 列表页中没有找到论文链接，回退到浏览器抓取。")
+        yield from self._iter_browser_papers()
+
+    def _apply_limit(self, items: List[Any]) -> List[Any]:
+        limit = self.task_info.get("limit")
+        if limit and len(items) > limit:
+            self.logger.info(f"    -> 应用限制：处理前 {limit} 个链接。")
+            return items[:limit]
+        return items
+
+    def _index_record(self, paper_url: str, paper_title: str, placeholder: str = 'N/A') -> Dict[str, Any]:
+        return {
+            'id': f"{self.VENUE.lower()}_{self.task_info['year']}_{paper_key(paper_url)}",
+            'title': paper_title.strip(),
+            'authors': placeholder,
+            'abstract': placeholder,
+            'pdf_url': None,
+            'source_url': paper_url
+        }
+
+    # --- HTTP 路径 ---
+
+    def _fetch_index_links(self, url: str) -> List[Tuple[str, str]]:
+        self.logger.info(f"    -> 正在通过 HTTP 获取 {self.VENUE} 列表页: {url}")
+        response = robust_get(url)
+        if not response:
+            return []
+        try:
+            links = parse_in_pool(type(self).INDEX_PARSER, response.content, url)
+        except Exception as e:
+            self.logger.error(f"    [✖ ERROR] 解析 {self.VENUE} 列表页失败 {url}: {e}")
+            return []
+        if links:
+            self.logger.info(f"    -> 找到了 {len(links)} 个潜在的论文链接。")
+        return links
+
+    def _iter_http_papers(self, links: List[Tuple[str, str]]) -> Iterator[Dict[str, Any]]:
+        papers = self._apply_limit([self._index_record(paper_url, title) for paper_url, title in links if title])
+        if not self.task_info.get("fetch_details", True):
+            yield from (paper for paper in papers if paper['source_url'] not in self._known_urls)
+            return
+
+        # 过滤下推: 标题不匹配的论文无需访问文章页
+        pending = {paper['source_url']: paper for paper in papers
+                   if paper['source_url'] not in self._known_urls and self.keep_title(paper['title'])}
+        if not pending:
+            return
+        pbar_desc = f"    -> 并发解析 {self.VENUE} 文章页"
+        detail_requests = [(url, self._detail_callback(paper)) for url, paper in pending.items()]
+        for paper in self.iter_details(detail_requests, total=len(detail_requests), desc=pbar_desc):
+            pending.pop(paper['source_url'], None)
+            yield paper
+        # iter_details 会跳过已保存的论文，剩下的是文章页抓取或解析失败的论文，仍保留列表页中的信息
+        if pending:
+            self.logger.warning(f"    [⚠ WARNING] {len(pending)} 个文章页未能解析，这些论文只包含列表页信息。")
+        yield from pending.values()
+
+    def _detail_callback(self, record: Dict[str, Any]):
+        def parse(url: str, content: bytes) -> Optional[Dict[str, Any]]:
+            try:
+                fields = parse_article_meta(content, url)
+            except Exception as e:
+                self.logger.debug(f"    -> 解析 {self.VENUE} 文章页失败 {url}: {e}")
+                return None
+            if not fields:
+                return None
+            merged = dict(record)
+            merged.update(fields)
+            return merged
+
+        return parse
+
+    # --- 浏览器路径 ---
+
+    def _iter_browser_papers(self) -> Iterator[Dict[str, Any]]:
+        url = self.task_info["url"]
+        timeout = self.task_info.get("wait_timeout", DEFAULT_WAIT_TIMEOUT)
+
+        self.logger.info(f"    -> 正在通过共享浏览器池访问 ({self.VENUE}): {url}")
+        try:
+            with get_browser_pool().driver() as driver:
+                driver.get(url)
+                link_elements = wait_for_elements(driver, self.LINK_SELECTOR, timeout)
+                if not link_elements:
+                    self.logger.warning(f"    -> Selenium 在 {timeout} 秒内未找到任何论文链接，使用的选择器是: "
+                                        f"'{self.LINK_SELECTOR}'")
+                    return
+
+                self.logger.info(f"    -> 找到了 {len(link_elements)} 个潜在的论文链接。")
+                papers = []
+                for link_elem in self._apply_limit(link_elements):
+                    paper_url = link_elem.get_attribute('href')
+                    paper_title = link_elem.text
+                    if paper_url and paper_title:
+                        papers.append(self._index_record(paper_url, paper_title, self.browser_placeholder))
+
+                if not self.task_info.get("fetch_details", True):
+                    yield from (paper for paper in papers if paper['source_url'] not in self._known_urls)
+                    return
+                yield from self._iter_tab_details(driver, papers, timeout)
+
+        except Exception as e:
+            # 向上抛出: 由 run_single_task 丢弃不完整的输出并保留检查点
+            self.logger.error(f"    [✖ ERROR] {self.VENUE} Selenium 抓取失败 {url}: {e}")
+            raise
+
+    def _iter_tab_details(self, driver: Any, papers: List[Dict[str, Any]], timeout: float) -> Iterator[Dict[str, Any]]:
+        """在并行标签页中访问详情页并补全论文信息；详情页加载失败的论文仍以索引页信息产出。"""
+        by_url: Dict[str, Dict[str, Any]] = {}
+        skipped, restored = 0, 0
+        for paper in papers:
+            source_url = paper['source_url']
+            if source_url in self._known_urls:
+                skipped += 1
+            elif self.checkpoint is not None and source_url in self.checkpoint:
+                restored += 1
+                yield self.checkpoint.get(source_url)
+            # 过滤下推: 标题不匹配的论文无需打开详情页
+            elif self.keep_title(paper['title']):
+                by_url[source_url] = paper
+        if skipped:
+            self.logger.info(f"    -> [增量模式] 跳过 {skipped} 篇已保存的论文。")
+        if restored:
+            self.logger.info(f"    -> [断点续爬] 从检查点恢复 {restored} 篇，剩余 {len(by_url)} 篇待抓取。")
+
+        tabs = self.task_info.get("browser_tabs", DEFAULT_TABS)
+        failed = 0
+        with tqdm(total=len(by_url), desc=f"    -> 并行标签页抓取 {self.VENUE} 详情页", leave=True) as pbar:
+            for url, fields in fetch_in_tabs(driver, list(by_url), self.DETAIL_READY_SELECTOR,
+                                             lambda page_url, html: parse_article_meta(html.encode('utf-8'), page_url),
+                                             tabs=tabs, timeout=timeout):
+                paper = dict(by_url[url])
+                if fields:
+                    paper.update(fields)
+                    if self.checkpoint is not None:
+                        self.checkpoint.append(url, paper)
+                else:
+                    failed += 1
+                pbar.update(1)
+                yield paper
+        if failed:
+            self.logger.warning(f"    [⚠ WARNING] {failed} 个详情页未能加载，这些论文只包含索引页信息。")
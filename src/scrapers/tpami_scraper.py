@@ -1,35 +1,77 @@
 # FILE: src/scrapers/tpami_scraper.py (API Version)
 
-import requests
 import json
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Iterator, Optional
 from tqdm import tqdm
-import time
 
 from .base_scraper import BaseScraper
+from src.utils.network_utils import get_http_client
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+DEFAULT_TOC_WORKERS = 4  # 同时在途的 TOC 请求数，实际速率仍由 ieeexplore.ieee.org 的限速器控制
+YEAR_KEYS = ('year', 'publicationYear', 'issueYear')
+
+
+def _iter_issue_entries(data: Any) -> Iterator[Dict[str, Any]]:
+    """在 regular-issues 接口返回的 JSON 中找出所有带 issueNumber 的条目 (不依赖具体的嵌套结构)。"""
+    if isinstance(data, dict):
+        if 'issueNumber' in data:
+            yield data
+            return
+        for value in data.values():
+            yield from _iter_issue_entries(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from _iter_issue_entries(item)
+
+
+def _issue_year(entry: Dict[str, Any]) -> Optional[int]:
+    for key in YEAR_KEYS:
+        try:
+            return int(str(entry[key])[:4])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def _issue_key(value: Any) -> str:
+    """期号统一为整数字符串: 从 CSV 读回的期号可能被解析为浮点数 (如 '10123.0')。"""
+    text = str(value).strip()
+    try:
+        return str(int(float(text)))
+    except (ValueError, OverflowError):
+        return text
 
 
 class TpamiScraper(BaseScraper):
     """
     专门用于 IEEE TPAMI 期刊的爬虫 (使用后台 API)。
     这是一个更稳定、更高效的方案，取代了 Selenium。
+
+    - 默认只抓取当前一期 (currentIssue，通常为 Early Access)。
+    - 给出 year_from / year_to (或直接给出 issues 列表) 时，枚举该范围内的全部期号用于历史回填。
+    - 各期的 TOC 分页由线程池并发获取 (max_workers)，请求速率由共享的主机限速器控制。
+    - 每完成一个 (期号, 页码) 就写入检查点，中断后重新运行只抓取剩余页面。
+    - 增量模式下，已保存论文所属的期号 (当前一期除外) 整期跳过。
     """
     BASE_URL = "https://ieeexplore.ieee.org"
 
+    def _headers(self, punumber: str, referer_query: str = '') -> Dict[str, str]:
+        # 关键请求头，模拟从期刊主页发起的请求
+        return {'Referer': f'{self.BASE_URL}/xpl/conhome/{punumber}/proceeding{referer_query}',
+                'User-Agent': USER_AGENT}
+
     def _get_issue_number(self, punumber: str) -> str:
         """
         第一步: 调用 metadata API 获取最新的 'issueNumber'。
         这个 issueNumber 是获取论文列表的关键。
         """
         metadata_url = f"{self.BASE_URL}/rest/publication/home/metadata?pubid={punumber}"
-        headers = {
-            # 关键请求头，模拟从期刊主页发起的请求
-            'Referer': f'{self.BASE_URL}/xpl/conhome/{punumber}/proceeding',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
         self.logger.info(f"    -> 正在获取 issue number from: {metadata_url}")
         try:
-            response = requests.get(metadata_url, headers=headers, timeout=20)
+            response = get_http_client().get(metadata_url, headers=self._headers(punumber), timeout=20)
             response.raise_for_status()
             data = response.json()
             # issueNumber 可以是 'Early Access' 的 ID，也可以是最新一期的 ID
@@ -40,79 +82,164 @@ class TpamiScraper(BaseScraper):
             self.logger.error(f"    [✖ ERROR] 获取 issue number 失败: {e}")
             return None
 
+    def _list_issues(self, punumber: str, year_from: int, year_to: int) -> List[str]:
+        """枚举 [year_from, year_to] 内的全部期号 (regular-issues 接口按年代返回)，按年份从新到旧排列。失败时抛出异常。"""
+        issues: Dict[str, int] = {}
+        for decade in sorted({year // 10 * 10 for year in range(year_from, year_to + 1)}):
+            url = f"{self.BASE_URL}/rest/publication/{punumber}/regular-issues?decade={decade}"
+            try:
+                response = get_http_client().get(url, headers=self._headers(punumber), timeout=20)
+                response.raise_for_status()
+                data = response.json()
+            except Exception as e:
+                # 与 TOC 页面失败一样使任务失败: 缺少整个年代的期号时不能保存结果或推进增量状态
+                self.logger.error(f"    [✖ ERROR] 获取 {decade} 年代的期号列表失败: {e}")
+                raise
+            for entry in _iter_issue_entries(data):
+                year = _issue_year(entry)
+                if year is not None and year_from <= year <= year_to:
+                    issues[str(entry['issueNumber'])] = year
+        return sorted(issues, key=lambda issue: (issues[issue], issue), reverse=True)
+
+    def _resolve_issues(self, punumber: str) -> List[str]:
+        current_issue = self._get_issue_number(punumber)
+        year_from = self.task_info.get("year_from")
+        if self.task_info.get("issues"):
+            issues = [_issue_key(issue) for issue in self.task_info["issues"]]
+        elif year_from:
+            year_to = int(self.task_info.get("year_to") or year_from)
+            issues = self._list_issues(punumber, int(year_from), year_to)
+            self.logger.info(f"    -> {year_from}-{year_to} 年共有 {len(issues)} 期。")
+        else:
+            return [current_issue] if current_issue else []
+
+        # 已保存的期不会再变化，整期跳过；当前一期 (Early Access) 仍在增长，始终重新抓取
+        # 抓取失败时任务整体失败 (见 _iter_issue_pages)，因此已保存的期都是完整抓取过的
+        held = {_issue_key(p['issue']) for p in self.known_papers.values() if p.get('issue')}
+        skipped = [issue for issue in issues if issue in held and issue != current_issue]
+        if skipped:
+            self.logger.info(f"    -> [增量模式] 跳过 {len(skipped)} 个已保存的期号。")
+        return [issue for issue in issues if issue not in skipped]
+
+    def _fetch_toc_page(self, punumber: str, issue_number: str, page_number: int) -> Dict[str, Any]:
+        """获取某一期 TOC 的一页，返回 {'total_records', 'total_pages', 'papers'}。失败时抛出异常。"""
+        toc_url = f"{self.BASE_URL}/rest/search/pub/{punumber}/issue/{issue_number}/toc"
+        payload = {
+            "pageNumber": str(page_number),
+            "punumber": str(punumber),
+            "isnumber": str(issue_number)
+        }
+        headers = self._headers(punumber, f'?pageNumber={page_number}')
+        headers['Content-Type'] = 'application/json;charset=UTF-8'
+        response = get_http_client().post(toc_url, headers=headers, data=json.dumps(payload), timeout=20)
+        response.raise_for_status()
+        data = response.json()
+        return {'total_records': data.get('totalRecords', 0), 'total_pages': data.get('totalPages', 1),
+                'papers': [self._parse_record(record, issue_number) for record in data.get('records', [])]}
+
+    def _parse_record(self, record: Dict[str, Any], issue_number: str) -> Dict[str, Any]:
+        return {
+            'id': record.get('articleNumber', ''),
+            'title': record.get('highlightedTitle', 'N/A').replace('<br>', ' '),
+            'authors': ', '.join([author['name'] for author in record.get('authors', [])]),
+            'abstract': record.get('abstract', 'N/A'),
+            'pdf_url': f"请访问源页面查看PDF（可能需要订阅）",
+            'source_url': self.BASE_URL + record.get('documentLink', ''),
+            'conference': 'TPAMI',
+            'issue': issue_number
+        }
+
     def scrape(self) -> List[Dict[str, Any]]:
+        return list(self.iter_papers())
+
+    def iter_papers(self) -> Iterator[Dict[str, Any]]:
         punumber = self.task_info.get("punumber")
         if not punumber:
             self.logger.error("    [✖ ERROR] TPAMI task in YAML must have a 'punumber'. For TPAMI, it's '34'.")
-            return []
-
-        limit = self.task_info.get("limit")
+            return
 
-        issue_number = self._get_issue_number(punumber)
-        if not issue_number:
-            return []
-
-        papers = []
-        page_number = 1
-        total_records = 0
-        total_pages = 1  # 先假设只有一页
-
-        self.logger.info("    -> 开始逐页获取论文列表...")
-        pbar = tqdm(total=total_records or limit or 25, desc=f"    -> Scraping TPAMI page {page_number}")
-
-        while True:
-            toc_url = f"{self.BASE_URL}/rest/search/pub/{punumber}/issue/{issue_number}/toc"
-            payload = {
-                "pageNumber": str(page_number),
-                "punumber": str(punumber),
-                "isnumber": str(issue_number)
-            }
-            headers = {
-                'Referer': f'{self.BASE_URL}/xpl/conhome/{punumber}/proceeding?pageNumber={page_number}',
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Content-Type': 'application/json;charset=UTF-8'
-            }
+        issues = self._resolve_issues(punumber)
+        if not issues:
+            return
+        yield from self._iter_issue_pages(punumber, issues)
 
-            try:
-                response = requests.post(toc_url, headers=headers, data=json.dumps(payload), timeout=20)
-                response.raise_for_status()
-                data = response.json()
+    def _iter_issue_pages(self, punumber: str, issues: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        并发获取各期的 TOC 分页: 先提交每期的第 1 页，拿到 totalPages 后再提交该期的其余页面。
+        检查点以 "期号:页码" 为键记录整页结果，已完成的页面直接从检查点恢复。
+        """
+        limit = self.task_info.get("limit")
+        workers = self.task_info.get("max_workers", DEFAULT_TOC_WORKERS)
+        checkpoint = self.checkpoint
+        if checkpoint is not None and len(checkpoint):
+            self.logger.info(f"    -> [断点续爬] 检查点中已有 {len(checkpoint)} 个已完成的 TOC 页面。")
+        self.logger.info(f"    -> 以 {workers} 个并发请求获取 {len(issues)} 期的论文列表...")
+
+        ready = deque()
+        pending = {}
+        seen, failed, unchanged = set(), 0, 0
+        pbar = tqdm(total=limit, desc="    -> Scraping TPAMI TOC", unit="paper")
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+        def schedule(issue_number: str, page_number: int):
+            key = f"{issue_number}:{page_number}"
+            if checkpoint is not None and key in checkpoint:
+                ready.append((issue_number, page_number, checkpoint.get(key)))
+            else:
+                future = executor.submit(self._fetch_toc_page, punumber, issue_number, page_number)
+                pending[future] = (issue_number, page_number)
 
+        try:
+            for issue_number in issues:
+                schedule(issue_number, 1)
+
+            while ready or pending:
+                if not ready:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        issue_number, page_number = pending.pop(future)
+                        try:
+                            page = future.result()
+                        except Exception as e:
+                            failed += 1
+                            self.logger.error(f"    [✖ ERROR] 第 {issue_number} 期第 {page_number} 页抓取失败: {e}")
+                            continue
+                        if checkpoint is not None:
+                            checkpoint.append(f"{issue_number}:{page_number}", page)
+                        ready.append((issue_number, page_number, page))
+                    continue
+
+                issue_number, page_number, page = ready.popleft()
                 if page_number == 1:
-                    total_records = data.get('totalRecords', 0)
-                    total_pages = data.get('totalPages', 1)
-                    pbar.total = limit if limit and limit < total_records else total_records
-                    self.logger.info(f"    -> 共发现 {total_records} 篇论文，分布在 {total_pages} 页。")
-
-                records = data.get('records', [])
-                if not records:
-                    self.logger.info("    -> 当前页没有更多论文，抓取结束。")
-                    break
-
-                for record in records:
-                    papers.append({
-                        'id': record.get('articleNumber', ''),
-                        'title': record.get('highlightedTitle', 'N/A').replace('<br>', ' '),
-                        'authors': ', '.join([author['name'] for author in record.get('authors', [])]),
-                        'abstract': record.get('abstract', 'N/A'),
-                        'pdf_url': f"请访问源页面查看PDF（可能需要订阅）",
-                        'source_url': self.BASE_URL + record.get('documentLink', ''),
-                        'conference': 'TPAMI'
-                    })
+                    self.logger.info(f"    -> 第 {issue_number} 期共 {page['total_records']} 篇论文，"
+                                     f"分布在 {page['total_pages']} 页。")
+                    if limit is None:
+                        pbar.total = (pbar.total or 0) + page['total_records']
+                        pbar.refresh()
+                    for next_page in range(2, int(page['total_pages'] or 1) + 1):
+                        schedule(issue_number, next_page)
+
+                for paper in page['papers']:
+                    # Early Access 论文正式分期后文章号不变，同一篇可能出现在两期中
+                    if paper['id'] in seen:
+                        continue
+                    seen.add(paper['id'])
+                    if self.is_known(paper['id']):
+                        unchanged += 1
+                        continue
                     pbar.update(1)
-                    if limit and len(papers) >= limit:
-                        break
-
-                if (limit and len(papers) >= limit) or page_number >= total_pages:
-                    break
-
-                page_number += 1
-                pbar.set_description(f"    -> Scraping TPAMI page {page_number}")
-                time.sleep(1)  # 友好访问
-
-            except Exception as e:
-                self.logger.error(f"    [✖ ERROR] 在第 {page_number} 页抓取失败: {e}")
-                break
-
-        pbar.close()
-        return papers
\ No newline at end of file
+                    yield paper
+                    if limit and pbar.n >= limit:
+                        return
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+            pbar.close()
+
+        if unchanged:
+            self.logger.info(f"    -> [增量模式] {unchanged} 篇论文已保存，未重复产出。")
+        if failed:
+            # 不能正常结束: 否则残缺的期会被保存并在增量模式下整期跳过，检查点也会被清除
+            self.logger.error(f"    [✖ ERROR] {failed} 个 TOC 页面抓取失败，已完成的页面保存在检查点中，重新运行该任务即可补抓。")
+            raise IOError(f"{failed} TPAMI TOC page(s) failed to download")
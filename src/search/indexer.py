@@ -1,7 +1,13 @@
 # FILE: src/search/indexer.py
 
+import argparse
+import gzip
+import os
+import sys
 import sqlite3
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from tqdm import tqdm
 import time
@@ -9,13 +15,25 @@ import time
 # --- 配置 ---
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 METADATA_DIR = PROJECT_ROOT / "output" / "metadata"
+# 按会议/年份分区的 Parquet 数据集 (见 src/utils/metadata_store.py)，存在时优先于 CSV
+DATASET_DIR = PROJECT_ROOT / "output" / "dataset"
 # 新增：定义统一的数据库存放目录
 DB_DIR = PROJECT_ROOT / "database"
 
 # 修改：让 DB_PATH 指向新目录中的文件
 DB_PATH = DB_DIR / "papers.db"
+# PDF 仓库与全文旁路存储 (见 src/utils/pdf_store.py、src/utils/pdf_text.py)
+PDF_STORE_DIR = PROJECT_ROOT / "output" / "pdf_store"
+PDF_TEXT_DIR = PDF_STORE_DIR / "text"
 # 定义需要的列，与数据库表结构对应
 REQUIRED_COLUMNS = ['title', 'authors', 'abstract', 'conference', 'year', 'pdf_url', 'source_file']
+# 从 Parquet 数据集中只读取这些列 (id 用于查找 PDF 全文，task 作为来源名称)
+DATASET_COLUMNS = ['id', 'title', 'authors', 'abstract', 'conference', 'year', 'pdf_url', 'task']
+
+CHUNK_SIZE = 5000
+# 索引正文时每块行数更少、每篇正文截断，内存上限约为 BODY_CHUNK_SIZE * max_body_chars 个字符
+BODY_CHUNK_SIZE = 500
+DEFAULT_BODY_CHARS = 100_000
 
 
 def create_fts_table(conn):
@@ -33,64 +51,156 @@ def create_fts_table(conn):
             year UNINDEXED,
             pdf_url UNINDEXED,
             source_file UNINDEXED,
+            body,                  -- PDF 全文 (使用 --body 建立索引时填充，否则为空)
             tokenize='porter'      -- 使用 porter 分词器，支持英文词干提取(例如搜 searching 能匹配 search)
         )
     """)
     conn.commit()
 
 
-def index_csv_files():
+def _load_body(args):
+    """在工作进程中解压一篇全文 (gzip 解压与读取分摊到多个 CPU 核)。"""
+    path, max_chars = args
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return f.read(max_chars) if max_chars else f.read()
+    except Exception:
+        return ''
+
+
+class BodyLoader:
+    """按 CSV 行查找 PDF 全文: 论文 id / pdf_url -> 内容哈希 (PDF 仓库清单) -> 旁路文本，文本在进程池中并行读取。"""
+
+    def __init__(self, workers=None, max_chars=DEFAULT_BODY_CHARS):
+        from src.utils.pdf_store import PdfStore
+        from src.utils.pdf_text import TextStore
+
+        self.pdf_store = PdfStore(PDF_STORE_DIR)
+        self.text_store = TextStore(PDF_TEXT_DIR)
+        self.max_chars = max_chars
+        self.pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self.found = 0
+
+    def load(self, chunk_df):
+        jobs, positions = [], []
+        for pos, row in enumerate(chunk_df[['id', 'conference', 'pdf_url']].itertuples(index=False)):
+            paper_id, conference, pdf_url = row
+            content_hash = self.pdf_store.find({'id': paper_id, 'conference': conference}, pdf_url or None)
+            if content_hash and content_hash in self.text_store:
+                jobs.append((str(self.text_store.path(content_hash)), self.max_chars))
+                positions.append(pos)
+        bodies = [''] * len(chunk_df)
+        for pos, text in zip(positions, self.pool.map(_load_body, jobs, chunksize=16)):
+            bodies[pos] = text
+            self.found += bool(text)
+        return bodies
+
+    def close(self):
+        self.pool.shutdown()
+        self.pdf_store.close()
+
+
+def _dataset_chunks(store, conference, year, chunksize):
+    for chunk_df in store.iter_batches(columns=DATASET_COLUMNS, conference=conference, year=year, batch_rows=chunksize):
+        chunk_df['source_file'] = chunk_df.pop('task').fillna('') + '.parquet'
+        yield chunk_df
+
+
+def find_sources(chunksize):
+    """
+    返回 [(来源名称, 块迭代器工厂)]。
+    有 Parquet 分区的 会议/年份 从数据集读取，只读取索引需要的列，每个任务只有一份数据；
+    还没有分区的 会议/年份 回退到逐个读取 CSV 文件 (启用数据集之前的旧数据，可能包含不同日期的重复文件)。
+    """
+    from src.utils.metadata_store import csv_files_without_partition, open_metadata_store
+
+    store = open_metadata_store(DATASET_DIR)
+    partitions = store.partitions() if store is not None else []
+    sources = [(f"{conference}/{year}", partial(_dataset_chunks, store, conference, year, chunksize))
+               for conference, year in partitions]
+    if partitions:
+        print(f"    - 数据源: Parquet 数据集 {DATASET_DIR}")
+    csv_files = csv_files_without_partition(METADATA_DIR, partitions)
+    if csv_files:
+        print(f"    - 数据源目录: {METADATA_DIR} ({len(csv_files)} 个 CSV 文件)")
+    sources.extend((csv_path.name, partial(pd.read_csv, csv_path, chunksize=chunksize, dtype=str))
+                   for csv_path in csv_files)
+    return sources
+
+
+def index_csv_files(include_body=False, workers=None, max_body_chars=DEFAULT_BODY_CHARS):
     print(f"[*] 开始构建索引...")
-    print(f"    - 数据源目录: {METADATA_DIR}")
     print(f"    - 数据库路径: {DB_PATH}")
-
-    csv_files = list(METADATA_DIR.rglob("*_data_*.csv"))
-    if not csv_files:
-        print("[!] 错误: 没有找到任何 CSV 文件。请先运行爬虫采集数据。")
+    # 直接运行 `python src/search/indexer.py` 时也能导入 src 包
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+    body_loader = None
+    if include_body:
+        if not PDF_TEXT_DIR.exists():
+            print(f"[!] 警告: 没有找到 PDF 全文 ({PDF_TEXT_DIR})，请先在 tasks.yaml 中启用 text_extraction。只索引元数据。")
+        else:
+            body_loader = BodyLoader(workers=workers, max_chars=max_body_chars)
+            print(f"    - 同时索引 PDF 全文 (每篇最多 {max_body_chars} 个字符)")
+
+    chunksize = BODY_CHUNK_SIZE if body_loader is not None else CHUNK_SIZE
+    sources = find_sources(chunksize)
+    if not sources:
+        print("[!] 错误: 没有找到任何数据文件。请先运行爬虫采集数据。")
+        if body_loader is not None:
+            body_loader.close()
         return
 
     conn = sqlite3.connect(str(DB_PATH))
     create_fts_table(conn)
 
-    total_files = len(csv_files)
+    total_files = len(sources)
     total_papers = 0
     start_time = time.time()
 
-    print(f"[*] 发现 {total_files} 个文件，开始处理...")
-
-    for i, csv_path in enumerate(csv_files, 1):
-        try:
-            # 使用 chunksize 分块读取，核心内存优化点！
-            # 每次只读 5000 行到内存，处理完就释放，绝不爆内存。
-            chunk_iterator = pd.read_csv(csv_path, chunksize=5000, dtype=str)
-
-            for chunk_df in chunk_iterator:
-                if chunk_df.empty: continue
-
-                # 数据清洗和标准化
-                chunk_df = chunk_df.fillna('')
-                if 'source_file' not in chunk_df.columns:
-                    chunk_df['source_file'] = csv_path.name
-
-                # 确保所有需要的列都存在
-                for col in REQUIRED_COLUMNS:
-                    if col not in chunk_df.columns:
-                        chunk_df[col] = ''
-
-                # 选取并排序特定的列以匹配数据库结构
-                data_to_insert = chunk_df[REQUIRED_COLUMNS].values.tolist()
-
-                # 批量插入数据
-                conn.executemany(
-                    "INSERT INTO papers_fts(title, authors, abstract, conference, year, pdf_url, source_file) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    data_to_insert
-                )
-                total_papers += len(data_to_insert)
-
-            print(f"    [{i}/{total_files}] 已索引: {csv_path.name}")
-
-        except Exception as e:
-            print(f"    [!] 处理文件失败 {csv_path.name}: {e}")
+    print(f"[*] 发现 {total_files} 个数据源，开始处理...")
+
+    try:
+        for i, (source_name, open_chunks) in enumerate(sources, 1):
+            try:
+                # 使用 chunksize 分块读取，核心内存优化点！
+                # 每次只读一块到内存，处理完就释放，绝不爆内存。
+                chunk_iterator = open_chunks()
+
+                for chunk_df in chunk_iterator:
+                    if chunk_df.empty: continue
+
+                    # 数据清洗和标准化
+                    chunk_df = chunk_df.fillna('')
+                    if 'source_file' not in chunk_df.columns:
+                        chunk_df['source_file'] = source_name
+
+                    # 确保所有需要的列都存在
+                    for col in REQUIRED_COLUMNS + ['id']:
+                        if col not in chunk_df.columns:
+                            chunk_df[col] = ''
+
+                    # 选取并排序特定的列以匹配数据库结构
+                    data_to_insert = chunk_df[REQUIRED_COLUMNS].values.tolist()
+                    bodies = body_loader.load(chunk_df) if body_loader is not None else [''] * len(data_to_insert)
+                    for row, text in zip(data_to_insert, bodies):
+                        row.append(text)
+
+                    # 批量插入数据
+                    conn.executemany(
+                        "INSERT INTO papers_fts(title, authors, abstract, conference, year, pdf_url, source_file, body) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        data_to_insert
+                    )
+                    total_papers += len(data_to_insert)
+
+                print(f"    [{i}/{total_files}] 已索引: {source_name}")
+
+            except Exception as e:
+                print(f"    [!] 处理文件失败 {source_name}: {e}")
+    finally:
+        if body_loader is not None:
+            body_loader.close()
 
     # 提交事务并进行优化
     print("[*] 正在提交并优化数据库 (可能需要一点时间)...")
@@ -102,9 +212,16 @@ def index_csv_files():
     end_time = time.time()
     print(f"\n[✔] 索引构建完成！")
     print(f"    - 总计索引论文: {total_papers} 篇")
+    if body_loader is not None:
+        print(f"    - 包含全文的论文: {body_loader.found} 篇")
     print(f"    - 总耗时: {end_time - start_time:.2f} 秒")
     print(f"    - 数据库文件大小: {DB_PATH.stat().st_size / (1024 * 1024):.2f} MB")
 
 
 if __name__ == "__main__":
-    index_csv_files()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="构建论文全文检索 (SQLite FTS5) 索引")
+    parser.add_argument("--body", action="store_true", help="同时索引已提取的 PDF 全文")
+    parser.add_argument("--workers", type=int, default=None, help="读取全文的进程数 (默认 CPU 核数)")
+    parser.add_argument("--body-chars", type=int, default=DEFAULT_BODY_CHARS, help="每篇全文索引的最大字符数")
+    args = parser.parse_args()
+    index_csv_files(include_body=args.body, workers=args.workers, max_body_chars=args.body_chars)
\ No newline at end of file
@@ -0,0 +1,97 @@
+# FILE: src/test/test_acl_exports.py
+#
+# -----------------------------------------------------------------------------
+# [ACL Anthology 卷级导出文件解析测试]
+#
+# 目  的:
+#   验证 src/utils/bibtex.py 的 BibTeX 解析 (嵌套花括号、引号与裸值、LaTeX 转义、作者名转换、逐条流式读取)
+#   以及 src/scrapers/acl_scraper.py 的 iter_mods_records / iter_bibtex_records:
+#   两种导出格式得到与详情页解析相同的字段与 URL，卷条目和编者被跳过。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_acl_exports.py
+# -----------------------------------------------------------------------------
+
+import io
+
+from src.scrapers.acl_scraper import iter_bibtex_records, iter_mods_records
+from src.utils.bibtex import bibtex_authors, iter_bibtex_entries, latex_to_unicode, parse_bibtex_fields
+
+VOLUME_BIB = r"""@proceedings{acl-2024-long,
+    title = "Proceedings of the 62nd Annual Meeting",
+    editor = "Ku, Lun-Wei and Martins, Andre",
+    url = "https://aclanthology.org/2024.acl-long.0/",
+}
+@inproceedings{muller-2024-sparse,
+    title = "{S}parse {E}xperts for {M}{\"u}ller's Tasks",
+    author = "M{\"u}ller, J{\"o}rg  and
+      Garc{\'\i}a, Ana",
+    booktitle = "Proceedings of the 62nd Annual Meeting",
+    year = 2024,
+    url = "https://aclanthology.org/2024.acl-long.1/",
+    abstract = "We study {M}o{E} models with 10\% of the compute.",
+}
+"""
+
+VOLUME_MODS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<modsCollection xmlns="http://www.loc.gov/mods/v3">
+<mods ID="muller-2024-sparse">
+    <titleInfo><title>Sparse Experts</title></titleInfo>
+    <name type="personal">
+        <namePart type="given">J\xc3\xb6rg</namePart><namePart type="family">M\xc3\xbcller</namePart>
+        <role><roleTerm authority="marcrelator" type="text">author</roleTerm></role>
+    </name>
+    <name type="personal">
+        <namePart type="given">Ana</namePart><namePart type="family">Garc\xc3\xada</namePart>
+        <role><roleTerm authority="marcrelator" type="text">author</roleTerm></role>
+    </name>
+    <relatedItem type="host">
+        <name type="personal">
+            <namePart type="given">Lun-Wei</namePart><namePart type="family">Ku</namePart>
+            <role><roleTerm authority="marcrelator" type="text">editor</roleTerm></role>
+        </name>
+    </relatedItem>
+    <abstract>We study MoE
+        models.</abstract>
+    <location><url>https://aclanthology.org/2024.acl-long.1/</url></location>
+</mods>
+<mods ID="no-url"><titleInfo><title>Front matter</title></titleInfo></mods>
+</modsCollection>
+"""
+
+
+def test_parse_bibtex_fields_handles_nesting_quotes_and_bare_values():
+    fields = parse_bibtex_fields('@article{key, title = {A {B}ig "Quote"}, year = 2024, '
+                                 'note = "see {x, y}", pages={1--2}}')
+    assert fields == {'title': 'A Big "Quote"', 'year': '2024', 'note': 'see x, y', 'pages': '1--2'}
+    raw = parse_bibtex_fields(r'@misc{k, title = {{M}{\"u}ller}}', convert_latex=False)
+    assert raw['title'] == r'{M}{\"u}ller'
+
+
+def test_latex_to_unicode():
+    assert latex_to_unicode(r'M{\"u}ller and Garc{\'\i}a') == 'Müller and García'
+    assert latex_to_unicode(r'\c{c}a, {\o}ystein, \ss, 10\% \& more') == 'ça, øystein, ß, 10% & more'
+
+
+def test_bibtex_authors():
+    assert bibtex_authors("Müller, Jörg  and\n García, Ana and Plato") == "Jörg Müller, Ana García, Plato"
+
+
+def test_iter_bibtex_entries_streams_one_entry_at_a_time():
+    entries = list(iter_bibtex_entries(io.StringIO("@comment{ignored}\n" + VOLUME_BIB)))
+    assert [(entry_type, key) for entry_type, key, _ in entries] == [
+        ('proceedings', 'acl-2024-long'), ('inproceedings', 'muller-2024-sparse')]
+
+
+def test_bibtex_and_mods_exports_produce_the_same_record():
+    expected = {
+        'id': '2024.acl-long.1', 'title': "Sparse Experts", 'authors': "Jörg Müller, Ana García",
+        'pdf_url': "https://aclanthology.org/2024.acl-long.1.pdf",
+        'source_url': "https://aclanthology.org/2024.acl-long.1/",
+    }
+    [from_bib] = iter_bibtex_records(io.BytesIO(VOLUME_BIB.encode('utf-8')))
+    [from_mods] = iter_mods_records(io.BytesIO(VOLUME_MODS))
+    assert from_bib == dict(expected, title="Sparse Experts for Müller's Tasks",
+                            abstract="We study MoE models with 10% of the compute.")
+    # 编者 (relatedItem 中的 <name>) 不算作者，没有 URL 的卷首条目被跳过
+    assert from_mods == dict(expected, abstract="We study MoE models.")
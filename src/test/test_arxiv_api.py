@@ -0,0 +1,184 @@
+# FILE: src/test/test_arxiv_api.py
+#
+# -----------------------------------------------------------------------------
+# [arXiv API 分页与日期窗口二分测试]
+#
+# 目  的:
+#   用本地 arXiv API 桩服务器 (按 submittedDate 子句与 start/max_results 从内存语料生成 Atom 页)
+#   验证 ArxivScraper 的默认 API 模式: 超过结果上限的查询被二分为日期窗口、逐页翻页、
+#   单日窗口无法再拆分时只取上限内的结果、请求失败或持续返回空页时抛出异常，
+#   以及中断后按检查点中的游标续爬。
+#   API_RESULT_CAP 在测试中调小为 5，语料只需十几篇论文。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_arxiv_api.py
+# -----------------------------------------------------------------------------
+
+import logging
+import re
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.scrapers import arxiv_scraper
+from src.scrapers.arxiv_scraper import ArxivScraper
+from src.utils.checkpoint import CheckpointJournal
+from src.utils.network_utils import configure_http_client
+
+logger = logging.getLogger("test_arxiv_api")
+WINDOW_CLAUSE = re.compile(r'submittedDate:\[(\d{8})0000 TO (\d{8})2359\]')
+
+
+class StubArxivApi:
+    """按查询中的日期窗口过滤内存语料 (按日期降序)，并记录每个请求的 (窗口, start)。"""
+
+    def __init__(self, days):
+        # days: 每篇论文的提交日期 (date)，编号按日期先后
+        self.corpus = [(f"2401.{i:05d}v1", day) for i, day in enumerate(sorted(days), start=1)][::-1]
+        self.requests = []
+        self.fail_at = None      # 从第几个请求 (从 1 计) 开始返回 500
+        self.empty_pages = False
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                status, body = stub.respond(params)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/atom+xml')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/api/query?"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def respond(self, params):
+        match = WINDOW_CLAUSE.search(params['search_query'])
+        window = (match.group(1), match.group(2)) if match else None
+        start, size = int(params['start']), int(params['max_results'])
+        self.requests.append((window, start))
+        if self.fail_at is not None and len(self.requests) >= self.fail_at:
+            return 500, b"Internal Server Error"
+
+        matching = [(paper_id, day) for paper_id, day in self.corpus
+                    if window is None or window[0] <= day.strftime('%Y%m%d') <= window[1]]
+        entries = '' if self.empty_pages else ''.join(
+            f"<entry><id>http://arxiv.org/abs/{paper_id}</id><title>Paper {paper_id}</title>"
+            f"<summary>Submitted {day}</summary><author><name>Ada</name></author>"
+            f'<link title="pdf" href="http://arxiv.org/pdf/{paper_id}"/></entry>'
+            for paper_id, day in matching[start:start + size])
+        return 200, (f'<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+                     f'<opensearch:totalResults>{len(matching)}</opensearch:totalResults>{entries}</feed>').encode()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def _days(first, count, per_day=1):
+    return [date.fromisoformat(first) + timedelta(days=i) for i in range(count) for _ in range(per_day)]
+
+
+@pytest.fixture
+def make_api(monkeypatch):
+    servers = []
+    monkeypatch.setattr(arxiv_scraper, 'API_RESULT_CAP', 5)
+    configure_http_client(retries=0)
+
+    def make(days):
+        server = StubArxivApi(days)
+        monkeypatch.setattr(ArxivScraper, 'BASE_URL', server.url)
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.close()
+    configure_http_client()
+
+
+def _scraper(**options):
+    task_info = {'name': 'arXiv_cs.LG', 'source_type': 'arxiv', 'search_query': 'cat:cs.LG', 'max_results': None,
+                 'page_size': 2, 'date_from': '2024-01-01', 'date_to': '2024-01-12', 'max_retries': 2}
+    task_info.update(options.pop('task', {}))
+    return ArxivScraper(task_info, logger, **options)
+
+
+def test_split_bisects_in_sort_order():
+    scraper = _scraper()
+    assert scraper._split(('2024-01-01', '2024-01-12')) == [('2024-01-07', '2024-01-12'), ('2024-01-01', '2024-01-06')]
+    assert _scraper(task={'sort_order': 'ascending'})._split(('2024-01-01', '2024-01-02')) == \
+           [('2024-01-01', '2024-01-01'), ('2024-01-02', '2024-01-02')]
+    assert scraper._split(('2024-01-05', '2024-01-05')) is None
+    assert scraper._split(None)[-1][0] == arxiv_scraper.ARXIV_EPOCH.isoformat()
+
+
+def test_large_query_is_sliced_into_windows_under_the_cap(make_api):
+    api = make_api(_days('2024-01-01', 12))
+    papers = _scraper().scrape()
+
+    assert [p['id'] for p in papers] == [paper_id for paper_id, _ in api.corpus]
+    assert papers[0]['pdf_url'] == "http://arxiv.org/pdf/2401.00012v1"
+    # 窗口依次二分直到不超过上限，每个窗口按 page_size 翻页
+    assert api.requests == [
+        (('20240101', '20240112'), 0), (('20240107', '20240112'), 0),
+        (('20240110', '20240112'), 0), (('20240110', '20240112'), 2),
+        (('20240107', '20240109'), 0), (('20240107', '20240109'), 2),
+        (('20240101', '20240106'), 0),
+        (('20240104', '20240106'), 0), (('20240104', '20240106'), 2),
+        (('20240101', '20240103'), 0), (('20240101', '20240103'), 2),
+    ]
+
+
+def test_single_day_over_the_cap_keeps_only_the_first_results(make_api):
+    api = make_api(_days('2024-01-05', 1, per_day=7))
+    papers = _scraper(task={'date_from': '2024-01-05', 'date_to': '2024-01-05', 'page_size': 1}).scrape()
+    assert len(papers) == 5
+    assert [start for _, start in api.requests] == [0, 1, 2, 3, 4]
+
+
+def test_max_results_stops_without_slicing(make_api):
+    api = make_api(_days('2024-01-01', 12))
+    papers = _scraper(task={'max_results': 3, 'page_size': 10}).scrape()
+    assert [p['id'] for p in papers] == ['2401.00012v1', '2401.00011v1', '2401.00010v1']
+    assert api.requests == [(('20240101', '20240112'), 0)]
+
+
+def test_failures_raise_instead_of_skipping_the_window(make_api):
+    api = make_api(_days('2024-01-01', 3))
+    api.fail_at = 1
+    with pytest.raises(IOError, match="500"):
+        _scraper().scrape()
+
+    api.fail_at, api.empty_pages = None, True
+    api.requests.clear()
+    with pytest.raises(IOError, match="empty page"):
+        _scraper().scrape()
+    assert len(api.requests) == 2  # max_retries
+
+
+def test_resume_continues_from_the_saved_cursor(make_api, tmp_path):
+    api = make_api(_days('2024-01-01', 12))
+    api.fail_at = 5
+    checkpoint = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+    with pytest.raises(IOError):
+        _scraper(checkpoint=checkpoint).scrape()
+    checkpoint.close()
+
+    api.fail_at = None
+    api.requests.clear()
+    checkpoint = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+    papers = _scraper(checkpoint=checkpoint).scrape()
+    checkpoint.close()
+    assert [p['id'] for p in papers] == [paper_id for paper_id, _ in api.corpus]
+    # 已完成的窗口不再请求，从失败的窗口开头继续
+    assert api.requests[0] == (('20240107', '20240109'), 0)
+    assert (('20240110', '20240112'), 0) not in api.requests
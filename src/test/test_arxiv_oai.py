@@ -0,0 +1,182 @@
+# FILE: src/test/test_arxiv_oai.py
+#
+# -----------------------------------------------------------------------------
+# [arXiv OAI-PMH 抓取模式测试]
+#
+# 目  的:
+#   用本地 OAI-PMH 桩服务器 (回放 src/test/fixtures/arxiv_oai/ 中录制的 XML) 验证
+#   ArxivScraper 的 harvest_mode: oai —— resumptionToken 翻页、分类过滤、
+#   水位线持久化与每日增量 (from=上次水位线)、断点续爬。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_arxiv_oai.py
+# -----------------------------------------------------------------------------
+
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.scrapers.arxiv_oai import OaiError, list_records_url, parse_list_records
+from src.scrapers.arxiv_scraper import ArxivScraper
+from src.utils.checkpoint import CheckpointJournal
+
+FIXTURES = Path(__file__).parent / "fixtures" / "arxiv_oai"
+TOKEN = "6960524|1001"
+logger = logging.getLogger("test_arxiv_oai")
+
+
+class StubOaiServer:
+    """按请求参数回放录制的 ListRecords 响应，并记录收到的每个请求。"""
+
+    def __init__(self):
+        self.requests = []
+        self.expired_tokens = set()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                stub.requests.append(params)
+                body = (FIXTURES / stub.fixture_for(params)).read_bytes()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/xml')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/oai2"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def fixture_for(self, params):
+        token = params.get('resumptionToken')
+        if token:
+            return "bad_resumption_token.xml" if token in self.expired_tokens else "list_records_page2.xml"
+        if params.get('from'):
+            return "no_records_match.xml"
+        return "list_records_page1.xml"
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def oai_server():
+    server = StubOaiServer()
+    yield server
+    server.close()
+
+
+def _scraper(server, tmp_path, **options):
+    task_info = {'name': 'arXiv_cs.LG_daily', 'source_type': 'arxiv', 'harvest_mode': 'oai',
+                 'search_query': 'cat:cs.LG', 'oai_url': server.url,
+                 'watermark_file': str(tmp_path / "state" / "arXiv_cs.LG_daily.oai_watermark.json")}
+    task_info.update(options.pop('task', {}))
+    return ArxivScraper(task_info, logger, **options)
+
+
+def test_parse_list_records():
+    page = parse_list_records((FIXTURES / "list_records_page1.xml").read_bytes())
+    assert page.resumption_token == TOKEN
+    assert page.complete_list_size == 5
+    assert page.response_date == "2024-05-02T09:15:31Z"
+    assert page.deleted == 1
+    first = page.records[0]
+    assert first['id'] == '2404.01001'
+    assert first['title'] == 'Scaling Laws for Sparse Mixture-of-Experts'
+    assert first['authors'] == 'Jörg Müller, Li Chen'
+    assert first['abstract'] == 'We study how sparse mixture-of-experts models scale.'
+    assert first['mdate'] == '2024-04-30'
+
+    last = parse_list_records((FIXTURES / "list_records_page2.xml").read_bytes())
+    assert last.resumption_token is None
+    assert last.records[0]['authors'] == 'A. B. Smith Jr, Collaboration'
+
+    assert parse_list_records((FIXTURES / "no_records_match.xml").read_bytes()).records == []
+    with pytest.raises(OaiError) as excinfo:
+        parse_list_records((FIXTURES / "bad_resumption_token.xml").read_bytes())
+    assert excinfo.value.code == 'badResumptionToken'
+
+
+def test_list_records_url():
+    assert list_records_url('http://x/oai2', 'cs', '2024-05-02') == \
+           'http://x/oai2?verb=ListRecords&metadataPrefix=arXiv&set=cs&from=2024-05-02'
+    # 后续页只能携带 resumptionToken
+    assert list_records_url('http://x/oai2', 'cs', '2024-05-02', resumption_token=TOKEN) == \
+           'http://x/oai2?verb=ListRecords&resumptionToken=6960524%7C1001'
+
+
+def test_full_harvest_then_daily_increment(oai_server, tmp_path):
+    scraper = _scraper(oai_server, tmp_path)
+    papers = scraper.scrape()
+    # cs.CV 的记录、已删除的记录与跨页重复的记录都不产出
+    assert [p['id'] for p in papers] == ['2404.01001', '2405.00010']
+    assert oai_server.requests[0] == {'verb': 'ListRecords', 'metadataPrefix': 'arXiv', 'set': 'cs'}
+    assert oai_server.requests[1] == {'verb': 'ListRecords', 'resumptionToken': TOKEN}
+
+    # 结果保存之前水位线不前移
+    watermark_file = Path(scraper.watermark_file)
+    assert not watermark_file.exists()
+    scraper.commit_state()
+    assert json.loads(watermark_file.read_text(encoding='utf-8'))['from'] == '2024-05-02'
+
+    # 第二天的任务只请求上次水位线以来的变更
+    oai_server.requests.clear()
+    daily = _scraper(oai_server, tmp_path)
+    assert daily.scrape() == []
+    assert oai_server.requests == [{'verb': 'ListRecords', 'metadataPrefix': 'arXiv', 'set': 'cs',
+                                    'from': '2024-05-02'}]
+    daily.commit_state()
+    assert json.loads(watermark_file.read_text(encoding='utf-8'))['from'] == '2024-05-03'
+
+
+def test_incremental_skips_unchanged_records(oai_server, tmp_path):
+    known = {'2404.01001': {'id': '2404.01001', 'mdate': '2024-04-30'},
+             '2405.00010': {'id': '2405.00010', 'mdate': '2024-04-15'}}
+    papers = _scraper(oai_server, tmp_path, known_papers=known).scrape()
+    assert [p['id'] for p in papers] == ['2405.00010']
+
+
+def test_limit_does_not_advance_watermark(oai_server, tmp_path):
+    scraper = _scraper(oai_server, tmp_path, task={'limit': 1})
+    assert len(scraper.scrape()) == 1
+    scraper.commit_state()
+    assert not Path(scraper.watermark_file).exists()
+
+
+def test_resume_from_saved_token(oai_server, tmp_path):
+    checkpoint = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+    harvest = _scraper(oai_server, tmp_path, checkpoint=checkpoint).iter_papers()
+    assert next(harvest)['id'] == '2404.01001'
+    # 取到第二页的第一篇时，第一页的游标已写入检查点；随后模拟中断
+    assert next(harvest)['id'] == '2405.00010'
+    harvest.close()
+    checkpoint.close()
+
+    oai_server.requests.clear()
+    checkpoint = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+    papers = _scraper(oai_server, tmp_path, checkpoint=checkpoint).scrape()
+    checkpoint.close()
+    assert sorted(p['id'] for p in papers) == ['2404.01001', '2405.00010']
+    assert oai_server.requests == [{'verb': 'ListRecords', 'resumptionToken': TOKEN}]
+
+
+def test_expired_token_restarts_window(oai_server, tmp_path):
+    checkpoint = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+    checkpoint.set_state('arxiv_oai_cursor', {'signature': f"oai|{oai_server.url}|cs|None|None",
+                                              'token': 'expired', 'response_date': '2024-05-02T09:15:31Z'})
+    oai_server.expired_tokens.add('expired')
+    papers = _scraper(oai_server, tmp_path, checkpoint=checkpoint).scrape()
+    checkpoint.close()
+    assert [p['id'] for p in papers] == ['2404.01001', '2405.00010']
+    assert oai_server.requests[0] == {'verb': 'ListRecords', 'resumptionToken': 'expired'}
+    assert oai_server.requests[1] == {'verb': 'ListRecords', 'metadataPrefix': 'arXiv', 'set': 'cs'}
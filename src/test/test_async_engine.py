@@ -0,0 +1,155 @@
+# FILE: src/test/test_async_engine.py
+#
+# -----------------------------------------------------------------------------
+# [异步详情页抓取引擎测试]
+#
+# 目  的:
+#   用本地桩服务器验证 src/utils/async_engine.py 的 AsyncCrawlEngine:
+#   每主机并发上限、可重试状态码 (503) 的重试、失败页面不产出结果且以警告记录并汇总计数、
+#   iter_results 的流式产出与提前停止，以及未安装 aiohttp 时的线程池回退实现 (同样按需读取请求)。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_async_engine.py
+# -----------------------------------------------------------------------------
+
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.utils import async_engine
+from src.utils.async_engine import AsyncCrawlEngine
+from src.utils.network_utils import configure_http_client
+from src.utils.rate_limiter import get_rate_limiter
+
+
+class StubServer:
+    """/paper/<i> 返回 "paper <i>"；/flaky 第一次返回 503；其余路径返回 404。记录并发峰值。"""
+
+    def __init__(self):
+        self.active = self.peak = 0
+        self.flaky_hits = 0
+        lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with lock:
+                    stub.active += 1
+                    stub.peak = max(stub.peak, stub.active)
+                try:
+                    time.sleep(0.05)
+                    status, body = 404, b""
+                    if self.path.startswith("/paper/"):
+                        status, body = 200, f"paper {self.path.rsplit('/', 1)[1]}".encode()
+                    elif self.path == "/flaky":
+                        with lock:
+                            stub.flaky_hits += 1
+                            first = stub.flaky_hits == 1
+                        status, body = (503, b"") if first else (200, b"recovered")
+                    self.send_response(status)
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with lock:
+                        stub.active -= 1
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    get_rate_limiter().configure('127.0.0.1', rate=1000, burst=1000)
+    configure_http_client(retries=0)
+    stub = StubServer()
+    yield stub
+    stub.close()
+    configure_http_client()
+
+
+def _parse(url, content):
+    return {'url': url, 'text': content.decode()}
+
+
+def _requests(server, n):
+    return [(f"{server.url}/paper/{i}", _parse) for i in range(n)]
+
+
+@pytest.mark.skipif(not async_engine.IS_AIOHTTP_AVAILABLE, reason="需要 aiohttp")
+def test_run_respects_per_host_limit_and_retries(server):
+    engine = AsyncCrawlEngine(max_concurrency=50, per_host_limit=3, backoff_factor=0)
+    requests = _requests(server, 12) + [(f"{server.url}/flaky", _parse), (f"{server.url}/missing", _parse)]
+    results = engine.run(requests, total=len(requests))
+    texts = sorted(result['text'] for result in results)
+    assert texts == sorted([f"paper {i}" for i in range(12)] + ["recovered"])
+    assert server.flaky_hits == 2
+    assert 1 < server.peak <= 3
+
+
+@pytest.mark.skipif(not async_engine.IS_AIOHTTP_AVAILABLE, reason="需要 aiohttp")
+def test_iter_results_stops_early_without_hanging(server):
+    engine = AsyncCrawlEngine(max_concurrency=2, per_host_limit=2)
+    results = engine.iter_results(_requests(server, 40))
+    first = [next(results), next(results)]
+    results.close()
+    assert all(result['text'].startswith("paper ") for result in first)
+    assert not any(thread.name == "crawl-engine" for thread in threading.enumerate())
+
+
+def test_thread_fallback_produces_the_same_results(server, monkeypatch):
+    monkeypatch.setattr(async_engine, "IS_AIOHTTP_AVAILABLE", False)
+    engine = AsyncCrawlEngine(per_host_limit=4)
+    requests = _requests(server, 8) + [(f"{server.url}/missing", _parse)]
+    results = list(engine.iter_results(requests, total=len(requests)))
+    assert sorted(result['text'] for result in results) == sorted(f"paper {i}" for i in range(8))
+    assert server.peak <= 4
+
+
+def _broken_parse(url, content):
+    raise ValueError("unexpected markup")
+
+
+@pytest.mark.parametrize("aiohttp_available", [True, False])
+def test_failures_are_logged_and_counted(server, monkeypatch, caplog, aiohttp_available):
+    if aiohttp_available and not async_engine.IS_AIOHTTP_AVAILABLE:
+        pytest.skip("需要 aiohttp")
+    monkeypatch.setattr(async_engine, "IS_AIOHTTP_AVAILABLE", aiohttp_available)
+    engine = AsyncCrawlEngine(per_host_limit=2, retries=0)
+    requests = _requests(server, 2) + [(f"{server.url}/missing", _parse), (f"{server.url}/paper/x", _broken_parse),
+                                       (f"{server.url}/paper/y", lambda url, content: None)]
+    with caplog.at_level(logging.WARNING):
+        results = engine.run(requests, total=len(requests))
+    assert len(results) == 2 and engine.failed == 3
+    warnings = [record.getMessage() for record in caplog.records if record.levelno >= logging.WARNING]
+    assert any("/paper/x" in message and "unexpected markup" in message for message in warnings)
+    assert any("3 个详情页未能抓取或解析" in message for message in warnings)
+
+
+def test_thread_fallback_reads_requests_lazily(server, monkeypatch):
+    monkeypatch.setattr(async_engine, "IS_AIOHTTP_AVAILABLE", False)
+    consumed = []
+
+    def requests():
+        for i in range(1000):
+            consumed.append(i)
+            yield f"{server.url}/paper/{i}", _parse
+
+    results = AsyncCrawlEngine(per_host_limit=2).iter_results(requests())
+    next(results)
+    results.close()
+    # 在途请求最多 per_host_limit * 2 个，再加上取走第一个结果后补充的窗口
+    assert len(consumed) <= 8
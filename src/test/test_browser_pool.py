@@ -0,0 +1,103 @@
+# FILE: src/test/test_browser_pool.py
+#
+# -----------------------------------------------------------------------------
+# [共享浏览器池测试]
+#
+# 目  的:
+#   用不启动 Chrome 的假浏览器验证 src/utils/browser_pool.py 的 BrowserPool:
+#   按需创建且不超过 size、归还后复用、出错丢弃后腾出名额、借用等待超时，
+#   以及关闭后正在等待的借用者立即报错而不是永远阻塞。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_browser_pool.py
+# -----------------------------------------------------------------------------
+
+import threading
+import time
+
+import pytest
+
+from src.utils.browser_pool import BrowserPool
+
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.window_handles = ["main"]
+        self.switch_to = self
+        self.quit_called = False
+
+    def window(self, handle):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakePool(BrowserPool):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.launched = []
+
+    def _create_driver(self):
+        driver = FakeDriver(len(self.launched))
+        self.launched.append(driver)
+        return driver
+
+
+def test_pool_creates_on_demand_and_reuses_released_drivers():
+    pool = FakePool(size=2)
+    first, second = pool._checkout(), pool._checkout()
+    assert len(pool.launched) == 2
+    pool._release(first)
+    assert pool._checkout() is first
+    assert len(pool.launched) == 2
+    pool.close()
+    assert all(driver.quit_called for driver in pool.launched)
+
+
+def test_discarded_driver_frees_a_slot_for_waiters():
+    pool = FakePool(size=1, checkout_timeout=10)
+    broken = pool._checkout()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool._checkout()))
+    waiter.start()
+    time.sleep(0.2)
+    pool._discard(broken)
+    waiter.join(timeout=5)
+    assert got and got[0] is not broken and len(pool.launched) == 2
+    pool.close()
+
+
+def test_checkout_times_out_when_every_driver_is_busy():
+    pool = FakePool(size=1, checkout_timeout=0.5)
+    pool._checkout()
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        pool._checkout()
+    assert time.monotonic() - started < 5
+    pool.close()
+
+
+def test_close_wakes_waiters_and_rejects_new_checkouts():
+    pool = FakePool(size=1, checkout_timeout=60)
+    busy = pool._checkout()
+    errors = []
+
+    def wait_for_driver():
+        try:
+            pool._checkout()
+        except RuntimeError as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=wait_for_driver)
+    waiter.start()
+    time.sleep(0.2)
+    pool.close()
+    waiter.join(timeout=5)
+    assert not waiter.is_alive() and len(errors) == 1
+    with pytest.raises(RuntimeError):
+        pool._checkout()
+    # 关闭后归还的浏览器直接退出，不再进入空闲队列
+    pool._release(busy)
+    assert busy.quit_called and pool._idle.empty()
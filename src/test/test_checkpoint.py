@@ -0,0 +1,90 @@
+# FILE: src/test/test_checkpoint.py
+#
+# -----------------------------------------------------------------------------
+# [断点续爬日志测试]
+#
+# 目  的:
+#   验证 src/utils/checkpoint.py 的 CheckpointJournal: 追加的记录与续爬状态在重新打开后恢复
+#   (后写入的值覆盖先前的值)、进程崩溃留下的半行被忽略且不会与新记录拼接、多线程并发追加、
+#   任务名到文件名的转换，以及 clear()/close() 后不留下日志文件。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_checkpoint.py
+# -----------------------------------------------------------------------------
+
+import threading
+
+from src.utils.checkpoint import CheckpointJournal
+
+
+def test_records_and_state_survive_reopening(tmp_path):
+    journal = CheckpointJournal(tmp_path / "task.jsonl")
+    journal.append("https://a.org/1", {'id': '1', 'title': "First"})
+    journal.append("https://a.org/2", {'id': '2', 'title': "Second"})
+    journal.append("https://a.org/1", {'id': '1', 'title': "First (updated)"})
+    journal.set_state("cursor", {'start': 100})
+    journal.set_state("cursor", {'start': 200})
+    journal.close()
+
+    reopened = CheckpointJournal(tmp_path / "task.jsonl")
+    assert len(reopened) == 2 and "https://a.org/2" in reopened
+    assert reopened.get("https://a.org/1")['title'] == "First (updated)"
+    assert [key for key, _ in reopened.items()] == ["https://a.org/1", "https://a.org/2"]
+    # 状态行不计入论文记录
+    assert reopened.get_state("cursor") == {'start': 200}
+    assert reopened.get_state("missing", "default") == "default"
+    reopened.close()
+
+
+def test_half_written_line_is_ignored_and_not_merged_with_new_records(tmp_path):
+    path = tmp_path / "task.jsonl"
+    journal = CheckpointJournal(path)
+    journal.append("k1", {'id': 1})
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"key": "k2", "record": {"id"')  # 进程在写入中途崩溃
+
+    journal = CheckpointJournal(path)
+    assert len(journal) == 1
+    journal.append("k3", {'id': 3})
+    journal.close()
+
+    reopened = CheckpointJournal(path)
+    assert sorted(key for key, _ in reopened.items()) == ["k1", "k3"]
+    reopened.close()
+
+
+def test_concurrent_appends_are_all_persisted(tmp_path):
+    journal = CheckpointJournal(tmp_path / "task.jsonl")
+
+    def worker(n):
+        for i in range(50):
+            journal.append(f"{n}-{i}", {'n': n, 'i': i, 'text': "x" * 200})
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    journal.close()
+    assert len(CheckpointJournal(tmp_path / "task.jsonl")) == 400
+
+
+def test_for_task_sanitises_the_file_name(tmp_path):
+    journal = CheckpointJournal.for_task(tmp_path / "checkpoints", "ICLR 2024: oral/poster")
+    assert journal.path == tmp_path / "checkpoints" / "ICLR_2024__oral_poster.jsonl"
+    journal.close()
+
+
+def test_clear_and_close_leave_no_file_behind(tmp_path):
+    journal = CheckpointJournal(tmp_path / "task.jsonl")
+    journal.append("k", {'id': 1})
+    journal.set_state("cursor", 1)
+    journal.clear()
+    assert len(journal) == 0 and journal.get_state("cursor") is None
+    journal.close()
+    assert not (tmp_path / "task.jsonl").exists()
+
+    # 从未写入任何内容的日志同样不保留
+    CheckpointJournal(tmp_path / "empty.jsonl").close()
+    assert not (tmp_path / "empty.jsonl").exists()
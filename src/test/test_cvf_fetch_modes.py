@@ -0,0 +1,121 @@
+# FILE: src/test/test_cvf_fetch_modes.py
+#
+# -----------------------------------------------------------------------------
+# [CVF 快速抓取模式测试]
+#
+# 目  的:
+#   用本地桩服务器 (提供 src/test/fixtures/ 中的 CVF 索引页与详情页样本) 验证 CvfScraper 的 fetch_mode:
+#   index_only 不请求任何详情页；two_phase 为全部论文补全摘要，开启 prefilter_titles 时只为标题通过 filters 的论文补全，
+#   详情页抓取失败的论文仍保留索引页中的信息；max_papers_limit 与 detail 模式一样在标题过滤之后应用；
+#   增量模式下已保存的论文不再产出。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_cvf_fetch_modes.py
+# -----------------------------------------------------------------------------
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.scrapers.cvf_scraper import CvfScraper
+
+FIXTURES = Path(__file__).parent / "fixtures"
+DETAIL_PATH = "/content/CVPR2024/html/Zhang_Unified_Reasoning_CVPR_2024_paper.html"
+logger = logging.getLogger("test_cvf_fetch_modes")
+
+
+@pytest.fixture
+def cvf_site():
+    """索引页与一篇论文的详情页；其余详情页返回 404。记录每个请求的路径。"""
+    paths = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            paths.append(self.path)
+            if self.path.startswith("/CVPR2024"):
+                status, body = 200, (FIXTURES / "cvf_index.html").read_bytes()
+            elif self.path == DETAIL_PATH:
+                status, body = 200, (FIXTURES / "cvf_detail.html").read_bytes()
+            else:
+                status, body = 404, b"Not Found"
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", paths
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _scraper(base_url, **task):
+    task_info = {'name': 'CVPR_2024', 'conference': 'CVPR', 'url': f"{base_url}/CVPR2024?day=all"}
+    task_info.update(task)
+    return CvfScraper(task_info, logger)
+
+
+def test_index_only_builds_records_without_detail_requests(cvf_site):
+    base_url, paths = cvf_site
+    papers = _scraper(base_url, fetch_mode='index_only').scrape()
+    assert [p['id'] for p in papers] == ['Zhang_Unified_Reasoning_CVPR_2024_paper', 'Li_Segment_Anything_CVPR_2024_paper',
+                                         'Ng_LoRA_CVPR_2024_paper']
+    assert papers[0]['abstract'] == 'N/A' and papers[0]['authors'] == 'Wei Zhang, Jörg Müller'
+    assert papers[0]['source_url'] == base_url + DETAIL_PATH
+    assert paths == ["/CVPR2024?day=all"]
+
+
+def test_two_phase_backfills_only_matching_titles(cvf_site):
+    base_url, paths = cvf_site
+    scraper = _scraper(base_url, fetch_mode='two_phase', filters=['reasoning', 'lora'], prefilter_titles=True)
+    papers = {p['id']: p for p in scraper.scrape()}
+
+    assert sorted(paths[1:]) == sorted([DETAIL_PATH, "/content/CVPR2024/html/Ng_LoRA_CVPR_2024_paper.html"])
+    assert scraper.paper_filter.fetches_avoided == 1
+    assert sorted(papers) == ['Ng_LoRA_CVPR_2024_paper', 'Zhang_Unified_Reasoning_CVPR_2024_paper']
+    # 详情页补全摘要，索引页中的补充材料链接保留
+    zhang = papers['Zhang_Unified_Reasoning_CVPR_2024_paper']
+    assert '“grounded”' in zhang['abstract']
+    assert zhang['supp_url'].endswith('Zhang_Unified_Reasoning_CVPR_2024_supplemental.pdf')
+    # 详情页 404: 仍产出索引页中的记录
+    assert papers['Ng_LoRA_CVPR_2024_paper']['abstract'] == 'N/A'
+
+
+def test_two_phase_backfills_every_paper_without_title_prefilter(cvf_site):
+    base_url, paths = cvf_site
+    scraper = _scraper(base_url, fetch_mode='two_phase', filters=['reasoning', 'lora'])
+    papers = scraper.scrape()
+    # 仅在摘要中命中关键词的论文也要补全摘要后交给最终过滤
+    assert len(paths) == 4 and scraper.paper_filter.fetches_avoided == 0
+    assert len(papers) == 3
+
+
+def test_fast_modes_skip_known_papers(cvf_site):
+    base_url, paths = cvf_site
+    known = {'Zhang_Unified_Reasoning_CVPR_2024_paper': {'id': 'Zhang_Unified_Reasoning_CVPR_2024_paper',
+                                                         'source_url': base_url + DETAIL_PATH}}
+    scraper = CvfScraper({'name': 'CVPR_2024', 'url': f"{base_url}/CVPR2024?day=all", 'fetch_mode': 'two_phase'},
+                         logger, known_papers=known)
+    papers = scraper.scrape()
+    assert sorted(p['id'] for p in papers) == ['Li_Segment_Anything_CVPR_2024_paper', 'Ng_LoRA_CVPR_2024_paper']
+    assert DETAIL_PATH not in paths
+
+
+@pytest.mark.parametrize("fetch_mode", ['detail', 'index_only', 'two_phase'])
+def test_limit_applies_after_the_title_filter_in_every_mode(cvf_site, fetch_mode):
+    base_url, paths = cvf_site
+    scraper = _scraper(base_url, fetch_mode=fetch_mode, filters=['lora'], prefilter_titles=True, max_papers_limit=1)
+    papers = scraper.scrape()
+    # 三种模式选中同一篇论文 (排在第三位、标题匹配的 LoRA)
+    ng_path = "/content/CVPR2024/html/Ng_LoRA_CVPR_2024_paper.html"
+    assert paths[1:] == ([] if fetch_mode == 'index_only' else [ng_path])
+    # 详情页 404 时 detail 模式没有结果，其余模式保留索引页记录
+    assert [p['id'] for p in papers] == ([] if fetch_mode == 'detail' else ['Ng_LoRA_CVPR_2024_paper'])
@@ -0,0 +1,254 @@
+# FILE: src/test/test_download_manager.py
+#
+# -----------------------------------------------------------------------------
+# [PDF 下载管理器测试]
+#
+# 目  的:
+#   用本地桩服务器 (支持 Range，可模拟连接中断) 验证 src/utils/download_manager.py:
+#   并发下载与每主机并发上限、.part 断点续传与原子重命名、持久化下载队列的续传，
+#   src/utils/pdf_store.py 内容寻址仓库的跨任务去重与视图，
+#   以及 src/crawlers/processor.py 把 PDF 直接流式写入 zip 的归档器。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_download_manager.py
+# -----------------------------------------------------------------------------
+
+import os
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.crawlers.processor import StreamingZipArchiver
+from src.utils.checkpoint import CheckpointJournal
+from src.utils.download_manager import DownloadManager, download_file, pdf_path
+from src.utils.network_utils import configure_http_client
+from src.utils.pdf_store import PdfStore
+
+SIZE = 1024 * 1024
+
+
+class StubPdfServer:
+    """提供 /p<i>.pdf 的随机内容；drop 中的路径第一次请求只发送一部分就断开连接，no_range 中的路径忽略 Range。"""
+
+    def __init__(self):
+        self.files = {f"/p{i}.pdf": os.urandom(SIZE + i) for i in range(6)}
+        self.drop = set()
+        self.no_range = set()
+        self.ranges = []
+        self.active = self.peak = self.requests = 0
+        lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with lock:
+                    stub.active += 1
+                    stub.requests += 1
+                    stub.peak = max(stub.peak, stub.active)
+                try:
+                    if self.path not in stub.files:
+                        self.send_response(404)
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+                    self._serve(stub.files[self.path])
+                finally:
+                    with lock:
+                        stub.active -= 1
+
+            def _serve(self, body):
+                start = 0
+                if self.headers.get('Range') and self.path not in stub.no_range:
+                    start = int(self.headers['Range'].split('=')[1].rstrip('-'))
+                    stub.ranges.append((self.path, start))
+                    if start >= len(body):
+                        self.send_response(416)
+                        self.send_header('Content-Range', f"bytes */{len(body)}")
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header('Content-Range', f"bytes {start}-{len(body) - 1}/{len(body)}")
+                else:
+                    self.send_response(200)
+                self.send_header('Content-Length', str(len(body) - start))
+                self.end_headers()
+                time.sleep(0.1)
+                if self.path in stub.drop:
+                    stub.drop.discard(self.path)
+                    self.wfile.write(body[start:start + SIZE * 3 // 4])
+                    self.wfile.flush()
+                    self.connection.shutdown(2)
+                    return
+                self.wfile.write(body[start:])
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def pdf_server():
+    configure_http_client(retries=0)
+    server = StubPdfServer()
+    yield server
+    server.close()
+    configure_http_client()
+
+
+def _paper(server, i, title=None):
+    return {'title': title or f"Paper {i}", 'pdf_url': f"{server.url}/p{i}.pdf"}
+
+
+def test_concurrent_downloads_respect_per_host_limit(pdf_server, tmp_path):
+    queue = CheckpointJournal(tmp_path / "queue.jsonl")
+    manager = DownloadManager(tmp_path / "pdfs", queue=queue, max_workers=6, per_host=2)
+    for i in range(6):
+        assert manager.submit(_paper(pdf_server, i))
+    assert not manager.submit({'title': 'TPAMI', 'pdf_url': '请访问源页面查看PDF（可能需要订阅）'})
+    stats = manager.close()
+
+    assert stats.files == 6 and stats.failed == 0
+    assert pdf_server.peak == 2
+    for i in range(6):
+        assert pdf_path(_paper(pdf_server, i), tmp_path / "pdfs").read_bytes() == pdf_server.files[f"/p{i}.pdf"]
+    assert not list((tmp_path / "pdfs").glob("*.part"))
+    # 全部完成后删除下载队列
+    assert not (tmp_path / "queue.jsonl").exists()
+
+
+def test_dropped_connection_resumes_with_range(pdf_server, tmp_path):
+    pdf_server.drop.add("/p1.pdf")
+    target = tmp_path / "p1.pdf"
+    result = download_file(f"{pdf_server.url}/p1.pdf", target)
+    assert target.read_bytes() == pdf_server.files["/p1.pdf"]
+    assert result['resumed_from'] > 0
+    assert pdf_server.ranges == [("/p1.pdf", result['resumed_from'])]
+
+    # .part 已完整 (上次在重命名前中断): 服务器返回 416，直接完成
+    complete = tmp_path / "p2.pdf"
+    complete.with_name("p2.pdf.part").write_bytes(pdf_server.files["/p2.pdf"])
+    download_file(f"{pdf_server.url}/p2.pdf", complete)
+    assert complete.read_bytes() == pdf_server.files["/p2.pdf"]
+
+
+def test_persistent_queue_resumes_unfinished_downloads(pdf_server, tmp_path):
+    queue_path, pdf_dir = tmp_path / "queue.jsonl", tmp_path / "pdfs"
+    pdf_dir.mkdir()
+    # 上次运行: p3 已完成，p4 下载到一半时进程退出
+    queue = CheckpointJournal(queue_path)
+    queue.append(f"{pdf_server.url}/p3.pdf", {'path': "Paper 3.pdf", 'status': 'done'})
+    queue.append(f"{pdf_server.url}/p4.pdf", {'path': "Paper 4.pdf", 'paper': {'title': "Paper 4"}, 'status': 'pending'})
+    queue.close()
+    (pdf_dir / "Paper 4.pdf.part").write_bytes(pdf_server.files["/p4.pdf"][:4096])
+
+    stats = DownloadManager(pdf_dir, queue=CheckpointJournal(queue_path), max_workers=2).close()
+    assert stats.files == 1 and stats.resumed == 1
+    assert pdf_server.ranges == [("/p4.pdf", 4096)]
+    assert (pdf_dir / "Paper 4.pdf").read_bytes() == pdf_server.files["/p4.pdf"]
+    assert not queue_path.exists()
+
+
+def test_pdf_store_deduplicates_across_tasks(pdf_server, tmp_path):
+    store = PdfStore(tmp_path / "store")
+    cvpr = {'id': 'a1', 'conference': 'CVPR', 'year': 2024, **_paper(pdf_server, 0, "Same Title")}
+    first = DownloadManager(tmp_path / "pdfs" / "CVPR", store=store)
+    first.submit(cvpr)
+    # 标题相同、内容不同的另一篇论文不会被跳过
+    first.submit({'id': 'a2', 'conference': 'CVPR', 'year': 2024, **_paper(pdf_server, 1, "Same Title")})
+    assert first.close().files == 2
+
+    # 另一个任务中的同一篇论文 (相同 URL): 不发请求，只创建视图
+    requests_before = pdf_server.requests
+    second = DownloadManager(tmp_path / "pdfs" / "arXiv", store=store)
+    second.submit({'id': '2401.00001', 'conference': 'arXiv', 'year': 2024, **_paper(pdf_server, 0, "Same Title")})
+    stats = second.close()
+    assert stats.files == 0 and stats.deduplicated == 1
+    assert pdf_server.requests == requests_before
+
+    content_hash = store.find(cvpr)
+    views = sorted(p.name for p in (tmp_path / "pdfs" / "CVPR").glob("*.pdf"))
+    assert len(views) == 2 and "Same Title.pdf" in views
+    arxiv_view = tmp_path / "pdfs" / "arXiv" / "Same Title.pdf"
+    assert os.path.samefile(arxiv_view, store.blob_path(content_hash))
+    assert store.find({'id': '2401.00001', 'conference': 'arXiv'}) == content_hash
+    assert len(list((tmp_path / "store" / "blobs").rglob("*.pdf"))) == 2
+    store.close()
+
+
+def test_pdf_store_id_hit_requires_the_same_url(tmp_path):
+    store = PdfStore(tmp_path / "store")
+    incoming = store.incoming_path("https://a.org/v1.pdf")
+    incoming.write_bytes(b"%PDF-1.4 v1")
+    paper = {'id': 'x1', 'conference': 'ICLR'}
+    content_hash = store.add(incoming, "https://a.org/v1.pdf", paper)
+    assert store.find(paper, "https://a.org/v1.pdf") == content_hash
+    assert store.find(paper) == content_hash
+    # PDF 链接变了 (论文更新了版本): 不能返回旧内容
+    assert store.find(paper, "https://a.org/v2.pdf") is None
+    # 同一 URL 被另一篇论文引用时仍按 URL 命中
+    assert store.find({'id': 'y', 'conference': 'ICLR'}, "https://a.org/v1.pdf") == content_hash
+    store.close()
+
+
+def test_pdf_store_view_failure_is_logged_not_raised(tmp_path, monkeypatch):
+    store = PdfStore(tmp_path / "store", view_mode='copy')
+    incoming = store.incoming_path("https://a.org/p.pdf")
+    incoming.write_bytes(b"%PDF-1.4")
+    content_hash = store.add(incoming, "https://a.org/p.pdf")
+
+    def fail(*args, **kwargs):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr("src.utils.pdf_store.shutil.copyfile", fail)
+    store.link_view(content_hash, tmp_path / "pdfs" / "P.pdf")
+    assert not list((tmp_path / "pdfs").iterdir())
+    store.close()
+
+
+def test_streaming_zip_archiver_writes_entries_without_temp_files(pdf_server, tmp_path):
+    pdf_server.drop.add("/p2.pdf")
+    zip_path = tmp_path / "papers.zip"
+    with StreamingZipArchiver(str(zip_path), max_workers=3, queue_chunks=2) as archive:
+        for i in range(4):
+            archive.submit(f"{pdf_server.url}/p{i}.pdf", f"Paper {i}.pdf")
+        # 同名文件不会覆盖已有条目
+        archive.submit(f"{pdf_server.url}/p5.pdf", "Paper 0.pdf")
+        archive.submit(f"{pdf_server.url}/missing.pdf", "Missing.pdf")
+
+    assert archive.added == 5 and archive.failed == 1
+    assert pdf_server.ranges and pdf_server.ranges[0][0] == "/p2.pdf"
+    assert pdf_server.peak > 1
+    with zipfile.ZipFile(zip_path) as zf:
+        assert sorted(zf.namelist()) == ["Paper 0 (2).pdf", "Paper 0.pdf", "Paper 1.pdf", "Paper 2.pdf", "Paper 3.pdf"]
+        for i in range(4):
+            assert zf.read(f"Paper {i}.pdf") == pdf_server.files[f"/p{i}.pdf"]
+        assert zf.read("Paper 0 (2).pdf") == pdf_server.files["/p5.pdf"]
+    assert os.listdir(tmp_path) == ["papers.zip"]
+
+
+def test_streaming_zip_archiver_reports_entries_truncated_mid_stream(pdf_server, tmp_path):
+    # 连接中断后服务器不支持 Range: 已写入 zip 的部分无法撤回
+    pdf_server.drop.add("/p1.pdf")
+    pdf_server.no_range.add("/p1.pdf")
+    zip_path = tmp_path / "papers.zip"
+    with StreamingZipArchiver(str(zip_path), max_workers=2) as archive:
+        archive.submit(f"{pdf_server.url}/p0.pdf", "Paper 0.pdf")
+        archive.submit(f"{pdf_server.url}/p1.pdf", "Paper 1.pdf")
+
+    assert archive.added == 1 and archive.failed == 1 and archive.truncated == ["Paper 1.pdf"]
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.read("Paper 0.pdf") == pdf_server.files["/p0.pdf"]
+        assert "Paper 1.pdf" in zf.read(StreamingZipArchiver.TRUNCATED_LIST).decode().splitlines()
@@ -0,0 +1,72 @@
+# FILE: src/test/test_formatter.py
+#
+# -----------------------------------------------------------------------------
+# [流式 CSV / Markdown 写入器测试]
+#
+# 目  的:
+#   验证 src/utils/formatter.py 的 StreamingCsvWriter 与 StreamingMarkdownWriter:
+#   字段不同的论文合并为完整表头 (常用列在前)、列表与空值的转换、报告头部的总数与词云、
+#   abort() 与空结果不留下任何文件。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_formatter.py
+# -----------------------------------------------------------------------------
+
+import pandas as pd
+
+from src.utils.formatter import StreamingCsvWriter, StreamingMarkdownWriter
+
+PAPERS = [
+    {'id': 'p1', 'title': "Sparse Experts", 'authors': ["Ada", "Alan"], 'abstract': "Line one\nline two",
+     'pdf_url': "https://a.org/p1.pdf"},
+    {'id': 'p2', 'title': "Diffusion", 'authors': "Grace", 'avg_rating': 6.5, 'decision': "Accept (Oral)",
+     'abstract': None},
+]
+
+
+def test_csv_writer_merges_columns_from_all_papers(tmp_path):
+    writer = StreamingCsvWriter("ICLR_2024", tmp_path)
+    for paper in PAPERS:
+        writer.write(paper)
+    path = writer.close()
+
+    assert path.name.startswith("ICLR_2024_data_") and path.suffix == ".csv"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [path.name]
+    df = pd.read_csv(path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    # 常用列在前，其余列按首次出现的顺序
+    assert list(df.columns) == ['title', 'authors', 'abstract', 'pdf_url', 'id', 'avg_rating', 'decision']
+    assert df.to_dict('records') == [
+        {'title': "Sparse Experts", 'authors': "Ada, Alan", 'abstract': "Line one\nline two",
+         'pdf_url': "https://a.org/p1.pdf", 'id': 'p1', 'avg_rating': '', 'decision': ''},
+        {'title': "Diffusion", 'authors': "Grace", 'abstract': '', 'pdf_url': '', 'id': 'p2',
+         'avg_rating': '6.5', 'decision': "Accept (Oral)"},
+    ]
+
+
+def test_markdown_writer_puts_the_total_and_wordcloud_in_the_header(tmp_path):
+    writer = StreamingMarkdownWriter("ICLR_2024", tmp_path)
+    for paper in PAPERS:
+        writer.write(paper)
+    path = writer.close(wordcloud_path=str(tmp_path / "ICLR_2024_wordcloud.png"))
+
+    text = path.read_text(encoding='utf-8')
+    assert text.startswith("# ICLR_2024 Papers (")
+    assert "Total papers found matching criteria: **2**" in text
+    assert "![Word Cloud](./ICLR_2024_wordcloud.png)" in text
+    assert "### 1. Sparse Experts" in text and "### 2. Diffusion" in text
+    assert "**Authors:** *Ada, Alan*" in text and "> Line one line two" in text
+    assert "**[PDF Link](https://a.org/p1.pdf)**" in text
+    assert sorted(p.name for p in tmp_path.iterdir()) == [path.name]
+
+
+def test_abort_and_empty_results_leave_no_files(tmp_path):
+    csv_writer, md_writer = StreamingCsvWriter("T", tmp_path), StreamingMarkdownWriter("T", tmp_path)
+    csv_writer.write(PAPERS[0])
+    md_writer.write(PAPERS[0])
+    csv_writer.abort()
+    md_writer.abort()
+    assert list(tmp_path.iterdir()) == []
+
+    assert StreamingCsvWriter("T", tmp_path).close() is None
+    assert StreamingMarkdownWriter("T", tmp_path).close() is None
+    assert list(tmp_path.iterdir()) == []
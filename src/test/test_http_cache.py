@@ -0,0 +1,155 @@
+# FILE: src/test/test_http_cache.py
+#
+# -----------------------------------------------------------------------------
+# [磁盘 HTTP 响应缓存测试]
+#
+# 目  的:
+#   验证 src/utils/http_cache.py 的 ResponseCache: 内容寻址去重、no-store、按主机的 TTL 与方法策略、
+#   LRU 淘汰与内容块回收；并通过共享 HttpClient 验证端到端行为:
+#   TTL 内直接命中不发请求，过期后发送 If-None-Match，304 时复用本地内容。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_http_cache.py
+# -----------------------------------------------------------------------------
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.utils.http_cache import ResponseCache, configure_response_cache
+from src.utils.network_utils import configure_http_client, get_http_client
+
+URL = "https://example.org/page"
+
+
+def _blobs(cache):
+    return sorted(path.name for path in cache.blob_dir.rglob("*") if path.is_file())
+
+
+def test_store_lookup_and_shared_blobs(tmp_path):
+    cache = ResponseCache(tmp_path)
+    headers = {'Content-Type': 'text/html', 'ETag': '"v1"', 'Set-Cookie': 'secret', 'Content-Encoding': 'gzip'}
+    key_a, key_b = cache.make_key('GET', URL), cache.make_key('GET', URL + "?mirror")
+    cache.store(key_a, URL, 200, headers, b"<html>same</html>")
+    cache.store(key_b, URL + "?mirror", 200, headers, b"<html>same</html>")
+
+    entry = cache.lookup(key_a)
+    assert entry.is_fresh and entry.etag == '"v1"'
+    assert entry.headers == {'Content-Type': 'text/html', 'ETag': '"v1"'}
+    assert cache.read_body(entry) == b"<html>same</html>"
+    # 相同内容只保存一份，仍被引用时不会被删除
+    assert len(_blobs(cache)) == 1
+    cache.delete(key_a)
+    assert cache.lookup(key_a) is None and len(_blobs(cache)) == 1
+    cache.delete(key_b)
+    assert _blobs(cache) == []
+    cache.close()
+
+
+def test_request_body_is_part_of_the_key():
+    assert ResponseCache.make_key('POST', URL, b'{"page": 1}') != ResponseCache.make_key('POST', URL, b'{"page": 2}')
+    assert ResponseCache.make_key('get', URL) == ResponseCache.make_key('GET', URL)
+
+
+def test_no_store_responses_are_not_cached(tmp_path):
+    cache = ResponseCache(tmp_path)
+    key = cache.make_key('GET', URL)
+    cache.store(key, URL, 200, {'Cache-Control': 'private, no-store'}, b"secret")
+    assert cache.lookup(key) is None and _blobs(cache) == []
+    cache.close()
+
+
+def test_host_policies(tmp_path):
+    cache = ResponseCache(tmp_path, default_ttl=60, policies={
+        'api.openreview.net': {'ttl': 3600, 'methods': ['GET', 'POST']},
+        'live.example.org': {'ttl': 0},
+    })
+    assert cache.ttl_for("https://api.openreview.net/notes") == 3600
+    assert cache.is_cacheable('POST', "https://api.openreview.net/notes")
+    assert not cache.is_cacheable('POST', URL) and cache.is_cacheable('GET', URL)
+    assert not cache.is_cacheable('GET', "https://live.example.org/feed")
+    cache.close()
+
+
+def test_lru_eviction_keeps_recently_read_entries(tmp_path):
+    cache = ResponseCache(tmp_path, max_size_mb=2500 / 1024 / 1024)
+    keys = [cache.make_key('GET', f"{URL}/{i}") for i in range(3)]
+    cache.store(keys[0], f"{URL}/0", 200, {}, b"a" * 1000)
+    time.sleep(0.01)
+    cache.store(keys[1], f"{URL}/1", 200, {}, b"b" * 1000)
+    time.sleep(0.01)
+    cache.read_body(cache.lookup(keys[0]))
+    time.sleep(0.01)
+    cache.store(keys[2], f"{URL}/2", 200, {}, b"c" * 1000)
+
+    assert cache.lookup(keys[1]) is None
+    assert cache.lookup(keys[0]) is not None and cache.lookup(keys[2]) is not None
+    assert len(_blobs(cache)) == 2
+    cache.close()
+
+
+def test_lookup_drops_entries_whose_blob_is_missing(tmp_path):
+    cache = ResponseCache(tmp_path)
+    key = cache.make_key('GET', URL)
+    cache.store(key, URL, 200, {}, b"body")
+    for path in cache.blob_dir.rglob("*"):
+        if path.is_file():
+            path.unlink()
+    assert cache.lookup(key) is None
+    cache.close()
+
+
+@pytest.fixture
+def etag_server():
+    """返回固定内容与 ETag，If-None-Match 匹配时返回 304。记录每次请求的条件头。"""
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            seen.append(self.headers.get('If-None-Match'))
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.send_header('ETag', '"v1"')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            body = b"<html>index</html>"
+            self.send_response(200)
+            self.send_header('ETag', '"v1"')
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    configure_http_client(retries=0)
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/index", seen
+    httpd.shutdown()
+    httpd.server_close()
+    configure_http_client()
+    configure_response_cache(None, enabled=False)
+
+
+def test_client_serves_fresh_hits_and_revalidates_stale_entries(tmp_path, etag_server):
+    url, seen = etag_server
+    configure_response_cache(tmp_path, {'local': {'hosts': ['127.0.0.1'], 'cache': {'ttl': 0.5}}})
+    client = get_http_client()
+
+    first = client.get(url)
+    assert first.content == b"<html>index</html>" and not getattr(first, 'from_cache', False)
+    fresh = client.get(url)
+    assert fresh.from_cache and fresh.content == first.content and seen == [None]
+
+    time.sleep(0.6)
+    revalidated = client.get(url)
+    assert seen == [None, '"v1"']
+    assert revalidated.status_code == 200 and revalidated.from_cache
+    assert revalidated.text == "<html>index</html>"
@@ -0,0 +1,94 @@
+# FILE: src/test/test_icml_scraper.py
+#
+# -----------------------------------------------------------------------------
+# [ICML (PMLR) 摘要补全测试]
+#
+# 目  的:
+#   用本地桩服务器 (回放 src/test/fixtures/ 中的 PMLR 索引页与摘要页样本) 验证 IcmlScraper 的 enrich_abstracts:
+#   索引页记录经摘要页补全摘要与 BibTeX 出版信息、摘要页抓取失败的论文仍以索引页信息产出，
+#   以及增量模式下已保存且有摘要的论文被跳过、已保存但缺少摘要的论文重新请求。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_icml_scraper.py
+# -----------------------------------------------------------------------------
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.scrapers.icml_scraper import IcmlScraper
+from src.scrapers.parsers import ICML_ABSTRACT_PLACEHOLDER
+
+FIXTURES = Path(__file__).parent / "fixtures"
+logger = logging.getLogger("test_icml_scraper")
+
+
+@pytest.fixture
+def pmlr_site():
+    """/v235/ 为索引页 (绝对链接改写到本地)，只有 wang24a 有摘要页，其余摘要页返回 404。记录每个请求的路径。"""
+    paths = []
+    site = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            paths.append(self.path)
+            if self.path == "/v235/":
+                status = 200
+                body = (FIXTURES / "pmlr_index.html").read_bytes().replace(
+                    b"https://proceedings.mlr.press/v235/", f"{site['base']}/v235/".encode())
+            elif self.path == "/v235/wang24a.html":
+                status, body = 200, (FIXTURES / "pmlr_abstract.html").read_bytes()
+            else:
+                status, body = 404, b"Not Found"
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    site['base'] = f"http://127.0.0.1:{httpd.server_address[1]}"
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield site['base'], paths
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _scraper(base_url, **options):
+    task_info = {'name': 'ICML_2024', 'conference': 'ICML', 'url': f"{base_url}/v235/", 'enrich_abstracts': True}
+    return IcmlScraper(task_info, logger, **options)
+
+
+def test_abstracts_are_enriched_and_failed_pages_keep_the_index_record(pmlr_site, caplog):
+    base_url, paths = pmlr_site
+    with caplog.at_level(logging.WARNING):
+        papers = {p['id']: p for p in _scraper(base_url).scrape()}
+
+    assert sorted(papers) == ['hayou24a', 'paolo24a', 'wang24a']
+    wang = papers['wang24a']
+    assert wang['abstract'].startswith('In enhancing the reasoning capabilities')
+    assert (wang['pages'], wang['volume'], wang['publisher']) == ('28--50', '235', 'PMLR')
+    # 摘要页 404 的论文不能整篇丢失
+    assert papers['paolo24a']['abstract'] == ICML_ABSTRACT_PLACEHOLDER
+    assert papers['hayou24a']['title'] and papers['hayou24a']['abstract'] == ICML_ABSTRACT_PLACEHOLDER
+    assert any("2 个摘要页未能获取" in record.getMessage() for record in caplog.records)
+
+
+def test_known_papers_without_an_abstract_are_fetched_again(pmlr_site):
+    base_url, paths = pmlr_site
+    known = {
+        'wang24a': {'id': 'wang24a', 'source_url': f"{base_url}/v235/wang24a.html", 'abstract': "Saved abstract."},
+        'paolo24a': {'id': 'paolo24a', 'source_url': f"{base_url}/v235/paolo24a.html",
+                     'abstract': ICML_ABSTRACT_PLACEHOLDER},
+    }
+    papers = _scraper(base_url, known_papers=known).scrape()
+
+    assert "/v235/wang24a.html" not in paths
+    assert sorted(paths[1:]) == ["/v235/hayou24a.html", "/v235/paolo24a.html"]
+    assert sorted(p['id'] for p in papers) == ['hayou24a', 'paolo24a']
@@ -0,0 +1,47 @@
+# FILE: src/test/test_incremental.py
+#
+# -----------------------------------------------------------------------------
+# [增量模式合并测试]
+#
+# 目  的:
+#   验证 src/utils/incremental.py: 按 id 合并新旧结果 (保持已有顺序、替换重新抓取的条目、
+#   新条目追加在末尾)，没有可用 id 的新条目不丢失，以及旧 CSV 的查找与清理。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_incremental.py
+# -----------------------------------------------------------------------------
+
+from src.utils.incremental import find_dataset_files, merge_papers, prune_superseded
+
+
+def test_merge_replaces_updated_papers_in_place_and_appends_new_ones():
+    existing = [{'id': 'a', 'v': 1}, {'id': 'b', 'v': 1}, {'id': 'c', 'v': 1}]
+    fresh = [{'id': 'd', 'v': 2}, {'id': 'b', 'v': 2}]
+    merged = merge_papers(existing, fresh)
+    assert [(p['id'], p['v']) for p in merged] == [('a', 1), ('b', 2), ('c', 1), ('d', 2)]
+
+
+def test_merge_keeps_every_fresh_paper_without_a_usable_id():
+    existing = [{'id': 'a', 'title': 'old'}, {'id': '', 'title': 'saved without id'}]
+    fresh = [{'id': 'N/A', 'title': 'x'}, {'id': 'N/A', 'title': 'y'}, {'id': '', 'title': 'z'},
+             {'id': None, 'title': 'w'}, {'title': 'v'}]
+    merged = merge_papers(existing, fresh)
+    assert [p['title'] for p in merged] == ['old', 'saved without id', 'x', 'y', 'z', 'w', 'v']
+
+
+def test_merge_deduplicates_real_ids_within_fresh_results():
+    merged = merge_papers([], [{'id': 7, 'v': 1}, {'id': '7', 'v': 2}, {'id': 8, 'v': 1}])
+    assert [(str(p['id']), p['v']) for p in merged] == [('7', 2), ('8', 1)]
+
+
+def test_prune_superseded_keeps_only_the_merged_file(tmp_path):
+    for stamp in ("20240101", "20240301", "20240201"):
+        (tmp_path / f"ICLR_2024_data_{stamp}.csv").write_text("id\n")
+    (tmp_path / "ICLR_2024_extra_data_20240101.csv").write_text("id\n")  # 另一个任务，不受影响
+
+    files = find_dataset_files("ICLR_2024", tmp_path)
+    assert [p.name for p in files] == ["ICLR_2024_data_20240101.csv", "ICLR_2024_data_20240201.csv",
+                                       "ICLR_2024_data_20240301.csv"]
+    assert prune_superseded("ICLR_2024", tmp_path, keep=files[-1]) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ICLR_2024_data_20240301.csv",
+                                                          "ICLR_2024_extra_data_20240101.csv"]
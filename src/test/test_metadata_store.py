@@ -0,0 +1,78 @@
+# FILE: src/test/test_metadata_store.py
+#
+# -----------------------------------------------------------------------------
+# [Parquet 元数据数据集测试]
+#
+# 目  的:
+#   验证 src/utils/metadata_store.py: 按 conference/year 分区写入、同一任务重跑覆盖旧数据 (无过期重复)、
+#   列裁剪与分区过滤读取、增量模式所需的完整记录还原 (extra 列)。需要可选依赖 pyarrow。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_metadata_store.py
+# -----------------------------------------------------------------------------
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.utils.metadata_store import MetadataStore, csv_files_without_partition
+
+
+def _write(store, task_name, conference, year, papers):
+    writer = store.writer(task_name, conference, year)
+    for paper in papers:
+        writer.write(paper)
+    return writer.close()
+
+
+def _papers(n, prefix):
+    return [{'id': f"{prefix}{i}", 'title': f"{prefix} paper {i}", 'authors': ["Ada", "Alan"], 'abstract': "...",
+             'avg_rating': 6.5 if i % 2 else 'N/A', 'decision': 'Poster', 'reviews': [{'rating': 6}]}
+            for i in range(n)]
+
+
+def test_partitions_and_rerun_replaces_previous_data(tmp_path):
+    store = MetadataStore(tmp_path / "dataset", batch_rows=3)
+    path = _write(store, "ICLR_2024", "ICLR", 2024, _papers(7, "old"))
+    assert path == tmp_path / "dataset" / "conference=ICLR" / "year=2024" / "ICLR_2024.parquet"
+    _write(store, "ICLR_2025", "ICLR", 2025, _papers(2, "next"))
+    _write(store, "CVPR_2024", "CVPR", 2024, _papers(4, "cvpr"))
+    # 同一任务再次运行: 覆盖自己的分区文件，而不是再多一份按日期命名的文件
+    _write(store, "ICLR_2024", "ICLR", 2024, _papers(5, "new"))
+
+    assert store.partitions() == [("CVPR", "2024"), ("ICLR", "2024"), ("ICLR", "2025")]
+    df = store.read(columns=['title', 'avg_rating'], conference="ICLR", year=2024)
+    assert list(df.columns) == ['title', 'avg_rating']
+    assert len(df) == 5 and df['title'].str.startswith("new").all()
+    assert df['avg_rating'].isna().sum() == 3
+    assert sum(len(chunk) for chunk in store.iter_batches(columns=['conference'], batch_rows=2)) == 11
+    assert not list((tmp_path / "dataset").rglob("*.part"))
+
+
+def test_load_task_restores_full_records(tmp_path):
+    store = MetadataStore(tmp_path / "dataset")
+    _write(store, "ICLR_2024", "ICLR", 2024, _papers(2, "a"))
+    _write(store, "ICLR_2024_workshop", "ICLR", 2024, _papers(1, "w"))
+
+    papers = store.load_task("ICLR_2024", "ICLR", 2024)
+    assert [p['id'] for p in papers] == ["a0", "a1"]
+    assert papers[1]['authors'] == "Ada, Alan" and papers[1]['avg_rating'] == 6.5
+    assert 'avg_rating' not in papers[0]
+    assert papers[0]['reviews'] == [{'rating': 6}]
+    # 没有论文的运行不会删除已有数据
+    assert store.writer("ICLR_2024", "ICLR", 2024).close() is None
+    assert len(store.load_task("ICLR_2024", "ICLR", 2024)) == 2
+
+
+def test_csv_fallback_covers_only_partitions_missing_from_the_dataset(tmp_path):
+    store = MetadataStore(tmp_path / "dataset")
+    _write(store, "ICLR_2024", "ICLR", 2024, _papers(2, "iclr"))
+    metadata_dir = tmp_path / "metadata"
+    for conference, year in (("ICLR", 2024), ("ICLR", 2023), ("NeurIPS", 2024)):
+        (metadata_dir / conference / str(year)).mkdir(parents=True)
+        (metadata_dir / conference / str(year) / f"{conference}_{year}_data_20240101.csv").write_text("id\n")
+
+    # ICLR/2024 已有分区，只回退到其余 (会议, 年份) 的历史 CSV
+    files = csv_files_without_partition(metadata_dir, store.partitions())
+    assert sorted(path.parent.relative_to(metadata_dir).as_posix() for path in files) == ["ICLR/2023", "NeurIPS/2024"]
+    assert len(csv_files_without_partition(metadata_dir, [])) == 3
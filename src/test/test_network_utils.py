@@ -0,0 +1,85 @@
+# FILE: src/test/test_network_utils.py
+#
+# -----------------------------------------------------------------------------
+# [共享 HTTP 客户端测试]
+#
+# 目  的:
+#   验证 src/utils/network_utils.py 的 HttpClient: 连接池按 max_workers 只扩不缩、
+#   第三方 Session 挂载同一套限速适配器、同一主机的请求复用 keep-alive 连接，
+#   以及 robust_get 在 4xx 时返回 None 而不是抛出异常。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_network_utils.py
+# -----------------------------------------------------------------------------
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.utils.network_utils import HttpClient, PoliteHTTPAdapter, configure_http_client, get_http_client, robust_get
+
+
+@pytest.fixture
+def server():
+    """/ok 返回 200，其余路径返回 404；记录每个请求使用的客户端端口 (即 TCP 连接)。"""
+    ports = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            ports.append(self.client_address[1])
+            body = b"ok" if self.path == "/ok" else b""
+            self.send_response(200 if self.path == "/ok" else 404)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    configure_http_client(retries=0)
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", ports
+    httpd.shutdown()
+    httpd.server_close()
+    configure_http_client()
+
+
+def _pool_maxsize(session: requests.Session) -> int:
+    return session.get_adapter("https://example.org/")._pool_maxsize
+
+
+def test_ensure_pool_size_only_grows():
+    client = HttpClient(pool_maxsize=4)
+    client.ensure_pool_size(2)
+    assert _pool_maxsize(client.session) == 4
+    client.ensure_pool_size(24)
+    assert client.pool_maxsize == 24 and _pool_maxsize(client.session) == 24
+    client.ensure_pool_size(8)
+    assert _pool_maxsize(client.session) == 24
+    client.close()
+
+
+def test_attach_mounts_the_polite_adapter_on_foreign_sessions():
+    client = HttpClient(pool_maxsize=12)
+    session = client.attach(requests.Session())
+    adapter = session.get_adapter("https://api.openreview.net/notes")
+    assert isinstance(adapter, PoliteHTTPAdapter) and adapter._pool_maxsize == 12
+    client.close()
+
+
+def test_requests_to_one_host_reuse_the_connection(server):
+    base_url, ports = server
+    for _ in range(3):
+        assert get_http_client().get(f"{base_url}/ok").content == b"ok"
+    assert len(ports) == 3 and len(set(ports)) == 1
+
+
+def test_robust_get_returns_none_on_http_errors(server):
+    base_url, _ = server
+    assert robust_get(f"{base_url}/ok").status_code == 200
+    assert robust_get(f"{base_url}/missing") is None
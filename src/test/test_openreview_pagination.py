@@ -0,0 +1,89 @@
+# FILE: src/test/test_openreview_pagination.py
+#
+# -----------------------------------------------------------------------------
+# [OpenReview 并发 offset 分页测试]
+#
+# 目  的:
+#   用假的 OpenReview 客户端验证 src/scrapers/openreview_pagination.py 的 iter_note_pages:
+#   按 offset 顺序产出、在途请求不超过 workers、遇到不满一页时停止提交、limit 截断、
+#   调用方提前停止时不再请求，以及单页失败时重试并在次数用尽后抛出异常。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_openreview_pagination.py
+# -----------------------------------------------------------------------------
+
+import threading
+import time
+
+import pytest
+
+from src.scrapers import openreview_pagination
+from src.scrapers.openreview_pagination import iter_note_pages
+
+
+class FakeClient:
+    """get_notes 按 offset/limit 切片 total 条 note，记录请求与同时在途的请求数峰值。"""
+
+    def __init__(self, total, failures=0):
+        self.total = total
+        self.failures = failures
+        self.calls = []
+        self.running = self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_notes(self, limit, offset, **query):
+        with self._lock:
+            self.calls.append((offset, limit, query))
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.02)
+        with self._lock:
+            self.running -= 1
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("temporary failure")
+        return list(range(offset, min(offset + limit, self.total)))
+
+
+def test_pages_are_yielded_in_offset_order_with_bounded_concurrency():
+    client = FakeClient(total=23)
+    pages = list(iter_note_pages(client, {'invitation': 'ICLR.cc/2024/-/Submission'}, page_size=5, workers=3))
+    assert [note for page in pages for note in page] == list(range(23))
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    assert client.peak == 3
+    assert all(query == {'invitation': 'ICLR.cc/2024/-/Submission'} for _, _, query in client.calls)
+    # 最后一页不满 5 条之后不再提交更远的窗口 (已在途的窗口最多多出 workers - 1 个)
+    assert max(offset for offset, _, _ in client.calls) <= 20 + 5 * 2
+
+
+def test_limit_truncates_the_last_page():
+    client = FakeClient(total=100)
+    pages = list(iter_note_pages(client, {}, page_size=5, workers=2, limit=12))
+    assert [note for page in pages for note in page] == list(range(12))
+    assert sorted((offset, limit) for offset, limit, _ in client.calls) == [(0, 5), (5, 5), (10, 2)]
+
+
+def test_exact_multiple_of_page_size_ends_on_an_empty_page():
+    client = FakeClient(total=10)
+    pages = list(iter_note_pages(client, {}, page_size=5, workers=1))
+    assert pages == [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+    assert [offset for offset, _, _ in client.calls] == [0, 5, 10]
+
+
+def test_stopping_early_cancels_windows_not_yet_started():
+    client = FakeClient(total=1000)
+    pages = iter_note_pages(client, {}, page_size=5, workers=1)
+    assert next(pages) == [0, 1, 2, 3, 4]
+    pages.close()
+    assert len(client.calls) <= 2
+
+
+def test_failed_page_is_retried_then_raises(monkeypatch):
+    monkeypatch.setattr(openreview_pagination.time, 'sleep', lambda seconds: None)
+    client = FakeClient(total=3, failures=1)
+    assert list(iter_note_pages(client, {}, page_size=5, workers=1)) == [[0, 1, 2]]
+
+    client = FakeClient(total=3, failures=3)
+    with pytest.raises(ConnectionError):
+        list(iter_note_pages(client, {}, page_size=5, workers=1, max_retries=3))
+    assert len(client.calls) == 3
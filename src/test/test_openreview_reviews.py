@@ -0,0 +1,47 @@
+# FILE: src/test/test_openreview_reviews.py
+#
+# -----------------------------------------------------------------------------
+# [OpenReview 审稿与决定汇总测试]
+#
+# 目  的:
+#   验证 src/scrapers/openreview_reviews.py: 从批量获取 (details=replies/directReplies) 的投稿回复中
+#   提取决定与评分，兼容 API v1 / v2 的字段形式、Note 对象与 JSON 字典，以及没有审稿时的默认值。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_openreview_reviews.py
+# -----------------------------------------------------------------------------
+
+from types import SimpleNamespace
+
+from src.scrapers.openreview_reviews import empty_review_summary, summarize_note_replies, summarize_reviews
+
+V2_REPLIES = [
+    {'invitations': ['ICLR.cc/2024/Conference/Submission1/-/Official_Review'], 'content': {'rating': {'value': 8}}},
+    {'invitations': ['ICLR.cc/2024/Conference/Submission1/-/Official_Review'],
+     'content': {'rating': {'value': '5: marginally below the acceptance threshold'}}},
+    {'invitations': ['ICLR.cc/2024/Conference/Submission1/-/Official_Comment'], 'content': {'rating': {'value': 1}}},
+    {'invitations': ['ICLR.cc/2024/Conference/Submission1/-/Decision'], 'content': {'decision': {'value': 'Accept (poster)'}}},
+]
+
+
+def test_summarize_v2_replies():
+    # 评论 (Official_Comment) 中的 rating 不计入评分
+    assert summarize_reviews(V2_REPLIES) == {'decision': 'Accept (poster)', 'avg_rating': 6.5, 'review_ratings': [8, 5]}
+
+
+def test_summarize_v1_note_with_direct_replies():
+    replies = [
+        SimpleNamespace(invitation='ICLR.cc/2020/Conference/Paper1/-/Official_Review', content={'rating': '6: Weak Accept'}),
+        SimpleNamespace(invitation='ICLR.cc/2020/Conference/Paper1/-/Official_Review', content={'rating': '3: Weak Reject'}),
+        SimpleNamespace(invitation='ICLR.cc/2020/Conference/Paper1/-/Decision', content={'decision': 'Reject'}),
+    ]
+    note = SimpleNamespace(details={'directReplies': replies})
+    assert summarize_note_replies(note, api_version='v1') == \
+           {'decision': 'Reject', 'avg_rating': 4.5, 'review_ratings': [6, 3]}
+
+
+def test_notes_without_replies_get_the_empty_summary():
+    assert summarize_note_replies(SimpleNamespace(details=None)) == empty_review_summary()
+    assert summarize_note_replies(SimpleNamespace(details={'replies': []})) == empty_review_summary()
+    # 以 v2 的键读取 v1 的 details 得不到回复
+    assert summarize_note_replies(SimpleNamespace(details={'directReplies': V2_REPLIES})) == empty_review_summary()
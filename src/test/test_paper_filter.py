@@ -0,0 +1,76 @@
+# FILE: src/test/test_paper_filter.py
+#
+# -----------------------------------------------------------------------------
+# [过滤下推测试]
+#
+# 目  的:
+#   验证 src/utils/paper_filter.py 的 PaperFilter 与 BaseScraper.keep_title / keep_paper:
+#   标题 + 摘要阶段与主程序的最终过滤一致、标题阶段默认关闭 (过滤下推不改变结果)、需由 prefilter_titles 显式开启、
+#   没有 filters 时不排除任何论文，以及被提前排除的论文计入 fetches_avoided。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_paper_filter.py
+# -----------------------------------------------------------------------------
+
+import logging
+
+from src.scrapers.base_scraper import BaseScraper
+from src.utils.paper_filter import PaperFilter
+
+
+class DummyScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def test_matches_searches_title_and_abstract_case_insensitively():
+    paper_filter = PaperFilter([r"diffusion", r"\bLLM\b"])
+    assert paper_filter
+    assert paper_filter.matches({'title': "Latent DIFFUSION Models"})
+    assert paper_filter.matches({'title': "Scaling Laws", 'abstract': "We train an LLM on ..."})
+    assert not paper_filter.matches({'title': "Graph Networks", 'abstract': "LLMs are not used"})
+    assert not paper_filter.matches({'title': "Graph Networks", 'abstract': None})
+
+
+def test_title_stage_is_opt_in():
+    # 默认不按标题提前排除: 只在摘要中命中关键词的论文要等拿到摘要后再判断
+    paper_filter = PaperFilter(["diffusion"])
+    assert paper_filter.matches_title("Graph Networks")
+    assert PaperFilter.from_task({'filters': ["diffusion"]}).matches_title("Graph Networks")
+
+    strict = PaperFilter.from_task({'filters': ["diffusion"], 'prefilter_titles': True})
+    assert strict.matches_title("Diffusion Policies") and not strict.matches_title("Graph Networks")
+    assert not strict.matches_title(None)
+
+
+def test_no_filters_keeps_everything():
+    paper_filter = PaperFilter.from_task({})
+    assert not paper_filter
+    assert paper_filter.matches({'title': "Anything"}) and paper_filter.matches_title("Anything")
+
+
+def test_scraper_counts_avoided_fetches():
+    scraper = DummyScraper({'filters': ["diffusion"], 'prefilter_titles': True}, logging.getLogger("test_paper_filter"))
+    titles = ["Diffusion Policies", "Graph Networks", "Protein Folding"]
+    assert [title for title in titles if scraper.keep_title(title)] == ["Diffusion Policies"]
+    assert scraper.paper_filter.fetches_avoided == 2
+
+    assert scraper.keep_paper({'title': "Graph Networks", 'abstract': "A diffusion view"})
+    assert not scraper.keep_paper({'title': "Graph Networks", 'abstract': "No match"})
+    assert not scraper.keep_paper({'title': "Protein Folding"}, avoids_fetch=False)
+    assert scraper.paper_filter.fetches_avoided == 3
+
+
+def test_scraper_keeps_abstract_only_matches_by_default():
+    scraper = DummyScraper({'filters': ["diffusion"]}, logging.getLogger("test_paper_filter"))
+    assert scraper.keep_title("Graph Networks")
+    assert scraper.keep_paper({'title': "Graph Networks", 'abstract': "A diffusion view"})
+    assert scraper.paper_filter.fetches_avoided == 0
+
+
+def test_scraper_uses_the_shared_filter_when_given():
+    shared = PaperFilter(["diffusion"], prefilter_titles=True)
+    scraper = DummyScraper({'filters': ["ignored"]}, logging.getLogger("test_paper_filter"), paper_filter=shared)
+    assert scraper.paper_filter is shared
+    scraper.keep_title("Graph Networks")
+    assert shared.fetches_avoided == 1
@@ -0,0 +1,172 @@
+# FILE: src/test/test_parsers.py
+#
+# -----------------------------------------------------------------------------
+# [HTML 解析层一致性测试]
+#
+# 目  的:
+#   验证 src/scrapers/parsers.py 中 lxml XPath 快速路径与 BeautifulSoup 回退实现
+#   在保存的页面样本 (src/test/fixtures/) 上输出完全一致，并检查若干关键字段。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_parsers.py
+# -----------------------------------------------------------------------------
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.scrapers import parsers
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+CASES = [
+    ("pmlr_index.html", "https://proceedings.mlr.press/v235/",
+     parsers._parse_icml_index_lxml, parsers._parse_icml_index_bs4),
+    ("pmlr_abstract.html", "https://proceedings.mlr.press/v235/wang24a.html",
+     parsers._parse_pmlr_abstract_lxml, parsers._parse_pmlr_abstract_bs4),
+    ("acl_volume.html", "https://aclanthology.org/volumes/2024.acl-long/",
+     parsers._parse_acl_index_lxml, parsers._parse_acl_index_bs4),
+    ("acl_detail.html", "https://aclanthology.org/2024.acl-long.2/",
+     parsers._parse_acl_detail_lxml, parsers._parse_acl_detail_bs4),
+    ("cvf_index.html", "https://openaccess.thecvf.com/CVPR2024?day=all",
+     parsers._parse_cvf_index_lxml, parsers._parse_cvf_index_bs4),
+    ("cvf_detail.html", "https://openaccess.thecvf.com/content/CVPR2024/html/Zhang_Unified_Reasoning_CVPR_2024_paper.html",
+     parsers._parse_cvf_detail_lxml, parsers._parse_cvf_detail_bs4),
+    ("aaai_article.html", "https://ojs.aaai.org/index.php/AAAI/article/view/29641",
+     parsers._parse_article_meta_lxml, parsers._parse_article_meta_bs4),
+    ("acm_article.html", "https://dl.acm.org/doi/10.1145/3637528.3671500",
+     parsers._parse_article_meta_lxml, parsers._parse_article_meta_bs4),
+    ("aaai_issue.html", "https://ojs.aaai.org/index.php/AAAI/issue/view/576",
+     parsers._parse_aaai_index_lxml, parsers._parse_aaai_index_bs4),
+    ("acm_toc.html", "https://dl.acm.org/doi/proceedings/10.1145/3637528",
+     parsers._parse_acm_index_lxml, parsers._parse_acm_index_bs4),
+]
+
+
+def _load(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+@pytest.fixture(autouse=True)
+def _reset_parsers():
+    yield
+    parsers.shutdown_parse_pool()
+    parsers.configure_parsers()
+
+
+@pytest.mark.skipif(not parsers.IS_LXML_AVAILABLE, reason="lxml 未安装")
+@pytest.mark.parametrize("name, url, fast, fallback", CASES, ids=[case[0] for case in CASES])
+def test_lxml_matches_bs4(name, url, fast, fallback):
+    content = _load(name)
+    assert fast(content, url) == fallback(content, url)
+
+
+def test_icml_index():
+    papers = parsers.parse_icml_index(_load("pmlr_index.html"), "https://proceedings.mlr.press/v235/")
+    # 最后一个条目的 abs 链接缺少 href，与旧实现一样整条跳过
+    assert [p['id'] for p in papers] == ['paolo24a', 'wang24a', 'hayou24a']
+    assert papers[0]['authors'] == 'Giuseppe\xa0Paolo,\xa0Jonas\xa0Gonzalez-Billandon,\xa0Balázs\xa0Kégl'
+    assert papers[1]['authors'] == 'Xuezhi\xa0Wang, \xa0Denny\xa0Zhou'
+    assert papers[1]['pdf_url'] == 'https://proceedings.mlr.press/v235/wang24a/wang24a.pdf'
+    assert papers[2]['pdf_url'] == 'N/A'
+    assert all(p['abstract'] == parsers.ICML_ABSTRACT_PLACEHOLDER for p in papers)
+
+
+def test_pmlr_abstract():
+    url = "https://proceedings.mlr.press/v235/wang24a.html"
+    fields = parsers.parse_pmlr_abstract(_load("pmlr_abstract.html"), url)
+    assert fields['abstract'].startswith('In enhancing the reasoning capabilities')
+    assert 'specific prompting techniques' in fields['abstract']
+    assert fields['pages'] == '28--50'
+    assert fields['volume'] == '235'
+    assert fields['publisher'] == 'PMLR'
+    assert fields['pdf_url'].endswith('/wang24a/wang24a.pdf')
+
+
+def test_acl_pages():
+    index = parsers.parse_acl_index(_load("acl_volume.html"), "https://aclanthology.org/volumes/2024.acl-long/")
+    assert [url for url, _ in index] == [f"https://aclanthology.org/2024.acl-long.{i}/" for i in range(4)]
+    assert index[1][1].startswith('Quantified Task Misalignment to Inform PEFT')
+
+    detail = parsers.parse_acl_detail(_load("acl_detail.html"), "https://aclanthology.org/2024.acl-long.2/")
+    assert detail['id'] == '2024.acl-long.2'
+    assert detail['title'] == 'Self-Reasoning Language Models: Unfold Hidden Reasoning Chains'
+    assert detail['authors'] == 'Hongru Wang, José García, Kam-Fai  Wong'
+    assert detail['pdf_url'] == 'https://aclanthology.org/2024.acl-long.2.pdf'
+
+
+def test_cvf_pages():
+    base_url = "https://openaccess.thecvf.com/CVPR2024?day=all"
+    papers = parsers.parse_cvf_index(_load("cvf_index.html"), base_url)
+    assert [p['id'] for p in papers] == ['Zhang_Unified_Reasoning_CVPR_2024_paper', 'Li_Segment_Anything_CVPR_2024_paper',
+                                         'Ng_LoRA_CVPR_2024_paper']
+    assert papers[0]['authors'] == 'Wei Zhang, Jörg Müller'
+    assert papers[0]['supp_url'].endswith('Zhang_Unified_Reasoning_CVPR_2024_supplemental.pdf')
+    assert papers[1]['authors'] == 'Ann Li, Bob Smith'
+    assert 'supp_url' not in papers[1]
+    assert papers[2]['pdf_url'] is None and papers[2]['authors'] == 'N/A'
+
+    # 详情页样本为 windows-1252 编码
+    detail = parsers.parse_cvf_detail(_load("cvf_detail.html"), CASES[5][1])
+    assert detail['authors'] == 'Wei Zhang, Jörg Müller'
+    assert '“grounded”' in detail['abstract']
+
+
+def test_article_meta():
+    # AAAI (OJS): citation_* meta 优先，摘要来自 DC.Description
+    aaai = parsers.parse_article_meta(_load("aaai_article.html"), CASES[6][1])
+    assert aaai == {
+        'title': 'Graph Prompting for Few-Shot Reasoning',
+        'authors': 'Mei Lin, Óscar Pérez',
+        'abstract': 'We propose graph prompting, which encodes intermediate reasoning steps as a graph & '
+                    'lets the model revise them.',
+        'pdf_url': 'https://ojs.aaai.org/index.php/AAAI/article/download/29641/31082',
+    }
+
+    # ACM DL: 只有 dc.* meta，摘要取自 abstractSection 中的段落，没有 PDF 链接
+    acm = parsers.parse_article_meta(_load("acm_article.html"), CASES[7][1])
+    assert acm == {
+        'title': 'Streaming Anomaly Detection at Scale',
+        'authors': 'Priya Raman, Lukas Schäfer',
+        'abstract': 'Detecting anomalies in high-volume streams requires bounded memory. '
+                    'We present SketchAD , a sketch-based detector with provable error bounds.',
+    }
+
+
+def test_proceedings_indexes():
+    # OJS 期目录页: 相对链接补全为绝对地址，缺少 href 的条目与侧栏中的 h3.title 不计入
+    aaai = parsers.parse_aaai_index(_load("aaai_issue.html"), CASES[8][1])
+    assert aaai == [('https://ojs.aaai.org/index.php/AAAI/article/view/29641', 'Graph Prompting for Few-Shot Reasoning'),
+                    ('https://ojs.aaai.org/index.php/AAAI/article/view/29642', 'Sparse Attention Without Tears')]
+
+    acm = parsers.parse_acm_index(_load("acm_toc.html"), CASES[9][1])
+    assert acm == [('https://dl.acm.org/doi/10.1145/3637528.3671500', 'Streaming Anomaly Detection at Scale'),
+                   ('https://dl.acm.org/doi/10.1145/3637528.3671512', 'Learning to Rank with k-NN Graphs')]
+
+
+def test_bs4_backend_is_used_when_configured(monkeypatch):
+    parsers.configure_parsers(backend='bs4')
+    monkeypatch.setattr(parsers, '_parse_acl_detail_lxml', lambda *args: pytest.fail("不应调用 lxml 路径"))
+    detail = parsers.parse_acl_detail(_load("acl_detail.html"), "https://aclanthology.org/2024.acl-long.2/")
+    assert detail['id'] == '2024.acl-long.2'
+
+
+def test_parse_in_pool_matches_inline():
+    content, url = _load("pmlr_index.html"), "https://proceedings.mlr.press/v235/"
+    inline = parsers.parse_in_pool(parsers.parse_icml_index, content, url)
+    # 阈值为 1KB 时样本页交给进程池解析
+    parsers.configure_parsers(process_pool_min_kb=1)
+    try:
+        assert parsers.parse_in_pool(parsers.parse_icml_index, content, url) == inline
+        # 与实际运行时一样从工作线程首次使用进程池
+        results = []
+        worker = threading.Thread(target=lambda: results.append(
+            parsers.parse_in_pool(parsers.parse_icml_index, content, url)))
+        worker.start()
+        worker.join(timeout=60)
+        assert results == [inline]
+        assert parsers._pool is not None and parsers._pool._mp_context.get_start_method() == 'spawn'
+    finally:
+        parsers.shutdown_parse_pool()
+        parsers.configure_parsers()
@@ -0,0 +1,110 @@
+# FILE: src/test/test_pdf_text.py
+#
+# -----------------------------------------------------------------------------
+# [PDF 全文提取测试]
+#
+# 目  的:
+#   验证 src/utils/pdf_text.py: gzip 旁路文本存储的读写与截断读取，
+#   进程池提取按内容哈希缓存 (同一份 PDF 只提取一次，需要可选依赖 pypdf)，
+#   以及单篇超时、工作进程崩溃时的恢复与失败标记。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_pdf_text.py
+# -----------------------------------------------------------------------------
+
+import os
+import time
+
+import pytest
+
+from src.utils import pdf_text
+from src.utils.pdf_store import PdfStore
+from src.utils.pdf_text import TextStore, extract_pending
+
+
+def _minimal_pdf(text: str) -> bytes:
+    """单页、只含一行文本的最小 PDF (不依赖任何 PDF 生成库)。"""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode('latin-1')
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out, offsets = bytearray(b"%PDF-1.4\n"), []
+    for i, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def test_text_store_roundtrip(tmp_path):
+    store = TextStore(tmp_path / "text")
+    content_hash = "ab" + "0" * 62
+    assert content_hash not in store and store.read(content_hash) is None
+    store.write(content_hash, "attention is all you need " * 100)
+    assert content_hash in store
+    assert store.path(content_hash).name.endswith(".txt.gz")
+    assert store.read(content_hash).startswith("attention is all you need")
+    assert store.read(content_hash, max_chars=9) == "attention"
+
+
+def test_extract_pending_processes_each_pdf_once(tmp_path):
+    pytest.importorskip("pypdf")
+    pdf_store = PdfStore(tmp_path / "store")
+    text_store = TextStore(tmp_path / "store" / "text")
+    for i, text in enumerate(["Sparse mixture of experts", "Diffusion models beat GANs"]):
+        path = tmp_path / f"{i}.pdf"
+        path.write_bytes(_minimal_pdf(text))
+        pdf_store.add(path, url=f"https://example.org/{i}.pdf")
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    pdf_store.add(broken, url="https://example.org/broken.pdf")
+
+    stats = extract_pending(pdf_store, text_store, workers=2)
+    assert stats == {'extracted': 2, 'failed': 1, 'skipped': 0}
+    content_hash = pdf_store.find({}, "https://example.org/0.pdf")
+    assert "Sparse mixture of experts" in text_store.read(content_hash)
+
+    # 再次运行: 已提取的与已标记失败的文件都不再处理
+    assert extract_pending(pdf_store, text_store, workers=2) == {'extracted': 0, 'failed': 0, 'skipped': 3}
+    assert extract_pending(pdf_store, text_store, workers=2, retry_failed=True) == \
+        {'extracted': 0, 'failed': 1, 'skipped': 2}
+    pdf_store.close()
+
+
+def _misbehaving_job(content_hash, path, max_pages, max_chars):
+    """代替 _extract_job: 按文件内容模拟卡死与工作进程崩溃。"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    if content == b"hang":
+        time.sleep(60)
+    if content == b"crash":
+        os._exit(1)
+    return content_hash, content.decode(), ''
+
+
+def test_extract_pending_survives_hung_and_crashing_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_text, "PdfReader", object)  # 只需要通过 "已安装 pypdf" 的检查
+    monkeypatch.setattr(pdf_text, "_extract_job", _misbehaving_job)
+    pdf_store = PdfStore(tmp_path / "store")
+    text_store = TextStore(tmp_path / "store" / "text")
+    hashes = {}
+    for name in ("ok-1", "hang", "ok-2", "crash", "ok-3", "ok-4"):
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        hashes[name] = pdf_store.add(path, url=f"https://example.org/{name}.pdf")
+
+    stats = extract_pending(pdf_store, text_store, workers=2, timeout=3)
+    assert stats == {'extracted': 4, 'failed': 2, 'skipped': 0}
+    assert text_store.read(hashes["ok-2"]) == "ok-2"
+    assert "timed out" in text_store.failed_path(hashes["hang"]).read_text()
+    assert "crashed" in text_store.failed_path(hashes["crash"]).read_text()
+    assert not text_store.has_failed(hashes["ok-3"])
+    pdf_store.close()
@@ -0,0 +1,116 @@
+# FILE: src/test/test_rate_limiter.py
+#
+# -----------------------------------------------------------------------------
+# [按主机令牌桶限速器测试]
+#
+# 目  的:
+#   验证 src/utils/rate_limiter.py: 令牌桶的突发容量与透支排队、AIMD 调节
+#   (429/503/网络错误/延迟突增时乘性减，冷却期内只减一次，健康请求加性增且不超过 max_rate)、
+#   Retry-After 暂停，以及从 source_definitions 读取的按主机配置。
+#   通过 _reserve() 返回的等待时间断言，测试本身不需要真的等待。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_rate_limiter.py
+# -----------------------------------------------------------------------------
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.rate_limiter import HostRateLimiter, RateLimiterRegistry, configure_rate_limits, get_rate_limiter
+
+
+def test_burst_then_requests_queue_at_the_configured_rate():
+    limiter = HostRateLimiter("example.org", rate=10, burst=3)
+    assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # 令牌透支: 第 4、5 个请求分别排在 0.1 秒与 0.2 秒之后
+    assert limiter._reserve() == pytest.approx(0.1, abs=0.02)
+    assert limiter._reserve() == pytest.approx(0.2, abs=0.02)
+
+
+def test_congestion_halves_the_rate_once_per_cooldown():
+    limiter = HostRateLimiter("example.org", rate=8, cooldown=60)
+    limiter.record(429)
+    assert limiter.rate == 4
+    # 同一波拥塞中的其他请求不会继续惩罚
+    limiter.record(503)
+    limiter.record(None)
+    assert limiter.rate == 4
+    # 出现拥塞后令牌桶被清空，下一个请求需要排队
+    assert limiter._reserve() > 0
+
+
+def test_rate_never_drops_below_min_rate():
+    limiter = HostRateLimiter("example.org", rate=1, min_rate=0.4, cooldown=0)
+    for _ in range(5):
+        limiter.record(None)
+    assert limiter.rate == 0.4
+
+
+def test_healthy_responses_increase_the_rate_up_to_max_rate():
+    limiter = HostRateLimiter("example.org", rate=1, max_rate=1.25, increase_step=0.1)
+    for _ in range(5):
+        limiter.record(200, latency=0.1)
+    assert limiter.rate == 1.25
+    # 4xx 既不加速也不减速
+    limiter.record(404, latency=0.1)
+    assert limiter.rate == 1.25
+
+
+def test_latency_spike_counts_as_congestion():
+    limiter = HostRateLimiter("example.org", rate=4, latency_factor=2.0, latency_floor=1.0, cooldown=0)
+    limiter.record(200, latency=0.8)
+    rate = limiter.rate
+    limiter.record(200, latency=1.2)   # 未超过绝对下限 latency_floor
+    assert limiter.rate > rate
+    limiter.record(200, latency=5.0)
+    assert limiter.rate < rate
+
+
+def test_retry_after_blocks_the_host():
+    limiter = HostRateLimiter("example.org", rate=100, burst=100)
+    limiter.record(200, retry_after=30)
+    assert 29 < limiter._reserve() <= 30
+
+
+def test_acquire_async_waits_without_blocking_the_loop():
+    limiter = HostRateLimiter("example.org", rate=20, burst=1)
+
+    async def main():
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        started = time.monotonic()
+        await asyncio.gather(ticker(), limiter.acquire_async(), limiter.acquire_async(), limiter.acquire_async())
+        return time.monotonic() - started, ticks
+
+    elapsed, ticks = asyncio.run(main())
+    assert elapsed >= 0.09
+    # 等待期间事件循环仍在调度其他协程 (阻塞式 sleep 会让这些间隔至少 0.05 秒)
+    assert ticks[-1] - ticks[0] < 0.05
+
+
+def test_registry_resolves_urls_and_applies_host_configuration():
+    registry = RateLimiterRegistry()
+    registry.configure("api.openreview.net", rate=2, burst=4)
+    limiter = registry.get("https://api.openreview.net/notes?offset=0")
+    assert limiter is registry.get("api.openreview.net")
+    assert (limiter.rate, limiter.burst) == (2, 4)
+    assert registry.get("https://other.org/").rate == registry.default_options['rate']
+
+
+def test_configure_rate_limits_reads_source_definitions():
+    configure_rate_limits({
+        'html_cvf': {'hosts': ["cvf.test.invalid"], 'rate_limit': {'rate': 3, 'max_rate': 6}},
+        'api_arxiv': {'rate_limit': {'rate': 0.3, 'hosts': ["arxiv.test.invalid"]}},
+        'no_limit': {'hosts': ["plain.test.invalid"]},
+    })
+    registry = get_rate_limiter()
+    assert (registry.get("cvf.test.invalid").rate, registry.get("cvf.test.invalid").max_rate) == (3, 6)
+    assert registry.get("arxiv.test.invalid").rate == 0.3
+    assert registry.get("plain.test.invalid").rate == registry.default_options['rate']
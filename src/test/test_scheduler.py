@@ -0,0 +1,85 @@
+# FILE: src/test/test_scheduler.py
+#
+# -----------------------------------------------------------------------------
+# [并发任务调度器测试]
+#
+# 目  的:
+#   验证 src/crawlers/scheduler.py 的 TaskScheduler: 全局并发上限、按主机的并发上限
+#   (慢主机上的任务不阻塞其他主机)、相同输出目录的任务严格串行，
+#   以及单个任务失败时其余任务照常完成。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_scheduler.py
+# -----------------------------------------------------------------------------
+
+import threading
+import time
+from collections import Counter
+
+from src.crawlers.scheduler import ScheduledTask, TaskScheduler
+
+
+class Tracker:
+    """记录同时运行的任务数 (总数、按主机、按输出目录) 的峰值，以及各任务的起止时间。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.running = Counter()
+        self.peak = Counter()
+        self.spans = {}
+
+    def task(self, name, hosts=(), output_key=None, duration=0.1, fail=False):
+        keys = ['*'] + [f"host:{host}" for host in hosts] + ([f"out:{output_key}"] if output_key else [])
+
+        def run():
+            with self._lock:
+                started = time.monotonic()
+                for key in keys:
+                    self.running[key] += 1
+                    self.peak[key] = max(self.peak[key], self.running[key])
+            time.sleep(duration)
+            with self._lock:
+                for key in keys:
+                    self.running[key] -= 1
+                self.spans[name] = (started, time.monotonic())
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            return name.upper()
+
+        return ScheduledTask(name=name, run=run, hosts=set(hosts), output_key=output_key)
+
+
+def test_global_concurrency_limit():
+    tracker = Tracker()
+    tasks = [tracker.task(f"t{i}", duration=0.05) for i in range(6)]
+    results = TaskScheduler(max_workers=2).run(tasks)
+    assert results == {f"t{i}": f"T{i}" for i in range(6)}
+    assert tracker.peak['*'] == 2
+
+
+def test_per_host_limit_does_not_block_other_hosts():
+    tracker = Tracker()
+    tasks = [tracker.task("slow-1", hosts=["slow.org"], duration=0.2),
+             tracker.task("slow-2", hosts=["slow.org"], duration=0.2),
+             tracker.task("fast", hosts=["fast.org"], duration=0.05)]
+    TaskScheduler(max_workers=3, per_host_limit=1).run(tasks)
+    assert tracker.peak['host:slow.org'] == 1
+    # 排在后面的 fast 任务不必等 slow.org 上的任务依次完成
+    assert tracker.spans['fast'][1] < tracker.spans['slow-2'][0]
+
+
+def test_tasks_writing_the_same_output_dir_run_serially():
+    tracker = Tracker()
+    tasks = [tracker.task(f"iclr-{i}", output_key="ICLR/2024", duration=0.05) for i in range(3)]
+    tasks.append(tracker.task("cvpr", output_key="CVPR/2024", duration=0.05))
+    TaskScheduler(max_workers=4, per_host_limit=4).run(tasks)
+    assert tracker.peak['out:ICLR/2024'] == 1
+    assert tracker.peak['*'] == 2
+
+
+def test_failed_task_returns_none_and_releases_its_resources():
+    tracker = Tracker()
+    tasks = [tracker.task("broken", hosts=["a.org"], output_key="A/2024", fail=True),
+             tracker.task("after", hosts=["a.org"], output_key="A/2024")]
+    results = TaskScheduler(max_workers=2, per_host_limit=1).run(tasks)
+    assert results == {"broken": None, "after": "AFTER"}
@@ -0,0 +1,138 @@
+# FILE: src/test/test_tpami_scraper.py
+#
+# -----------------------------------------------------------------------------
+# [TPAMI 多期并发抓取测试]
+#
+# 目  的:
+#   用替换了网络请求的 TpamiScraper 验证: 各期 TOC 分页的并发获取 (不超过 max_workers)、
+#   跨期重复论文去重、增量模式下整期跳过已保存的期号 (期号从 CSV 读回时为浮点数亦可)，
+#   以及期号列表或页面抓取失败时任务抛出异常、重新运行只补抓检查点中缺少的页面。
+#
+# 运  行 (在项目根目录):
+#   python -m pytest -q src/test/test_tpami_scraper.py
+# -----------------------------------------------------------------------------
+
+import logging
+import threading
+import time
+
+import pytest
+
+from src.scrapers import tpami_scraper
+from src.scrapers.tpami_scraper import TpamiScraper, _issue_key
+from src.utils.checkpoint import CheckpointJournal
+
+logger = logging.getLogger("test_tpami_scraper")
+
+# 期号 -> 每页的文章号; '200' 是当前一期 (Early Access)，其中的 'a1' 已经正式分到 '100' 期
+TOC = {
+    '200': [['e1', 'e2'], ['e3', 'a1']],
+    '100': [['a1', 'a2'], ['a3', 'a4'], ['a5']],
+    '90': [['b1']],
+}
+
+
+class FakeTpamiScraper(TpamiScraper):
+    """不访问网络: 期号列表与 TOC 页面来自 TOC，记录请求过的页面与同时在途的请求数峰值。"""
+
+    def __init__(self, *args, fail_pages=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_pages = set(fail_pages)
+        self.fetched = []
+        self.running = self.peak = 0
+        self._lock = threading.Lock()
+
+    def _get_issue_number(self, punumber):
+        return '200'
+
+    def _list_issues(self, punumber, year_from, year_to):
+        return list(TOC)
+
+    def _fetch_toc_page(self, punumber, issue_number, page_number):
+        with self._lock:
+            self.fetched.append((issue_number, page_number))
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.02)
+        with self._lock:
+            self.running -= 1
+        if (issue_number, page_number) in self.fail_pages:
+            raise IOError("HTTP 500")
+        pages = TOC[issue_number]
+        return {'total_records': sum(len(p) for p in pages), 'total_pages': len(pages),
+                'papers': [{'id': paper_id, 'title': paper_id, 'issue': issue_number}
+                           for paper_id in pages[page_number - 1]]}
+
+
+def _scraper(**options):
+    task_info = {'name': 'TPAMI_2024', 'punumber': '34', 'year_from': 2024, 'max_workers': 2}
+    task_info.update(options.pop('task', {}))
+    return FakeTpamiScraper(task_info, logger, **options)
+
+
+def test_issue_key_normalises_numbers_read_back_from_csv():
+    assert _issue_key(10123) == _issue_key('10123') == _issue_key('10123.0') == _issue_key(10123.0) == '10123'
+    assert _issue_key(' Early Access ') == 'Early Access'
+
+
+def test_all_pages_of_all_issues_are_fetched_concurrently():
+    scraper = _scraper()
+    papers = scraper.scrape()
+    assert sorted(p['id'] for p in papers) == ['a1', 'a2', 'a3', 'a4', 'a5', 'b1', 'e1', 'e2', 'e3']
+    assert sorted(scraper.fetched) == sorted((issue, n) for issue, pages in TOC.items()
+                                            for n in range(1, len(pages) + 1))
+    assert scraper.peak == 2
+
+
+def test_incremental_skips_saved_issues_except_the_current_one():
+    known = {'a1': {'id': 'a1', 'issue': 100.0}, 'e1': {'id': 'e1', 'issue': '200'}}
+    scraper = _scraper(known_papers=known)
+    papers = scraper.scrape()
+    assert {issue for issue, _ in scraper.fetched} == {'200', '90'}
+    # 当前一期仍会重新抓取，但已保存的论文不重复产出
+    assert sorted(p['id'] for p in papers) == ['b1', 'e2', 'e3']
+
+
+def test_explicit_issue_list_and_limit():
+    scraper = _scraper(task={'issues': [90.0], 'year_from': None})
+    assert [p['id'] for p in scraper.scrape()] == ['b1']
+    assert len(_scraper(task={'limit': 3}).scrape()) == 3
+
+
+def test_failed_page_fails_the_task_and_is_refetched_on_rerun(tmp_path):
+    checkpoint = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+    scraper = _scraper(checkpoint=checkpoint, fail_pages={('100', 2)})
+    with pytest.raises(IOError):
+        list(scraper.iter_papers())
+    checkpoint.close()
+
+    checkpoint = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+    rerun = _scraper(checkpoint=checkpoint)
+    papers = rerun.scrape()
+    checkpoint.close()
+    assert rerun.fetched == [('100', 2)]
+    assert sorted(p['id'] for p in papers) == ['a1', 'a2', 'a3', 'a4', 'a5', 'b1', 'e1', 'e2', 'e3']
+
+
+def test_failed_issue_listing_fails_the_task(monkeypatch):
+    class Response:
+        def __init__(self, decade):
+            self.decade = decade
+
+        def raise_for_status(self):
+            if self.decade == '2020':
+                raise IOError("HTTP 503")
+
+        def json(self):
+            return {'issues': [{'issueNumber': 100, 'year': 2019}]}
+
+    class Client:
+        def get(self, url, **kwargs):
+            return Response(url.rsplit('=', 1)[-1])
+
+    monkeypatch.setattr(tpami_scraper, 'get_http_client', lambda: Client())
+    scraper = TpamiScraper({'name': 'TPAMI', 'punumber': '34'}, logger)
+    assert scraper._list_issues('34', 2018, 2019) == ['100']
+    # 缺少 2020 年代的期号时不能当作成功
+    with pytest.raises(IOError):
+        scraper._list_issues('34', 2019, 2021)
@@ -0,0 +1,275 @@
+# FILE: src/utils/async_engine.py
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from tqdm import tqdm
+
+from src.utils.http_cache import get_response_cache
+from src.utils.network_utils import HEADERS, get_http_client, robust_get
+from src.utils.rate_limiter import get_rate_limiter
+
+# 尝试导入 aiohttp，如果失败则优雅降级为基于共享连接池的线程池实现
+try:
+    import aiohttp
+
+    IS_AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    IS_AIOHTTP_AVAILABLE = False
+
+# 解析回调: 接收 (url, 响应体字节)，返回论文字典或 None
+ParseCallback = Callable[[str, bytes], Optional[Dict[str, Any]]]
+FetchRequest = Tuple[str, ParseCallback]
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+_DONE = object()
+
+
+class AsyncCrawlEngine:
+    """
+    基于 asyncio 的详情页抓取引擎。
+
+    - 单线程事件循环即可同时保持数百个在途请求，不再受限于线程数。
+    - 全局在途请求数由 max_concurrency 控制，每个主机的并发连接数由 per_host_limit 控制。
+    - 每个请求前都会向按主机的自适应限速器申请令牌 (见 src/utils/rate_limiter.py)。
+    - BeautifulSoup 解析通过 run_in_executor 交给独立的工作线程池，避免阻塞事件循环。
+    - 未安装 aiohttp 时，自动回退为基于共享 HttpClient 的线程池实现，接口保持一致 (同样按需读取请求，在途数量有界)。
+    - 抓取或解析失败的详情页逐一记录警告并计入 failed，结束时汇总报告。
+    """
+
+    def __init__(self, max_concurrency: int = 100, per_host_limit: int = 8, timeout: int = 20, retries: int = 3,
+                 backoff_factor: float = 1.0, parse_workers: Optional[int] = None,
+                 logger: Optional[logging.Logger] = None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.parse_workers = parse_workers or min(8, os.cpu_count() or 1)
+        self.logger = logger or logging.getLogger(__name__)
+        self.failed = 0  # 最近一次运行中未能抓取或解析的详情页数
+
+    def run(self, requests: Iterable[FetchRequest], total: Optional[int] = None,
+            desc: Optional[str] = None) -> List[Dict[str, Any]]:
+        """抓取并解析所有请求，按完成顺序返回解析成功的结果。"""
+        self.failed = 0
+        pbar = tqdm(total=total, desc=desc, leave=True)
+        try:
+            if IS_AIOHTTP_AVAILABLE:
+                results: List[Dict[str, Any]] = []
+
+                async def collect(result: Dict[str, Any]):
+                    results.append(result)
+
+                asyncio.run(self._crawl(requests, pbar, collect))
+                return results
+            self.logger.debug("    -> 未安装 aiohttp，回退到线程池抓取模式。")
+            return list(self._crawl_with_threads(requests, pbar))
+        finally:
+            pbar.close()
+            self._report_failures()
+
+    def iter_results(self, requests: Iterable[FetchRequest], total: Optional[int] = None,
+                     desc: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        run 的流式版本: 解析成功的结果一产生就交给调用方，不在内存中累积。
+        事件循环运行在后台线程中，结果经有界队列传递；调用方消费过慢时，抓取会自动放缓 (背压)。
+        调用方提前停止迭代时，后台抓取会被取消。
+        """
+        self.failed = 0
+        pbar = tqdm(total=total, desc=desc, leave=True)
+        try:
+            if not IS_AIOHTTP_AVAILABLE:
+                self.logger.debug("    -> 未安装 aiohttp，回退到线程池抓取模式。")
+                yield from self._crawl_with_threads(requests, pbar)
+                return
+
+            out: queue.Queue = queue.Queue(maxsize=self.max_concurrency * 2)
+            stop = threading.Event()
+            errors: List[BaseException] = []
+
+            async def forward(result: Dict[str, Any]):
+                if not stop.is_set():
+                    # 阻塞的 put 交给默认线程池，避免卡住事件循环
+                    await asyncio.get_running_loop().run_in_executor(None, out.put, result)
+
+            def run_loop():
+                try:
+                    asyncio.run(self._crawl(requests, pbar, forward, stop))
+                except BaseException as e:
+                    errors.append(e)
+                finally:
+                    out.put(_DONE)
+
+            thread = threading.Thread(target=run_loop, name="crawl-engine", daemon=True)
+            thread.start()
+            finished = False
+            try:
+                while True:
+                    item = out.get()
+                    if item is _DONE:
+                        finished = True
+                        break
+                    yield item
+            finally:
+                if not finished:
+                    stop.set()
+                    while out.get() is not _DONE:
+                        pass
+                thread.join()
+            if errors:
+                raise errors[0]
+        finally:
+            pbar.close()
+            self._report_failures()
+
+    def _report_failures(self):
+        if self.failed:
+            self.logger.warning(f"    [⚠ WARNING] {self.failed} 个详情页未能抓取或解析，详见上方的警告。")
+
+    # --- asyncio 实现 ---
+
+    async def _crawl(self, requests: Iterable[FetchRequest], pbar: tqdm,
+                     sink: Callable[[Dict[str, Any]], Awaitable[None]],
+                     stop: Optional[threading.Event] = None):
+        # 有界队列: 生产者按需从迭代器取请求，保证内存占用与请求总数无关
+        work: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        loop = asyncio.get_running_loop()
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host_limit)
+        client_timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        with ThreadPoolExecutor(max_workers=self.parse_workers) as parse_pool:
+            async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                             headers=HEADERS) as session:
+
+                async def worker():
+                    while True:
+                        item = await work.get()
+                        if item is None:
+                            work.task_done()
+                            return
+                        url, callback = item
+                        try:
+                            if stop is not None and stop.is_set():
+                                continue
+                            content = await self._fetch(session, url)
+                            if content is None:
+                                self.failed += 1
+                                continue
+                            result = await loop.run_in_executor(parse_pool, callback, url, content)
+                            if result:
+                                await sink(result)
+                            else:
+                                self.failed += 1
+                        except Exception as e:
+                            self.failed += 1
+                            self.logger.warning(f"    [⚠ WARNING] 处理详情页失败 {url}: {e}")
+                        finally:
+                            pbar.update(1)
+                            work.task_done()
+
+                workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+                for item in requests:
+                    if stop is not None and stop.is_set():
+                        break
+                    await work.put(item)
+                for _ in workers:
+                    await work.put(None)
+                await asyncio.gather(*workers)
+
+    async def _fetch(self, session, url: str) -> Optional[bytes]:
+        # 与共享 HttpClient 使用同一个磁盘响应缓存: 新鲜条目直接返回，过期条目发条件请求
+        cache = get_response_cache()
+        cache_key, entry = None, None
+        if cache is not None and cache.is_cacheable('GET', url):
+            cache_key = cache.make_key('GET', url)
+            entry = cache.lookup(cache_key)
+            if entry is not None and entry.is_fresh:
+                try:
+                    return cache.read_body(entry)
+                except FileNotFoundError:
+                    entry = None
+        headers = entry.conditional_headers() if entry is not None and entry.has_validators else {}
+
+        limiter = get_rate_limiter().get(url)
+        for attempt in range(self.retries + 1):
+            await limiter.acquire_async()
+            start = time.monotonic()
+            try:
+                async with session.get(url, headers=headers) as response:
+                    retry_after = response.headers.get('Retry-After')
+                    limiter.record(response.status, time.monotonic() - start,
+                                   retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None)
+                    if response.status == 304 and entry is not None:
+                        cache.refresh(entry, response.headers)
+                        try:
+                            return cache.read_body(entry)
+                        except FileNotFoundError:
+                            headers, entry = {}, None
+                            continue
+                    if response.status in RETRY_STATUS and attempt < self.retries:
+                        await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+                        continue
+                    if response.status >= 400:
+                        self.logger.warning(f"    [⚠ WARNING] 请求详情页失败 (HTTP {response.status}): {url}")
+                        return None
+                    content = await response.read()
+                    if cache_key is not None and response.status == 200:
+                        cache.store(cache_key, url, response.status, response.headers, content)
+                    return content
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                limiter.record(None)
+                if attempt < self.retries:
+                    await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+                    continue
+                self.logger.error(f"    [✖ NETWORK ERROR] 请求失败，已达到最大重试次数 for URL: {url}. Error: {e}")
+        return None
+
+    # --- 线程池回退实现 ---
+
+    def _crawl_with_threads(self, requests: Iterable[FetchRequest], pbar: tqdm) -> Iterator[Dict[str, Any]]:
+        def fetch_and_parse(url: str, callback: ParseCallback) -> Optional[Dict[str, Any]]:
+            response = robust_get(url, timeout=self.timeout)
+            if not response:
+                return None
+            return callback(url, response.content)
+
+        get_http_client().ensure_pool_size(self.per_host_limit)
+        # 与 asyncio 实现一样按需从迭代器取请求: 在途 (已提交未取走) 的请求最多 window 个
+        window = self.per_host_limit * 2
+        pending_requests = iter(requests)
+        in_flight: Dict[Any, str] = {}
+        with ThreadPoolExecutor(max_workers=self.per_host_limit) as executor:
+            try:
+                while True:
+                    for url, callback in islice(pending_requests, window - len(in_flight)):
+                        in_flight[executor.submit(fetch_and_parse, url, callback)] = url
+                    if not in_flight:
+                        break
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        url = in_flight.pop(future)
+                        pbar.update(1)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            self.failed += 1
+                            self.logger.warning(f"    [⚠ WARNING] 处理详情页失败 {url}: {e}")
+                            continue
+                        if result:
+                            yield result
+                        else:
+                            self.failed += 1
+            finally:
+                for future in in_flight:
+                    future.cancel()
@@ -0,0 +1,110 @@
+# FILE: src/utils/bibtex.py
+
+import re
+import unicodedata
+from typing import Dict, Iterable, Iterator, Tuple
+
+_FIELD_START = re.compile(r'(\w+)\s*=\s*([{"]?)')
+_ENTRY_HEAD = re.compile(r'@(\w+)\s*[{(]\s*([^,\s]*)\s*,')
+
+# LaTeX 重音命令 -> Unicode 组合字符
+_ACCENTS = {'"': '\u0308', "'": '\u0301', '`': '\u0300', '^': '\u0302', '~': '\u0303', '=': '\u0304',
+            '.': '\u0307', 'c': '\u0327', 'v': '\u030c', 'H': '\u030b', 'u': '\u0306', 'k': '\u0328',
+            'r': '\u030a'}
+_ACCENT_CMD = re.compile(r'\\(["\'`^~=.])\s*\{?\\?(\w)\}?|\\([cvHukr])(?:\s+|\{)\\?(\w)\}?')
+_LETTER_CMDS = {'o': 'ø', 'O': 'Ø', 'ss': 'ß', 'l': 'ł', 'L': 'Ł', 'aa': 'å', 'AA': 'Å', 'ae': 'æ', 'i': 'ı'}
+_LETTER_CMD = re.compile(r'\\(' + '|'.join(sorted(_LETTER_CMDS, key=len, reverse=True)) + r')(?![a-zA-Z])\s*(?:\{\})?')
+_SPECIAL_CHARS = {r'\&': '&', r'\%': '%', r'\$': '$', r'\_': '_', r'\#': '#', '\\"': '"', '``': '"', "''": '"'}
+
+
+def latex_to_unicode(text: str) -> str:
+    """把常见的 LaTeX 转义 (重音、特殊字符) 转换为 Unicode，并去掉用于大小写保护的花括号。"""
+    def replace_accent(match: re.Match) -> str:
+        command = match.group(1) or match.group(3)
+        letter = match.group(2) or match.group(4)
+        return unicodedata.normalize('NFC', letter + _ACCENTS[command])
+
+    text = _ACCENT_CMD.sub(replace_accent, text)
+    text = _LETTER_CMD.sub(lambda m: _LETTER_CMDS[m.group(1)], text)
+    for latex, char in _SPECIAL_CHARS.items():
+        text = text.replace(latex, char)
+    return re.sub(r'\s+', ' ', text.replace('{', '').replace('}', '')).strip()
+
+
+def _read_value(text: str, start: int, opener: str) -> Tuple[str, int]:
+    """从 start 处读取一个字段值，返回 (原始值, 值结束后的位置)。花括号可以嵌套，引号值内部的花括号同样计入深度。"""
+    if not opener:  # 不加括号的值，如数字或宏名
+        match = re.match(r'[^,}\s]*', text[start:])
+        return match.group(0), start + match.end()
+    closer = '}' if opener == '{' else '"'
+    depth, i = 0, start
+    while i < len(text):
+        char = text[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == closer and depth == 0:
+            return text[start:i], i + 1
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        i += 1
+    return text[start:], len(text)
+
+
+def parse_bibtex_fields(bibtex: str, convert_latex: bool = True) -> Dict[str, str]:
+    """
+    解析单条 BibTeX 记录的字段，返回 {小写字段名: 值}。
+    支持 {...} 嵌套、"..." 与裸值三种取值形式；convert_latex 为 True 时把 LaTeX 转义转换为 Unicode。
+    """
+    head = _ENTRY_HEAD.search(bibtex)
+    pos = head.end() if head else 0
+    fields = {}
+    while True:
+        match = _FIELD_START.search(bibtex, pos)
+        if not match:
+            break
+        name = match.group(1).lower()
+        value, pos = _read_value(bibtex, match.end(), match.group(2))
+        fields[name] = latex_to_unicode(value) if convert_latex else value.strip()
+    return fields
+
+
+def iter_bibtex_entries(lines: Iterable[str]) -> Iterator[Tuple[str, str, Dict[str, str]]]:
+    """
+    流式解析 BibTeX 文件，逐条产出 (条目类型, 引用键, 字段字典)。
+    每条记录以行首的 @ 开始，因此只需缓存当前一条记录的文本，内存占用与文件大小无关。
+    """
+    buffer = []
+
+    def flush():
+        text = ''.join(buffer)
+        head = _ENTRY_HEAD.search(text)
+        if head and head.group(1).lower() not in ('comment', 'preamble', 'string'):
+            return head.group(1).lower(), head.group(2), parse_bibtex_fields(text)
+        return None
+
+    for line in lines:
+        if line.lstrip().startswith('@') and buffer:
+            entry = flush()
+            if entry:
+                yield entry
+            buffer = []
+        buffer.append(line)
+    if buffer:
+        entry = flush()
+        if entry:
+            yield entry
+
+
+def bibtex_authors(value: str) -> str:
+    """把 BibTeX 的 "Last, First and Last2, First2" 转换为 "First Last, First2 Last2"。"""
+    names = []
+    for name in re.split(r'\s+and\s+', value):
+        parts = [p.strip() for p in name.split(',')]
+        if len(parts) >= 2 and parts[1]:
+            names.append(f"{parts[1]} {parts[0]}")
+        elif parts[0]:
+            names.append(parts[0])
+    return ', '.join(names)
@@ -0,0 +1,300 @@
+# FILE: src/utils/browser_pool.py
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.network_utils import HEADERS
+
+# 尝试导入 Selenium，如果失败则需要浏览器的抓取器会给出明确的错误提示
+try:
+    from selenium import webdriver
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    IS_SELENIUM_AVAILABLE = True
+except ImportError:
+    webdriver = None
+    IS_SELENIUM_AVAILABLE = False
+
+try:
+    from webdriver_manager.chrome import ChromeDriverManager
+except ImportError:
+    ChromeDriverManager = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2        # 同时存在的 Chrome 实例数 (多个任务共享)
+DEFAULT_WAIT_TIMEOUT = 20    # 等待目标元素出现的最长秒数
+DEFAULT_TABS = 4             # 每个浏览器并行打开的详情页标签数
+DEFAULT_CHECKOUT_TIMEOUT = 600  # 所有浏览器都被占用时，等待其他任务归还的最长秒数
+POLL_INTERVAL = 0.2
+CHECKOUT_POLL_INTERVAL = 1.0
+_READY_STATE_SCRIPT = ("return window.__pcLoading ? 'loading' : "
+                       "(document.querySelector(arguments[0]) ? 'ready' : 'waiting');")
+
+# 详情页标签的处理结果: (url, 提取结果)；超时或出错时提取结果为 None
+TabResult = Tuple[str, Optional[Dict[str, Any]]]
+
+
+class BrowserPool:
+    """
+    进程内共享的无头 Chrome 池。
+
+    - 浏览器按需创建 (最多 size 个)，用完归还，同一次运行中的多个任务复用，不再每个任务启动一次 Chrome。
+    - chromedriver 只解析一次 (webdriver-manager，失败时回退到 Selenium 自带的 Selenium Manager)。
+    - 禁用图片与 CSS 加载，页面加载策略为 eager (DOMContentLoaded 即返回)，
+      是否加载完成由调用方用 wait_for_elements 显式等待目标元素。
+    - 浏览器出错时不归还，由池子在下次需要时重新创建。
+    - 浏览器都被占用时最多等待 checkout_timeout 秒；池子关闭后，正在等待与之后的借用都会立即报错。
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, headless: bool = True, block_resources: bool = True,
+                 page_load_timeout: int = 60, checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT):
+        self.size = max(1, int(size))
+        self.headless = headless
+        self.block_resources = block_resources
+        self.page_load_timeout = page_load_timeout
+        self.checkout_timeout = checkout_timeout
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._all: List[Any] = []
+        self._driver_path: Optional[str] = None
+
+    def _options(self) -> "Options":
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument(f"user-agent={HEADERS['User-Agent']}")
+        options.page_load_strategy = 'eager'
+        if self.block_resources:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+            })
+        return options
+
+    def _service(self) -> "Service":
+        if self._driver_path is None and ChromeDriverManager is not None:
+            try:
+                self._driver_path = ChromeDriverManager().install()
+            except Exception as e:
+                logger.warning(f"    [⚠ WARNING] webdriver-manager 获取 chromedriver 失败，改用 Selenium Manager: {e}")
+                self._driver_path = ''
+        return Service(self._driver_path) if self._driver_path else Service()
+
+    def _create_driver(self) -> Any:
+        driver = webdriver.Chrome(service=self._service(), options=self._options())
+        driver.set_page_load_timeout(self.page_load_timeout)
+        return driver
+
+    def _checkout(self) -> Any:
+        deadline = time.monotonic() + self.checkout_timeout if self.checkout_timeout else None
+        while True:
+            self._raise_if_closed()
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = None
+            if driver is not None:
+                return driver
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            if create:
+                return self._launch()
+            # 所有浏览器都在使用中: 等待其他任务归还；出错的浏览器被丢弃后腾出的名额在下一轮检查时使用
+            try:
+                driver = self._idle.get(timeout=CHECKOUT_POLL_INTERVAL)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"等待空闲浏览器超过 {self.checkout_timeout} 秒 (池大小 {self.size})。")
+                continue
+            return driver
+
+    def _raise_if_closed(self):
+        if self._closed:
+            raise RuntimeError("浏览器池已关闭，无法再借出浏览器。")
+
+    def _launch(self) -> Any:
+        try:
+            driver = self._create_driver()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._all.append(driver)
+        if closed:
+            # 启动期间池子被关闭: 这个浏览器不会再被 close() 回收
+            self._discard(driver)
+            self._raise_if_closed()
+        return driver
+
+    def _discard(self, driver: Any):
+        with self._lock:
+            # close() 之后 (或启动期间池子被关闭) 这个浏览器已不在计数中
+            if driver in self._all:
+                self._all.remove(driver)
+                self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def driver(self) -> Iterator[Any]:
+        """借出一个浏览器；正常退出时关闭多余的标签并归还，出错时丢弃该浏览器。"""
+        if not IS_SELENIUM_AVAILABLE:
+            raise RuntimeError("Selenium 未安装，无法使用浏览器抓取 (pip install selenium webdriver-manager)。")
+        driver = self._checkout()
+        try:
+            yield driver
+        except WebDriverException:
+            self._discard(driver)
+            raise
+        except BaseException:
+            self._release(driver)
+            raise
+        else:
+            self._release(driver)
+
+    def _release(self, driver: Any):
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+        except Exception:
+            self._discard(driver)
+            return
+        if self._closed:
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def close(self):
+        """关闭所有浏览器。等待中的借用者在下一次检查时收到 RuntimeError，不会永远阻塞。"""
+        with self._lock:
+            self._closed = True
+            drivers, self._all = self._all, []
+            self._created = 0
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def wait_for_elements(driver: Any, css_selector: str, timeout: float = DEFAULT_WAIT_TIMEOUT) -> List[Any]:
+    """显式等待: 直到页面中出现匹配 css_selector 的元素 (最多 timeout 秒)，超时返回空列表。"""
+    try:
+        return WebDriverWait(driver, timeout).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, css_selector)))
+    except TimeoutException:
+        return []
+
+
+def fetch_in_tabs(driver: Any, urls: Iterable[str], ready_selector: str,
+                  extract: Callable[[str, str], Optional[Dict[str, Any]]], tabs: int = DEFAULT_TABS,
+                  timeout: float = DEFAULT_WAIT_TIMEOUT) -> Iterator[TabResult]:
+    """
+    在同一个浏览器的多个标签中并行加载详情页，按完成顺序逐个产出 (url, extract(url, page_source))。
+
+    每个标签通过 window.location 发起导航 (不阻塞)，然后轮询各标签: 新文档中出现 ready_selector 即视为就绪；
+    超过 timeout 仍未出现时，只要新文档已经载入就用当时的页面内容尝试提取 (服务端渲染的页面通常已包含所需信息)，
+    仍停留在旧文档则产出 (url, None)。
+    """
+    pending = list(urls)
+    pending.reverse()
+    handles = [driver.current_window_handle]
+    for _ in range(max(1, tabs) - 1):
+        if len(handles) >= len(pending):
+            break
+        driver.switch_to.new_window('tab')
+        handles.append(driver.current_window_handle)
+
+    in_flight: Dict[str, Tuple[str, float]] = {}
+    while pending or in_flight:
+        for handle in handles:
+            if handle not in in_flight and pending:
+                url = pending.pop()
+                driver.switch_to.window(handle)
+                # 标记旧文档: 导航完成后新文档中没有该标记，避免把上一页误认为已就绪
+                driver.execute_script("window.__pcLoading = true; window.location.href = arguments[0];", url)
+                in_flight[handle] = (url, time.monotonic())
+
+        for handle, (url, started) in list(in_flight.items()):
+            driver.switch_to.window(handle)
+            try:
+                state = driver.execute_script(_READY_STATE_SCRIPT, ready_selector)
+            except WebDriverException:
+                # 导航进行中，页面暂时不可访问
+                state = 'loading'
+            if state != 'ready' and time.monotonic() - started < timeout:
+                continue
+            del in_flight[handle]
+            result = None
+            if state != 'loading':
+                try:
+                    result = extract(url, driver.page_source)
+                except Exception as e:
+                    logger.debug(f"    -> 详情页提取失败 {url}: {e}")
+            else:
+                logger.debug(f"    -> 详情页加载超时 {url}")
+            yield url, result
+
+        if in_flight:
+            time.sleep(POLL_INTERVAL)
+
+
+_pool: Optional[BrowserPool] = None
+_pool_options: Dict[str, Any] = {}
+_pool_lock = threading.Lock()
+
+
+def configure_browser_pool(**options):
+    """使用 tasks.yaml 中 `browser:` 小节的参数 (size、headless、block_resources、page_load_timeout) 配置共享浏览器池。"""
+    global _pool_options
+    shutdown_browser_pool()
+    _pool_options = dict(options)
+
+
+def get_browser_pool() -> BrowserPool:
+    """返回进程级共享的浏览器池 (首次使用时创建，不会启动浏览器)。"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(**_pool_options)
+        return _pool
+
+
+def shutdown_browser_pool():
+    """关闭池中所有浏览器，在采集阶段结束时调用。"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,114 @@
+# FILE: src/utils/checkpoint.py
+
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointJournal:
+    """
+    单个任务的断点续爬日志 (append-only JSONL)。
+
+    - 每完成一条工作 (详情页 URL 或 OpenReview note id) 就追加一行 {"key": ..., "record": {...}} 并立即 flush，
+      因此网络中断、Ctrl-C 或任务异常时，已解析的结果都不会丢失。
+    - 重新运行同一任务时先加载日志，跳过已完成的 key，只抓取剩余部分。
+    - 进程崩溃可能留下半行，加载时会忽略无法解析的行。
+    - 需要按偏移量续爬的抓取器 (如 arXiv 分页) 可用 set_state/get_state 记录游标，
+      写入为 {"state": ..., "value": ...} 行，不计入论文记录。
+    - 任务结果成功保存后调用 clear() 删除日志。
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._state: Dict[str, Any] = {}
+        self._load()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        # 上次崩溃留下的半行不能与新记录拼接在一起
+        if self.path.stat().st_size and not self._ends_with_newline():
+            self._file.write('\n')
+            self._file.flush()
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as f:
+            f.seek(-1, 2)
+            return f.read(1) == b'\n'
+
+    @classmethod
+    def for_task(cls, checkpoint_dir: Path, task_name: str) -> 'CheckpointJournal':
+        safe_name = re.sub(r'[\\/*?:"<>|\s]', "_", task_name)
+        return cls(Path(checkpoint_dir) / f"{safe_name}.jsonl")
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        skipped = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    item = json.loads(line)
+                    if 'state' in item:
+                        self._state[item['state']] = item['value']
+                    else:
+                        self._records[item['key']] = item['record']
+                except (ValueError, KeyError, TypeError):
+                    skipped += 1
+        if skipped:
+            logger.debug(f"    -> 断点日志 {self.path.name} 中有 {skipped} 行无法解析，已忽略。")
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._records.get(key)
+
+    def records(self) -> List[Dict[str, Any]]:
+        return list(self._records.values())
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        return list(self._records.items())
+
+    def append(self, key: str, record: Dict[str, Any]):
+        """记录一条已完成的工作。线程安全，可在解析线程池中直接调用。"""
+        line = json.dumps({'key': key, 'record': record}, ensure_ascii=False, default=str)
+        with self._lock:
+            self._records[key] = record
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def get_state(self, name: str, default: Any = None) -> Any:
+        return self._state.get(name, default)
+
+    def set_state(self, name: str, value: Any):
+        """记录抓取器的续爬状态 (后写入的值覆盖先前的值)。"""
+        line = json.dumps({'state': name, 'value': value}, ensure_ascii=False, default=str)
+        with self._lock:
+            self._state[name] = value
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def clear(self):
+        """任务结果已成功保存: 删除日志文件。"""
+        with self._lock:
+            self._records.clear()
+            self._state.clear()
+            self._file.close()
+            self.path.unlink(missing_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+            # 没有任何记录的空日志没有保留的意义
+            if not self._records and not self._state and self.path.exists() and self.path.stat().st_size == 0:
+                self.path.unlink()
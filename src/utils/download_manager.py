@@ -0,0 +1,300 @@
+# FILE: src/utils/download_manager.py
+
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+from tqdm import tqdm
+
+from src.utils.checkpoint import CheckpointJournal
+from src.utils.network_utils import get_http_client
+from src.utils.pdf_store import PdfStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_WORKERS = 8   # 同时进行的下载数
+DEFAULT_PER_HOST = 4           # 同一主机同时进行的下载数
+DEFAULT_ATTEMPTS = 3           # 单个文件的尝试次数，每次从 .part 已写入的位置继续
+CHUNK_SIZE = 256 * 1024
+PART_SUFFIX = '.part'
+# 持久化队列中为每个下载保存的论文字段 (续传时用于重建视图与仓库清单)
+QUEUED_PAPER_FIELDS = ('id', 'title', 'conference', 'year')
+_CONTENT_RANGE = re.compile(r'bytes\s+(\d+)-\d+/(\d+|\*)')
+
+
+def pdf_path(paper: Dict[str, Any], pdf_dir: Path) -> Path:
+    """论文 PDF 的保存路径: 以清理后的标题命名 (最多 150 个字符)。"""
+    title = paper.get('title', 'untitled')
+    sanitized_title = re.sub(r'[\\/*?:"<>|]', "", title).replace('\n', ' ').replace('\r', '')
+    return Path(pdf_dir) / (sanitized_title[:150] + ".pdf")
+
+
+def download_file(url: str, path: Path, timeout: int = 30, attempts: int = DEFAULT_ATTEMPTS,
+                  progress=None) -> Dict[str, int]:
+    """
+    下载单个文件到 path。数据先写入 path.part，完成后原子地重命名为 path，中途失败不会留下残缺的目标文件。
+    .part 已存在时用 HTTP Range 从断点继续；服务器不支持 Range (返回 200) 时从头下载。
+    progress(n) 在每写入 n 字节后调用。返回 {'bytes': 本次下载的字节数, 'resumed_from': 续传起点}，失败时抛出异常。
+    """
+    path = Path(path)
+    part = path.with_name(path.name + PART_SUFFIX)
+    downloaded, resumed_from = 0, 0
+    for attempt in range(1, attempts + 1):
+        offset = part.stat().st_size if part.exists() else 0
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+        try:
+            with get_http_client().get(url, stream=True, timeout=timeout, headers=headers) as response:
+                if offset and response.status_code == 416:
+                    # .part 已是完整文件 (上次在重命名之前中断)，或与服务器上的文件不一致
+                    total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                    if total == str(offset):
+                        break
+                    part.unlink()
+                    continue
+                response.raise_for_status()
+                match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+                if offset and response.status_code == 206 and match and int(match.group(1)) == offset:
+                    mode = 'ab'
+                    resumed_from = resumed_from or offset
+                else:
+                    mode = 'wb'
+                with open(part, mode) as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if progress is not None:
+                            progress(len(chunk))
+            break
+        except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout) as e:
+            # 连接中断: 已写入 .part 的部分保留，下一次尝试从断点继续
+            if attempt == attempts:
+                raise
+            logger.debug(f"    -> 下载中断 ({attempt}/{attempts})，将从 {part.stat().st_size if part.exists() else 0} "
+                         f"字节处继续: {url}: {e}")
+    else:
+        raise IOError(f"服务器拒绝了 Range 请求，{attempts} 次尝试后仍未完成: {url}")
+    os.replace(part, path)
+    return {'bytes': downloaded, 'resumed_from': resumed_from}
+
+
+def iter_download(url: str, timeout: int = 30, attempts: int = DEFAULT_ATTEMPTS,
+                  chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    流式下载 url，逐块产出响应体，不落盘 (供边下载边写入 zip 等场景使用)。
+    连接中断时用 HTTP Range 从已产出的位置继续；服务器不支持 Range 时抛出 IOError，因为已产出的数据无法撤回。
+    """
+    offset = 0
+    for attempt in range(1, attempts + 1):
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+        try:
+            with get_http_client().get(url, stream=True, timeout=timeout, headers=headers) as response:
+                response.raise_for_status()
+                if offset:
+                    match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+                    if response.status_code != 206 or not match or int(match.group(1)) != offset:
+                        raise IOError(f"服务器不支持 Range 请求，无法从 {offset} 字节处续传: {url}")
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    offset += len(chunk)
+                    yield chunk
+            return
+        except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout) as e:
+            if attempt == attempts:
+                raise
+            logger.debug(f"    -> 下载中断 ({attempt}/{attempts})，将从 {offset} 字节处继续: {url}: {e}")
+
+
+class DownloadStats:
+    """下载吞吐统计 (线程安全)。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.files = 0
+        self.bytes = 0
+        self.skipped = 0
+        self.failed = 0
+        self.resumed = 0
+        self.deduplicated = 0
+
+    def add_bytes(self, n: int):
+        with self._lock:
+            self.bytes += n
+
+    def count(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    @property
+    def elapsed(self) -> float:
+        return max(time.monotonic() - self.started, 1e-6)
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / 1024 / 1024 / self.elapsed
+
+    @property
+    def files_per_s(self) -> float:
+        return self.files / self.elapsed
+
+    def summary(self) -> str:
+        text = (f"{self.files} 个文件, {self.bytes / 1024 / 1024:.1f} MB, 用时 {self.elapsed:.1f} 秒 "
+                f"({self.mb_per_s:.2f} MB/s, {self.files_per_s:.2f} 文件/s)")
+        if self.resumed:
+            text += f"，{self.resumed} 个断点续传"
+        if self.skipped:
+            text += f"，{self.skipped} 个已存在"
+        if self.deduplicated:
+            text += f"，{self.deduplicated} 个已在 PDF 仓库中 (未重复下载)"
+        if self.failed:
+            text += f"，{self.failed} 个失败"
+        return text
+
+
+class DownloadManager:
+    """
+    任务级的并发 PDF 下载管理器。
+
+    - submit() 把论文放入下载队列后立即返回，由 max_workers 个线程并发下载，同一主机最多 per_host 个；
+      在途任务数有上限，主流水线 (写 CSV/Markdown) 不会因下载慢而无限堆积。
+    - 每个文件先写入 .part，完成后原子重命名；连接中断时用 HTTP Range 从已写入的位置继续。
+    - 队列持久化在 CheckpointJournal 中 (键为 PDF URL，值为 {path, paper, status})，任务中断后重新运行时，
+      上次未完成的下载会先被重新排队；全部完成后删除队列文件，失败的条目保留到下次运行重试。
+    - 给出 store (PdfStore) 时，PDF 存入内容寻址仓库，pdf_dir 下只创建视图；论文 id 或 URL 已在仓库中时不再下载。
+    - 进度条显示已完成的文件数与实时吞吐量 (MB/s)，close() 返回 DownloadStats。
+    """
+
+    def __init__(self, pdf_dir: Path, queue: Optional[CheckpointJournal] = None,
+                 max_workers: int = DEFAULT_DOWNLOAD_WORKERS, per_host: int = DEFAULT_PER_HOST,
+                 timeout: int = 30, attempts: int = DEFAULT_ATTEMPTS, store: Optional[PdfStore] = None,
+                 task_logger: Optional[logging.Logger] = None, desc: str = "    -> Downloading PDFs"):
+        self.pdf_dir = Path(pdf_dir)
+        self.pdf_dir.mkdir(parents=True, exist_ok=True)
+        self.queue = queue
+        self.store = store
+        self.max_workers = max(1, int(max_workers))
+        self.per_host = max(1, int(per_host))
+        self.timeout = timeout
+        self.attempts = attempts
+        self.logger = task_logger or logger
+        self.stats = DownloadStats()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='pdf-download')
+        # 排队 + 在途的下载数上限
+        self._slots = threading.BoundedSemaphore(self.max_workers * 4)
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+        self._submitted = set()
+        self._closed = False
+        get_http_client().ensure_pool_size(self.per_host)
+        self._pbar = tqdm(desc=desc, unit="pdf", leave=True)
+        self._resume_queue()
+
+    def _resume_queue(self):
+        if self.queue is None:
+            return
+        leftover = [(url, entry) for url, entry in self.queue.items() if entry.get('status') != 'done']
+        if leftover:
+            self.logger.info(f"    -> [断点续传] 下载队列中有 {len(leftover)} 个上次未完成的文件，重新排队。")
+        for url, entry in leftover:
+            self._enqueue(url, self.pdf_dir / entry['path'], entry.get('paper') or {})
+
+    def submit(self, paper: Dict[str, Any]) -> bool:
+        """把论文的 PDF 加入下载队列。没有 PDF 链接时返回 False。"""
+        pdf_url = paper.get('pdf_url')
+        if not pdf_url or not str(pdf_url).startswith('http'):
+            self.logger.debug(f"    -> Skipping download (no PDF URL): {paper.get('title', 'untitled')[:50]}...")
+            return False
+        path = pdf_path(paper, self.pdf_dir)
+        self._enqueue(pdf_url, path, {field: paper.get(field) for field in QUEUED_PAPER_FIELDS})
+        return True
+
+    def _enqueue(self, url: str, path: Path, paper: Dict[str, Any]):
+        with self._lock:
+            if url in self._submitted:
+                return
+            self._submitted.add(url)
+        if self.store is not None:
+            content_hash = self.store.find(paper, url)
+            if content_hash:
+                # 其他任务 (或上次运行) 已下载过: 只登记论文并创建视图
+                self.store.register(paper, content_hash, url)
+                self.store.link_view(content_hash, path)
+                self.stats.count('deduplicated')
+                self._pbar.update(1)
+                return
+        elif path.exists():
+            self.stats.count('skipped')
+            self._pbar.update(1)
+            return
+        if self.queue is not None:
+            self.queue.append(url, {'path': path.name, 'paper': paper, 'status': 'pending'})
+        self._slots.acquire()
+        try:
+            self._executor.submit(self._run, url, path, paper)
+        except RuntimeError:
+            # 已取消 (close(cancel=True))，队列中的条目留待下次运行
+            self._slots.release()
+
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _run(self, url: str, path: Path, paper: Dict[str, Any]):
+        try:
+            with self._host_slot(url):
+                if self._closed:
+                    return
+                target = self.store.incoming_path(url) if self.store is not None else path
+                result = download_file(url, target, timeout=self.timeout, attempts=self.attempts,
+                                       progress=self.stats.add_bytes)
+            if self.store is not None:
+                self.store.link_view(self.store.add(target, url, paper), path)
+            self.stats.count('files')
+            if result['resumed_from']:
+                self.stats.count('resumed')
+            if self.queue is not None:
+                self.queue.append(url, {'path': path.name, 'paper': paper, 'status': 'done'})
+        except Exception as e:
+            self.stats.count('failed')
+            self.logger.error(f"    [✖ ERROR] Failed to download {url}. Reason: {e}")
+            if self.queue is not None:
+                self.queue.append(url, {'path': path.name, 'paper': paper, 'status': 'failed',
+                                        'error': str(e)[:200]})
+        finally:
+            self._slots.release()
+            self._pbar.set_postfix_str(f"{self.stats.mb_per_s:.2f} MB/s", refresh=False)
+            self._pbar.update(1)
+
+    def close(self, cancel: bool = False) -> DownloadStats:
+        """
+        等待队列中的下载全部完成并报告吞吐量。cancel=True 时 (任务异常或被中断) 丢弃尚未开始的下载，
+        它们保留在持久化队列中，下次运行时继续。
+        """
+        if cancel:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+        self._pbar.close()
+        if self.queue is not None:
+            if not cancel and not self.stats.failed:
+                self.queue.clear()
+            self.queue.close()
+        if self.stats.files or self.stats.failed or self.stats.deduplicated:
+            self.logger.info(f"    -> PDF 下载完成: {self.stats.summary()}")
+        return self.stats
+
+    def __enter__(self) -> 'DownloadManager':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(cancel=exc_type is not None)
@@ -1,10 +1,10 @@
 # FILE: src/utils/downloader.py (Tqdm Removed Version)
 
 import requests
-import re
 from pathlib import Path
 
 from src.crawlers.config import get_logger
+from src.utils.download_manager import download_file, pdf_path
 
 logger = get_logger(__name__)
 
@@ -12,6 +12,7 @@ def download_single_pdf(paper: dict, pdf_dir: Path):
     """
     Downloads a single PDF file. This function is now designed to be called within a loop
     controlled by an external tqdm instance.
+    Batch downloads should use DownloadManager (src/utils/download_manager.py), which runs them concurrently.
     """
     pdf_url = paper.get('pdf_url')
     title = paper.get('title', 'untitled')
@@ -20,26 +21,18 @@ def download_single_pdf(paper: dict, pdf_dir: Path):
         logger.warning(f"    -> Skipping download (no PDF URL): {title[:50]}...")
         return False
 
-    sanitized_title = re.sub(r'[\\/*?:"<>|]', "", title).replace('\n', ' ').replace('\r', '')
-    filename = (sanitized_title[:150] + ".pdf")
-    filepath = pdf_dir / filename
+    filepath = pdf_path(paper, pdf_dir)
 
     if filepath.exists():
         return True # Skip if already exists
 
     try:
-        response = requests.get(pdf_url, stream=True, timeout=30, headers={'User-Agent': 'Mozilla/5.0'})
-        response.raise_for_status()
-
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # 先写入 .part，完成后原子重命名；中断后再次调用会从断点继续
+        download_file(pdf_url, filepath)
         return True
     except requests.exceptions.RequestException as e:
         logger.error(f"    [✖ ERROR] Failed to download {pdf_url}. Reason: {e}")
-        if filepath.exists(): filepath.unlink() # Clean up failed download
         return False
     except Exception as e:
         logger.error(f"    [✖ ERROR] An unexpected error occurred for {pdf_url}. Reason: {e}")
-        if filepath.exists(): filepath.unlink()
-        return False
\ No newline at end of file
+        return False
@@ -1,54 +1,97 @@
 # FILE: src/utils/formatter.py
 
-import pandas as pd
+import csv
+import json
+import math
+import os
+import shutil
 from pathlib import Path
 from datetime import datetime
 
+CSV_LEADING_COLUMNS = ['title', 'authors', 'abstract', 'pdf_url', 'keywords', 'source_url']
+
+
+def _format_markdown_entry(index: int, paper: dict) -> str:
+    title = str(paper.get('title') or 'N/A').replace('\n', ' ')
+
+    # --- 修复点: 健壮地处理作者字段，无论是字符串还是列表 ---
+    authors_data = paper.get('authors', 'N/A')
+    if isinstance(authors_data, list):
+        authors = ", ".join(authors_data)
+    else:
+        authors = str(authors_data)  # 确保是字符串
+    authors = authors.replace('\n', ' ')
+
+    abstract = str(paper.get('abstract') or 'N/A').replace('\n', ' ')
+    pdf_url = paper.get('pdf_url', '#')
+
+    entry = f"### {index}. {title}\n\n"
+    entry += f"**Authors:** *{authors}*\n\n"
+    if pdf_url and pdf_url != '#':
+        entry += f"**[PDF Link]({pdf_url})**\n\n"
+    entry += f"**Abstract:**\n"
+    entry += f"> {abstract}\n\n"
+    entry += "---\n\n"
+    return entry
+
+
+class StreamingMarkdownWriter:
+    """
+    逐篇写入 Markdown 报告，内存占用与论文数量无关。
+    报告头部 (论文总数、词云图) 要到最后才能确定，因此正文先写入临时文件，close() 时再拼接。
+    """
+
+    def __init__(self, task_name: str, output_dir: Path):
+        self.task_name = task_name
+        self.timestamp = datetime.now().strftime("%Y-%m-%d")
+        self.path = output_dir / f"{task_name}_report_{self.timestamp}.md"
+        self._body_path = self.path.with_name(self.path.name + ".part")
+        self._body = open(self._body_path, 'w', encoding='utf-8')
+        self.count = 0
+
+    def write(self, paper: dict):
+        self.count += 1
+        self._body.write(_format_markdown_entry(self.count, paper))
+
+    def abort(self):
+        """任务失败: 丢弃临时文件，不生成报告。"""
+        self._body.close()
+        self._body_path.unlink(missing_ok=True)
+
+    def close(self, wordcloud_path: str = None):
+        """写出最终报告。没有任何论文时不生成文件，返回 None。"""
+        self._body.close()
+        if not self.count:
+            self._body_path.unlink(missing_ok=True)
+            return None
+
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(f"# {self.task_name} Papers ({self.timestamp})\n\n")
+            f.write(f"Total papers found matching criteria: **{self.count}**\n\n")
+
+            if wordcloud_path:
+                f.write(f"## Trend Word Cloud\n\n")
+                # --- 修复点: 确保路径在Markdown中是正确的相对路径 ---
+                f.write(f"![Word Cloud](./{Path(wordcloud_path).name})\n\n")
+
+            f.write("---\n\n")
+            with open(self._body_path, 'r', encoding='utf-8') as body:
+                shutil.copyfileobj(body, f)
+        self._body_path.unlink(missing_ok=True)
+
+        print(f"Successfully saved Markdown report to {self.path}")
+        return self.path
+
 
 def save_as_markdown(papers: list, task_name: str, output_dir: Path, wordcloud_path: str = None):
     """Saves a list of paper dictionaries as a formatted Markdown file."""
     if not papers:
         return
 
-    timestamp = datetime.now().strftime("%Y-%m-%d")
-    filename = output_dir / f"{task_name}_report_{timestamp}.md"
-
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"# {task_name} Papers ({timestamp})\n\n")
-        f.write(f"Total papers found matching criteria: **{len(papers)}**\n\n")
-
-        if wordcloud_path:
-            f.write(f"## Trend Word Cloud\n\n")
-            # --- 修复点: 确保路径在Markdown中是正确的相对路径 ---
-            f.write(f"![Word Cloud](./{Path(wordcloud_path).name})\n\n")
-
-        f.write("---\n\n")
-
-        for i, paper in enumerate(papers, 1):
-            title = paper.get('title', 'N/A').replace('\n', ' ')
-
-            # --- 修复点: 健壮地处理作者字段，无论是字符串还是列表 ---
-            authors_data = paper.get('authors', 'N/A')
-            if isinstance(authors_data, list):
-                authors = ", ".join(authors_data)
-            else:
-                authors = str(authors_data)  # 确保是字符串
-            authors = authors.replace('\n', ' ')
-
-            abstract = paper.get('abstract', 'N/A').replace('\n', ' ')
-            pdf_url = paper.get('pdf_url', '#')
-
-            f.write(f"### {i}. {title}\n\n")
-            f.write(f"**Authors:** *{authors}*\n\n")
-
-            if pdf_url and pdf_url != '#':
-                f.write(f"**[PDF Link]({pdf_url})**\n\n")
-
-            f.write(f"**Abstract:**\n")
-            f.write(f"> {abstract}\n\n")
-            f.write("---\n\n")
-
-    print(f"Successfully saved Markdown report to {filename}")
+    writer = StreamingMarkdownWriter(task_name, output_dir)
+    for paper in papers:
+        writer.write(paper)
+    writer.close(wordcloud_path=wordcloud_path)
 
 
 def save_as_summary_txt(papers: list, task_name: str, output_dir: Path):
@@ -85,28 +128,71 @@ def save_as_summary_txt(papers: list, task_name: str, output_dir: Path):
     print(f"Successfully saved TXT summary to {filename}")
 
 
+def _csv_value(value):
+    # --- 修复点: 确保所有列表都变成字符串 ---
+    if isinstance(value, list):
+        return ", ".join(map(str, value))
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    return value
+
+
+class StreamingCsvWriter:
+    """
+    逐篇写入 CSV，内存占用与论文数量无关。
+
+    不同论文的字段可能不同 (例如部分论文才有审稿字段)，而 CSV 表头必须包含所有列，
+    因此记录先追加到临时 JSONL 文件，close() 时确定完整表头后再一次性转换为 CSV。
+    列顺序与 save_as_csv 的 DataFrame 写法一致: 常用列在前，其余按首次出现的顺序。
+    """
+
+    def __init__(self, task_name: str, output_dir: Path):
+        timestamp = datetime.now().strftime("%Y%m%d")
+        self.path = output_dir / f"{task_name}_data_{timestamp}.csv"
+        self._spool_path = self.path.with_name(self.path.name + ".part")
+        self._spool = open(self._spool_path, 'w', encoding='utf-8')
+        self._columns = {}
+        self.count = 0
+
+    def write(self, paper: dict):
+        self.count += 1
+        for key in paper:
+            self._columns.setdefault(key, None)
+        self._spool.write(json.dumps(paper, ensure_ascii=False, default=str) + "\n")
+
+    def abort(self):
+        """任务失败: 丢弃临时文件，不生成 CSV。"""
+        self._spool.close()
+        self._spool_path.unlink(missing_ok=True)
+
+    def close(self):
+        """写出最终 CSV 并返回其路径。没有任何论文时不生成文件，返回 None。"""
+        self._spool.close()
+        if not self.count:
+            self._spool_path.unlink(missing_ok=True)
+            return None
+
+        columns = [c for c in CSV_LEADING_COLUMNS if c in self._columns] + \
+                  [c for c in self._columns if c not in CSV_LEADING_COLUMNS]
+        with open(self._spool_path, 'r', encoding='utf-8') as spool, \
+                open(self.path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=columns, lineterminator=os.linesep)
+            writer.writeheader()
+            for line in spool:
+                paper = json.loads(line)
+                writer.writerow({key: _csv_value(value) for key, value in paper.items()})
+        self._spool_path.unlink(missing_ok=True)
+
+        print(f"Successfully saved CSV data to {self.path}")
+        return self.path
+
+
 def save_as_csv(papers: list, task_name: str, output_dir: Path):
-    """Saves a list of paper dictionaries as a CSV file."""
+    """Saves a list of paper dictionaries as a CSV file. Returns the path of the written file."""
     if not papers:
-        return
+        return None
 
-    timestamp = datetime.now().strftime("%Y%m%d")
-    filename = output_dir / f"{task_name}_data_{timestamp}.csv"
-
-    # --- 修复点: 在转换为DataFrame之前，确保所有列表都变成字符串 ---
-    processed_papers = []
+    writer = StreamingCsvWriter(task_name, output_dir)
     for paper in papers:
-        new_paper = paper.copy()
-        for key, value in new_paper.items():
-            if isinstance(value, list):
-                new_paper[key] = ", ".join(map(str, value))
-        processed_papers.append(new_paper)
-
-    df = pd.DataFrame(processed_papers)
-
-    cols = ['title', 'authors', 'abstract', 'pdf_url', 'keywords', 'source_url']
-    df_cols = [c for c in cols if c in df.columns] + [c for c in df.columns if c not in cols]
-    df = df[df_cols]
-
-    df.to_csv(filename, index=False, encoding='utf-8-sig')
-    print(f"Successfully saved CSV data to {filename}")
\ No newline at end of file
+        writer.write(paper)
+    return writer.close()
@@ -0,0 +1,257 @@
+# FILE: src/utils/http_cache.py
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 3600          # 未配置策略的主机: 1 天内直接命中，之后条件重验证
+DEFAULT_MAX_SIZE_MB = 2048       # 缓存总大小上限，超出后按 LRU 淘汰
+# 响应体以解码后的形式存储，因此不保留 Content-Encoding 等传输相关的头
+CACHED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    url: str
+    status: int
+    headers: Dict[str, str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    stored_at: float
+    ttl: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """构造条件请求头，用于向服务器确认缓存是否仍然有效。"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    基于磁盘的 HTTP 响应缓存。
+
+    - 响应体按 SHA-256 内容寻址存储在 blobs/ 下，相同内容只保存一份。
+    - SQLite 索引记录 URL -> (状态码, 响应头, ETag/Last-Modified, 内容哈希, 存储/访问时间)。
+    - 每个主机可配置 TTL 与可缓存的方法；TTL 内直接命中，过期后用 If-None-Match /
+      If-Modified-Since 条件请求重验证，304 时复用本地内容。
+    - 总大小超过上限时，按最近最少使用 (LRU) 淘汰条目，并删除不再被引用的内容块。
+    """
+
+    def __init__(self, root: Path, max_size_mb: float = DEFAULT_MAX_SIZE_MB, default_ttl: float = DEFAULT_TTL,
+                 policies: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.default_ttl = default_ttl
+        self.policies = policies or {}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / "index.sqlite"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access);
+            CREATE INDEX IF NOT EXISTS idx_entries_hash ON entries(body_hash);
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL
+            );
+        """)
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    # --- 策略 ---
+
+    def _policy(self, url: str) -> Dict[str, Any]:
+        return self.policies.get(urlparse(url).hostname or '', {})
+
+    def ttl_for(self, url: str) -> float:
+        return float(self._policy(url).get('ttl', self.default_ttl))
+
+    def is_cacheable(self, method: str, url: str) -> bool:
+        methods = self._policy(url).get('methods', ['GET'])
+        return method.upper() in {m.upper() for m in methods} and self.ttl_for(url) > 0
+
+    @staticmethod
+    def make_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+        digest = hashlib.sha256(f"{method.upper()} {url}".encode('utf-8'))
+        if body:
+            digest.update(b'\n')
+            digest.update(body if isinstance(body, bytes) else str(body).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _blob_path(self, body_hash: str) -> Path:
+        return self.blob_dir / body_hash[:2] / body_hash
+
+    # --- 读写 ---
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, url, status, headers, etag, last_modified, body_hash, stored_at FROM entries WHERE key = ?",
+                (key,)).fetchone()
+        if not row:
+            return None
+        entry = CacheEntry(key=row[0], url=row[1], status=row[2], headers=json.loads(row[3]), etag=row[4],
+                           last_modified=row[5], body_hash=row[6], stored_at=row[7], ttl=self.ttl_for(row[1]))
+        if not self._blob_path(entry.body_hash).exists():
+            self.delete(key)
+            return None
+        return entry
+
+    def read_body(self, entry: CacheEntry) -> bytes:
+        with self._lock:
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), entry.key))
+            self._conn.commit()
+        return self._blob_path(entry.body_hash).read_bytes()
+
+    def store(self, key: str, url: str, status: int, headers: Dict[str, str], body: bytes):
+        """写入一条响应。响应体按内容哈希去重存储。"""
+        cache_control = (headers.get('Cache-Control') or '').lower()
+        if 'no-store' in cache_control:
+            return
+        body_hash = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(body_hash)
+        kept_headers = {name: headers[name] for name in CACHED_HEADERS if headers.get(name)}
+        now = time.time()
+
+        with self._lock:
+            if not blob_path.exists():
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = blob_path.with_suffix('.tmp')
+                tmp_path.write_bytes(body)
+                tmp_path.replace(blob_path)
+            cursor = self._conn.execute("INSERT OR IGNORE INTO blobs(hash, size) VALUES (?, ?)", (body_hash, len(body)))
+            if cursor.rowcount:
+                self._total_bytes += len(body)
+            old = self._conn.execute("SELECT body_hash FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries(key, url, status, headers, etag, last_modified, body_hash, stored_at, "
+                "last_access) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(kept_headers), headers.get('ETag'), headers.get('Last-Modified'),
+                 body_hash, now, now))
+            if old and old[0] != body_hash:
+                self._release_blob(old[0])
+            self._conn.commit()
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def refresh(self, entry: CacheEntry, headers: Dict[str, str]):
+        """304 Not Modified: 重置条目的存储时间，并更新服务器返回的新验证器。"""
+        now = time.time()
+        etag = headers.get('ETag') or entry.etag
+        last_modified = headers.get('Last-Modified') or entry.last_modified
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET stored_at = ?, last_access = ?, etag = ?, last_modified = ? WHERE key = ?",
+                (now, now, etag, last_modified, entry.key))
+            self._conn.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            row = self._conn.execute("SELECT body_hash FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            if row:
+                self._release_blob(row[0])
+            self._conn.commit()
+
+    # --- 淘汰 (调用方需持有锁) ---
+
+    def _release_blob(self, body_hash: str):
+        """当没有任何条目引用某个内容块时，删除它。"""
+        if self._conn.execute("SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone():
+            return
+        row = self._conn.execute("SELECT size FROM blobs WHERE hash = ?", (body_hash,)).fetchone()
+        self._conn.execute("DELETE FROM blobs WHERE hash = ?", (body_hash,))
+        if row:
+            self._total_bytes -= row[0]
+        self._blob_path(body_hash).unlink(missing_ok=True)
+
+    def _evict(self):
+        # 淘汰到上限的 90%，避免每次写入都触发淘汰
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        while self._total_bytes > target:
+            rows = self._conn.execute("SELECT key, body_hash FROM entries ORDER BY last_access ASC LIMIT 100").fetchall()
+            if not rows:
+                break
+            for key, body_hash in rows:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._release_blob(body_hash)
+                evicted += 1
+                if self._total_bytes <= target:
+                    break
+        self._conn.commit()
+        logger.debug(f"    -> HTTP 缓存 LRU 淘汰了 {evicted} 条记录，当前大小 {self._total_bytes / 1024 / 1024:.1f} MB")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """返回当前启用的响应缓存；未配置或已禁用时返回 None。"""
+    return _cache
+
+
+def configure_response_cache(root: Path, source_definitions: Optional[Dict[str, Any]] = None, enabled: bool = True,
+                             max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+                             default_ttl: float = DEFAULT_TTL) -> Optional[ResponseCache]:
+    """
+    根据 tasks.yaml 的 `cache:` 小节启用响应缓存。
+    每个 source_definitions 条目可用 `cache: { ttl: 秒, methods: [GET, POST] }` 声明其主机 (`hosts`) 的缓存策略。
+    """
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+    if not enabled:
+        return None
+
+    policies: Dict[str, Dict[str, Any]] = {}
+    for definition in (source_definitions or {}).values():
+        if not isinstance(definition, dict) or not isinstance(definition.get('cache'), dict):
+            continue
+        hosts: Iterable[str] = definition.get('hosts', [])
+        for host in hosts:
+            policies[host] = definition['cache']
+
+    _cache = ResponseCache(root, max_size_mb=max_size_mb, default_ttl=default_ttl, policies=policies)
+    return _cache
@@ -0,0 +1,76 @@
+# FILE: src/utils/incremental.py
+
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 增量模式下用于比对的列需要按字符串读取，否则 pandas 会把 TPAMI 文章号、OpenReview mdate 转成数字
+_KEY_COLUMNS = {'id': str, 'mdate': str}
+
+
+def find_dataset_files(task_name: str, output_dir: Path) -> List[Path]:
+    """返回某个任务已保存的 CSV 数据文件，按日期后缀从旧到新排序。"""
+    pattern = re.compile(rf"^{re.escape(task_name)}_data_(\d{{8}})\.csv$")
+    files = [p for p in Path(output_dir).glob(f"{task_name}_data_*.csv") if pattern.match(p.name)]
+    return sorted(files, key=lambda p: pattern.match(p.name).group(1))
+
+
+def load_latest_dataset(task_name: str, output_dir: Path) -> List[Dict[str, Any]]:
+    """加载某个任务最新一次保存的数据集；不存在或读取失败时返回空列表。"""
+    files = find_dataset_files(task_name, output_dir)
+    if not files:
+        return []
+    try:
+        df = pd.read_csv(files[-1], dtype=_KEY_COLUMNS, encoding='utf-8-sig')
+        df.fillna('', inplace=True)
+        return df.to_dict('records')
+    except Exception as e:
+        logger.error(f"    [✖ ERROR] 读取已有数据集失败 {files[-1]}: {e}")
+        return []
+
+
+def _has_id(paper: Dict[str, Any]) -> bool:
+    return paper.get('id') not in (None, '', 'N/A')
+
+
+def index_by_id(papers: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {str(p['id']): p for p in papers if _has_id(p)}
+
+
+def merge_papers(existing: List[Dict[str, Any]], fresh: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    按 id 合并: 已有条目保持原顺序，被重新抓取的条目用新结果替换，新条目追加在末尾。
+    没有可用 id (空或 'N/A') 的新条目无法去重，全部原样追加。
+    """
+    fresh_by_id = index_by_id(fresh)
+    merged = []
+    for paper in existing:
+        merged.append(fresh_by_id.pop(str(paper['id']), paper) if _has_id(paper) else paper)
+    for paper in fresh:
+        if not _has_id(paper):
+            merged.append(paper)
+            continue
+        # 同一 id 在新结果中出现多次时只保留一条 (最后一次的结果)
+        latest = fresh_by_id.pop(str(paper['id']), None)
+        if latest is not None:
+            merged.append(latest)
+    return merged
+
+
+def prune_superseded(task_name: str, output_dir: Path, keep: Optional[Path]) -> int:
+    """
+    删除被合并结果取代的旧 CSV。
+    增量模式下最新文件已包含全部数据，保留旧文件会让 analyze 模式重复统计同一批论文。
+    """
+    removed = 0
+    for path in find_dataset_files(task_name, output_dir):
+        if keep is not None and path.resolve() == Path(keep).resolve():
+            continue
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
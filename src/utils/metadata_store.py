@@ -0,0 +1,246 @@
+# FILE: src/utils/metadata_store.py
+
+import json
+import logging
+import math
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # 可选依赖: 未安装时 CSV 仍是唯一的数据文件
+    pa = ds = pq = None
+
+logger = logging.getLogger(__name__)
+
+# 固定的列及其类型 (所有任务、所有会议一致)；其余字段 (审稿意见、评分列表等) 以 JSON 存入 extra 列
+STRING_COLUMNS = ('id', 'title', 'authors', 'abstract', 'keywords', 'pdf_url', 'source_url', 'decision', 'mdate')
+FLOAT_COLUMNS = ('avg_rating',)
+PARTITION_COLUMNS = ('conference', 'year')
+DEFAULT_BATCH_ROWS = 5000
+_SAFE_NAME = re.compile(r'[\\/*?:"<>|=\s]+')
+
+
+def _schema():
+    return pa.schema([(name, pa.string()) for name in STRING_COLUMNS] +
+                     [(name, pa.float64()) for name in FLOAT_COLUMNS] +
+                     [('task', pa.string()), ('extra', pa.string())])
+
+
+def _partitioning():
+    # 分区值按字符串处理: year 可能是 'Latest'，会议名可能包含数字
+    return ds.partitioning(pa.schema([(name, pa.string()) for name in PARTITION_COLUMNS]), flavor='hive')
+
+
+def _string_value(value: Any) -> Optional[str]:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, list):
+        # 与 CSV 导出一致: 列表 (如作者) 以 ", " 连接
+        return ", ".join(map(str, value))
+    return str(value)
+
+
+def _float_value(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+def _partition_value(value: Any) -> str:
+    return _SAFE_NAME.sub('_', str(value)) or 'Misc'
+
+
+def partition_key(conference: Any, year: Any) -> Tuple[str, str]:
+    """(会议, 年份) 对应的分区目录值，与 MetadataStore.partitions() 的返回值可以直接比较。"""
+    return _partition_value(conference), _partition_value(year)
+
+
+def csv_files_without_partition(metadata_dir: Path, partitions: Sequence[Tuple[str, str]]) -> List[Path]:
+    """
+    metadata_dir/<会议>/<年份>/ 下的 CSV 中，所在 (会议, 年份) 还没有 Parquet 分区的那些。
+    启用数据集之前采集的历史数据只有 CSV，读取方按 (会议, 年份) 回退到这些文件，不会因为出现了新分区而丢失。
+    """
+    covered = set(partitions)
+    return [csv_path for csv_path in sorted(Path(metadata_dir).rglob("*_data_*.csv"))
+            if partition_key(csv_path.parent.parent.name, csv_path.parent.name) not in covered]
+
+
+class ParquetDatasetWriter:
+    """
+    把一个任务的论文逐批写入数据集分区 conference=<会议>/year=<年份>/<任务名>.parquet。
+
+    - 每 batch_rows 篇写出一个 row group，内存占用与论文数量无关。
+    - 先写入 .part 临时文件，close() 时原子替换: 同一任务重新运行 (包括增量合并) 会覆盖自己的文件，
+      不会像按日期命名的 CSV 那样留下过期的重复数据。
+    """
+
+    def __init__(self, root: Path, task_name: str, conference: Any, year: Any, compression: str = 'zstd',
+                 batch_rows: int = DEFAULT_BATCH_ROWS):
+        partition_dir = Path(root) / f"conference={_partition_value(conference)}" / f"year={_partition_value(year)}"
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        self.path = partition_dir / f"{_partition_value(task_name)}.parquet"
+        self._part_path = self.path.with_name(self.path.name + ".part")
+        self.task_name = task_name
+        self.batch_rows = batch_rows
+        self._schema = _schema()
+        self._writer = pq.ParquetWriter(str(self._part_path), self._schema, compression=compression)
+        self._rows: List[Dict[str, Any]] = []
+        self.count = 0
+
+    def write(self, paper: Dict[str, Any]):
+        row = {name: _string_value(paper.get(name)) for name in STRING_COLUMNS}
+        row.update({name: _float_value(paper.get(name)) for name in FLOAT_COLUMNS})
+        row['task'] = self.task_name
+        extra = {key: value for key, value in paper.items()
+                 if key not in row and key not in PARTITION_COLUMNS and value is not None}
+        row['extra'] = json.dumps(extra, ensure_ascii=False, default=str) if extra else None
+        self._rows.append(row)
+        self.count += 1
+        if len(self._rows) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self):
+        if self._rows:
+            self._writer.write_table(pa.Table.from_pylist(self._rows, schema=self._schema))
+            self._rows = []
+
+    def abort(self):
+        """任务失败: 丢弃临时文件，保留上一次成功写入的分区文件。"""
+        self._rows = []
+        self._writer.close()
+        self._part_path.unlink(missing_ok=True)
+
+    def close(self) -> Optional[Path]:
+        """写出分区文件并返回其路径。没有任何论文时不生成文件 (也不删除旧文件)，返回 None。"""
+        self._flush()
+        self._writer.close()
+        if not self.count:
+            self._part_path.unlink(missing_ok=True)
+            return None
+        os.replace(self._part_path, self.path)
+        return self.path
+
+
+class MetadataStore:
+    """
+    按会议/年份分区的 Parquet 元数据数据集 (output/dataset/)，取代按日期命名的 CSV 成为主数据存储。
+
+    读取时只扫描需要的列与分区 (会议、年份、任务的过滤条件下推到目录与 row group 统计信息)；
+    CSV 仍可作为导出格式 (csv_export) 写入 output/metadata/。
+    """
+
+    def __init__(self, root: Path, csv_export: bool = True, compression: str = 'zstd',
+                 batch_rows: int = DEFAULT_BATCH_ROWS):
+        self.root = Path(root)
+        self.csv_export = csv_export
+        self.compression = compression
+        self.batch_rows = batch_rows
+
+    def writer(self, task_name: str, conference: Any, year: Any) -> ParquetDatasetWriter:
+        return ParquetDatasetWriter(self.root, task_name, conference, year, compression=self.compression,
+                                    batch_rows=self.batch_rows)
+
+    # --- 读取 ---
+
+    def dataset(self):
+        """返回整个数据集 (pyarrow.dataset.Dataset)；还没有任何数据时返回 None。"""
+        # 只列出完成的分区文件，写入中的 .part 临时文件不会被读到
+        files = sorted(str(path) for path in self.root.glob("conference=*/year=*/*.parquet"))
+        if not files:
+            return None
+        return ds.dataset(files, format='parquet', partitioning=_partitioning(), partition_base_dir=str(self.root))
+
+    @staticmethod
+    def _filter(conference: Any = None, year: Any = None, task: Optional[str] = None):
+        expression = None
+        for column, value in (('conference', conference), ('year', year), ('task', task)):
+            if value is None:
+                continue
+            value = _partition_value(value) if column in PARTITION_COLUMNS else value
+            term = ds.field(column) == value
+            expression = term if expression is None else expression & term
+        return expression
+
+    def iter_batches(self, columns: Optional[Sequence[str]] = None, conference: Any = None, year: Any = None,
+                     task: Optional[str] = None, batch_rows: int = DEFAULT_BATCH_ROWS) -> Iterator[pd.DataFrame]:
+        """按块产出 DataFrame，任何时刻只有一个块在内存中。"""
+        dataset = self.dataset()
+        if dataset is None:
+            return
+        for batch in dataset.to_batches(columns=list(columns) if columns else None,
+                                        filter=self._filter(conference, year, task), batch_size=batch_rows):
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    def read(self, columns: Optional[Sequence[str]] = None, conference: Any = None, year: Any = None,
+             task: Optional[str] = None) -> pd.DataFrame:
+        dataset = self.dataset()
+        if dataset is None:
+            return pd.DataFrame(columns=list(columns or ()))
+        table = dataset.to_table(columns=list(columns) if columns else None,
+                                 filter=self._filter(conference, year, task))
+        return table.to_pandas()
+
+    def load_task(self, task_name: str, conference: Any, year: Any) -> List[Dict[str, Any]]:
+        """加载某个任务已保存的全部论文 (展开 extra 列)，供增量模式与已有数据合并；读取失败时返回空列表。"""
+        try:
+            df = self.read(conference=conference, year=year, task=task_name)
+        except Exception as e:
+            logger.error(f"    [✖ ERROR] 读取已有 Parquet 数据集失败 ({task_name}): {e}")
+            return []
+        papers = []
+        for record in df.to_dict('records'):
+            extra = record.pop('extra', None)
+            record.pop('task', None)
+            paper = {key: value for key, value in record.items()
+                     if value is not None and not (isinstance(value, float) and math.isnan(value))}
+            if extra:
+                paper.update(json.loads(extra))
+            papers.append(paper)
+        return papers
+
+    def partitions(self) -> List[Tuple[str, str]]:
+        """已有数据的 (会议, 年份) 分区，只读取目录名，不打开任何文件。"""
+        found = []
+        for year_dir in sorted(self.root.glob("conference=*/year=*")):
+            if any(year_dir.glob("*.parquet")):
+                found.append((year_dir.parent.name.split('=', 1)[1], year_dir.name.split('=', 1)[1]))
+        return found
+
+
+_store: Optional[MetadataStore] = None
+
+
+def get_metadata_store() -> Optional[MetadataStore]:
+    """返回当前启用的 Parquet 数据集；未配置、已禁用或未安装 pyarrow 时返回 None (仅写 CSV)。"""
+    return _store
+
+
+def configure_metadata_store(root: Path, enabled: bool = True, csv_export: bool = True, compression: str = 'zstd',
+                             batch_rows: int = DEFAULT_BATCH_ROWS) -> Optional[MetadataStore]:
+    """根据 tasks.yaml 的 `metadata_store:` 小节启用 Parquet 元数据数据集。"""
+    global _store
+    _store = None
+    if not enabled:
+        return None
+    if pa is None:
+        logger.warning("    -> [⚠ WARNING] 未安装 pyarrow，元数据仍只保存为 CSV (pip install pyarrow)。")
+        return None
+    _store = MetadataStore(root, csv_export=csv_export, compression=compression, batch_rows=batch_rows)
+    return _store
+
+
+def open_metadata_store(root: Path) -> Optional[MetadataStore]:
+    """只读场景 (索引、Streamlit) 打开已有数据集；未安装 pyarrow 或数据集不存在时返回 None。"""
+    if pa is None or not Path(root).exists():
+        return None
+    return MetadataStore(root)
@@ -1,11 +1,18 @@
 # FILE: src/utils/network_utils.py
 
 import requests
-import time
+import threading
 import logging
+import time
+from typing import Optional
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 from urllib3.util.retry import Retry
 
+from src.utils.http_cache import CacheEntry, get_response_cache
+from src.utils.rate_limiter import get_rate_limiter
+
 # 获取一个简单的日志记录器，或者你可以从主配置中传递一个
 logger = logging.getLogger(__name__)
 
@@ -13,45 +20,247 @@ HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
+# 共享客户端的默认参数，可通过 tasks.yaml 顶层的 `http:` 小节覆盖
+DEFAULT_POOL_CONNECTIONS = 16   # 缓存多少个不同主机的连接池
+DEFAULT_POOL_MAXSIZE = 32       # 每个主机连接池中保留的最大 keep-alive 连接数
+DEFAULT_RETRIES = 5
+DEFAULT_BACKOFF_FACTOR = 1.0
+DEFAULT_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+
+def _parse_retry_after(headers) -> Optional[float]:
+    """解析 Retry-After 头 (仅支持秒数形式)。"""
+    value = headers.get('Retry-After') if headers is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class FeedbackRetry(Retry):
+    """
+    urllib3 的重试策略扩展: 每次内部重试前，把状态码反馈给对应主机的限速器，
+    这样被重试吞掉的 429/503 同样会触发 AIMD 退避。
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if _pool is not None:
+            status = response.status if response is not None else None
+            retry_after = _parse_retry_after(response.headers) if response is not None else None
+            get_rate_limiter().get(_pool.host).record(status, retry_after=retry_after)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class PoliteHTTPAdapter(HTTPAdapter):
+    """
+    所有经由共享客户端 (以及被 attach 的第三方 Session) 的请求都会经过这里:
+    - 先查询磁盘响应缓存 (见 src/utils/http_cache.py)，TTL 内直接返回，过期则发条件请求重验证；
+    - 真正发出请求前向主机限速器申请令牌，并把状态码与延迟反馈回去。
+    流式请求 (如 PDF 下载) 不经过缓存。
+    """
+
+    def send(self, request, **kwargs):
+        cache = get_response_cache()
+        if cache is None or kwargs.get('stream') or not cache.is_cacheable(request.method, request.url):
+            return self._send_polite(request, **kwargs)
+
+        key = cache.make_key(request.method, request.url, request.body)
+        entry = cache.lookup(key)
+        if entry is not None:
+            if entry.is_fresh:
+                cached = self._build_cached_response(request, entry, cache)
+                if cached is not None:
+                    return cached
+            elif entry.has_validators:
+                request.headers.update(entry.conditional_headers())
+
+        response = self._send_polite(request, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.refresh(entry, response.headers)
+            cached = self._build_cached_response(request, entry, cache)
+            if cached is not None:
+                return cached
+            # 内容块已被淘汰: 去掉条件头重新请求完整内容
+            for header in ('If-None-Match', 'If-Modified-Since'):
+                request.headers.pop(header, None)
+            response = self._send_polite(request, **kwargs)
+        if response.status_code == 200:
+            cache.store(key, request.url, response.status_code, response.headers, response.content)
+        return response
+
+    def _build_cached_response(self, request, entry: CacheEntry, cache) -> Optional[requests.Response]:
+        try:
+            body = cache.read_body(entry)
+        except FileNotFoundError:
+            return None
+        response = requests.Response()
+        response.status_code = entry.status
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        return response
+
+    def _send_polite(self, request, **kwargs):
+        limiter = get_rate_limiter().get(request.url)
+        limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+        except requests.exceptions.RequestException:
+            limiter.record(None)
+            raise
+        limiter.record(response.status_code, time.monotonic() - start,
+                       retry_after=_parse_retry_after(response.headers))
+        return response
+
+
 def get_session_with_retries(
-    retries=5,
-    backoff_factor=1,
-    status_forcelist=(500, 502, 503, 504),
+    retries=DEFAULT_RETRIES,
+    backoff_factor=DEFAULT_BACKOFF_FACTOR,
+    status_forcelist=DEFAULT_STATUS_FORCELIST,
     session=None,
+    pool_connections=DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize=DEFAULT_POOL_MAXSIZE,
 ):
     """
     创建一个带有重试机制的 requests Session 对象。
     这对于处理临时的网络错误或服务器不稳定非常有效。
+    挂载的适配器会经过按主机的令牌桶限速器 (见 src/utils/rate_limiter.py)。
     """
     session = session or requests.Session()
-    retry_strategy = Retry(
+    retry_strategy = FeedbackRetry(
         total=retries,
         read=retries,
         connect=retries,
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = PoliteHTTPAdapter(max_retries=retry_strategy, pool_connections=pool_connections,
+                                pool_maxsize=pool_maxsize)
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     return session
 
 
-def robust_get(url: str, timeout: int = 30, retries: int = 5, backoff_factor: float = 1.0):
+class HttpClient:
+    """
+    进程级共享的 HTTP 客户端。
+
+    - 所有 scraper 与下载器共用同一个 Session，urllib3 会为每个主机维护独立的连接池，
+      从而在线程之间复用 TCP/TLS 连接 (keep-alive)，避免每个请求都重新握手。
+    - 每个主机连接池的大小会随任务的 `max_workers` 自动扩容，保证并发线程不会因为
+      连接池过小而被迫丢弃连接。
+    - 重试与退避策略集中配置，所有请求都经过按主机的自适应限速器。
+    """
+
+    def __init__(self, retries: int = DEFAULT_RETRIES, backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                 status_forcelist=DEFAULT_STATUS_FORCELIST, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = tuple(status_forcelist)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        self._mount_adapters()
+
+    def _mount_adapters(self):
+        get_session_with_retries(
+            retries=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.status_forcelist,
+            session=self.session,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+
+    def ensure_pool_size(self, max_workers: int):
+        """确保每个主机的连接池至少能容纳 max_workers 个并发连接。只扩容，不缩容。"""
+        if not max_workers or max_workers <= self.pool_maxsize:
+            return
+        with self._lock:
+            if max_workers <= self.pool_maxsize:
+                return
+            logger.debug(f"    -> 连接池扩容: {self.pool_maxsize} -> {max_workers}")
+            self.pool_maxsize = max_workers
+            self._mount_adapters()
+
+    def attach(self, session: requests.Session) -> requests.Session:
+        """
+        为第三方库自带的 Session (例如 openreview-py 客户端) 挂载相同的重试与限速适配器，
+        使其请求同样受全局限速器约束。
+        """
+        return get_session_with_retries(
+            retries=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.status_forcelist,
+            session=session,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', 30)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """返回进程级共享的 HttpClient (首次调用时惰性创建，线程安全)。"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def configure_http_client(**options) -> HttpClient:
+    """
+    使用 tasks.yaml 中 `http:` 小节的参数重建共享客户端。
+    支持的键: retries, backoff_factor, status_forcelist, pool_connections, pool_maxsize。
+    """
+    global _client
+    with _client_lock:
+        old_client = _client
+        _client = HttpClient(**options)
+    if old_client:
+        old_client.close()
+    return _client
+
+
+def robust_get(url: str, timeout: int = 30, **kwargs) -> Optional[requests.Response]:
     """
-    一个健壮的 GET 请求函数，集成了重试和更长的超时。
+    一个健壮的 GET 请求函数，基于共享的连接池客户端，集成了重试和更长的超时。
+    重试次数与退避因子由共享客户端统一配置 (见 configure_http_client)。
     :param url: 要请求的 URL
     :param timeout: 单次请求的超时时间（秒）
-    :param retries: 最大重试次数
-    :param backoff_factor: 重试的退避因子 (e.g., 1s, 2s, 4s...)
     :return: requests.Response 对象或 None
     """
-    session = get_session_with_retries(retries=retries, backoff_factor=backoff_factor)
     try:
-        response = session.get(url, headers=HEADERS, timeout=timeout)
+        response = get_http_client().get(url, timeout=timeout, **kwargs)
         response.raise_for_status()  # 如果状态码是 4xx 或 5xx，则抛出异常
         return response
     except requests.exceptions.RequestException as e:
         # 使用 logger.error 而不是 print，以便记录到日志文件
         logger.error(f"    [✖ NETWORK ERROR] 请求失败，已达到最大重试次数 for URL: {url}. Error: {e}")
-        return None
\ No newline at end of file
+        return None
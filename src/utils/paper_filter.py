@@ -0,0 +1,47 @@
+# FILE: src/utils/paper_filter.py
+
+import re
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+
+class PaperFilter:
+    """
+    任务 filters 的预编译谓词，供抓取器在昂贵的请求之前提前过滤 (过滤下推)。
+
+    - matches(paper): 与主程序的最终过滤完全一致 (标题 + 摘要中任一命中即保留)。
+      用于已拿到摘要、但还未获取审稿信息或 PDF 的阶段。
+    - matches_title(title): 仅凭索引页上的标题判断，用于访问详情页之前。
+      摘要尚未获取，只在摘要中命中关键词的论文会被提前排除，结果因此可能少于最终过滤，
+      所以这一阶段默认关闭 (matches_title 总是返回 True)，需由任务显式设置 prefilter_titles: true 开启。
+    - 每次因过滤而跳过的请求都会计入 fetches_avoided，由主程序在任务结束时报告。
+    """
+
+    def __init__(self, patterns: Optional[Iterable[str]] = None, prefilter_titles: bool = False):
+        self.patterns = list(patterns or [])
+        self.regex = re.compile('|'.join(self.patterns), re.IGNORECASE) if self.patterns else None
+        self.prefilter_titles = prefilter_titles
+        self.fetches_avoided = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_task(cls, task_info: Dict[str, Any]) -> 'PaperFilter':
+        return cls(task_info.get('filters'), prefilter_titles=bool(task_info.get('prefilter_titles', False)))
+
+    def __bool__(self) -> bool:
+        return self.regex is not None
+
+    def matches(self, paper: Dict[str, Any]) -> bool:
+        if self.regex is None:
+            return True
+        return bool(self.regex.search(str(paper.get('title', '')) + ' ' + str(paper.get('abstract', ''))))
+
+    def matches_title(self, title: Any) -> bool:
+        if self.regex is None or not self.prefilter_titles:
+            return True
+        return bool(self.regex.search(str(title or '')))
+
+    def record_avoided(self, count: int = 1):
+        """记录因提前过滤而省去的请求数 (可在解析线程中调用)。"""
+        with self._lock:
+            self.fetches_avoided += count
@@ -0,0 +1,234 @@
+# FILE: src/utils/pdf_store.py
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+VIEW_MODES = ('hardlink', 'symlink', 'copy')
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PdfStore:
+    """
+    内容寻址的 PDF 仓库，多个任务下载的同一篇 PDF 只保存一份。
+
+    - PDF 按 SHA-256 存放在 blobs/ab/cd/<hash>.pdf (两级分片，避免单个目录下文件过多)。
+    - SQLite 清单 (manifest.sqlite) 记录 (会议, 论文 id) -> 内容哈希 与 URL -> 内容哈希；
+      下载前先按 URL 查找，再按论文 id 查找 (仅当登记的 URL 与本次请求一致或未给出 URL 时采用)，命中时不再发出请求。
+    - 不同 URL 下载到相同内容时 (如 arXiv 与 OpenReview 上的同一 PDF)，入库时按哈希去重。
+    - output/pdfs/<conference>/<year>/ 下的文件是指向仓库的视图 (硬链接，跨文件系统时回退为符号链接或复制)，
+      标题相同但内容不同的论文以 "<标题> [<哈希前 8 位>].pdf" 区分，不再被静默跳过。
+    - 下载中的文件位于 incoming/ 下 (按 URL 命名)，中断后可以用 Range 续传。
+    """
+
+    def __init__(self, root: Path, view_mode: str = 'hardlink'):
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.incoming_dir = self.root / "incoming"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.incoming_dir.mkdir(parents=True, exist_ok=True)
+        if view_mode not in VIEW_MODES:
+            logger.warning(f"    -> [⚠ WARNING] 未知的 view_mode '{view_mode}'，改用 hardlink。")
+            view_mode = 'hardlink'
+        self.view_mode = view_mode
+
+        self._lock = threading.Lock()
+        # 同名视图的检查与创建必须串行，否则两篇同标题论文可能同时占用同一个名字
+        self._view_lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / "manifest.sqlite"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS papers (
+                conference TEXT NOT NULL,
+                paper_id TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                url TEXT,
+                title TEXT,
+                year TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (conference, paper_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_papers_hash ON papers(hash);
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                hash TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def blob_path(self, content_hash: str) -> Path:
+        return self.blob_dir / content_hash[:2] / content_hash[2:4] / f"{content_hash}.pdf"
+
+    def incoming_path(self, url: str) -> Path:
+        """URL 对应的下载暂存路径 (固定，便于中断后续传)。"""
+        return self.incoming_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.pdf"
+
+    # --- 查询 ---
+
+    def find(self, paper: Dict[str, Any], url: Optional[str] = None) -> Optional[str]:
+        """
+        按 URL、再按 (会议, 论文 id) 查找已入库的 PDF，返回内容哈希；内容块已丢失时视为未命中。
+        按 id 命中的记录只有在登记的 URL 与本次的 URL 相同时才采用: PDF 链接变化 (如论文更新了版本) 时需要重新下载。
+        """
+        with self._lock:
+            row = None
+            if url:
+                row = self._conn.execute("SELECT hash FROM urls WHERE url = ?", (url,)).fetchone()
+            if row is None and paper.get('id'):
+                by_id = self._conn.execute("SELECT hash, url FROM papers WHERE conference = ? AND paper_id = ?",
+                                           (str(paper.get('conference') or ''), str(paper['id']))).fetchone()
+                if by_id is not None and (not url or by_id[1] == url):
+                    row = by_id
+        if row is None or not self.blob_path(row[0]).exists():
+            return None
+        return row[0]
+
+    def iter_hashes(self) -> Iterator[str]:
+        """仓库中所有内容块的哈希 (供全文提取等后续步骤遍历)。"""
+        with self._lock:
+            hashes = [row[0] for row in self._conn.execute("SELECT hash FROM blobs ORDER BY stored_at")]
+        return iter(hashes)
+
+    # --- 写入 ---
+
+    def add(self, path: Path, url: Optional[str] = None, paper: Optional[Dict[str, Any]] = None) -> str:
+        """
+        把下载完成的文件移入仓库 (内容已存在时直接删除该文件)，登记 URL 与论文 id，返回内容哈希。
+        path 应与仓库位于同一文件系统 (如 incoming_path 返回的路径)，以便原子移动。
+        """
+        path = Path(path)
+        content_hash = file_sha256(path)
+        size = path.stat().st_size
+        blob = self.blob_path(content_hash)
+        now = time.time()
+        with self._lock:
+            if blob.exists():
+                path.unlink()
+            else:
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(path, blob)
+            self._conn.execute("INSERT OR IGNORE INTO blobs(hash, size, stored_at) VALUES (?, ?, ?)",
+                               (content_hash, size, now))
+            if url:
+                self._conn.execute("INSERT OR REPLACE INTO urls(url, hash) VALUES (?, ?)", (url, content_hash))
+            if paper:
+                self._register(paper, content_hash, url, now)
+            self._conn.commit()
+        return content_hash
+
+    def register(self, paper: Dict[str, Any], content_hash: str, url: Optional[str] = None):
+        """把已入库的内容登记到另一篇论文 (例如按 URL 命中时)。"""
+        with self._lock:
+            self._register(paper, content_hash, url, time.time())
+            self._conn.commit()
+
+    def _register(self, paper: Dict[str, Any], content_hash: str, url: Optional[str], now: float):
+        if not paper.get('id'):
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO papers(conference, paper_id, hash, url, title, year, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (str(paper.get('conference') or ''), str(paper['id']), content_hash, url, paper.get('title'),
+             str(paper.get('year') or ''), now))
+
+    # --- 视图 ---
+
+    def link_view(self, content_hash: str, view_path: Path) -> Path:
+        """
+        在 view_path 创建指向内容块的视图，返回实际使用的路径。
+        该路径已被另一篇内容不同的论文占用时 (标题相同)，改用 "<标题> [<哈希前 8 位>].pdf"。
+        """
+        blob = self.blob_path(content_hash)
+        view_path = Path(view_path)
+        with self._view_lock:
+            return self._link_view(blob, content_hash, view_path)
+
+    def _link_view(self, blob: Path, content_hash: str, view_path: Path) -> Path:
+        for candidate in (view_path, view_path.with_name(f"{view_path.stem} [{content_hash[:8]}]{view_path.suffix}")):
+            if candidate.exists() or candidate.is_symlink():
+                if self._is_view_of(candidate, blob, content_hash):
+                    return candidate
+                if candidate is view_path:
+                    continue
+                # 带哈希后缀的名字只会属于这份内容，残留的损坏视图直接替换
+                candidate.unlink()
+            candidate.parent.mkdir(parents=True, exist_ok=True)
+            self._make_link(blob, candidate)
+            return candidate
+        return view_path
+
+    @staticmethod
+    def _is_view_of(candidate: Path, blob: Path, content_hash: str) -> bool:
+        try:
+            if os.path.samefile(candidate, blob):
+                return True
+            # 复制模式的视图，或是仓库启用之前下载的同一文件
+            return candidate.stat().st_size == blob.stat().st_size and file_sha256(candidate) == content_hash
+        except OSError:
+            return False
+
+    def _make_link(self, blob: Path, view: Path):
+        tmp = view.with_name(view.name + '.tmp')
+        tmp.unlink(missing_ok=True)
+        modes = VIEW_MODES[VIEW_MODES.index(self.view_mode):]
+        for mode in modes:
+            try:
+                if mode == 'hardlink':
+                    os.link(blob, tmp)
+                elif mode == 'symlink':
+                    tmp.symlink_to(os.path.relpath(blob, view.parent))
+                else:
+                    shutil.copyfile(blob, tmp)
+                break
+            except OSError as e:
+                # 跨文件系统无法硬链接、Windows 上没有创建符号链接的权限等: 依次降级
+                logger.debug(f"    -> 无法以 {mode} 方式创建视图 {view}: {e}")
+        else:
+            # 所有方式都失败 (如目标目录不可写): 内容仍在仓库中，只是缺少这个视图，下次运行会重新创建
+            logger.error(f"    [✖ ERROR] 无法创建 PDF 视图 {view} (已尝试 {', '.join(modes)})。")
+            return
+        os.replace(tmp, view)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[PdfStore] = None
+
+
+def get_pdf_store() -> Optional[PdfStore]:
+    """返回当前启用的 PDF 仓库；未配置或已禁用时返回 None (PDF 直接按标题保存)。"""
+    return _store
+
+
+def configure_pdf_store(root: Path, enabled: bool = True, view_mode: str = 'hardlink') -> Optional[PdfStore]:
+    """根据 tasks.yaml 的 `pdf_store:` 小节启用内容寻址 PDF 仓库。"""
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
+    if enabled:
+        _store = PdfStore(root, view_mode=view_mode)
+    return _store
@@ -0,0 +1,247 @@
+# FILE: src/utils/pdf_text.py
+
+import gzip
+import logging
+import multiprocessing
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from tqdm import tqdm
+
+from src.utils.pdf_store import PdfStore
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # 可选依赖: 未安装时跳过全文提取
+    PdfReader = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PAGES = 50          # 每篇只提取前 N 页 (正文 + 参考文献通常足够)，0 表示不限制
+DEFAULT_MAX_CHARS = 400_000     # 单篇文本的上限，防止超长附录/扫描件撑爆内存与索引
+DEFAULT_JOB_TIMEOUT = 120       # 单篇 PDF 的提取时限 (秒)，超时的文件记为失败，0 表示不限制
+_WHITESPACE = re.compile(r'[ \t\r\f\v]+')
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def extract_pdf_text(path: str, max_pages: int = DEFAULT_MAX_PAGES, max_chars: int = DEFAULT_MAX_CHARS) -> str:
+    """提取 PDF 的文本 (在解析进程中运行，必须是模块级函数以便 pickle)。"""
+    reader = PdfReader(path)
+    pages = reader.pages if not max_pages else reader.pages[:max_pages]
+    parts, size = [], 0
+    for page in pages:
+        text = page.extract_text() or ''
+        parts.append(text)
+        size += len(text)
+        if max_chars and size >= max_chars:
+            break
+    text = _BLANK_LINES.sub('\n\n', _WHITESPACE.sub(' ', '\n'.join(parts))).strip()
+    return text[:max_chars] if max_chars else text
+
+
+def _extract_job(content_hash: str, path: str, max_pages: int, max_chars: int) -> Tuple[str, Optional[str], str]:
+    try:
+        return content_hash, extract_pdf_text(path, max_pages, max_chars), ''
+    except Exception as e:
+        # 加密、损坏或非 PDF 的文件: 记录错误，不中断整个进程池
+        return content_hash, None, f"{type(e).__name__}: {e}"
+
+
+class TextStore:
+    """
+    PDF 全文的 gzip 旁路存储，以 PdfStore 的内容哈希为键: <root>/ab/<hash>.txt.gz。
+    同一份 PDF (无论被多少任务、多少 URL 引用) 只提取一次；提取失败 (损坏、超时、导致工作进程崩溃) 的文件
+    写入 <hash>.failed 标记 (内容为失败原因)，之后的运行不再重试。
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, content_hash: str) -> Path:
+        return self.root / content_hash[:2] / f"{content_hash}.txt.gz"
+
+    def __contains__(self, content_hash: str) -> bool:
+        return self.path(content_hash).exists()
+
+    def failed_path(self, content_hash: str) -> Path:
+        return self.root / content_hash[:2] / f"{content_hash}.failed"
+
+    def has_failed(self, content_hash: str) -> bool:
+        return self.failed_path(content_hash).exists()
+
+    def mark_failed(self, content_hash: str, error: str):
+        path = self.failed_path(content_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(error, encoding='utf-8')
+
+    def read(self, content_hash: str, max_chars: int = 0) -> Optional[str]:
+        """读取全文；max_chars > 0 时只解压前 max_chars 个字符。没有该文本时返回 None。"""
+        return self.read_path(self.path(content_hash), max_chars)
+
+    @staticmethod
+    def read_path(path: Path, max_chars: int = 0) -> Optional[str]:
+        """按文件路径读取 (供只拿到路径的工作进程使用)。"""
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return f.read(max_chars) if max_chars else f.read()
+        except FileNotFoundError:
+            return None
+
+    def write(self, content_hash: str, text: str):
+        path = self.path(content_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        with gzip.open(tmp, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+
+def _new_pool(workers: int) -> ProcessPoolExecutor:
+    # 提取在爬虫进程中进行，此时进程内已有下载、日志等线程 (可能持有锁): 用 spawn 启动全新的进程，不 fork 多线程进程
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+def _terminate(pool: ProcessPoolExecutor):
+    """结束进程池: 卡死的工作进程不会自己退出，shutdown() 本身无法回收它们。"""
+    for process in list((getattr(pool, '_processes', None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def extract_pending(pdf_store: PdfStore, text_store: TextStore, workers: Optional[int] = None,
+                    max_pages: int = DEFAULT_MAX_PAGES, max_chars: int = DEFAULT_MAX_CHARS,
+                    timeout: float = DEFAULT_JOB_TIMEOUT, hashes: Optional[Iterable[str]] = None,
+                    retry_failed: bool = False) -> Dict[str, int]:
+    """
+    用进程池提取仓库中尚无文本的 PDF，写入 text_store。
+    同时在途的任务数不超过 workers (每个任务提交后即开始执行，超时从提交时算起)，结果由主进程逐个写盘，
+    内存占用与 PDF 数量无关。
+
+    - 超过 timeout 秒的文件记为失败，结束并重建进程池，其余在途任务重新提交。
+    - 工作进程崩溃 (BrokenProcessPool) 时无法得知是哪个文件导致的: 当时在途的文件逐个单独重试，
+      单独运行时仍然崩溃的文件记为失败。
+    - 失败的文件写入标记，以后的运行跳过 (retry_failed=True 时重试)。
+
+    返回 {'extracted': 成功数, 'failed': 失败数, 'skipped': 已有文本或已标记失败而跳过的数量}。
+    """
+    stats = {'extracted': 0, 'failed': 0, 'skipped': 0}
+    if PdfReader is None:
+        logger.warning("    -> [⚠ WARNING] 未安装 pypdf，跳过 PDF 全文提取 (pip install pypdf)。")
+        return stats
+
+    queued = deque()
+    for content_hash in (hashes if hashes is not None else pdf_store.iter_hashes()):
+        if content_hash in text_store or (not retry_failed and text_store.has_failed(content_hash)):
+            stats['skipped'] += 1
+        elif pdf_store.blob_path(content_hash).exists():
+            queued.append(content_hash)
+    if not queued:
+        return stats
+
+    workers = workers or os.cpu_count() or 1
+    logger.info(f"    -> 使用 {workers} 个进程提取 {len(queued)} 篇 PDF 的全文 ({stats['skipped']} 篇已有缓存)。")
+    suspects = deque()  # 进程池崩溃时在途的文件，逐个单独重试
+    in_flight = {}      # future -> (内容哈希, 提交时间, 是否单独运行)
+    pool = _new_pool(workers)
+
+    def submit(content_hash: str, alone: bool):
+        future = pool.submit(_extract_job, content_hash, str(pdf_store.blob_path(content_hash)), max_pages, max_chars)
+        in_flight[future] = (content_hash, time.monotonic(), alone)
+
+    def fail(content_hash: str, error: str):
+        stats['failed'] += 1
+        text_store.mark_failed(content_hash, error)
+        logger.debug(f"    -> PDF 全文提取失败 {content_hash[:12]}: {error}")
+        pbar.update(1)
+
+    try:
+        with tqdm(total=len(queued), desc="    -> Extracting PDF text", leave=True) as pbar:
+            while queued or suspects or in_flight:
+                if suspects:
+                    if not in_flight:
+                        submit(suspects.popleft(), alone=True)
+                else:
+                    while queued and len(in_flight) < workers:
+                        submit(queued.popleft(), alone=False)
+
+                wait_for = None
+                if timeout:
+                    oldest = min(started for _, started, _ in in_flight.values())
+                    wait_for = max(0.0, oldest + timeout - time.monotonic())
+                done, _ = wait(in_flight, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                broken = False
+                for future in done:
+                    content_hash, _, alone = in_flight.pop(future)
+                    try:
+                        content_hash, text, error = future.result()
+                    except BrokenProcessPool:
+                        broken = True
+                        if alone:
+                            fail(content_hash, "worker process crashed")
+                        else:
+                            suspects.append(content_hash)
+                        continue
+                    if text is None:
+                        fail(content_hash, error)
+                    else:
+                        text_store.write(content_hash, text)
+                        stats['extracted'] += 1
+                        pbar.update(1)
+
+                now = time.monotonic()
+                expired = [future for future, (_, started, _) in in_flight.items()
+                           if timeout and now - started >= timeout]
+                if not expired and not broken:
+                    continue
+                for future in expired:
+                    fail(in_flight.pop(future)[0], f"timed out after {timeout}s")
+                # 重建进程池: 超时时其余在途文件放回队首；崩溃时它们都有嫌疑，逐个重试
+                for content_hash, _, alone in in_flight.values():
+                    if broken and not alone:
+                        suspects.append(content_hash)
+                    elif broken:
+                        fail(content_hash, "worker process crashed")
+                    else:
+                        queued.appendleft(content_hash)
+                in_flight.clear()
+                _terminate(pool)
+                pool = _new_pool(workers)
+    finally:
+        _terminate(pool)
+
+    if stats['failed']:
+        logger.warning(f"    [⚠ WARNING] {stats['failed']} 篇 PDF 未能提取文本 (加密、损坏、扫描件或超时)，已记录，"
+                       f"以后的运行不再重试。")
+    return stats
+
+
+_settings = {'enabled': False, 'workers': None, 'max_pages': DEFAULT_MAX_PAGES, 'max_chars': DEFAULT_MAX_CHARS,
+             'timeout': DEFAULT_JOB_TIMEOUT, 'retry_failed': False}
+
+
+def configure_text_extraction(enabled: bool = False, workers: Optional[int] = None,
+                              max_pages: int = DEFAULT_MAX_PAGES, max_chars: int = DEFAULT_MAX_CHARS,
+                              timeout: float = DEFAULT_JOB_TIMEOUT, retry_failed: bool = False):
+    """根据 tasks.yaml 的 `text_extraction:` 小节配置 PDF 全文提取。"""
+    _settings.update(enabled=enabled, workers=workers, max_pages=max_pages, max_chars=max_chars, timeout=timeout,
+                     retry_failed=retry_failed)
+
+
+def run_text_extraction(pdf_store: Optional[PdfStore], text_dir: Path) -> Optional[Dict[str, int]]:
+    """采集阶段结束后的流水线步骤: 已启用且有 PDF 仓库时，为新下载的 PDF 提取全文，写入 text_dir。"""
+    if not _settings['enabled']:
+        return None
+    if pdf_store is None:
+        logger.warning("    -> [⚠ WARNING] PDF 全文提取需要启用 pdf_store，已跳过。")
+        return None
+    return extract_pending(pdf_store, TextStore(text_dir), workers=_settings['workers'], max_pages=_settings['max_pages'],
+                           max_chars=_settings['max_chars'], timeout=_settings['timeout'],
+                           retry_failed=_settings['retry_failed'])
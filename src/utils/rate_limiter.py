@@ -0,0 +1,163 @@
+# FILE: src/utils/rate_limiter.py
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# 未在 tasks.yaml 中配置的主机使用的默认参数 (请求/秒)
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 20
+# 触发退避的状态码: 服务器明确表示 "太快了" 或 "暂时扛不住"
+BACKOFF_STATUS = {429, 503}
+
+
+class HostRateLimiter:
+    """
+    单个主机的令牌桶限速器，带 AIMD (加性增、乘性减) 自适应调节。
+
+    - 令牌以 rate 个/秒的速度补充，桶容量为 burst，每个请求消耗一个令牌。
+    - 收到 429/503、请求出错或延迟明显高于基线时，rate 乘以 decrease_factor (乘性减)。
+    - 请求健康时，rate 每次增加 increase_step，直到 max_rate (加性增)。
+    - 服务器返回 Retry-After 时，在指定时间内暂停发放令牌。
+    """
+
+    def __init__(self, host: str, rate: float = DEFAULT_RATE, burst: Optional[int] = None,
+                 min_rate: Optional[float] = None, max_rate: Optional[float] = None, increase_step: float = 0.1,
+                 decrease_factor: float = 0.5, latency_factor: float = 2.0, latency_floor: float = 1.0,
+                 cooldown: float = 2.0):
+        self.host = host
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, self.rate))
+        self.min_rate = float(min_rate if min_rate is not None else min(self.rate, 0.1))
+        self.max_rate = float(max_rate if max_rate is not None else self.rate * 4)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.latency_floor = latency_floor
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._latency_ewma: Optional[float] = None
+
+    def _reserve(self) -> float:
+        """预留一个令牌，返回调用方需要等待的秒数。令牌可以透支，从而让并发调用者自动排队。"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self):
+        """阻塞直到可以向该主机发起下一个请求。"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """acquire 的协程版本，供异步抓取引擎使用，等待期间不阻塞事件循环。"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record(self, status: Optional[int], latency: Optional[float] = None, retry_after: Optional[float] = None):
+        """
+        根据一次请求的结果调整速率。
+        :param status: HTTP 状态码；网络错误时传 None
+        :param latency: 请求耗时 (秒)
+        :param retry_after: 服务器 Retry-After 头给出的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+            congested = status is None or status in BACKOFF_STATUS
+            if not congested and latency is not None:
+                # 延迟超过基线的 latency_factor 倍 (且超过绝对下限 latency_floor 秒) 视为拥塞
+                if self._latency_ewma is not None and latency > max(self._latency_ewma * self.latency_factor,
+                                                                    self.latency_floor):
+                    congested = True
+                # 基线本身也缓慢跟随，避免主机整体变慢后被无限期惩罚
+                self._latency_ewma = latency if self._latency_ewma is None else (
+                        0.8 * self._latency_ewma + 0.2 * latency)
+
+            if congested:
+                # 冷却期内只减一次，避免同一波拥塞被并发请求重复惩罚
+                if now - self._last_decrease >= self.cooldown:
+                    self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                    # 清空令牌桶，让后续请求按新的速率排队
+                    self._tokens = min(self._tokens, 0.0)
+                    self._last_decrease = now
+                    logger.warning(f"    [⚠ RATE LIMIT] {self.host} 出现拥塞 (status={status})，"
+                                   f"速率降至 {self.rate:.2f} req/s")
+            elif status is not None and status < 400:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+
+class RateLimiterRegistry:
+    """按主机名管理 HostRateLimiter，线程安全。未配置的主机按默认参数惰性创建。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._limiters: Dict[str, HostRateLimiter] = {}
+        self._host_options: Dict[str, Dict[str, Any]] = {}
+        self.default_options: Dict[str, Any] = {'rate': DEFAULT_RATE, 'burst': DEFAULT_BURST}
+
+    def configure(self, host: str, **options):
+        with self._lock:
+            self._host_options[host] = options
+            self._limiters.pop(host, None)
+
+    def get(self, host_or_url: str) -> HostRateLimiter:
+        host = urlparse(host_or_url).hostname if '://' in host_or_url else host_or_url
+        host = host or ''
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(host)
+                if limiter is None:
+                    options = self._host_options.get(host, self.default_options)
+                    limiter = HostRateLimiter(host, **options)
+                    self._limiters[host] = limiter
+        return limiter
+
+    def acquire(self, host_or_url: str):
+        self.get(host_or_url).acquire()
+
+
+_registry = RateLimiterRegistry()
+
+
+def get_rate_limiter() -> RateLimiterRegistry:
+    """返回进程级共享的限速器注册表。"""
+    return _registry
+
+
+def configure_rate_limits(source_definitions: Dict[str, Any]):
+    """
+    从 tasks.yaml 的 source_definitions 中读取每个数据源的 `rate_limit` 配置。
+
+    示例:
+        html_cvf:
+          hosts: ["openaccess.thecvf.com"]
+          rate_limit: { rate: 8, burst: 16, max_rate: 32 }
+    """
+    for source_name, definition in (source_definitions or {}).items():
+        if not isinstance(definition, dict) or not isinstance(definition.get('rate_limit'), dict):
+            continue
+        options = dict(definition['rate_limit'])
+        hosts = options.pop('hosts', None) or definition.get('hosts', [])
+        for host in hosts:
+            _registry.configure(host, **options)
+            logger.debug(f"    -> 限速配置 [{source_name}] {host}: {options}")
@@ -23,7 +23,8 @@ try:
         generate_ai_response, get_stats_summary, _initialized,
         ZHIPUAI_API_KEY, SEARCH_RESULTS_DIR
     )
-    from src.crawlers.config import METADATA_OUTPUT_DIR, TRENDS_OUTPUT_DIR
+    from src.crawlers.config import METADATA_OUTPUT_DIR, TRENDS_OUTPUT_DIR, METADATA_STORE_DIR
+    from src.utils.metadata_store import open_metadata_store
     # 【v1.8 核心】从 trends.py 导入分析逻辑
     from src.analysis.trends import _load_trend_config, _create_analysis_df
 except ImportError as e:
@@ -36,6 +37,7 @@ except ImportError as e:
 STREAMLIT_AI_CONTEXT_PAPERS = 20
 RESULTS_PER_PAGE = 25
 ANALYSIS_TOP_N = 50  # 趋势分析图表默认显示 Top N 主题
+ANALYSIS_COLUMNS = ['title', 'abstract', 'avg_rating', 'decision']  # 即时趋势分析只需读取这些列
 
 # -----------------------------------------------------------------
 # 3. Streamlit 页面配置与后端初始化
@@ -138,6 +140,15 @@ def find_analysis_files():
             except Exception as scan_e:
                 logging.warning(f"扫描文件 {f} 时出错: {scan_e}")
 
+    # Parquet 数据集: 每个 会议/年份 分区一项 (每个任务只保留最新一份数据)，只读取目录名
+    store = open_metadata_store(METADATA_STORE_DIR)
+    for conf, year in (store.partitions() if store is not None else []):
+        all_conferences.add(conf);
+        all_years.add(year)
+        entries = analysis_data.setdefault(conf, {}).setdefault(year, {"csvs": []})["csvs"]
+        entries.append({"path": METADATA_STORE_DIR / f"conference={conf}" / f"year={year}", "type": "dataset",
+                        "label": "Parquet 数据集"})
+
     return analysis_data, sorted(list(all_conferences)), sorted(list(all_years),
                                                                 key=lambda y: "9999" if y == "Cross-Year" else y,
                                                                 reverse=True)
@@ -326,8 +337,10 @@ def render_analysis_dashboard_page():
 
     files_info = conf_data[selected_year]
     csv_options_sorted = sorted(files_info["csvs"], key=lambda item: (
-        0 if item['type'] == 'raw_data' else 1 if item['type'] == 'summary_table' else 2))
-    csv_options = {f"{item['path'].name} (类型: {item['type']})": item for item in csv_options_sorted}
+        0 if item['type'] == 'dataset' else 1 if item['type'] == 'raw_data' else
+        2 if item['type'] == 'summary_table' else 3))
+    csv_options = {f"{item.get('label', item['path'].name)} (类型: {item['type']})": item
+                   for item in csv_options_sorted}
     selected_csv_label = st.selectbox("3. 选择要分析的 CSV 文件", options=csv_options.keys())
     if not selected_csv_label: st.stop()
 
@@ -335,11 +348,16 @@ def render_analysis_dashboard_page():
     csv_path = selected_csv_info["path"]
     csv_type = selected_csv_info["type"]
 
-    st.markdown(f"#### 正在分析: `{csv_path.name}`")
+    st.markdown(f"#### 正在分析: `{selected_csv_info.get('label', csv_path.name)}`")
 
     # --- 加载并处理 CSV ---
     try:
-        df = pd.read_csv(csv_path)
+        if csv_type == "dataset":
+            # 只读取所选分区与分析需要的列；全为空的列 (如没有审稿数据的会议) 与 CSV 中一样视为不存在
+            df = open_metadata_store(METADATA_STORE_DIR).read(columns=ANALYSIS_COLUMNS, conference=selected_conf,
+                                                              year=selected_year).dropna(axis=1, how='all')
+        else:
+            df = pd.read_csv(csv_path)
         if df.empty:
             st.warning("CSV 文件为空。");
             st.stop()
@@ -354,7 +372,7 @@ def render_analysis_dashboard_page():
             analysis_df = df
             is_analyzed = True
 
-        elif csv_type == "raw_data":
+        elif csv_type in ("raw_data", "dataset"):
             st.info("💡 检测到 **原始数据文件**。正在进行即时趋势分析...")
             trend_config = _load_trend_config()
             if trend_config: